@@ -4,16 +4,59 @@ Provides a deterministic check identifier based on the canonical
 representation of a check's configuration fields. The same check
 definition always produces the same hash, making it suitable as a
 globally unique identifier across runs and across machines.
+
+Identifiers are computed with a versioned scheme. Version 1 hashed an
+indented JSON form that repeated the command, check, and options of a
+check next to the full check data. Version 2 hashes a compact JSON form
+of the check data, prefixed with its version, which the C encoder of
+the json module produces many times faster. Version 1 is still computed
+on request, so that identifiers stored by earlier versions of gatorgrade
+can be matched to the checks they identify.
+
+Identifiers of the current version are memoized per check. The key of
+a check is a short digest of its pickled fields, since pickling them is
+several times faster than encoding them canonically, and two checks
+whose fields pickle to the same bytes always have the same canonical
+form. The memo can be stored between runs, so that editing one check of
+a large configuration file only computes the identifier of that check.
 """
 
 import hashlib
+import itertools
 import json as json_module
-from typing import Any
+import pickle
+from typing import Any, Dict
 
 # JSON serialisation constants for canonical check representation
 INDENT_JSON = 4
 SORT_KEYS = True
 FILE_ENCODING = "utf-8"
+COMPACT_SEPARATORS = (",", ":")
+
+# the versions of the scheme that check identifiers are computed with
+LEGACY_CHECK_ID_VERSION = 1
+CHECK_ID_VERSION = 2
+CHECK_ID_PREFIX_FMT = "gatorgrade-check-id-v{}\n"
+UNKNOWN_CHECK_ID_VERSION_FMT = "Unknown check identifier version {}"
+
+# an encoder is reused for every check, since json.dumps builds a new one
+# for each call that passes any option
+COMPACT_ENCODER = json_module.JSONEncoder(
+    separators=COMPACT_SEPARATORS, sort_keys=SORT_KEYS
+)
+CHECK_ID_PREFIX = CHECK_ID_PREFIX_FMT.format(CHECK_ID_VERSION).encode(
+    FILE_ENCODING
+)
+
+# the size, in bytes, of the key of a check in the memo of identifiers,
+# and the number of identifiers that the memo keeps; when it is full, the
+# most recently computed half is kept
+MEMO_KEY_SIZE = 16
+MAX_MEMOIZED_CHECK_IDS = 100_000
+
+# the digest of each identifier computed with the current version of the
+# scheme, keyed by the digest of the pickled fields of its check
+_CHECK_ID_MEMO: Dict[bytes, bytes] = {}
 
 # default values for optional check fields used when hashing
 DEFAULT_WEIGHT = 1
@@ -65,6 +108,7 @@ def compute_check_id(  # noqa: PLR0913
     weight: int = DEFAULT_WEIGHT,
     outputlimit: int | None = DEFAULT_OUTPUTLIMIT,
     hint: str | None = DEFAULT_HINT,
+    version: int = CHECK_ID_VERSION,
 ) -> str:
     """Compute a deterministic SHA-256 identifier for a check.
 
@@ -100,11 +144,120 @@ def compute_check_id(  # noqa: PLR0913
         weight: The weight of the check.
         outputlimit: The maximum number of diagnostic lines.
         hint: An optional hint message.
+        version: The version of the scheme to compute the identifier
+            with, which is the current one unless an identifier stored
+            by an earlier version of gatorgrade has to be matched.
 
     Returns:
         A 64-character hexadecimal SHA-256 digest.
 
+    Raises:
+        ValueError: If the version is not a known version of the scheme.
+
     """
+    if version == LEGACY_CHECK_ID_VERSION:
+        return _compute_legacy_check_id(
+            description,
+            check_data,
+            file_context,
+            weight=weight,
+            outputlimit=outputlimit,
+            hint=hint,
+        )
+    if version != CHECK_ID_VERSION:
+        raise ValueError(UNKNOWN_CHECK_ID_VERSION_FMT.format(version))
+    key = _memo_key(
+        (description, check_data, file_context, weight, outputlimit, hint)
+    )
+    if key is not None:
+        memoized = _CHECK_ID_MEMO.get(key)
+        if memoized is not None:
+            return memoized.hex()
+    # the check data already holds the command, check, and options of
+    # the check, so only the resolved values of the other fields and the
+    # file path are added next to it
+    canonical: dict[str, Any] = {
+        DESCRIPTION_KEY: description,
+        WEIGHT_KEY: weight,
+        OUTPUTLIMIT_KEY: outputlimit,
+        HINT_KEY: hint,
+        JSON_INFO_KEY: check_data,
+    }
+    if file_context is not None:
+        canonical[FILE_KEY] = file_context
+    # real YAML data is encoded as it is, without first being copied;
+    # only data that the encoder rejects is made JSON-safe
+    try:
+        raw = COMPACT_ENCODER.encode(canonical)
+    except TypeError:
+        canonical[JSON_INFO_KEY] = _ensure_json_safe(check_data)
+        raw = COMPACT_ENCODER.encode(canonical)
+    digest = hashlib.sha256(CHECK_ID_PREFIX)
+    digest.update(raw.encode(FILE_ENCODING))
+    if key is not None:
+        _memoize(key, digest.digest())
+    return digest.hexdigest()
+
+
+def _memo_key(fields: tuple) -> bytes | None:
+    """Return the key of the fields of a check in the memo of identifiers.
+
+    Args:
+        fields: Every field of the check that its identifier covers.
+
+    Returns:
+        A digest of the pickled fields, or None when they cannot be
+        pickled, in which case the identifier is not memoized.
+
+    """
+    try:
+        data = pickle.dumps(fields, protocol=pickle.HIGHEST_PROTOCOL)
+    except (pickle.PicklingError, TypeError, AttributeError):
+        return None
+    return hashlib.blake2b(data, digest_size=MEMO_KEY_SIZE).digest()
+
+
+def _memoize(key: bytes, digest: bytes) -> None:
+    """Keep a computed identifier, dropping the oldest ones when full."""
+    if len(_CHECK_ID_MEMO) >= MAX_MEMOIZED_CHECK_IDS:
+        newest = list(
+            itertools.islice(
+                reversed(_CHECK_ID_MEMO.items()), MAX_MEMOIZED_CHECK_IDS // 2
+            )
+        )
+        _CHECK_ID_MEMO.clear()
+        _CHECK_ID_MEMO.update(reversed(newest))
+    _CHECK_ID_MEMO[key] = digest
+
+
+def memoized_check_ids() -> Dict[bytes, bytes]:
+    """Return a copy of the memo of identifiers, to store it between runs."""
+    return dict(_CHECK_ID_MEMO)
+
+
+def remember_check_ids(memo: Dict[bytes, bytes]) -> None:
+    """Add identifiers that an earlier run memoized to the memo.
+
+    Args:
+        memo: A memo returned by memoized_check_ids in an earlier run of
+            the same version of the scheme.
+
+    """
+    for key, digest in memo.items():
+        if key not in _CHECK_ID_MEMO:
+            _memoize(key, digest)
+
+
+def _compute_legacy_check_id(  # noqa: PLR0913
+    description: str,
+    check_data: dict[str, Any],
+    file_context: str | None,
+    *,
+    weight: int,
+    outputlimit: int | None,
+    hint: str | None,
+) -> str:
+    """Compute the identifier of a check with version 1 of the scheme."""
     # build the canonical representation from every identifying field
     # of the check; each of the check object's own attributes is
     # included explicitly so that the hash captures the resolved/
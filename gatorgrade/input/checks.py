@@ -5,6 +5,13 @@ from typing import Any, List
 NEWLINE = "\n"
 WEIGHT_FIELD = "weight"
 OUTPUTLIMIT_FIELD = "outputlimit"
+PARALLEL_FIELD = "parallel"
+DEPENDS_ON_FIELD = "depends_on"
+INPUTS_FIELD = "inputs"
+TIMEOUT_FIELD = "timeout"
+
+# the command that runs pytest for a PytestCheck that does not name one
+DEFAULT_PYTEST_RUNNER = "pytest"
 
 
 def validate_positive_nonzero_int(value: int, name: str) -> str | None:
@@ -28,9 +35,81 @@ def validate_positive_nonzero_int(value: int, name: str) -> str | None:
     return None
 
 
+def validate_bool(value: Any, name: str) -> str | None:
+    """Return an error message if value is not a boolean, else None.
+
+    Args:
+        value: The value to validate.
+        name: The name of the field (used in the error message).
+
+    Returns:
+        An error string if invalid, None if valid.
+
+    """
+    # only accept real booleans so that YAML strings like "no" that
+    # were quoted by the author are not silently treated as truthy
+    if not isinstance(value, bool):
+        return f"Check {name} must be true or false, got {value}"
+    return None
+
+
+def validate_nonempty_str(value: Any, name: str) -> str | None:
+    """Return an error message if value is not a non-empty string, else None.
+
+    Args:
+        value: The value to validate.
+        name: The name of the field (used in the error message).
+
+    Returns:
+        An error string if invalid, None if valid.
+
+    """
+    if not isinstance(value, str) or not value.strip():
+        return f"Check {name} must be a non-empty string, got {value}"
+    return None
+
+
+def validate_str_list(value: Any, name: str) -> str | None:
+    """Return an error message if value is not a string or list of strings.
+
+    Args:
+        value: The value to validate.
+        name: The name of the field (used in the error message).
+
+    Returns:
+        An error string if invalid, None if valid.
+
+    """
+    # a single string is accepted as shorthand for a one-item list
+    if isinstance(value, str):
+        return None
+    if isinstance(value, list) and all(
+        isinstance(item, str) for item in value
+    ):
+        return None
+    return f"Check {name} must be a string or a list of strings, got {value}"
+
+
 class ShellCheck:  # pylint: disable=too-few-public-methods
     """Represent a shell check."""
 
+    # a large configuration has many checks, each with the same fixed
+    # attributes, which slots store without a dictionary for every check
+    __slots__ = (
+        "argv",
+        "check_id",
+        "command",
+        "depends_on",
+        "description",
+        "hint",
+        "inputs",
+        "json_info",
+        "outputlimit",
+        "parallel",
+        "timeout",
+        "weight",
+    )
+
     def __init__(  # noqa: PLR0913
         self,
         command: str,
@@ -40,6 +119,11 @@ class ShellCheck:  # pylint: disable=too-few-public-methods
         outputlimit: int | None = None,
         hint: str | None = None,
         check_id: str | None = None,
+        parallel: bool = True,
+        depends_on: List[str] | None = None,
+        inputs: List[str] | None = None,
+        timeout: int | None = None,
+        argv: List[str] | None = None,
     ):
         """Construct a ShellCheck.
 
@@ -53,6 +137,17 @@ class ShellCheck:  # pylint: disable=too-few-public-methods
             outputlimit: The maximum number of diagnostic lines to display.
             hint: An optional hint message shown when the check fails.
             check_id: An optional SHA-256 hash uniquely identifying this check.
+            parallel: Whether the check may run at the same time as other
+                checks when gatorgrade runs with more than one job.
+            depends_on: The identifiers of the checks that must pass
+                before this check runs.
+            inputs: The glob patterns of the files that determine the
+                result of the check; only a check with inputs can have
+                its result reused from the result cache.
+            timeout: The maximum number of seconds that the check may run;
+                when omitted, the timeout given on the command-line is used.
+            argv: The program and arguments of the command when it uses
+                no feature of the shell, so that it can run without one.
 
         """
         # validate the weight and the outputlimit so that they
@@ -67,6 +162,10 @@ class ShellCheck:  # pylint: disable=too-few-public-methods
             )
             if error:
                 errors.append(error)
+        if timeout is not None:
+            error = validate_positive_nonzero_int(timeout, TIMEOUT_FIELD)
+            if error:
+                errors.append(error)
         # if there are any errors, raise a ValueError with all
         # of the error messages joined by newlines
         if errors:
@@ -79,11 +178,29 @@ class ShellCheck:  # pylint: disable=too-few-public-methods
         self.outputlimit = outputlimit
         self.hint = hint
         self.check_id = check_id
+        self.parallel = parallel
+        self.depends_on = depends_on if depends_on is not None else []
+        self.inputs = inputs
+        self.timeout = timeout
+        self.argv = argv
 
 
 class GatorGraderCheck:  # pylint: disable=too-few-public-methods
     """Represent a GatorGrader check."""
 
+    __slots__ = (
+        "check_id",
+        "depends_on",
+        "gg_args",
+        "hint",
+        "inputs",
+        "json_info",
+        "outputlimit",
+        "parallel",
+        "timeout",
+        "weight",
+    )
+
     def __init__(  # noqa: PLR0913
         self,
         gg_args: List[str],
@@ -92,6 +209,10 @@ class GatorGraderCheck:  # pylint: disable=too-few-public-methods
         outputlimit: int | None = None,
         hint: str | None = None,
         check_id: str | None = None,
+        parallel: bool = True,
+        depends_on: List[str] | None = None,
+        inputs: List[str] | None = None,
+        timeout: int | None = None,
     ):
         """Construct a GatorGraderCheck.
 
@@ -102,6 +223,15 @@ class GatorGraderCheck:  # pylint: disable=too-few-public-methods
             outputlimit: The maximum number of diagnostic lines to display.
             hint: An optional hint message shown when the check fails.
             check_id: An optional SHA-256 hash uniquely identifying this check.
+            parallel: Whether the check may run at the same time as other
+                checks when gatorgrade runs with more than one job.
+            depends_on: The identifiers of the checks that must pass
+                before this check runs.
+            inputs: The glob patterns of the files that determine the
+                result of the check; only a check with inputs can have
+                its result reused from the result cache.
+            timeout: The maximum number of seconds that the check may run;
+                when omitted, the timeout given on the command-line is used.
 
         """
         errors = []
@@ -116,6 +246,10 @@ class GatorGraderCheck:  # pylint: disable=too-few-public-methods
             )
             if error:
                 errors.append(error)
+        if timeout is not None:
+            error = validate_positive_nonzero_int(timeout, TIMEOUT_FIELD)
+            if error:
+                errors.append(error)
         if errors:
             raise ValueError(NEWLINE.join(errors))
         # otherwise, set the attributes
@@ -125,3 +259,155 @@ class GatorGraderCheck:  # pylint: disable=too-few-public-methods
         self.outputlimit = outputlimit
         self.hint = hint
         self.check_id = check_id
+        self.parallel = parallel
+        self.depends_on = depends_on if depends_on is not None else []
+        self.inputs = inputs
+        self.timeout = timeout
+
+
+class PytestCheck:  # pylint: disable=too-few-public-methods
+    """Represent a check of the outcome of pytest tests."""
+
+    __slots__ = (
+        "check_id",
+        "depends_on",
+        "description",
+        "hint",
+        "inputs",
+        "json_info",
+        "nodeid",
+        "outputlimit",
+        "parallel",
+        "runner",
+        "timeout",
+        "weight",
+    )
+
+    def __init__(  # noqa: PLR0913
+        self,
+        nodeid: str,
+        runner: str = DEFAULT_PYTEST_RUNNER,
+        description: str | None = None,
+        json_info: dict[str, Any] | str | None = None,
+        *,
+        weight: int = 1,
+        outputlimit: int | None = None,
+        hint: str | None = None,
+        check_id: str | None = None,
+        parallel: bool = True,
+        depends_on: List[str] | None = None,
+        inputs: List[str] | None = None,
+        timeout: int | None = None,
+    ):
+        """Construct a PytestCheck.
+
+        Args:
+            nodeid: The pytest node ID of the test, or of the class or
+                file of tests, that must pass.
+            runner: The command that runs pytest, to which the options
+                and the node IDs of the tests are added.
+            description: The description to use in output.
+                If no description is given, the node ID is used as the description.
+            json_info: The all-encompassing check information to include in json output.
+            weight: The weight of the check. Must be a positive integer.
+            outputlimit: The maximum number of diagnostic lines to display.
+            hint: An optional hint message shown when the check fails.
+            check_id: An optional SHA-256 hash uniquely identifying this check.
+            parallel: Whether the check may run at the same time as other
+                checks when gatorgrade runs with more than one job.
+            depends_on: The identifiers of the checks that must pass
+                before this check runs.
+            inputs: The glob patterns of the files that determine the
+                result of the check; only a check with inputs can have
+                its result reused from the result cache.
+            timeout: The maximum number of seconds that the run of pytest
+                may take; when omitted, the timeout given on the
+                command-line is used.
+
+        """
+        errors = []
+        error = validate_positive_nonzero_int(weight, WEIGHT_FIELD)
+        if error:
+            errors.append(error)
+        if outputlimit is not None:
+            error = validate_positive_nonzero_int(
+                outputlimit, OUTPUTLIMIT_FIELD
+            )
+            if error:
+                errors.append(error)
+        if timeout is not None:
+            error = validate_positive_nonzero_int(timeout, TIMEOUT_FIELD)
+            if error:
+                errors.append(error)
+        # if there are any errors, raise a ValueError with all
+        # of the error messages joined by newlines
+        if errors:
+            raise ValueError(NEWLINE.join(errors))
+        # otherwise, set the attributes
+        self.nodeid = nodeid
+        self.runner = runner
+        self.description = description if description is not None else nodeid
+        self.json_info = json_info
+        self.weight = weight
+        self.outputlimit = outputlimit
+        self.hint = hint
+        self.check_id = check_id
+        self.parallel = parallel
+        self.depends_on = depends_on if depends_on is not None else []
+        self.inputs = inputs
+        self.timeout = timeout
+
+
+class InvalidCheck:  # pylint: disable=too-few-public-methods
+    """Represent an entry of the configuration file that is not a valid check.
+
+    When the checks are streamed from the configuration file, an entry
+    that is not valid can be found after other checks have already run,
+    so it is reported as a failing check of its own instead of stopping
+    the whole run.
+    """
+
+    __slots__ = (
+        "check_id",
+        "depends_on",
+        "description",
+        "diagnostic",
+        "hint",
+        "inputs",
+        "json_info",
+        "outputlimit",
+        "parallel",
+        "timeout",
+        "weight",
+    )
+
+    def __init__(
+        self,
+        description: str,
+        diagnostic: str,
+        json_info: dict[str, Any] | str | None = None,
+        *,
+        weight: int = 1,
+        check_id: str | None = None,
+    ):
+        """Construct an InvalidCheck.
+
+        Args:
+            description: The description of the entry, to use in output.
+            diagnostic: The configuration errors of the entry.
+            json_info: The data of the entry, if it has any.
+            weight: The weight of the failing check.
+            check_id: The identifier of the entry, if it is a check.
+
+        """
+        self.description = description
+        self.diagnostic = diagnostic
+        self.json_info = json_info
+        self.weight = weight
+        self.check_id = check_id
+        self.depends_on: List[str] = []
+        self.hint = None
+        self.inputs = None
+        self.outputlimit = None
+        self.parallel = True
+        self.timeout = None
@@ -0,0 +1,181 @@
+"""Split plain commands into argument lists that can run without a shell.
+
+Most commands in a configuration are a program and its arguments, such
+as "uv run pytest tests/test_main.py", and use no feature of the shell.
+Running such a command through /bin/sh costs one extra process that
+only splits the command into words and then starts the program. A
+command whose meaning cannot depend on the shell is split into its
+words once, when the checks are generated, so that the program can be
+started directly. Every other command, and every command on a platform
+without a POSIX shell, still runs through the shell.
+"""
+
+import os
+from typing import List
+
+# characters that give a command a meaning that only the shell knows,
+# wherever they appear: expansions, escapes, and line breaks
+ALWAYS_SPECIAL_CHARACTERS = frozenset("$`\\\n\r")
+
+# characters that are special to the shell outside of quotes:
+# pipelines, lists, redirections, subshells, globs, and brace groups
+UNQUOTED_SPECIAL_CHARACTERS = frozenset("|&;<>()*?[]{}")
+
+# characters that are special at the start of an unquoted word:
+# comments and home directory expansion
+WORD_START_SPECIAL_CHARACTERS = frozenset("#~")
+
+# a word with this character before any quote assigns a variable when
+# it comes before the name of the program
+ASSIGNMENT_CHARACTER = "="
+
+SINGLE_QUOTE = "'"
+DOUBLE_QUOTE = '"'
+WHITESPACE = frozenset(" \t")
+
+# programs that the shell runs as built-in commands or keywords; the
+# shell's own version can differ from a program of the same name, such
+# as echo, so a command that starts with one of them uses the shell
+SHELL_BUILTINS = frozenset(
+    {
+        "!",
+        ".",
+        ":",
+        "[",
+        "alias",
+        "bg",
+        "break",
+        "case",
+        "cd",
+        "command",
+        "continue",
+        "do",
+        "done",
+        "echo",
+        "elif",
+        "else",
+        "esac",
+        "eval",
+        "exec",
+        "exit",
+        "export",
+        "false",
+        "fc",
+        "fg",
+        "fi",
+        "for",
+        "function",
+        "getopts",
+        "hash",
+        "if",
+        "in",
+        "jobs",
+        "kill",
+        "local",
+        "printf",
+        "pwd",
+        "read",
+        "readonly",
+        "return",
+        "select",
+        "set",
+        "shift",
+        "source",
+        "test",
+        "then",
+        "times",
+        "trap",
+        "true",
+        "type",
+        "ulimit",
+        "umask",
+        "unalias",
+        "unset",
+        "until",
+        "wait",
+        "while",
+    }
+)
+
+# direct execution follows the word splitting of a POSIX shell, which
+# is not what cmd.exe does on Windows
+HAS_DIRECT_EXEC = os.name == "posix"
+
+
+def _split_words(command: str) -> List[str] | None:
+    """Split a command into words as the shell would, if that is simple.
+
+    Args:
+        command: The command from the configuration file.
+
+    Returns:
+        The words of the command with their quotes removed, or None if
+        the command uses a feature of the shell.
+
+    """
+    words: List[str] = []
+    word: List[str] = []
+    # whether the current word exists, which is true for "" as well
+    in_word = False
+    # whether a quote appeared in the current word yet
+    quoted = False
+    quote = None
+    for character in command:
+        if character in ALWAYS_SPECIAL_CHARACTERS:
+            return None
+        if quote is not None:
+            # everything but the closing quote is literal inside quotes
+            if character == quote:
+                quote = None
+            else:
+                word.append(character)
+            continue
+        if character in WHITESPACE:
+            if in_word:
+                words.append("".join(word))
+                word = []
+                in_word = False
+                quoted = False
+            continue
+        # outside of quotes, also check for the characters that are only
+        # special at the start of a word and for an assignment, which only
+        # counts before the name of the program
+        if (
+            character in UNQUOTED_SPECIAL_CHARACTERS
+            or (not in_word and character in WORD_START_SPECIAL_CHARACTERS)
+            or (character == ASSIGNMENT_CHARACTER and not words and not quoted)
+        ):
+            return None
+        in_word = True
+        if character in (SINGLE_QUOTE, DOUBLE_QUOTE):
+            quote = character
+            quoted = True
+            continue
+        word.append(character)
+    # a quote that is never closed is an error for the shell to report
+    if quote is not None:
+        return None
+    if in_word:
+        words.append("".join(word))
+    return words
+
+
+def split_plain_command(command: str) -> List[str] | None:
+    """Return the argument list of a command that does not need a shell.
+
+    Args:
+        command: The command from the configuration file.
+
+    Returns:
+        The program and its arguments, or None if the command has to
+        run through the shell, because it uses a feature of the shell,
+        starts with a built-in command of the shell, or is empty, or
+        because this platform does not have a POSIX shell.
+
+    """
+    if not HAS_DIRECT_EXEC:
+        return None
+    words = _split_words(command)
+    if not words or words[0] in SHELL_BUILTINS:
+        return None
+    return words
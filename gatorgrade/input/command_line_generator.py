@@ -1,11 +1,27 @@
 """Generates a dictionary of shell and GatorGrader command options from a list of dictionary-based checks."""
 
+import itertools
 import os
-from typing import List, Union
+from typing import Dict, Iterable, Iterator, List, Union
 
-from gatorgrade.hash import compute_check_id
+from gatorgrade.hash import (
+    CHECK_ID_VERSION,
+    LEGACY_CHECK_ID_VERSION,
+    compute_check_id,
+)
 
-from .checks import GatorGraderCheck, ShellCheck, validate_positive_nonzero_int
+from .checks import (
+    DEFAULT_PYTEST_RUNNER,
+    GatorGraderCheck,
+    InvalidCheck,
+    PytestCheck,
+    ShellCheck,
+    validate_bool,
+    validate_nonempty_str,
+    validate_positive_nonzero_int,
+    validate_str_list,
+)
+from .command_argv import split_plain_command
 from .in_file_path import CheckData
 
 EMPTY = ""
@@ -20,140 +36,671 @@ ARG_FILE = "--file"
 
 DESCRIPTION_KEY = "description"
 UNNAMED_CHECK = "unnamed check"
+# the description of an entry of the configuration file that is not a check
+INVALID_ENTRY = "Malformed entry of the configuration file"
 WEIGHT_KEY = "weight"
 OUTPUTLIMIT_KEY = "outputlimit"
 COMMAND_KEY = "command"
 CHECK_KEY = "check"
 OPTIONS_KEY = "options"
 HINT_KEY = "hint"
+PARALLEL_KEY = "parallel"
+DEPENDS_ON_KEY = "depends_on"
+INPUTS_KEY = "inputs"
+TIMEOUT_KEY = "timeout"
+
+# the name of the check that inspects the outcome of pytest tests, which
+# gatorgrade runs itself instead of handing it to GatorGrader
+PYTEST_CHECK_NAME = "PytestOutcome"
+NODEID_OPTION = "nodeid"
+RUNNER_OPTION = "runner"
+NODEID_SEPARATOR = "::"
+PYTEST_OPTIONS_MSG = (
+    "Check PytestOutcome needs options with a nodeid, unless it is nested"
+    " under the file of its tests"
+)
 
 CONFIG_ERROR_FMT = "- Configuration error in check '{}': {}{}{}"
+UNKNOWN_DEPENDENCY_FMT = (
+    "Check depends_on refers to '{}', which is not the description"
+    " or identifier of any check"
+)
+SELF_DEPENDENCY_MSG = "Check depends_on must not refer to the check itself"
+DEPENDENCY_CYCLE_FMT = "Check depends_on forms a cycle: {}"
+DEPENDENCY_ARROW = " -> "
+
+
+def _str_list(check: dict, key: str) -> List[str]:
+    """Return a string or list of strings field of a check as a list."""
+    values = check.get(key, [])
+    # a single value may be written without a surrounding list
+    if isinstance(values, str):
+        return [values]
+    return values
+
+
+def _find_dependency_cycle(
+    graph: Dict[int, List[int]], start: int
+) -> List[int] | None:
+    """Return a cycle of checks that passes through start, if one exists.
+
+    Args:
+        graph: The indices of the prerequisites of every check.
+        start: The index of the check at which the search starts.
+
+    Returns:
+        The indices of the checks in the cycle, beginning and ending
+        with start, or None when start is not part of a cycle.
+
+    """
+    # use an explicit stack of (check, path) pairs instead of recursion
+    # so that long chains of prerequisites cannot exhaust the stack
+    stack = [(start, [start])]
+    visited = set()
+    while stack:
+        index, path = stack.pop()
+        for prerequisite in graph[index]:
+            if prerequisite == start:
+                return [*path, start]
+            if prerequisite not in visited:
+                visited.add(prerequisite)
+                stack.append((prerequisite, [*path, prerequisite]))
+    return None
+
+
+def _dependency_cycle_errors(
+    check_data_list: List[CheckData], graph: Dict[int, List[int]]
+) -> Dict[int, str]:
+    """Return a configuration error for every cycle of dependencies.
+
+    Args:
+        check_data_list: The check data from the configuration file.
+        graph: The indices of the prerequisites of every check.
+
+    Returns:
+        The error message of each cycle that was found, by the index of
+        the first check that is part of it.
+
+    """
+    errors: Dict[int, str] = {}
+    # report each cycle once, from the first check that is part of it
+    in_reported_cycle: set = set()
+    for index, check_data in enumerate(check_data_list):
+        if index in in_reported_cycle:
+            continue
+        cycle = _find_dependency_cycle(graph, index)
+        if cycle is not None:
+            in_reported_cycle.update(cycle)
+            desc = check_data.check.get(DESCRIPTION_KEY, UNNAMED_CHECK)
+            path = DEPENDENCY_ARROW.join(
+                str(
+                    check_data_list[i].check.get(
+                        DESCRIPTION_KEY, UNNAMED_CHECK
+                    )
+                )
+                for i in cycle
+            )
+            error = DEPENDENCY_CYCLE_FMT.format(path)
+            errors[index] = CONFIG_ERROR_FMT.format(desc, NEWLINE, TAB, error)
+    return errors
+
+
+def _check_id(
+    check_data: CheckData,
+    weight: int,
+    outputlimit: int | None,
+    version: int = CHECK_ID_VERSION,
+) -> str:
+    """Compute the identifier of a check from its data and resolved values.
+
+    Args:
+        check_data: The check data from the configuration file.
+        weight: The weight of the check, after applying the baseline.
+        outputlimit: The maximum number of diagnostic lines, if any.
+        version: The version of the scheme to compute the identifier with.
+
+    Returns:
+        The identifier of the check.
+
+    """
+    check = check_data.check
+    # a GatorGrader check keeps a description that is explicitly empty,
+    # while the other checks are unnamed without a description
+    if COMMAND_KEY in check or check.get(CHECK_KEY) == PYTEST_CHECK_NAME:
+        description = check.get(DESCRIPTION_KEY)
+        if description is None:
+            description = UNNAMED_CHECK
+    else:
+        description = check.get(DESCRIPTION_KEY, UNNAMED_CHECK)
+    return compute_check_id(
+        description=description,
+        check_data=check,
+        file_context=check_data.file_context,
+        weight=weight,
+        outputlimit=outputlimit,
+        hint=check.get(HINT_KEY),
+        version=version,
+    )
 
 
-def generate_checks(  # noqa: PLR0912
+def legacy_check_ids(
     check_data_list: List[CheckData],
-    baseline_weight: int = 1,
-) -> List[Union[ShellCheck, GatorGraderCheck]]:
-    """Generate a list of checks based on check data from the configuration file.
+    checks: List[Union[ShellCheck, GatorGraderCheck, PytestCheck]],
+) -> Dict[str, str]:
+    """Map the identifier that an earlier scheme gave each check to its own.
 
     Args:
-        check_data_list: A list of CheckData that each represent a check from the
-            configuration file.
-        baseline_weight: Default weight applied to checks that do not specify
-            an explicit weight.
+        check_data_list: The check data from the configuration file.
+        checks: The checks generated from the check data, in order.
 
     Returns:
-        A list of ShellChecks and GatorGraderChecks.
+        The current identifier of each check, by the identifier that
+        version 1 of the scheme gives it.
+
+    """
+    return {
+        _check_id(
+            check_data,
+            check.weight,
+            check.outputlimit,
+            LEGACY_CHECK_ID_VERSION,
+        ): str(check.check_id)
+        for check_data, check in zip(check_data_list, checks)
+    }
 
-    Raises:
-        ValueError: If any check has an invalid weight or outputlimit.
+
+def _index_checks_by_name(
+    check_data_list: List[CheckData],
+    checks: List[Union[ShellCheck, GatorGraderCheck, PytestCheck]],
+) -> Dict[str, List[int]]:
+    """Return the indices of the checks by each name they can be depended on.
+
+    Args:
+        check_data_list: The check data from the configuration file.
+        checks: The checks generated from the check data, in order.
+
+    Returns:
+        The indices of the checks by their descriptions and identifiers.
 
     """
-    errors: List[str] = []
-    for check_data in check_data_list:
+    indices_by_name: Dict[str, List[int]] = {}
+    for index, (check_data, check) in enumerate(zip(check_data_list, checks)):
+        description = check_data.check.get(DESCRIPTION_KEY)
+        if description is not None:
+            indices_by_name.setdefault(str(description), []).append(index)
+        if check.check_id is not None:
+            indices_by_name.setdefault(check.check_id, []).append(index)
+    # a configuration file may still name a check by the identifier that
+    # an earlier scheme gave it, which is only computed when some name
+    # is not found otherwise
+    if any(
+        name not in indices_by_name
+        for check_data in check_data_list
+        for name in _str_list(check_data.check, DEPENDS_ON_KEY)
+    ):
+        for index, (check_data, check) in enumerate(
+            zip(check_data_list, checks)
+        ):
+            legacy_id = _check_id(
+                check_data,
+                check.weight,
+                check.outputlimit,
+                LEGACY_CHECK_ID_VERSION,
+            )
+            indices_by_name.setdefault(legacy_id, []).append(index)
+    return indices_by_name
+
+
+def _resolve_dependencies(
+    check_data_list: List[CheckData],
+    checks: List[Union[ShellCheck, GatorGraderCheck, PytestCheck]],
+) -> Dict[int, List[str]]:
+    """Translate every depends_on entry into the identifier of a check.
+
+    An entry may name either the description of a check or its check
+    identifier; when several checks share a description the check
+    depends on all of them. A check whose entries cannot be resolved
+    depends on nothing, so that a cycle is broken at the check that
+    reports it and the other checks of the cycle are skipped.
+
+    Args:
+        check_data_list: The check data from the configuration file.
+        checks: The checks generated from the check data, in order.
+
+    Returns:
+        The configuration errors, by the index of the check, of each
+        check with an entry that does not name any check, that names the
+        check itself, or that closes a cycle of dependencies.
+
+    """
+    indices_by_name = _index_checks_by_name(check_data_list, checks)
+    errors: Dict[int, List[str]] = {}
+    graph: Dict[int, List[int]] = {}
+    for index, check_data in enumerate(check_data_list):
         desc = check_data.check.get(DESCRIPTION_KEY, UNNAMED_CHECK)
-        weight = check_data.check.get(WEIGHT_KEY, baseline_weight)
-        outputlimit = check_data.check.get(OUTPUTLIMIT_KEY)
-        weight_error = validate_positive_nonzero_int(weight, WEIGHT_KEY)
-        if weight_error:
+        graph[index] = []
+        for name in _str_list(check_data.check, DEPENDS_ON_KEY):
+            if name not in indices_by_name:
+                error = UNKNOWN_DEPENDENCY_FMT.format(name)
+                errors.setdefault(index, []).append(
+                    CONFIG_ERROR_FMT.format(desc, NEWLINE, TAB, error)
+                )
+                continue
+            for prerequisite in indices_by_name[name]:
+                if prerequisite == index:
+                    errors.setdefault(index, []).append(
+                        CONFIG_ERROR_FMT.format(
+                            desc, NEWLINE, TAB, SELF_DEPENDENCY_MSG
+                        )
+                    )
+                elif prerequisite not in graph[index]:
+                    graph[index].append(prerequisite)
+    for index, error in _dependency_cycle_errors(
+        check_data_list, graph
+    ).items():
+        errors.setdefault(index, []).append(error)
+    for index, check in enumerate(checks):
+        check.depends_on = (
+            []
+            if index in errors
+            else [
+                str(checks[prerequisite].check_id)
+                for prerequisite in graph[index]
+            ]
+        )
+    return errors
+
+
+def _pytest_option_errors(check_data: CheckData) -> List[str]:
+    """Return the errors in the options of a PytestOutcome check.
+
+    Args:
+        check_data: The check data of a PytestOutcome check.
+
+    Returns:
+        The messages of the errors in the options, if any.
+
+    """
+    options = check_data.check.get(OPTIONS_KEY)
+    if options is None:
+        options = {}
+    if not isinstance(options, dict):
+        return [PYTEST_OPTIONS_MSG]
+    # a check nested under a file checks the tests of that file, so
+    # it only needs a node ID to name one of those tests
+    if NODEID_OPTION not in options and check_data.file_context is None:
+        return [PYTEST_OPTIONS_MSG]
+    errors = []
+    for option in (NODEID_OPTION, RUNNER_OPTION):
+        if option in options:
+            error = validate_nonempty_str(options[option], option)
+            if error:
+                errors.append(error)
+    return errors
+
+
+def _pytest_nodeid(check_data: CheckData) -> str:
+    """Return the node ID of the tests that a PytestOutcome check runs.
+
+    A check that is nested under a file names a test of that file, or
+    all of the tests of the file when it has no node ID of its own.
+
+    Args:
+        check_data: The check data of a valid PytestOutcome check.
+
+    Returns:
+        The pytest node ID of the test, class, or file of tests.
+
+    """
+    options = check_data.check.get(OPTIONS_KEY) or {}
+    nodeid = options.get(NODEID_OPTION)
+    if check_data.file_context is None:
+        return str(nodeid)
+    if nodeid is None:
+        return check_data.file_context
+    return check_data.file_context + NODEID_SEPARATOR + str(nodeid)
+
+
+def _check_errors(check_data: CheckData, baseline_weight: int) -> List[str]:
+    """Return the configuration errors of one check.
+
+    Args:
+        check_data: The check data from the configuration file.
+        baseline_weight: Default weight applied to checks that do not
+            specify an explicit weight.
+
+    Returns:
+        The formatted configuration errors of the check, if any.
+
+    """
+    errors: List[str] = []
+    desc = check_data.check.get(DESCRIPTION_KEY, UNNAMED_CHECK)
+    weight = check_data.check.get(WEIGHT_KEY, baseline_weight)
+    outputlimit = check_data.check.get(OUTPUTLIMIT_KEY)
+    weight_error = validate_positive_nonzero_int(weight, WEIGHT_KEY)
+    if weight_error:
+        errors.append(
+            CONFIG_ERROR_FMT.format(desc, NEWLINE, TAB, weight_error)
+        )
+    if outputlimit is not None:
+        ol_error = validate_positive_nonzero_int(outputlimit, OUTPUTLIMIT_KEY)
+        if ol_error:
             errors.append(
-                CONFIG_ERROR_FMT.format(desc, NEWLINE, TAB, weight_error)
+                CONFIG_ERROR_FMT.format(desc, NEWLINE, TAB, ol_error)
             )
-        if outputlimit is not None:
-            ol_error = validate_positive_nonzero_int(
-                outputlimit, OUTPUTLIMIT_KEY
+    timeout = check_data.check.get(TIMEOUT_KEY)
+    if timeout is not None:
+        timeout_error = validate_positive_nonzero_int(timeout, TIMEOUT_KEY)
+        if timeout_error:
+            errors.append(
+                CONFIG_ERROR_FMT.format(desc, NEWLINE, TAB, timeout_error)
             )
-            if ol_error:
-                errors.append(
-                    CONFIG_ERROR_FMT.format(desc, NEWLINE, TAB, ol_error)
-                )
-    if errors:
-        raise ValueError(NEWLINE.join(errors))
-    checks: List[Union[ShellCheck, GatorGraderCheck]] = []
-    for check_data in check_data_list:
-        weight = check_data.check.get(WEIGHT_KEY, baseline_weight)
-        outputlimit = check_data.check.get(OUTPUTLIMIT_KEY)
-        # if the check has a command key, then it is a shell check
-        # which means that it will be run by the computer's shell
-        if COMMAND_KEY in check_data.check:
-            description = check_data.check.get(DESCRIPTION_KEY)
-            effective_desc = (
-                description if description is not None else UNNAMED_CHECK
+    if PARALLEL_KEY in check_data.check:
+        parallel_error = validate_bool(
+            check_data.check[PARALLEL_KEY], PARALLEL_KEY
+        )
+        if parallel_error:
+            errors.append(
+                CONFIG_ERROR_FMT.format(desc, NEWLINE, TAB, parallel_error)
             )
-            # compute the check identifier using a SHA256 hash,
-            # this helps to uniquely identifier each of these
-            # checks across runs, across JSON reports, and across
-            # any of the auto-hint tracking files
-            check_id = compute_check_id(
-                description=effective_desc,
-                check_data=check_data.check,
-                file_context=check_data.file_context,
-                weight=weight,
-                outputlimit=outputlimit,
-                hint=check_data.check.get(HINT_KEY),
+    if check_data.check.get(CHECK_KEY) == PYTEST_CHECK_NAME:
+        errors.extend(
+            CONFIG_ERROR_FMT.format(desc, NEWLINE, TAB, pytest_error)
+            for pytest_error in _pytest_option_errors(check_data)
+        )
+    for list_key in (DEPENDS_ON_KEY, INPUTS_KEY):
+        if list_key in check_data.check:
+            list_error = validate_str_list(
+                check_data.check[list_key], list_key
             )
-            checks.append(
-                ShellCheck(
-                    command=check_data.check.get(COMMAND_KEY),
-                    description=description,
-                    json_info=check_data.check,
-                    weight=weight,
-                    outputlimit=outputlimit,
-                    hint=check_data.check.get(HINT_KEY),
-                    check_id=check_id,
+            if list_error:
+                errors.append(
+                    CONFIG_ERROR_FMT.format(desc, NEWLINE, TAB, list_error)
                 )
+    return errors
+
+
+def _build_check(
+    check_data: CheckData, baseline_weight: int
+) -> Union[ShellCheck, GatorGraderCheck, PytestCheck]:
+    """Build the check for the data of one valid check.
+
+    Args:
+        check_data: The check data from the configuration file, which
+            has no configuration errors.
+        baseline_weight: Default weight applied to checks that do not
+            specify an explicit weight.
+
+    Returns:
+        The ShellCheck, PytestCheck, or GatorGraderCheck of the data.
+
+    """
+    weight = check_data.check.get(WEIGHT_KEY, baseline_weight)
+    outputlimit = check_data.check.get(OUTPUTLIMIT_KEY)
+    # checks run concurrently with other checks (when more than
+    # one job is requested) unless they explicitly opt out
+    parallel = check_data.check.get(PARALLEL_KEY, True)
+    # the files whose content decides the result of the check; a
+    # check without any inputs is never served from the cache
+    inputs = _str_list(check_data.check, INPUTS_KEY)
+    # if the check has a command key, then it is a shell check
+    # which means that it will be run by the computer's shell
+    if COMMAND_KEY in check_data.check:
+        description = check_data.check.get(DESCRIPTION_KEY)
+        # compute the check identifier using a SHA256 hash,
+        # this helps to uniquely identifier each of these
+        # checks across runs, across JSON reports, and across
+        # any of the auto-hint tracking files
+        check_id = _check_id(check_data, weight, outputlimit)
+        command = check_data.check.get(COMMAND_KEY)
+        return ShellCheck(
+            command=command,
+            description=description,
+            json_info=check_data.check,
+            weight=weight,
+            outputlimit=outputlimit,
+            hint=check_data.check.get(HINT_KEY),
+            check_id=check_id,
+            parallel=parallel,
+            inputs=inputs or None,
+            timeout=check_data.check.get(TIMEOUT_KEY),
+            # split the command once so that a command that needs
+            # no shell can start its program without one
+            argv=split_plain_command(command)
+            if isinstance(command, str)
+            else None,
+        )
+    # if the check inspects the outcome of pytest tests, then it is
+    # run by gatorgrade, together with all of the other such checks
+    # that use the same runner, in a single run of pytest
+    if check_data.check.get(CHECK_KEY) == PYTEST_CHECK_NAME:
+        description = check_data.check.get(DESCRIPTION_KEY)
+        options = check_data.check.get(OPTIONS_KEY) or {}
+        check_id = _check_id(check_data, weight, outputlimit)
+        return PytestCheck(
+            nodeid=_pytest_nodeid(check_data),
+            runner=options.get(RUNNER_OPTION, DEFAULT_PYTEST_RUNNER),
+            description=description,
+            json_info=check_data.check,
+            weight=weight,
+            outputlimit=outputlimit,
+            hint=check_data.check.get(HINT_KEY),
+            check_id=check_id,
+            parallel=parallel,
+            inputs=inputs or None,
+            timeout=check_data.check.get(TIMEOUT_KEY),
+        )
+    # otherwise, it is a GatorGrader check, which means that it
+    # is one of the checks that will be directly run by GatorGrader
+    gg_args = []
+    # add description option if in data
+    description = check_data.check.get(DESCRIPTION_KEY)
+    if description is not None:
+        gg_args.extend([ARG_DESCRIPTION, str(description)])
+    # always add name of check, which should be in data
+    gg_args.append(str(check_data.check.get(CHECK_KEY)))
+    # add any additional options
+    options = check_data.check.get(OPTIONS_KEY)
+    if options is not None:
+        for option in options:
+            # if option should be a flag (i.e., its value is the True boolean),
+            # then add only the option without a value
+            option_value = options[option]
+            if isinstance(option_value, bool):
+                if option_value:
+                    gg_args.append(f"--{option}")
+            # otherwise, add both the option and its value
+            else:
+                gg_args.extend([f"--{option}", str(option_value)])
+    # add directory and file if file context in data
+    if check_data.file_context is not None:
+        # get the file and directory using os
+        dirname, filename = os.path.split(check_data.file_context)
+        if dirname == EMPTY:
+            dirname = DEFAULT_DIRECTORY
+        gg_args.extend([ARG_DIRECTORY, dirname, ARG_FILE, filename])
+        # a check that inspects a file depends on its content,
+        # unless it runs a command whose output could change
+        if not (options and COMMAND_KEY in options):
+            inputs = [check_data.file_context, *inputs]
+    # compute the check identifier using a SHA256 hash,
+    # this helps to uniquely identifier each of these
+    # checks across runs, across JSON reports, and across
+    # any of the auto-hint tracking files
+    check_id = _check_id(check_data, weight, outputlimit)
+    return GatorGraderCheck(
+        gg_args=gg_args,
+        json_info=check_data.check,
+        weight=weight,
+        outputlimit=outputlimit,
+        hint=check_data.check.get(HINT_KEY),
+        check_id=check_id,
+        parallel=parallel,
+        inputs=inputs or None,
+        timeout=check_data.check.get(TIMEOUT_KEY),
+    )
+
+
+def _invalid_check(
+    check_data: CheckData, baseline_weight: int, errors: List[str]
+) -> InvalidCheck:
+    """Return the failing check that reports the errors of a check's data.
+
+    Args:
+        check_data: The check data from the configuration file.
+        baseline_weight: Default weight applied to checks that do not
+            specify an explicit weight.
+        errors: The formatted configuration errors of the check.
+
+    Returns:
+        The InvalidCheck of the data, which keeps its weight when that
+        is valid and is identified as the check would have been.
+
+    """
+    weight = check_data.check.get(WEIGHT_KEY, baseline_weight)
+    return InvalidCheck(
+        description=str(check_data.check.get(DESCRIPTION_KEY, UNNAMED_CHECK)),
+        diagnostic=NEWLINE.join(errors),
+        json_info=check_data.check,
+        weight=weight
+        if validate_positive_nonzero_int(weight, WEIGHT_KEY) is None
+        else baseline_weight,
+        check_id=_check_id(
+            check_data, weight, check_data.check.get(OUTPUTLIMIT_KEY)
+        ),
+    )
+
+
+def iter_checks(
+    check_data_list: Iterable[Union[CheckData, str]],
+    baseline_weight: int = 1,
+) -> Iterator[Union[ShellCheck, GatorGraderCheck, PytestCheck, InvalidCheck]]:
+    """Yield the check of each check data as soon as it is read.
+
+    The check data can be streamed from the configuration file, so a
+    check is yielded before the data of the later checks is read, and a
+    check with configuration errors is yielded as an InvalidCheck that
+    reports them instead of stopping the other checks. Since a check can
+    depend on a check that comes after it in the file, the rest of the
+    check data is read once the first check with depends_on is reached,
+    and the dependencies are resolved before any more checks are yielded.
+
+    Args:
+        check_data_list: The CheckData that each represent a check from the
+            configuration file, or the message of an entry that is not a
+            check, which may be produced lazily.
+        baseline_weight: Default weight applied to checks that do not specify
+            an explicit weight.
+
+    Yields:
+        The ShellCheck, PytestCheck, GatorGraderCheck, or InvalidCheck of
+        each check data, in the order of the check data.
+
+    """
+    valid_data: List[CheckData] = []
+    checks: List[Union[ShellCheck, GatorGraderCheck, PytestCheck]] = []
+    entries = iter(check_data_list)
+    for entry in entries:
+        if isinstance(entry, str):
+            yield InvalidCheck(description=INVALID_ENTRY, diagnostic=entry)
+            continue
+        if DEPENDS_ON_KEY in entry.check:
+            yield from _iter_dependent_checks(
+                itertools.chain([entry], entries),
+                baseline_weight,
+                valid_data,
+                checks,
             )
-        # otherwise, it is a GatorGrader check, which means that it
-        # is one of the checks that will be directly run by GatorGrader
-        else:
-            gg_args = []
-            # add description option if in data
-            description = check_data.check.get(DESCRIPTION_KEY)
-            if description is not None:
-                gg_args.extend([ARG_DESCRIPTION, str(description)])
-            # always add name of check, which should be in data
-            gg_args.append(str(check_data.check.get(CHECK_KEY)))
-            # add any additional options
-            options = check_data.check.get(OPTIONS_KEY)
-            if options is not None:
-                for option in options:
-                    # if option should be a flag (i.e., its value is the True boolean),
-                    # then add only the option without a value
-                    option_value = options[option]
-                    if isinstance(option_value, bool):
-                        if option_value:
-                            gg_args.append(f"--{option}")
-                    # otherwise, add both the option and its value
-                    else:
-                        gg_args.extend([f"--{option}", str(option_value)])
-            # add directory and file if file context in data
-            if check_data.file_context is not None:
-                # get the file and directory using os
-                dirname, filename = os.path.split(check_data.file_context)
-                if dirname == EMPTY:
-                    dirname = DEFAULT_DIRECTORY
-                gg_args.extend([ARG_DIRECTORY, dirname, ARG_FILE, filename])
-            description = check_data.check.get(DESCRIPTION_KEY, UNNAMED_CHECK)
-            # compute the check identifier using a SHA256 hash,
-            # this helps to uniquely identifier each of these
-            # checks across runs, across JSON reports, and across
-            # any of the auto-hint tracking files
-            check_id = compute_check_id(
-                description=description,
-                check_data=check_data.check,
-                file_context=check_data.file_context,
-                weight=weight,
-                outputlimit=outputlimit,
-                hint=check_data.check.get(HINT_KEY),
+            return
+        check_errors = _check_errors(entry, baseline_weight)
+        if check_errors:
+            yield _invalid_check(entry, baseline_weight, check_errors)
+            continue
+        check = _build_check(entry, baseline_weight)
+        valid_data.append(entry)
+        checks.append(check)
+        yield check
+
+
+def _iter_dependent_checks(
+    entries: Iterable[Union[CheckData, str]],
+    baseline_weight: int,
+    valid_data: List[CheckData],
+    checks: List[Union[ShellCheck, GatorGraderCheck, PytestCheck]],
+) -> Iterator[Union[ShellCheck, GatorGraderCheck, PytestCheck, InvalidCheck]]:
+    """Yield the rest of the checks once their dependencies are resolved.
+
+    Args:
+        entries: The rest of the check data, starting with the first
+            check that has depends_on.
+        baseline_weight: Default weight applied to checks that do not
+            specify an explicit weight.
+        valid_data: The data of the valid checks that were yielded.
+        checks: The valid checks that were yielded, which the rest of
+            the checks can depend on.
+
+    Yields:
+        The check of each of the rest of the check data, in order.
+
+    """
+    rest: List[Union[ShellCheck, GatorGraderCheck, PytestCheck, InvalidCheck]]
+    rest = []
+    # the positions of the valid checks of the rest among all valid checks
+    positions: Dict[int, int] = {}
+    for entry in entries:
+        if isinstance(entry, str):
+            rest.append(
+                InvalidCheck(description=INVALID_ENTRY, diagnostic=entry)
             )
-            checks.append(
-                GatorGraderCheck(
-                    gg_args=gg_args,
-                    json_info=check_data.check,
-                    weight=weight,
-                    outputlimit=outputlimit,
-                    hint=check_data.check.get(HINT_KEY),
-                    check_id=check_id,
-                )
+            continue
+        check_errors = _check_errors(entry, baseline_weight)
+        if check_errors:
+            rest.append(_invalid_check(entry, baseline_weight, check_errors))
+            continue
+        positions[len(rest)] = len(checks)
+        check = _build_check(entry, baseline_weight)
+        valid_data.append(entry)
+        checks.append(check)
+        rest.append(check)
+    errors = _resolve_dependencies(valid_data, checks)
+    for index, check in enumerate(rest):
+        position = positions.get(index)
+        if position is not None and position in errors:
+            yield _invalid_check(
+                valid_data[position], baseline_weight, errors[position]
             )
+        else:
+            yield check
+
+
+def generate_checks(
+    check_data_list: Iterable[CheckData],
+    baseline_weight: int = 1,
+) -> List[Union[ShellCheck, GatorGraderCheck, PytestCheck]]:
+    """Generate a list of checks based on check data from the configuration file.
+
+    Args:
+        check_data_list: The CheckData that each represent a check from the
+            configuration file, which may be produced lazily.
+        baseline_weight: Default weight applied to checks that do not specify
+            an explicit weight.
+
+    Returns:
+        A list of ShellChecks, PytestChecks, and GatorGraderChecks.
+
+    Raises:
+        ValueError: If any check has an invalid weight, outputlimit,
+            timeout, parallel setting, depends_on setting, or options of
+            a PytestOutcome check.
+
+    """
+    errors: List[str] = []
+    checks: List[Union[ShellCheck, GatorGraderCheck, PytestCheck]] = []
+    for check in iter_checks(check_data_list, baseline_weight):
+        if isinstance(check, InvalidCheck):
+            errors.append(check.diagnostic)
+        else:
+            checks.append(check)
+    if errors:
+        raise ValueError(NEWLINE.join(errors))
     return checks
@@ -0,0 +1,289 @@
+"""Store the compiled form of a configuration file so it is parsed only once.
+
+Parsing a large configuration file with the YAML loader and generating
+its checks gives the same result on every run until the file changes.
+The compiled form keeps the YAML documents of the file together with
+the checks that were generated from them, including their check_ids,
+under a key that is the SHA-256 of the bytes of the file, the version
+of gatorgrade, and the platform. A later run of the same file loads the
+compiled form instead of running the YAML loader at all. Since the key
+covers the exact bytes of the file, editing it always compiles it again.
+
+The compiled form is stored with pickle in the private data directory
+of the person running gatorgrade, the same place as the result cache,
+and is only ever read from there. The memo of check_ids is stored next
+to it, so that a file that was edited only computes the check_ids of
+the checks that changed when it is compiled again.
+"""
+
+import hashlib
+import os
+import pickle
+import sys
+import uuid
+from collections import namedtuple
+from pathlib import Path
+
+import platformdirs
+
+from gatorgrade.hash import (
+    CHECK_ID_VERSION,
+    memoized_check_ids,
+    remember_check_ids,
+)
+from gatorgrade.report_history import HISTORY_APPLICATION_NAME
+from gatorgrade.version import GATORGRADE_VERSION
+
+COMPILED_DIRECTORY_NAME = "compiled"
+COMPILED_FILE_SUFFIX = ".pickle"
+COMPILED_SCHEMA_VERSION = 3
+COMPILED_TEMPORARY_SUFFIX = ".tmp"
+KEY_SEPARATOR = b"\0"
+PRIVATE_DIRECTORY_MODE = 0o700
+# the file that stores the memo of check_ids, which is not a compiled
+# configuration and is thus never pruned, together with the version of
+# its layout
+CHECK_ID_MEMO_FILE_NAME = "check-ids.memo"
+CHECK_ID_MEMO_SCHEMA_VERSION = 1
+# the number of compiled configuration files kept, of which the least
+# recently used are deleted when another one is stored
+MAX_COMPILED_CONFIGS = 32
+
+# the compiled form of a configuration file: the version of its layout,
+# the YAML documents of the file, the baseline weight that its checks
+# were generated with, and the ParsedConfig with those checks
+CompiledConfig = namedtuple(
+    "CompiledConfig", ["schema", "documents", "baseline_weight", "config"]
+)
+
+
+def get_compiled_config_directory() -> Path:
+    """Return the platform-specific directory for compiled configurations."""
+    data_directory = platformdirs.user_data_dir(
+        HISTORY_APPLICATION_NAME,
+        appauthor=False,
+    )
+    return Path(data_directory) / COMPILED_DIRECTORY_NAME
+
+
+def compiled_config_key(data: bytes) -> str:
+    """Return the key of the compiled form of a configuration file.
+
+    Args:
+        data: The bytes of the configuration file.
+
+    Returns:
+        A hex digest of the bytes, the version of gatorgrade, and the
+        platform, since the checks are generated differently for each.
+
+    """
+    digest = hashlib.sha256()
+    for part in (
+        GATORGRADE_VERSION.encode(),
+        str(COMPILED_SCHEMA_VERSION).encode(),
+        sys.platform.encode(),
+    ):
+        digest.update(part)
+        digest.update(KEY_SEPARATOR)
+    digest.update(data)
+    return digest.hexdigest()
+
+
+def compiled_config_path(key: str, directory: Path | None = None) -> Path:
+    """Return the path of the file that stores a compiled configuration.
+
+    Args:
+        key: The key computed by compiled_config_key.
+        directory: The directory of compiled configurations, defaulting
+            to the platform-specific user data directory.
+
+    Returns:
+        The path of the file, which may not exist.
+
+    """
+    directory = (
+        directory if directory is not None else get_compiled_config_directory()
+    )
+    return directory / f"{key}{COMPILED_FILE_SUFFIX}"
+
+
+def load_compiled_config(
+    key: str, directory: Path | None = None
+) -> CompiledConfig | None:
+    """Load the compiled form of a configuration file, if it was stored.
+
+    Args:
+        key: The key computed by compiled_config_key.
+        directory: The directory of compiled configurations, defaulting
+            to the platform-specific user data directory.
+
+    Returns:
+        The compiled configuration, or None if it is missing, unreadable,
+        or was stored with a different layout.
+
+    """
+    path = compiled_config_path(key, directory)
+    try:
+        with path.open("rb") as file:
+            compiled = pickle.load(file)
+    # a stored file that a different version of gatorgrade wrote may fail
+    # to load in many ways, all of which mean that it must be compiled again
+    except (
+        OSError,
+        EOFError,
+        pickle.UnpicklingError,
+        AttributeError,
+        ImportError,
+        IndexError,
+        TypeError,
+        ValueError,
+    ):
+        return None
+    if not isinstance(compiled, CompiledConfig):
+        return None
+    if compiled.schema != COMPILED_SCHEMA_VERSION:
+        return None
+    # mark the entry as recently used so that pruning keeps it longest
+    try:
+        os.utime(path)
+    except OSError:
+        pass
+    return compiled
+
+
+def _prune_compiled_configs(directory: Path) -> None:
+    """Delete the least recently used compiled configurations over the limit."""
+    entries = sorted(
+        (path.stat().st_mtime, path)
+        for path in directory.iterdir()
+        if path.is_file() and path.name.endswith(COMPILED_FILE_SUFFIX)
+    )
+    for _, path in entries[:-MAX_COMPILED_CONFIGS]:
+        path.unlink(missing_ok=True)
+
+
+def _remove(path: Path) -> None:
+    """Delete a file, ignoring that it may not exist or be deletable."""
+    try:
+        path.unlink(missing_ok=True)
+    except OSError:
+        pass
+
+
+def _store(path: Path, value: object) -> Path | None:
+    """Pickle a value into a file, replacing it only once it is complete.
+
+    Args:
+        path: The path of the file, whose directory is created if needed.
+        value: The value to store.
+
+    Returns:
+        The path of the stored file, or None if it could not be stored.
+
+    """
+    # write through a temporary file so that a concurrent run never
+    # reads a partial file
+    temporary_path = path.with_name(
+        f".{path.name}.{uuid.uuid4().hex}{COMPILED_TEMPORARY_SUFFIX}"
+    )
+    try:
+        path.parent.mkdir(
+            parents=True, exist_ok=True, mode=PRIVATE_DIRECTORY_MODE
+        )
+        with temporary_path.open("wb") as file:
+            pickle.dump(value, file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temporary_path, path)
+    except (OSError, pickle.PicklingError, AttributeError, TypeError):
+        _remove(temporary_path)
+        return None
+    return path
+
+
+def save_compiled_config(
+    key: str, compiled: CompiledConfig, directory: Path | None = None
+) -> Path | None:
+    """Store the compiled form of a configuration file.
+
+    Failing to store it only means that the file is compiled again on
+    the next run, so errors are not reported.
+
+    Args:
+        key: The key computed by compiled_config_key.
+        compiled: The compiled configuration.
+        directory: The directory of compiled configurations, defaulting
+            to the platform-specific user data directory.
+
+    Returns:
+        The path of the stored file, or None if it could not be stored.
+
+    """
+    directory = (
+        directory if directory is not None else get_compiled_config_directory()
+    )
+    path = _store(compiled_config_path(key, directory), compiled)
+    if path is not None:
+        try:
+            _prune_compiled_configs(directory)
+        except OSError:
+            pass
+    return path
+
+
+def _check_id_memo_path(directory: Path | None) -> Path:
+    """Return the path of the file that stores the memo of check_ids."""
+    directory = (
+        directory if directory is not None else get_compiled_config_directory()
+    )
+    return directory / CHECK_ID_MEMO_FILE_NAME
+
+
+def load_check_id_memo(directory: Path | None = None) -> None:
+    """Add the check_ids that earlier runs memoized to the memo of this run.
+
+    A memo that is missing, unreadable, or stored with another layout or
+    another version of the scheme of check_ids is ignored.
+
+    Args:
+        directory: The directory of compiled configurations, defaulting
+            to the platform-specific user data directory.
+
+    """
+    try:
+        with _check_id_memo_path(directory).open("rb") as file:
+            stored = pickle.load(file)
+    # a damaged memo only means that the check_ids are computed again
+    except (
+        OSError,
+        EOFError,
+        pickle.UnpicklingError,
+        AttributeError,
+        ImportError,
+        IndexError,
+        TypeError,
+        ValueError,
+    ):
+        return
+    if (
+        isinstance(stored, tuple)
+        and len(stored) == 3  # noqa: PLR2004
+        and stored[:2] == (CHECK_ID_MEMO_SCHEMA_VERSION, CHECK_ID_VERSION)
+        and isinstance(stored[2], dict)
+    ):
+        remember_check_ids(stored[2])
+
+
+def save_check_id_memo(directory: Path | None = None) -> Path | None:
+    """Store the memo of check_ids of this run for later runs.
+
+    Args:
+        directory: The directory of compiled configurations, defaulting
+            to the platform-specific user data directory.
+
+    Returns:
+        The path of the stored memo, or None if it could not be stored.
+
+    """
+    return _store(
+        _check_id_memo_path(directory),
+        (CHECK_ID_MEMO_SCHEMA_VERSION, CHECK_ID_VERSION, memoized_check_ids()),
+    )
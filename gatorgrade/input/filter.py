@@ -51,14 +51,24 @@ So difflib does typo-tolerance on similar-length strings, not
 abbreviation matching. FUZZY handles abbreviation matching through
 subsequence search and handles typo-tolerance through a hand-rolled
 Levenshtein distance check — both pure Python with zero imports beyond
-the standard library (and the Levenshtein implementation imports
-nothing at all).
+the standard library.
+
+The Levenshtein distance is computed with the bit-parallel algorithm of
+Myers (1999), in the form given by Hyyrö (2001) for the distance between
+two whole strings: each column of the dynamic-programming table is kept
+as the bits of two Python integers, so a target word costs a few integer
+operations per character instead of a row of Python arithmetic. FUZZY
+matching only needs to know whether the distance is within the
+threshold, so it first compares the lengths of the words, whose
+difference is a lower bound on their distance, and stops walking the
+target word as soon as the distance can no longer fall within it.
 """
 
+import functools
 from enum import Enum
-from typing import Any, List
+from typing import Any, Dict, List
 
-from gatorgrade.input.checks import GatorGraderCheck
+from gatorgrade.input.checks import GatorGraderCheck, PytestCheck
 
 
 class FilterMode(Enum):
@@ -100,6 +110,11 @@ FUZZY_LEVENSHTEIN_RATIO = 0.4
 # so behavior is unchanged when flag is omitted
 DEFAULT_FILTER_FUZZY_THRESHOLD = FUZZY_LEVENSHTEIN_RATIO
 
+# the number of query words whose bit masks are kept for computing the
+# bit-parallel Levenshtein distance, so that each word of a query is
+# only prepared once for all of the checks that it is matched against
+PATTERN_MASK_CACHE_SIZE = 256
+
 
 def _exact_match(query: str, target: str) -> bool:
     """Return True if target equals query, case-insensitive.
@@ -157,39 +172,83 @@ def _fuzzy_subsequence(query: str, target: str) -> bool:
     return False
 
 
-def _levenshtein_distance(s1: str, s2: str) -> int:
+@functools.lru_cache(maxsize=PATTERN_MASK_CACHE_SIZE)
+def _pattern_masks(pattern: str) -> Dict[str, int]:
+    """Return the bit mask of the positions of each character in a pattern.
+
+    Args:
+        pattern: The string whose characters are mapped.
+
+    Returns:
+        For each character, an integer whose bit i is set when the
+        character is at position i of the pattern.
+
+    """
+    masks: Dict[str, int] = {}
+    for position, char in enumerate(pattern):
+        masks[char] = masks.get(char, 0) | (1 << position)
+    return masks
+
+
+def _levenshtein_distance(
+    s1: str, s2: str, max_distance: int | None = None
+) -> int:
     """Compute Levenshtein (edit) distance between two strings.
 
     The Levenshtein distance is the minimum number of single-character
     edits (insertions, deletions, or substitutions) needed to turn one
-    string into the other. Uses a classic dynamic-programming approach
-    with a single-row optimization, O(n*m) time and O(n) space.
+    string into the other. Uses the bit-parallel algorithm of Myers,
+    which keeps the vertical differences of a column of the classic
+    dynamic-programming table as the bits of two integers, taking
+    O(ceil(n/w)*m) time for a machine word of w bits.
 
     Args:
-        s1: The first string.
+        s1: The first string, whose bit masks are computed once and reused.
         s2: The second string.
+        max_distance: The largest distance of interest, if any. When the
+            distance is certain to exceed it, the computation stops.
 
     Returns:
-        The edit distance between s1 and s2.
+        The edit distance between s1 and s2, or, when max_distance is
+        given and the distance exceeds it, some value above max_distance.
 
     """
-    # ensure s2 is the shorter dimension for the O(min(m,n)) row
-    if len(s1) < len(s2):
-        s1, s2 = s2, s1
-    prev_row = list(range(len(s2) + 1))
-    for i, char1 in enumerate(s1, 1):
-        curr_row = [i]
-        for j, char2 in enumerate(s2, 1):
-            cost = 0 if char1 == char2 else 1
-            curr_row.append(
-                min(
-                    curr_row[j - 1] + 1,  # insertion
-                    prev_row[j] + 1,  # deletion
-                    prev_row[j - 1] + cost,  # substitution
-                )
-            )
-        prev_row = curr_row
-    return prev_row[-1]
+    length = len(s1)
+    remaining = len(s2)
+    # each edit changes the length by at most one, so the difference of
+    # the lengths is a lower bound on the distance
+    if max_distance is not None and abs(length - remaining) > max_distance:
+        return max_distance + 1
+    if length == 0:
+        return remaining
+    masks = _pattern_masks(s1)
+    full = (1 << length) - 1
+    last = 1 << (length - 1)
+    # the vertical differences of the first column are all +1
+    positive = full
+    negative = 0
+    score = length
+    for char in s2:
+        match = masks.get(char, 0)
+        vertical = match | negative
+        horizontal = (((match & positive) + positive) ^ positive) | match
+        up = (negative | ~(horizontal | positive)) & full
+        down = positive & horizontal
+        # the score follows the last row of the table, column by column
+        if up & last:
+            score += 1
+        elif down & last:
+            score -= 1
+        # the first row of the table grows by one in every column
+        up = ((up << 1) | 1) & full
+        down = (down << 1) & full
+        positive = (down | ~(vertical | up)) & full
+        negative = up & vertical
+        remaining -= 1
+        # each remaining column lowers the score by at most one
+        if max_distance is not None and score - remaining > max_distance:
+            return max_distance + 1
+    return score
 
 
 def _levenshtein_ratio(word_a: str, word_b: str) -> float:
@@ -214,6 +273,44 @@ def _levenshtein_ratio(word_a: str, word_b: str) -> float:
     return _levenshtein_distance(word_a.lower(), word_b.lower()) / max_len
 
 
+def _within_levenshtein_ratio(
+    word_a: str, word_b: str, fuzzy_threshold: float
+) -> bool:
+    """Return True if the normalized edit distance is within a threshold.
+
+    This gives the same result as comparing _levenshtein_ratio with the
+    threshold, but stops computing the distance as soon as it is certain
+    to be too large.
+
+    Args:
+        word_a: The first word, usually a word of the query.
+        word_b: The second word, usually a word of the target field.
+        fuzzy_threshold: Maximum normalized edit distance for a match.
+
+    Returns:
+        True if _levenshtein_ratio(word_a, word_b) <= fuzzy_threshold.
+
+    """
+    max_len = max(len(word_a), len(word_b))
+    if max_len == 0:
+        return 0.0 <= fuzzy_threshold
+    # no distance is within a threshold that is negative or not a number
+    if not fuzzy_threshold >= 0.0:
+        return False
+    lower_a = word_a.lower()
+    lower_b = word_b.lower()
+    bound = fuzzy_threshold * max_len
+    max_distance = None
+    # the distance is at most the length of the longer lowercase word,
+    # which can be longer than the word itself, so only a smaller bound
+    # can stop the computation early; one is added to it so that rounding
+    # the product never leaves out a distance that is within the threshold
+    if bound < max(len(lower_a), len(lower_b)):
+        max_distance = int(bound) + 1
+    distance = _levenshtein_distance(lower_a, lower_b, max_distance)
+    return distance / max_len <= fuzzy_threshold
+
+
 def _fuzzy_match_word(
     word: str,
     target: str,
@@ -246,7 +343,7 @@ def _fuzzy_match_word(
     # via edit distance (handles typos and differently-ending variants
     # like "checking" vs "check" which subsequence alone would miss)
     for target_word in target.split():
-        if _levenshtein_ratio(word, target_word) <= fuzzy_threshold:
+        if _within_levenshtein_ratio(word, target_word, fuzzy_threshold):
             return True
     return False
 
@@ -346,6 +443,7 @@ def _get_field_value(check: Any, field: FilterBy) -> str:  # noqa: PLR0911
     is searchable by both "ExecuteCommand" and its command text).
     ShellCheck reads from check.command (the shell command string,
     since top-level-command checks have no separate name).
+    PytestCheck combines the name of its check type with its node ID.
     For HINT, returns empty string when hint is None.
 
     Args:
@@ -366,6 +464,14 @@ def _get_field_value(check: Any, field: FilterBy) -> str:  # noqa: PLR0911
         # GatorGraderCheck
         return _ensure_str(getattr(check, "description", None))
     if field == FilterBy.NAME:
+        if isinstance(check, PytestCheck):
+            info = check.json_info
+            name = (
+                _ensure_str(info.get("check"))
+                if isinstance(info, dict)
+                else ""
+            )
+            return f"{name} {check.nodeid}".strip()
         if isinstance(check, GatorGraderCheck):
             info = check.json_info
             if isinstance(info, dict):
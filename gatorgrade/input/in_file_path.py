@@ -1,24 +1,336 @@
 """Generates a list of commands to be run through gatorgrader."""
 
+import sys
 from collections import namedtuple
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
 
 import yaml
-
-from gatorgrade.input.set_up_shell import run_setup
+from yaml.composer import Composer
+from yaml.events import SequenceEndEvent, SequenceStartEvent, StreamEndEvent
 
 # represent data for a check from the configuration file.
 # every check will have data (i.e., "check") and some may also have a "file_context",
 # which is a file path associated with the check to be used when running the check.
 CheckData = namedtuple("CheckData", ["file_context", "check"])
 
+# a malformed entry of the checks: the list indices and mapping keys that
+# lead to it in its YAML document, and what is wrong with it
+MalformedEntry = namedtuple("MalformedEntry", ["location", "message"])
+
+# the documents of a YAML file, with the data of every check in the
+# document of checks and a message for each of its malformed entries
+ParsedYaml = namedtuple("ParsedYaml", ["documents", "check_data", "malformed"])
+
 # define the default encoding
 DEFAULT_ENCODING = "utf8"
 
 # define the number of elements in YAML data that includes setup commands
 DATA_WITH_SETUP_LENGTH = 2
 
+# define the loader for configuration files, which is the much faster C
+# loader when PyYAML was built with libyaml; both loaders only build plain
+# data such as strings, lists, and timestamps, never arbitrary Python objects
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# the messages for entries of the checks that are malformed
+NEWLINE = "\n"
+PATH_SEPARATOR = "/"
+LOCATION_SEPARATOR = "/"
+MALFORMED_DOCUMENT_NAME = "checks"
+MALFORMED_ENTRY_FMT = "- Malformed entry at {}: {}"
+MALFORMED_POSITION_FMT = "- Malformed entry at line {}, column {}: {}"
+MALFORMED_LIST_MSG = "Checks must be given as a list"
+MALFORMED_ENTRY_MSG = (
+    "Entry must be a check or map a file or directory to a list of checks"
+)
+EXTRA_DOCUMENT_MSG = (
+    "A configuration file can only have front matter and a list of checks"
+)
+
+
+def parse_yaml_text(text: str) -> ParsedYaml:
+    """Parse the text of a YAML file and find the checks in its documents.
+
+    A document that is a list is composed and constructed one entry at a
+    time, and each entry is walked for checks while its YAML nodes, which
+    keep their positions in the text, are still at hand. This finds the
+    line and column of every malformed entry in the same pass that loads
+    the file, and no node outlives the entry that it belongs to.
+
+    Args:
+        text: The text of the YAML file.
+
+    Returns:
+        The documents of the file, the data of every check in the document
+        of checks, and a message for each of its malformed entries.
+
+    Raises:
+        yaml.YAMLError: If the text is not valid YAML.
+
+    """
+    loader = _entry_loader(YAML_LOADER)(text)
+    documents: List[Any] = []
+    walked: List[Tuple[List[CheckData], List[str]]] = []
+    try:
+        loader.get_event()
+        while not loader.check_event(StreamEndEvent):
+            loader.get_event()
+            # an alias can only refer to an anchor in its own document
+            loader.anchors = {}
+            if _is_entry_list(loader.peek_event()):
+                document = []
+                check_data = []
+                malformed = []
+                for found, messages in _iter_entries(loader, document):
+                    check_data.extend(found)
+                    malformed.extend(messages)
+            else:
+                node = loader.compose_node(None, None)
+                document = loader.construct_document(node)
+                check_data, malformed = _walk_checks(document, node)
+            loader.get_event()
+            documents.append(document)
+            walked.append((check_data, malformed))
+    finally:
+        loader.dispose()
+    if not documents:
+        return ParsedYaml(documents, [], [])
+    # the checks are in the second document when there is front matter
+    check_data, malformed = walked[
+        1 if len(documents) == DATA_WITH_SETUP_LENGTH else 0
+    ]
+    return ParsedYaml(documents, check_data, malformed)
+
+
+@lru_cache(maxsize=None)
+def _entry_loader(loader: type) -> type:
+    """Return a loader that can compose a document one node at a time.
+
+    The C loader composes a whole document at once, so the composer of
+    the pure-Python loader is borrowed to compose each entry of a list on
+    its own from the events that the C parser emits.
+    """
+    return type(
+        "EntryLoader",
+        (loader,),
+        {
+            "compose_node": Composer.compose_node,
+            "compose_scalar_node": Composer.compose_scalar_node,
+            "compose_sequence_node": Composer.compose_sequence_node,
+            "compose_mapping_node": Composer.compose_mapping_node,
+        },
+    )
+
+
+def _is_entry_list(event: Any) -> bool:
+    """Return whether an event starts a list that can be loaded by entry.
+
+    A list with an anchor or a tag is loaded whole, since an alias to it
+    or its tag needs the list itself.
+    """
+    return (
+        isinstance(event, SequenceStartEvent)
+        and event.anchor is None
+        and event.tag is None
+    )
+
+
+def _iter_entries(
+    loader: Any, entries: Optional[List[Any]] = None
+) -> Iterator[Tuple[List[CheckData], List[str]]]:
+    """Load a list one entry at a time, finding the checks in each entry.
+
+    Args:
+        loader: The loader, whose next event starts the list.
+        entries: The list that each entry is added to once it is loaded,
+            or None to keep no entries.
+
+    Yields:
+        The data of every check in each entry, and a message for each of
+        the entry's malformed entries.
+
+    """
+    loader.get_event()
+    index = 0
+    while not loader.check_event(SequenceEndEvent):
+        node = loader.compose_node(None, None)
+        entry = loader.construct_document(node)
+        if entries is not None:
+            entries.append(entry)
+        yield _walk_checks([entry], node, index)
+        index += 1
+    loader.get_event()
+
+
+def _walk_checks(
+    data: Any, node: yaml.Node, index: Optional[int] = None
+) -> Tuple[List[CheckData], List[str]]:
+    """Find the checks in YAML data, and the position of each malformed entry.
+
+    Args:
+        data: The list of checks, or a list with a single entry of one.
+        node: The YAML node of the list, or of its single entry.
+        index: The position of the single entry in its list, or None when
+            the data is the whole list.
+
+    Returns:
+        The data of every check, and a message for each malformed entry
+        that names its line and column when they can be found.
+
+    """
+    found: List[MalformedEntry] = []
+    check_data = list(iter_check_data(None, data, found))
+    messages = []
+    for location, message in found:
+        if index is None:
+            target = _find_node(node, location)
+            where = location
+        else:
+            target = _find_node(node, location[1:])
+            where = (index, *location[1:])
+        if target is None:
+            where = _location_name(where)
+            messages.append(MALFORMED_ENTRY_FMT.format(where, message))
+        else:
+            mark = target.start_mark
+            messages.append(
+                MALFORMED_POSITION_FMT.format(
+                    mark.line + 1, mark.column + 1, message
+                )
+            )
+    return check_data, messages
+
+
+class CheckDataStream:
+    """The checks of a YAML file, parsed one entry at a time as they are read.
+
+    The front matter is parsed as soon as the stream is created, so that
+    a run can set up before any check is parsed. Each entry of the list
+    of checks is then composed, constructed, and walked for checks only
+    once everything before it has been consumed, so the first checks can
+    run while the rest of the file is still unread. Since those checks
+    may already have run, a malformed entry, a YAML error, or a document
+    after the list of checks is yielded as a message where it is found
+    instead of stopping the stream before it starts.
+    """
+
+    def __init__(self, text: str, keep_documents: bool = False) -> None:
+        """Construct a CheckDataStream and parse the front matter of a file.
+
+        Args:
+            text: The text of the YAML file.
+            keep_documents: Whether to keep the documents of the file, so
+                that they are all in documents once the stream is consumed.
+
+        Raises:
+            yaml.YAMLError: If the front matter is not valid YAML.
+
+        """
+        self.front_matter: Dict[str, Any] = {}
+        self.documents: List[Any] = []
+        self.complete = False
+        self._keep_documents = keep_documents
+        self._loader = _entry_loader(YAML_LOADER)(text)
+        # the only document of the file, when it is not a list and has
+        # thus already been loaded while looking for the front matter
+        self._only: Optional[Tuple[Any, yaml.Node]] = None
+        self._empty = False
+        try:
+            self._read_front_matter()
+        except BaseException:
+            self._loader.dispose()
+            raise
+
+    def _read_front_matter(self) -> None:
+        """Parse up to the start of the document with the checks."""
+        loader = self._loader
+        loader.get_event()
+        if loader.check_event(StreamEndEvent):
+            self._empty = True
+            return
+        loader.get_event()
+        loader.anchors = {}
+        # a first document that is a list has the checks
+        if isinstance(loader.peek_event(), SequenceStartEvent):
+            return
+        node = loader.compose_node(None, None)
+        first = loader.construct_document(node)
+        loader.get_event()
+        if loader.check_event(StreamEndEvent):
+            self._only = (first, node)
+            return
+        if isinstance(first, dict):
+            self.front_matter = first
+        if self._keep_documents:
+            self.documents.append(first)
+        loader.get_event()
+        loader.anchors = {}
+
+    def __iter__(self) -> Iterator[Union[CheckData, str]]:
+        """Yield the data of each check, and the message of each error.
+
+        Yields:
+            The data of every check, with the file that it is nested
+            under, and a message for each malformed entry, in the order
+            that they appear in the file.
+
+        """
+        try:
+            yield from self._iter_checks()
+        except yaml.YAMLError as error:
+            yield str(error)
+        finally:
+            self._loader.dispose()
+
+    def _iter_checks(self) -> Iterator[Union[CheckData, str]]:
+        """Yield the data of each check of the document with the checks."""
+        if self._empty:
+            self.complete = True
+            return
+        if self._only is not None:
+            document, node = self._only
+            self._only = None
+            check_data, malformed = _walk_checks(document, node)
+            self._keep(document)
+            yield from check_data
+            yield from malformed
+            self.complete = not malformed
+            return
+        loader = self._loader
+        clean = True
+        if _is_entry_list(loader.peek_event()):
+            document: List[Any] = []
+            for check_data, malformed in _iter_entries(
+                loader, document if self._keep_documents else None
+            ):
+                yield from check_data
+                yield from malformed
+                clean = clean and not malformed
+        else:
+            node = loader.compose_node(None, None)
+            document = loader.construct_document(node)
+            check_data, malformed = _walk_checks(document, node)
+            yield from check_data
+            yield from malformed
+            clean = not malformed
+        self._keep(document)
+        loader.get_event()
+        if not loader.check_event(StreamEndEvent):
+            loader.get_event()
+            mark = loader.peek_event().start_mark
+            yield MALFORMED_POSITION_FMT.format(
+                mark.line + 1, mark.column + 1, EXTRA_DOCUMENT_MSG
+            )
+            return
+        self.complete = clean
+
+    def _keep(self, document: Any) -> None:
+        """Keep a document of the file, if the documents are kept."""
+        if self._keep_documents:
+            self.documents.append(document)
+
 
 def parse_yaml_file(file_path: Path) -> List[Any]:
     """Parse a YAML file and return its contents as a list of dictionaries."""
@@ -29,7 +341,7 @@ def parse_yaml_file(file_path: Path) -> List[Any]:
         with open(file_path, encoding=DEFAULT_ENCODING) as file:
             # after parsing with the yaml module, return a list
             # of all of the contents specified in the file
-            data = yaml.load_all(file, Loader=yaml.FullLoader)
+            data = yaml.load_all(file, Loader=YAML_LOADER)
             return list(data)
     # some aspect of the file does not exist
     # (i.e., wrong file or wrong directory)
@@ -38,40 +350,270 @@ def parse_yaml_file(file_path: Path) -> List[Any]:
     return []
 
 
-def reformat_yaml_data(data: List[Any]) -> List[CheckData]:
-    """Reformat the raw data from a YAML file into a list of tuples."""
-    reformatted_data: List[CheckData] = []
+def split_front_matter(data: List[Any]) -> Tuple[Dict[str, Any], List[Any]]:
+    """Separate the front matter of a parsed YAML file from its checks.
+
+    Args:
+        data: The documents of the YAML file, of which the first is the
+            front matter when there are two of them.
+
+    Returns:
+        The front matter, which is empty when the file has none, and
+        the list of checks.
+
+    Raises:
+        IndexError: If the file has no documents at all.
+
+    """
     if len(data) == DATA_WITH_SETUP_LENGTH:
-        # removes the setup commands
-        setup_commands = data.pop(0)
-        run_setup(setup_commands)
-    add_checks_to_list(None, data[0], reformatted_data)
-    return reformatted_data
+        front_matter = data[0] if isinstance(data[0], dict) else {}
+        return front_matter, data[1]
+    return {}, data[0]
 
 
-def add_checks_to_list(
+def reformat_yaml_data(data: List[Any]) -> List[CheckData]:
+    """Reformat the raw data from a YAML file into a list of tuples.
+
+    The front matter is skipped and nothing in it is run, so that a
+    configuration file can be parsed without any side effects.
+
+    Args:
+        data: The documents of the YAML file.
+
+    Returns:
+        The data of every check, with the file that it is nested under.
+
+    Raises:
+        ValueError: If any entry is neither a check nor a file or
+            directory with a list of checks, listing all such entries.
+
+    """
+    _, checks = split_front_matter(data)
+    malformed: List[MalformedEntry] = []
+    check_data = list(iter_check_data(None, checks, malformed))
+    if malformed:
+        raise ValueError(
+            NEWLINE.join(
+                MALFORMED_ENTRY_FMT.format(
+                    _location_name(entry.location), entry.message
+                )
+                for entry in malformed
+            )
+        )
+    return check_data
+
+
+def iter_check_data(
     path: Optional[str],
     data_list: List[Any],
-    reformatted_data: List[CheckData],
-) -> None:
-    """Recursively loop through the data and add checks that are found to the reformatted list."""
-    # saves the current path to keep track of the location
-    current_path = path
-    for ddict in data_list:
-        for item in ddict:
-            if isinstance(
-                ddict[item], list
-            ):  # checks if the current dictionary has another list as its value
-                if not path:
-                    path = item
+    malformed: Optional[List[MalformedEntry]] = None,
+) -> Iterator[CheckData]:
+    """Yield the data of each check as it is found in the parsed YAML data.
+
+    The nested files and directories are walked with an explicit stack
+    instead of recursion, so that no depth of nesting can exhaust the
+    stack, and the path of each file is interned, so that every check in
+    the same file shares one string for its file_context.
+
+    Args:
+        path: The path of the file that the checks are nested under, or
+            None for checks that are not nested under a file.
+        data_list: The parsed YAML list of checks and nested files.
+        malformed: The list that each malformed entry is added to before
+            it is skipped; without it, the first one raises an error.
+
+    Yields:
+        The data of every check, with the file that it is nested under,
+        in the order that the checks appear in the file.
+
+    Raises:
+        ValueError: If an entry is malformed and there is no list that
+            collects the malformed entries.
+
+    """
+    if not isinstance(data_list, list):
+        _malformed(malformed, (), MALFORMED_LIST_MSG)
+        return
+    # every frame on the stack is a list that is being walked: the path
+    # of the file that it is nested under, its location in the YAML
+    # document, and an iterator over the position and value of its entries;
+    # a location links to the location of the list that the entry is in,
+    # since it is only ever needed to report a malformed entry
+    stack: List[Tuple[Optional[str], Tuple[Any, ...], Iterator[Any]]] = [
+        (path, (), enumerate(data_list))
+    ]
+    while stack:
+        file_context, location, entries = stack[-1]
+        for index, entry in entries:
+            if not isinstance(entry, dict):
+                # the rest of an entry with several files may end in a check
+                if isinstance(entry, CheckData):
+                    yield entry
                 else:
-                    path = f"{path}/{item}"
-                # runs this same function on the list inside of a dictionary
-                add_checks_to_list(path, ddict[item], reformatted_data)
-                path = current_path
-            # adds the current check to the reformatted data list
-            else:
-                reformatted_data.append(
-                    CheckData(file_context=path, check=ddict)
+                    _malformed(
+                        malformed,
+                        (*_unlink(location), index),
+                        MALFORMED_ENTRY_MSG,
+                    )
+                continue
+            for item in entry:
+                value = entry[item]
+                # a dictionary whose first value is not a list is a check
+                if not isinstance(value, list):
+                    yield CheckData(file_context=file_context, check=entry)
+                    break
+                # the files after the first one in the same entry are
+                # walked once the checks of the first one are done
+                if len(entry) > 1:
+                    stack.append(
+                        (
+                            file_context,
+                            location,
+                            _rest_of_entry(file_context, index, entry),
+                        )
+                    )
+                names, value = _descend(item, value)
+                nested_path = PATH_SEPARATOR.join(names)
+                if file_context:
+                    nested_path = file_context + PATH_SEPARATOR + nested_path
+                stack.append(
+                    (
+                        sys.intern(nested_path),
+                        (location, index, names),
+                        enumerate(value),
+                    )
                 )
                 break
+            # walk the list that was just pushed, if any, before the rest
+            if stack[-1][2] is not entries:
+                break
+        else:
+            stack.pop()
+
+
+def _descend(item: Any, value: List[Any]) -> Tuple[List[str], List[Any]]:
+    """Walk through the directories that only hold another file or directory.
+
+    Args:
+        item: The name of a file or directory.
+        value: The list of checks, files, and directories nested under it.
+
+    Returns:
+        The names of the file or directory and of every one that was the
+        only entry of the list before it, and the list that ends them.
+
+    """
+    names = [str(item)]
+    # a generated configuration file often nests every check under a
+    # chain of directories, which is walked through at once so that the
+    # path is only joined for the file at the end of the chain
+    while len(value) == 1:
+        child = value[0]
+        if type(child) is not dict or len(child) != 1:
+            break
+        (child_item,) = child
+        child_value = child[child_item]
+        if not isinstance(child_value, list):
+            break
+        names.append(str(child_item))
+        value = child_value
+    return names, value
+
+
+def _unlink(location: Tuple[Any, ...]) -> Tuple[Any, ...]:
+    """Return the list indices and mapping keys of a linked location.
+
+    Args:
+        location: The linked location of a list of checks, which is
+            empty for the document or links to the location of the list
+            it is nested in with the position of its entry and the names
+            of the files and directories that lead to it.
+
+    Returns:
+        The list indices and mapping keys that lead to the list.
+
+    """
+    parts: List[Any] = []
+    while location:
+        location, index, names = location
+        # every name after the first was the only entry of its list
+        steps = [index, names[0]]
+        for name in names[1:]:
+            steps.extend((0, name))
+        parts[:0] = steps
+    return tuple(parts)
+
+
+def _rest_of_entry(
+    path: Optional[str], index: int, entry: Dict[Any, Any]
+) -> Iterator[Tuple[int, Any]]:
+    """Yield the files after the first one in an entry, as entries of their own.
+
+    Args:
+        path: The path of the file that the entry is nested under.
+        index: The position of the entry in its list.
+        entry: The entry, whose first value is a list of checks.
+
+    Yields:
+        The position of the entry with a dictionary for each later file
+        or directory, up to the first value that is not a list, which
+        makes the whole entry a check.
+
+    """
+    items = iter(entry.items())
+    next(items)
+    for item, value in items:
+        if not isinstance(value, list):
+            yield index, CheckData(file_context=path, check=entry)
+            return
+        yield index, {item: value}
+
+
+def _malformed(
+    malformed: Optional[List[MalformedEntry]],
+    location: Tuple[Any, ...],
+    message: str,
+) -> None:
+    """Record a malformed entry, or raise an error without a list for it."""
+    if malformed is None:
+        raise ValueError(
+            MALFORMED_ENTRY_FMT.format(_location_name(location), message)
+        )
+    malformed.append(MalformedEntry(location, message))
+
+
+def _location_name(location: Tuple[Any, ...]) -> str:
+    """Return the name of a location in a YAML document, for messages."""
+    return LOCATION_SEPARATOR.join(
+        str(part) for part in (MALFORMED_DOCUMENT_NAME, *location)
+    )
+
+
+def _find_node(
+    node: Optional[yaml.Node], location: Tuple[Any, ...]
+) -> Optional[yaml.Node]:
+    """Return the YAML node at a location, or None if it does not exist."""
+    for part in location:
+        if isinstance(node, yaml.SequenceNode) and isinstance(part, int):
+            node = node.value[part] if part < len(node.value) else None
+        elif isinstance(node, yaml.MappingNode):
+            node = next(
+                (
+                    value
+                    for key, value in node.value
+                    if str(key.value) == str(part)
+                ),
+                None,
+            )
+        else:
+            return None
+    return node
+
+
+def add_checks_to_list(
+    path: Optional[str],
+    data_list: List[Any],
+    reformatted_data: List[CheckData],
+) -> None:
+    """Loop through the data and add checks that are found to the reformatted list."""
+    reformatted_data.extend(iter_check_data(path, data_list))
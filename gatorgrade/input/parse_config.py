@@ -1,18 +1,44 @@
 """Returns the list of commands to be run through gatorgrader."""
 
 import datetime
+from collections import namedtuple
 from pathlib import Path
-from typing import Any, List, Tuple
+from typing import Any, Dict, Iterator, List, Tuple, Union
 
 import yaml
 
-from gatorgrade.input.checks import validate_positive_nonzero_int
-from gatorgrade.input.command_line_generator import generate_checks
+from gatorgrade.input.checks import (
+    GatorGraderCheck,
+    InvalidCheck,
+    PytestCheck,
+    ShellCheck,
+    validate_positive_nonzero_int,
+)
+from gatorgrade.input.command_line_generator import (
+    generate_checks,
+    iter_checks,
+)
+from gatorgrade.input.compiled_config import (
+    COMPILED_SCHEMA_VERSION,
+    CompiledConfig,
+    compiled_config_key,
+    load_check_id_memo,
+    load_compiled_config,
+    save_check_id_memo,
+    save_compiled_config,
+)
 from gatorgrade.input.in_file_path import (
     DATA_WITH_SETUP_LENGTH,
-    parse_yaml_file,
-    reformat_yaml_data,
+    DEFAULT_ENCODING,
+    NEWLINE,
+    CheckData,
+    CheckDataStream,
+    ParsedYaml,
+    parse_yaml_text,
+    split_front_matter,
 )
+from gatorgrade.input.set_up_shell import SetupPlan, plan_setup
+from gatorgrade.report_history import get_history_scope
 
 # importantly, note that the ordering of the front-matter field
 # names inside of the DUE_DATE_ALIASES tuple is important because
@@ -29,6 +55,31 @@ AUTO_HINT_MODEL_FIELD = "auto_hint_model"
 SYSTEM_PROMPT_FILE_FIELD = "system_prompt_file"
 VALIDATION_PHRASES_FILE_FIELD = "validation_phrases_file"
 
+# the parts of a configuration file, read without running anything in
+# it: the front matter, the plan of its set up commands, the data of its
+# checks, and the checks that were generated from that data
+ParsedConfig = namedtuple(
+    "ParsedConfig", ["front_matter", "setup_plan", "check_data", "checks"]
+)
+
+# the parsed documents of every configuration file read in this run,
+# keyed by resolved path: (modification time, size, parsed documents and
+# checks, error, key of the compiled form, compiled form)
+_CONFIG_DOCUMENTS: Dict[
+    Path,
+    Tuple[
+        int,
+        int,
+        ParsedYaml,
+        Exception | None,
+        str | None,
+        CompiledConfig | None,
+    ],
+] = {}
+
+# the parsed form of a configuration file that has no documents
+_EMPTY_PARSED_YAML = ParsedYaml([], [], [])
+
 # environment variable that can override the default config directory
 ENV_CONFIG_DIR = "GATORGRADE_CONFIG_DIR"
 
@@ -109,6 +160,560 @@ def resolve_config_path(
     return filename
 
 
+def _parse_due_date_value(
+    value: Any,
+) -> tuple[datetime.datetime | None, str | None]:
+    """Parse a due date value from the YAML front matter.
+
+    Supports quoted strings in ISO 8601 format, unquoted YAML datetime
+    objects, and unquoted YAML date objects. Timezone-aware datetimes
+    are converted to naive local time on computer running gatorgrade.
+
+    Args:
+        value: The raw value from the YAML front matter.
+
+    Returns:
+        A tuple of (datetime, None) on success, or (None, error_message)
+        if the value could not be parsed.
+
+    """
+    # convert the value to a datetime object, handling different
+    # types of input that are permitted in the YAML front matter
+    try:
+        # if the value is a string, parse it as an ISO 8601 datetime string
+        if isinstance(value, str):
+            dt = datetime.datetime.fromisoformat(value)
+        # if it could not be extracted as a string, it could
+        # could be a datetime object and thus can be assigned
+        elif isinstance(value, datetime.datetime):
+            dt = value
+        # otherwise, it could be handled as a date object,
+        # and could be assigned to it directly
+        elif isinstance(value, datetime.date):
+            dt = datetime.datetime.combine(value, datetime.time.min)
+        # some aspect of parsing did not work and thus
+        # the value could not be parsed, so return an error message
+        else:
+            return None, (f"Unsupported due date type: {type(value).__name__}")
+    # the value could not be parsed by any supported means,
+    # so return an error message indicating that parsing failed
+    except ValueError as e:
+        return None, f"Could not parse due date: {e}"
+    # convert timezone-aware datetimes to naive local time; note that
+    # if this conversion is not done and the creator of the gatorgrade
+    # configuration file has used a datetime with a timezone, then
+    # the program will crash if two different types of datetime
+    # objects (they are different types) are compared to each other
+    if dt.tzinfo is not None:
+        dt = dt.astimezone().replace(tzinfo=None)
+    return dt, None
+
+
+def _get_due_date_value(
+    front_matter: dict,
+) -> tuple[Any | None, str | None]:
+    """Find the due date value from the front matter, trying all aliases.
+
+    Args:
+        front_matter: The YAML front matter dictionary.
+
+    Returns:
+        A tuple of (raw_value, field_name) or (None, None) if no alias
+        is found. The first matching alias in DUE_DATE_ALIASES is used.
+
+    """
+    # search through each of the due date aliases
+    for alias in DUE_DATE_ALIASES:
+        # if one of the due date aliases is found,
+        # then extract it and the due date
+        if alias in front_matter:
+            return front_matter[alias], alias
+    # there were no due dates found inside of the
+    # front matter and thus no checking for due
+    # dates will occur and no diagnostics will appear
+    # at the end of the output to highlight project status
+    # from the perspective of the due date
+    return None, None
+
+
+def _empty_config() -> ParsedConfig:
+    """Return the parsed form of a configuration file without anything."""
+    return ParsedConfig({}, SetupPlan([], []), [], [])
+
+
+def _read_config_file(
+    file: Path, compiled: bool, stream: bool = False
+) -> Tuple[
+    Union[ParsedYaml, CheckDataStream],
+    Exception | None,
+    str | None,
+    CompiledConfig | None,
+]:
+    """Read the documents of a configuration file and its compiled form.
+
+    Args:
+        file: Path to the gatorgrade YAML configuration file.
+        compiled: Whether to load the compiled form of the file instead
+            of parsing it, when an earlier run stored it.
+        stream: Whether to only parse the front matter of the file and
+            to stream its checks, unless its compiled form was loaded.
+
+    Returns:
+        The documents of the file with the data of its checks, or the
+        stream of its checks, the error that reading or parsing it
+        raised, the key of its compiled form, and the compiled form.
+
+    """
+    try:
+        data = file.read_bytes()
+    except OSError as error:
+        return _EMPTY_PARSED_YAML, error, None, None
+    key = compiled_config_key(data)
+    if compiled:
+        compiled_config = load_compiled_config(key)
+        if compiled_config is not None:
+            parsed = ParsedYaml(
+                compiled_config.documents,
+                compiled_config.config.check_data,
+                [],
+            )
+            return parsed, None, key, compiled_config
+    try:
+        text = data.decode(DEFAULT_ENCODING)
+        if stream:
+            # the compiled form is stored from the documents of the file
+            return (
+                CheckDataStream(text, keep_documents=compiled),
+                None,
+                key,
+                None,
+            )
+        return parse_yaml_text(text), None, key, None
+    except (yaml.YAMLError, ValueError) as error:
+        return _EMPTY_PARSED_YAML, error, key, None
+
+
+class ConfigDocument:
+    """The documents of a configuration file, parsed once for a whole run.
+
+    A run reads the front matter for its due date, its name, its scope in
+    the report history, and its auto-hint settings, and then reads the
+    checks. Rather than parsing the YAML file again for every one of
+    these, the documents are parsed once and shared through a memo that
+    is keyed by the resolved path of the file, so that the file is only
+    parsed again when its modification time or its size changes. An
+    error from parsing is kept as well and raised by every accessor that
+    needs the documents, so each accessor handles it as it always did.
+
+    When the compiled form of the file was stored by an earlier run, its
+    documents and checks are loaded instead of running the YAML loader.
+    Otherwise, a run that does not need all of the checks before it
+    starts can stream them instead: only the front matter is parsed up
+    front, and each check is parsed once the run is ready for it.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        path: Path,
+        parsed: ParsedYaml | None = None,
+        error: Exception | None = None,
+        key: str | None = None,
+        compiled: CompiledConfig | None = None,
+        *,
+        store_compiled: bool = False,
+        stream: CheckDataStream | None = None,
+    ) -> None:
+        """Construct a ConfigDocument from the documents of a file.
+
+        Args:
+            path: The path of the configuration file.
+            parsed: The YAML documents of the file, with the data of its
+                checks and a message for each malformed entry.
+            error: The error that parsing the file raised, if any.
+            key: The key of the compiled form of the file, if it was read.
+            compiled: The compiled form of the file, if it was stored.
+            store_compiled: Whether to store the compiled form of the
+                file when its checks are generated.
+            stream: The stream of the checks of the file, when only its
+                front matter was parsed.
+
+        """
+        self.path = path
+        self.key = key
+        self._parsed = parsed if parsed is not None else _EMPTY_PARSED_YAML
+        self._error = error
+        self._compiled = compiled
+        self._store_compiled = store_compiled
+        self._stream = stream
+
+    @classmethod
+    def load(
+        cls, file: Path, compiled: bool = True, stream: bool = False
+    ) -> "ConfigDocument":
+        """Return the parsed documents of a file, parsing it only if needed.
+
+        Args:
+            file: Path to the gatorgrade YAML configuration file.
+            compiled: Whether to load the compiled form of the file that
+                an earlier run stored, and to store it when it is missing.
+            stream: Whether to stream the checks of the file through
+                stream_config, unless it was already parsed or compiled.
+
+        Returns:
+            The document for the file, whose parsed documents are shared
+            with every other caller until the modification time or the
+            size of the file change.
+
+        """
+        try:
+            status = file.stat()
+            resolved = file.resolve()
+        except OSError:
+            # a file that does not exist has no documents, and there
+            # is nothing to keep for when it appears
+            return cls(file)
+        stamp = (status.st_mtime_ns, status.st_size)
+        memo = _CONFIG_DOCUMENTS.get(resolved)
+        if memo is None or memo[:2] != stamp:
+            parsed, *rest = _read_config_file(file, compiled, stream)
+            # a stream can only be consumed once, so it is not shared
+            if isinstance(parsed, CheckDataStream):
+                return cls(
+                    file,
+                    None,
+                    *rest,
+                    store_compiled=compiled,
+                    stream=parsed,
+                )
+            memo = (*stamp, parsed, *rest)
+            _CONFIG_DOCUMENTS[resolved] = memo
+        _, _, parsed, error, key, compiled_config = memo
+        # the same file can be named by different paths, so each caller
+        # keeps the path that it gave, such as one relative to its cwd
+        return cls(
+            file,
+            parsed,
+            error,
+            key,
+            compiled_config if compiled else None,
+            store_compiled=compiled,
+        )
+
+    @property
+    def documents(self) -> List[Any]:
+        """Return the YAML documents of the file.
+
+        Raises:
+            yaml.YAMLError: If the file is not valid YAML.
+            OSError: If the file could not be read.
+            ValueError: If the file could not be decoded.
+
+        """
+        if self._error is not None:
+            raise self._error
+        return self._parsed.documents
+
+    @property
+    def front_matter(self) -> Dict[str, Any]:
+        """Return the front matter, which is empty when the file has none.
+
+        Raises:
+            yaml.YAMLError: If the file is not valid YAML.
+            OSError: If the file could not be read.
+            ValueError: If the file could not be decoded.
+
+        """
+        documents = self.documents
+        if self._stream is not None:
+            return self._stream.front_matter
+        if len(documents) >= DATA_WITH_SETUP_LENGTH and isinstance(
+            documents[0], dict
+        ):
+            return documents[0]
+        return {}
+
+    def _field(self, field: str) -> Any | None:
+        """Return a field of the front matter, or None if it cannot be read."""
+        try:
+            return self.front_matter.get(field, None)
+        except (yaml.YAMLError, OSError):
+            return None
+
+    def get_project_name(self) -> str | None:
+        """Return the project name of the front matter, if there is one."""
+        return self._field(NAME_FIELD)
+
+    def get_auto_hint_model(self) -> str | None:
+        """Return the auto-hint model of the front matter, if there is one."""
+        return self._field(AUTO_HINT_MODEL_FIELD)
+
+    def get_system_prompt_file(self) -> str | None:
+        """Return the system prompt filename of the front matter, if any."""
+        return self._field(SYSTEM_PROMPT_FILE_FIELD)
+
+    def get_validation_phrases_file(self) -> str | None:
+        """Return the validation phrases filename of the front matter, if any."""
+        return self._field(VALIDATION_PHRASES_FILE_FIELD)
+
+    def get_history_scope(self) -> str:
+        """Return the scope of the file and its project in the report history."""
+        return get_history_scope(self.path, self.get_project_name())
+
+    def get_due_date_aliases_present(self) -> list[str]:
+        """Return all due date alias field names found in the front matter."""
+        try:
+            front_matter = self.front_matter
+        except (yaml.YAMLError, OSError):
+            return []
+        return [alias for alias in DUE_DATE_ALIASES if alias in front_matter]
+
+    def has_due_date_field(self) -> bool:
+        """Return whether the front matter contains a due date field."""
+        return bool(self.get_due_date_aliases_present())
+
+    def get_due_date(self) -> tuple[datetime.datetime | None, str | None]:
+        """Return the due date of the front matter, or why it is not valid."""
+        try:
+            value, alias = _get_due_date_value(self.front_matter)
+        # report the error(s) that occurred when parsing the YAML file
+        except yaml.YAMLError as e:
+            return None, f"Could not parse YAML front matter: {e}"
+        except OSError as e:
+            return None, f"Could not read configuration file: {e}"
+        if value is None:
+            return None, None
+        due_date, parse_error = _parse_due_date_value(value)
+        if parse_error:
+            return None, f"Invalid value for '{alias}': {parse_error}"
+        return due_date, None
+
+    def _argument_error(self, baseline_weight: int) -> str | None:
+        """Return why the checks of the file cannot be generated, if so."""
+        # validate the baseline_weight so that it is a positive integer;
+        # note that this is already checked by the validation of the
+        # command-line arguments provided by the person using the program;
+        # however, adding the check here in case this function is called
+        # directly without going through the command-line argument validation
+        error = validate_positive_nonzero_int(
+            baseline_weight, BASELINE_WEIGHT_FIELD
+        )
+        # the baseline weight was not valid and thus this function
+        # should return early with an error message
+        if error:
+            return error
+        # check that the path is a file, not a directory, so that
+        # accidental use of --config .gatorgrade instead of
+        # --config gatorgrade.yml gives a clear error message; this
+        # is critical because you cannot read a directory as a file
+        # as doing so will crash the program and display a stack trace
+        if self.path.is_dir():
+            return f"The path {self.path} is a directory, not a file."
+        return None
+
+    def stream_config(
+        self, baseline_weight: int = 1, keep_check_data: bool = False
+    ) -> Tuple[ParsedConfig, str | None]:
+        """Generate the checks of the file as they are needed, running nothing.
+
+        The checks of a streamed file are parsed and generated one at a
+        time as the returned iterator is consumed, and an entry with a
+        configuration error becomes an InvalidCheck that reports it. The
+        check data of a streamed file is only kept in the config once
+        the iterator is consumed, and only when it is asked for or the
+        compiled form of the file is stored. A file that was not streamed,
+        such as one loaded from its compiled form, gives the list of its
+        checks, so that their number is known before they run.
+
+        Args:
+            baseline_weight: Default weight for checks that do not specify one
+            keep_check_data: Whether to keep the data of every check.
+
+        Returns:
+            Returns a tuple of (config, error_message), as load_config
+            does, except that the checks of a streamed file are an
+            iterator.
+
+        """
+        if self._stream is None:
+            return self.load_config(baseline_weight)
+        error = self._argument_error(baseline_weight)
+        if error:
+            return _empty_config(), error
+        try:
+            front_matter = self.front_matter
+            setup_plan = plan_setup(front_matter)
+        except (yaml.YAMLError, ValueError, TypeError, OSError) as error:
+            return _empty_config(), str(error)
+        check_data: List[CheckData] | None = (
+            [] if keep_check_data or self._store_compiled else None
+        )
+        config = ParsedConfig(
+            front_matter,
+            setup_plan,
+            check_data,
+            self._stream_checks(baseline_weight, check_data),
+        )
+        return config, None
+
+    def _stream_checks(
+        self, baseline_weight: int, check_data: List[CheckData] | None
+    ) -> Iterator[
+        Union[ShellCheck, GatorGraderCheck, PytestCheck, InvalidCheck]
+    ]:
+        """Yield the checks of a streamed file, storing its compiled form.
+
+        Args:
+            baseline_weight: Default weight for checks that do not specify one
+            check_data: The list that the data of every check is added
+                to, or None to keep no check data.
+
+        Yields:
+            The check of every entry of the file, in order.
+
+        """
+        stream = self._stream
+        if stream is None:
+            return
+        store = self._store_compiled and self.key is not None
+        if store:
+            load_check_id_memo()
+
+        def entries() -> Iterator[Union[CheckData, str]]:
+            """Yield the entries of the stream, keeping their check data."""
+            for entry in stream:
+                if check_data is not None and isinstance(entry, CheckData):
+                    check_data.append(entry)
+                yield entry
+
+        checks: List[Union[ShellCheck, GatorGraderCheck, PytestCheck]] = []
+        valid = True
+        for check in iter_checks(entries(), baseline_weight):
+            if isinstance(check, InvalidCheck):
+                valid = False
+            elif store:
+                checks.append(check)
+            yield check
+        # a file with any error is parsed again by the next run, which
+        # then reports the error again
+        if store and valid and stream.complete:
+            front_matter = stream.front_matter
+            save_compiled_config(
+                str(self.key),
+                CompiledConfig(
+                    COMPILED_SCHEMA_VERSION,
+                    stream.documents,
+                    baseline_weight,
+                    ParsedConfig(
+                        front_matter,
+                        plan_setup(front_matter),
+                        check_data,
+                        checks,
+                    ),
+                ),
+            )
+            save_check_id_memo()
+
+    def _collect_stream(
+        self, baseline_weight: int
+    ) -> Tuple[ParsedConfig, str | None]:
+        """Generate all of the checks of a streamed file at once.
+
+        Args:
+            baseline_weight: Default weight for checks that do not specify one
+
+        Returns:
+            Returns a tuple of (config, error_message), as load_config
+            does, with an error when any of the checks is not valid.
+
+        """
+        config, error = self.stream_config(
+            baseline_weight, keep_check_data=True
+        )
+        if error:
+            return config, error
+        checks = list(config.checks)
+        errors = [
+            check.diagnostic
+            for check in checks
+            if isinstance(check, InvalidCheck)
+        ]
+        if errors:
+            return _empty_config(), NEWLINE.join(errors)
+        return config._replace(checks=checks), None
+
+    def load_config(
+        self, baseline_weight: int = 1
+    ) -> Tuple[ParsedConfig, str | None]:
+        """Generate the checks of the file, running nothing.
+
+        Args:
+            baseline_weight: Default weight for checks that do not specify one
+
+        Returns:
+            Returns a tuple of (config, error_message), as load_config does.
+
+        """
+        error = self._argument_error(baseline_weight)
+        if error:
+            return _empty_config(), error
+        if self._stream is not None:
+            return self._collect_stream(baseline_weight)
+        # the compiled form of the file already has the checks, as long
+        # as they were generated with the same baseline weight
+        if (
+            self._compiled is not None
+            and self._compiled.baseline_weight == baseline_weight
+        ):
+            return self._compiled.config, None
+        try:
+            parsed_yaml_file = self.documents
+            # the parsed YAML file contains some contents in a list and thus
+            # the tool should generate a GatorGrader check for each element in list
+            if len(parsed_yaml_file) > 0:
+                front_matter, _ = split_front_matter(parsed_yaml_file)
+                setup_plan = plan_setup(front_matter)
+                # the malformed entries were found, with their positions,
+                # while the file was parsed
+                if self._parsed.malformed:
+                    raise ValueError(NEWLINE.join(self._parsed.malformed))
+                check_data = self._parsed.check_data
+                # reuse the check_ids that earlier runs computed, so that
+                # editing one check of a large file hashes only that check
+                if self._store_compiled:
+                    load_check_id_memo()
+                # use the check data to generate all of the checks;
+                # these will be valid checks that are now
+                # ready for execution with this tool
+                checks = generate_checks(check_data, baseline_weight)
+                config = ParsedConfig(
+                    front_matter, setup_plan, check_data, checks
+                )
+                if self._store_compiled and self.key is not None:
+                    save_compiled_config(
+                        self.key,
+                        CompiledConfig(
+                            COMPILED_SCHEMA_VERSION,
+                            parsed_yaml_file,
+                            baseline_weight,
+                            config,
+                        ),
+                    )
+                    save_check_id_memo()
+                return config, None
+            # return an empty configuration because of the fact that the
+            # parsing process did not return a list with content;
+            # allow the calling function to handle the empty list
+            return _empty_config(), None
+        except (
+            yaml.YAMLError,
+            ValueError,
+            TypeError,
+            IndexError,
+            IsADirectoryError,
+        ) as error:
+            return _empty_config(), str(error)
+
+
 def get_project_name(file: Path) -> str | None:
     """Extract the optional project name from a gatorgrade YAML config file.
 
@@ -127,15 +732,7 @@ def get_project_name(file: Path) -> str | None:
         The project name string if specified, or None if not present.
 
     """
-    try:
-        parsed_yaml_file = parse_yaml_file(file)
-        if len(parsed_yaml_file) >= DATA_WITH_SETUP_LENGTH and isinstance(
-            parsed_yaml_file[0], dict
-        ):
-            return parsed_yaml_file[0].get(NAME_FIELD, None)
-    except (yaml.YAMLError, OSError):
-        pass
-    return None
+    return ConfigDocument.load(file).get_project_name()
 
 
 def get_auto_hint_model(file: Path) -> str | None:
@@ -156,15 +753,7 @@ def get_auto_hint_model(file: Path) -> str | None:
         The model spec string if specified, or None if not present.
 
     """
-    try:
-        parsed_yaml_file = parse_yaml_file(file)
-        if len(parsed_yaml_file) >= DATA_WITH_SETUP_LENGTH and isinstance(
-            parsed_yaml_file[0], dict
-        ):
-            return parsed_yaml_file[0].get(AUTO_HINT_MODEL_FIELD, None)
-    except (yaml.YAMLError, OSError):
-        pass
-    return None
+    return ConfigDocument.load(file).get_auto_hint_model()
 
 
 def get_system_prompt_file(file: Path) -> str | None:
@@ -190,15 +779,7 @@ def get_system_prompt_file(file: Path) -> str | None:
         not present.
 
     """
-    try:
-        parsed_yaml_file = parse_yaml_file(file)
-        if len(parsed_yaml_file) >= DATA_WITH_SETUP_LENGTH and isinstance(
-            parsed_yaml_file[0], dict
-        ):
-            return parsed_yaml_file[0].get(SYSTEM_PROMPT_FILE_FIELD, None)
-    except (yaml.YAMLError, OSError):
-        pass
-    return None
+    return ConfigDocument.load(file).get_system_prompt_file()
 
 
 def get_validation_phrases_file(file: Path) -> str | None:
@@ -224,91 +805,7 @@ def get_validation_phrases_file(file: Path) -> str | None:
         None if not present.
 
     """
-    try:
-        parsed_yaml_file = parse_yaml_file(file)
-        if len(parsed_yaml_file) >= DATA_WITH_SETUP_LENGTH and isinstance(
-            parsed_yaml_file[0], dict
-        ):
-            return parsed_yaml_file[0].get(VALIDATION_PHRASES_FILE_FIELD, None)
-    except (yaml.YAMLError, OSError):
-        pass
-    return None
-
-
-def _parse_due_date_value(
-    value: Any,
-) -> tuple[datetime.datetime | None, str | None]:
-    """Parse a due date value from the YAML front matter.
-
-    Supports quoted strings in ISO 8601 format, unquoted YAML datetime
-    objects, and unquoted YAML date objects. Timezone-aware datetimes
-    are converted to naive local time on computer running gatorgrade.
-
-    Args:
-        value: The raw value from the YAML front matter.
-
-    Returns:
-        A tuple of (datetime, None) on success, or (None, error_message)
-        if the value could not be parsed.
-
-    """
-    # convert the value to a datetime object, handling different
-    # types of input that are permitted in the YAML front matter
-    try:
-        # if the value is a string, parse it as an ISO 8601 datetime string
-        if isinstance(value, str):
-            dt = datetime.datetime.fromisoformat(value)
-        # if it could not be extracted as a string, it could
-        # could be a datetime object and thus can be assigned
-        elif isinstance(value, datetime.datetime):
-            dt = value
-        # otherwise, it could be handled as a date object,
-        # and could be assigned to it directly
-        elif isinstance(value, datetime.date):
-            dt = datetime.datetime.combine(value, datetime.time.min)
-        # some aspect of parsing did not work and thus
-        # the value could not be parsed, so return an error message
-        else:
-            return None, (f"Unsupported due date type: {type(value).__name__}")
-    # the value could not be parsed by any supported means,
-    # so return an error message indicating that parsing failed
-    except ValueError as e:
-        return None, f"Could not parse due date: {e}"
-    # convert timezone-aware datetimes to naive local time; note that
-    # if this conversion is not done and the creator of the gatorgrade
-    # configuration file has used a datetime with a timezone, then
-    # the program will crash if two different types of datetime
-    # objects (they are different types) are compared to each other
-    if dt.tzinfo is not None:
-        dt = dt.astimezone().replace(tzinfo=None)
-    return dt, None
-
-
-def _get_due_date_value(
-    front_matter: dict,
-) -> tuple[Any | None, str | None]:
-    """Find the due date value from the front matter, trying all aliases.
-
-    Args:
-        front_matter: The YAML front matter dictionary.
-
-    Returns:
-        A tuple of (raw_value, field_name) or (None, None) if no alias
-        is found. The first matching alias in DUE_DATE_ALIASES is used.
-
-    """
-    # search through each of the due date aliases
-    for alias in DUE_DATE_ALIASES:
-        # if one of the due date aliases is found,
-        # then extract it and the due date
-        if alias in front_matter:
-            return front_matter[alias], alias
-    # there were no due dates found inside of the
-    # front matter and thus no checking for due
-    # dates will occur and no diagnostics will appear
-    # at the end of the output to highlight project status
-    # from the perspective of the due date
-    return None, None
+    return ConfigDocument.load(file).get_validation_phrases_file()
 
 
 def get_due_date_aliases_present(file: Path) -> list[str]:
@@ -322,27 +819,7 @@ def get_due_date_aliases_present(file: Path) -> list[str]:
         empty list if none are present in the front matter of the YAML file.
 
     """
-    result: list[str] = []
-    try:
-        # parse the YAML file using parse_yaml_file provided by gatorgrade
-        parsed_yaml_file = parse_yaml_file(file)
-        # if there were no due dates, then return the
-        # empty result list, meaning that no due date
-        # display and details will appear in the output
-        if not (
-            len(parsed_yaml_file) >= DATA_WITH_SETUP_LENGTH
-            and isinstance(parsed_yaml_file[0], dict)
-        ):
-            return result
-        # check for each of the due date aliases and add them to the result list
-        for alias in DUE_DATE_ALIASES:
-            if alias in parsed_yaml_file[0]:
-                result.append(alias)
-        return result
-    # if there was a parsing exception, then return the
-    # current state of the list, which should be empty
-    except (yaml.YAMLError, OSError):
-        return result
+    return ConfigDocument.load(file).get_due_date_aliases_present()
 
 
 def get_due_date(
@@ -376,28 +853,7 @@ def get_due_date(
         parse failure, or (None, None) if no due date is present.
 
     """
-    # try to parse the YAML file and extract the due date from
-    # the YAML front matter; this assumes that the date must be
-    # in the standard ISO 8601 format for specifying dates
-    try:
-        parsed_yaml_file = parse_yaml_file(file)
-        if not (
-            len(parsed_yaml_file) >= DATA_WITH_SETUP_LENGTH
-            and isinstance(parsed_yaml_file[0], dict)
-        ):
-            return None, None
-        value, alias = _get_due_date_value(parsed_yaml_file[0])
-        if value is None:
-            return None, None
-        due_date, parse_error = _parse_due_date_value(value)
-        if parse_error:
-            return None, f"Invalid value for '{alias}': {parse_error}"
-        return due_date, None
-    # report the error(s) that occurred when parsing the YAML file
-    except yaml.YAMLError as e:
-        return None, f"Could not parse YAML front matter: {e}"
-    except OSError as e:
-        return None, f"Could not read configuration file: {e}"
+    return ConfigDocument.load(file).get_due_date()
 
 
 def has_due_date_field(file: Path) -> bool:
@@ -412,18 +868,29 @@ def has_due_date_field(file: Path) -> bool:
         True if any due date alias is present, False otherwise.
 
     """
-    # determine whether or not there is any type of due
-    # date inside of the front matter of the YAML file
-    try:
-        parsed_yaml_file = parse_yaml_file(file)
-        if not (
-            len(parsed_yaml_file) >= DATA_WITH_SETUP_LENGTH
-            and isinstance(parsed_yaml_file[0], dict)
-        ):
-            return False
-        return any(alias in parsed_yaml_file[0] for alias in DUE_DATE_ALIASES)
-    except (yaml.YAMLError, OSError):
-        return False
+    return ConfigDocument.load(file).has_due_date_field()
+
+
+def load_config(
+    file: Path, baseline_weight: int = 1
+) -> Tuple[ParsedConfig, str | None]:
+    """Parse the input YAML file and generate its checks, running nothing.
+
+    Parsing never runs the set up commands of the front matter; it only
+    checks them and returns them as a plan, so that a configuration can
+    be parsed, checked, and filtered without installing anything.
+
+    Args:
+        file: YAML file containing gatorgrade and shell command checks
+        baseline_weight: Default weight for checks that do not specify one
+    Returns:
+        Returns a tuple of (config, error_message). When successful,
+        config contains the front matter, the set up plan, the check data,
+        and the checks, and error_message is None. On failure, config is
+        empty and error_message contains details.
+
+    """
+    return ConfigDocument.load(file).load_config(baseline_weight)
 
 
 def parse_config(
@@ -440,48 +907,5 @@ def parse_config(
         On failure, checks is empty and error_message contains details.
 
     """
-    # validate the baseline_weight so that it is a positive integer;
-    # note that this is already checked by the validation of the
-    # command-line arguments provided by the person using the program;
-    # however, adding the check here in case this function is called
-    # directly without going through the command-line argument validation
-    error = validate_positive_nonzero_int(
-        baseline_weight, BASELINE_WEIGHT_FIELD
-    )
-    # the baseline weight was not valid and thus this function
-    # should return early with an error message
-    if error:
-        return [], error
-    # check that the path is a file, not a directory, so that
-    # accidental use of --config .gatorgrade instead of
-    # --config gatorgrade.yml gives a clear error message; this
-    # is critical because you cannot read a directory as a file
-    # as doing so will crash the program and display a stack trace
-    if file.is_dir():
-        return [], f"The path {file} is a directory, not a file."
-    try:
-        # parse the YAML file using parse_yaml_file provided by gatorgrade
-        parsed_yaml_file = parse_yaml_file(file)
-        # the parsed YAML file contains some contents in a list and thus
-        # the tool should generate a GatorGrader check for each element in list
-        if len(parsed_yaml_file) > 0:
-            # after reformatting the parse YAML file,
-            # use it to generate all of the checks;
-            # these will be valid checks that are now
-            # ready for execution with this tool
-            parse_con = generate_checks(
-                reformat_yaml_data(parsed_yaml_file), baseline_weight
-            )
-            return parse_con, None
-        # return an empty list because of the fact that the
-        # parsing process did not return a list with content;
-        # allow the calling function to handle the empty list
-        return [], None
-    except (
-        yaml.YAMLError,
-        ValueError,
-        TypeError,
-        IndexError,
-        IsADirectoryError,
-    ) as error:
-        return [], str(error)
+    config, error = load_config(file, baseline_weight)
+    return config.checks, error
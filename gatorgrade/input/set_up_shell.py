@@ -1,13 +1,39 @@
-"""Set-up the shell commands."""
+"""Set-up the shell commands.
 
+The output of every set up command is streamed to the console while
+the command runs, and only a bounded tail of it is kept in memory for
+the message that explains a failure. The setup may be a multi-line
+string, whose lines run one after another, or a list whose entries are
+commands or groups of commands; the commands of a group that declares
+itself parallel run at the same time, with every line of their output
+labelled by the command that wrote it.
+"""
+
+import codecs
+import os
 import subprocess
 import sys
-from typing import Any, Dict
+import threading
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import IO, Any, Dict, List, Tuple
 
 import rich
 import typer
 from rich.rule import Rule
 
+from gatorgrade.input.checks import validate_bool, validate_str_list
+from gatorgrade.input.setup_stamp import (
+    SetupStep,
+    load_setup_stamp,
+    plan_setup_steps,
+    save_setup_stamp,
+    setup_inputs_fingerprint,
+)
+from gatorgrade.output.capture import BoundedCapture
+from gatorgrade.output.executor import NEW_PROCESS_GROUP, kill_process_group
+
 # define the exit codes for the individual
 # and overall setup commands
 EXIT_FAILURE = 1
@@ -15,64 +41,434 @@ EXIT_SUCCESS = 0
 
 # define constants used in setup command execution
 SETUP_KEY = "setup"
+SETUP_INPUTS_KEY = "setup_inputs"
+COMMANDS_KEY = "commands"
+PARALLEL_KEY = "parallel"
 SETUP_RULE_TITLE = "Running Set Up Command(s)"
+SETUP_FAILURE_RULE_TITLE = "Set Up Command Output"
 GREEN_STYLE = "green"
 BRIGHT_RED_STYLE = "bright_red"
 TIMEOUT_SECONDS = 300
 SETUP_DONE_MSG = "Finished!\n"
 SETUP_FAILURE_FMT = 'The set up command "{}" failed.\nExiting GatorGrade.'
+SETUP_TIMEOUT_FMT = 'The set up command "{}" timed out after {} second(s).\nExiting GatorGrade.'
+NEWLINE = "\n"
+NEWLINE_BYTE = b"\n"
+SETUP_ERROR_FMT = "- Configuration error in front matter: {}"
+SETUP_FORM_ERROR_FMT = (
+    "Setup must be a string of commands or a list of commands and"
+    " groups of commands, got {}"
+)
+SETUP_GROUP_ERROR_FMT = (
+    "A group of set up commands must be a mapping with commands and an"
+    " optional parallel, got {}"
+)
+SETUP_RUNNING_FMT = 'Running "{}" because {}.'
+SETUP_SKIPPED_FMT = 'Skipped "{}" because {}.'
+SETUP_SKIPPED_COUNT_FMT = (
+    "Skipped {} unchanged set up command(s); use --force-setup to run them."
+)
 
+# the label in front of every line of output of a command that runs at
+# the same time as other set up commands
+PARALLEL_LABEL_FMT = "[{}] "
 
-def run_setup(front_matter: Dict[str, Any]) -> None:
-    """Run the shell set up commands and exit the program if a command fails.
+# the number of bytes read from the output of a command at once, and
+# the number of bytes and lines from its end kept to explain a failure
+READ_CHUNK_BYTES = 64 * 1024
+SETUP_TAIL_BYTES = 64 * 1024
+SETUP_TAIL_LINES = 40
+
+# the commands of one entry of the setup and whether they run at the
+# same time or one after another
+SetupGroup = namedtuple("SetupGroup", ["commands", "parallel"])
+
+# the set up of a configuration file, read without running anything:
+# its groups of commands, in order, and the glob patterns of its inputs
+SetupPlan = namedtuple("SetupPlan", ["groups", "inputs"])
+
+# commands that run at the same time take turns writing to the console
+OUTPUT_LOCK = threading.Lock()
+
+
+class SetupOutput:
+    """Stream the output of one set up command and keep its tail."""
+
+    def __init__(self, label: str | None = None) -> None:
+        """Construct a SetupOutput that has not received any output.
+
+        Args:
+            label: The label to write in front of every line of output,
+                or None to stream the output exactly as it was written.
+
+        """
+        self.capture = BoundedCapture(
+            head_bytes=0, tail_bytes=SETUP_TAIL_BYTES
+        )
+        self._label = label
+        self._decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        # the start of a labelled line whose end has not been read yet
+        self._partial = b""
+
+    def _echo(self, text: str) -> None:
+        """Write text to the console without mixing it with other output."""
+        if text:
+            with OUTPUT_LOCK:
+                sys.stdout.write(text)
+                sys.stdout.flush()
+
+    def write(self, data: bytes) -> None:
+        """Stream a chunk of output to the console and keep its tail.
+
+        Args:
+            data: The chunk of output that the command wrote.
+
+        """
+        self.capture.write(data)
+        if self._label is None:
+            self._echo(self._decoder.decode(data))
+            return
+        # only whole lines are labelled, unless a line grows too long
+        lines = (self._partial + data).split(NEWLINE_BYTE)
+        self._partial = lines.pop()
+        if len(self._partial) > READ_CHUNK_BYTES:
+            lines.append(self._partial)
+            self._partial = b""
+        self._echo(
+            "".join(
+                self._label + line.decode(errors="replace") + NEWLINE
+                for line in lines
+            )
+        )
+
+    def read_from(self, stream: IO[bytes]) -> None:
+        """Stream all of the output of a command until it closes.
+
+        Args:
+            stream: The pipe that carries the output of the command.
+
+        """
+        with stream:
+            for chunk in iter(lambda: stream.read1(READ_CHUNK_BYTES), b""):
+                self.write(chunk)
+        if self._label is None:
+            self._echo(self._decoder.decode(b"", final=True))
+        elif self._partial:
+            self.write(NEWLINE_BYTE)
+        self.capture.close()
+
+    def tail(self) -> str:
+        """Return the last lines of the output that the command wrote."""
+        text = self.capture.getvalue().decode(errors="replace")
+        return NEWLINE.join(text.splitlines()[-SETUP_TAIL_LINES:])
+
+
+def _run_setup_command(
+    command: str, timeout: int, label: str | None = None
+) -> Tuple[int | None, str]:
+    """Run one set up command in its own process group, streaming its output.
 
     Args:
-        front_matter: A dictionary whose 'setup' key contains the set up commands
-        as a multi-line string.
+        command: The command to run in the shell.
+        timeout: The maximum number of seconds that the command may run.
+        label: The label to write in front of every line of its output,
+            or None to stream the output exactly as it was written.
+
+    Returns:
+        The exit code of the command, or None if it timed out and was
+        killed along with every process that it started, and the last
+        lines of its output.
+
+    """
+    process = subprocess.Popen(
+        command,
+        shell=True,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        **NEW_PROCESS_GROUP,
+    )
+    output = SetupOutput(label)
+    reader = threading.Thread(
+        target=output.read_from, args=(process.stdout,), daemon=True
+    )
+    reader.start()
+    try:
+        returncode: int | None = process.wait(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        kill_process_group(process.pid)
+        process.kill()
+        process.wait()
+        returncode = None
+    # the output ends once every process that could write to it is gone
+    reader.join()
+    return returncode, output.tail()
+
+
+def _setup_inputs(front_matter: Dict[str, Any]) -> list[str]:
+    """Return the glob patterns of the files that the set up installs from.
+
+    Args:
+        front_matter: The front matter of the configuration file.
+
+    Returns:
+        The setup_inputs patterns, which are empty when none are given.
+
+    Raises:
+        ValueError: If setup_inputs is not a string or a list of strings.
+
+    """
+    patterns = front_matter.get(SETUP_INPUTS_KEY)
+    if patterns is None:
+        return []
+    error = validate_str_list(patterns, SETUP_INPUTS_KEY)
+    if error:
+        raise ValueError(SETUP_ERROR_FMT.format(error))
+    return [patterns] if isinstance(patterns, str) else patterns
+
+
+def _command_lines(commands: str | List[str]) -> List[str]:
+    """Return the commands of a multi-line string or of a list, stripped."""
+    if isinstance(commands, str):
+        return [line.strip() for line in commands.splitlines()]
+    return [command.strip() for command in commands]
+
+
+def _setup_groups(setup: Any) -> List[SetupGroup]:
+    """Split the setup of the front matter into groups of commands.
+
+    Args:
+        setup: The setup of the front matter: a multi-line string of
+            commands, or a list of commands and of mappings with a list
+            of commands and whether they may run in parallel.
+
+    Returns:
+        The groups of commands, in the order that they run.
+
+    Raises:
+        ValueError: If the setup does not have one of these forms.
+
+    """
+    if isinstance(setup, str):
+        return [SetupGroup(_command_lines(setup), False)]
+    if not isinstance(setup, list):
+        raise ValueError(
+            SETUP_ERROR_FMT.format(SETUP_FORM_ERROR_FMT.format(setup))
+        )
+    groups = []
+    for entry in setup:
+        if isinstance(entry, str):
+            groups.append(SetupGroup(_command_lines(entry), False))
+            continue
+        if not isinstance(entry, dict) or COMMANDS_KEY not in entry:
+            raise ValueError(
+                SETUP_ERROR_FMT.format(SETUP_GROUP_ERROR_FMT.format(entry))
+            )
+        parallel = entry.get(PARALLEL_KEY, False)
+        error = validate_str_list(entry[COMMANDS_KEY], COMMANDS_KEY) or (
+            validate_bool(parallel, PARALLEL_KEY)
+        )
+        if error:
+            raise ValueError(SETUP_ERROR_FMT.format(error))
+        groups.append(
+            SetupGroup(_command_lines(entry[COMMANDS_KEY]), parallel)
+        )
+    return groups
+
+
+def _run_setup_group(
+    steps: List[SetupStep], parallel: bool, timeout: int
+) -> List[Tuple[int | None, str]]:
+    """Run the set up commands of one group that have to run.
+
+    Args:
+        steps: The steps of the group that have to run.
+        parallel: Whether the commands run at the same time.
+        timeout: The maximum number of seconds that each command may run.
+
+    Returns:
+        The exit code and the tail of the output of each command that
+        ran, in order. The commands of a group that is not parallel stop
+        at the first one that fails.
+
+    """
+    if parallel and len(steps) > 1:
+        with ThreadPoolExecutor(max_workers=len(steps)) as executor:
+            return list(
+                executor.map(
+                    lambda step: _run_setup_command(
+                        step.command,
+                        timeout,
+                        PARALLEL_LABEL_FMT.format(step.command),
+                    ),
+                    steps,
+                )
+            )
+    results = []
+    for step in steps:
+        results.append(_run_setup_command(step.command, timeout))
+        if results[-1][0] != EXIT_SUCCESS:
+            break
+    return results
+
+
+def _print_setup_failure(message: str, tail: str) -> None:
+    """Print the end of the output of a failed command and exit."""
+    rich.print()
+    rich.print(Rule(SETUP_FAILURE_RULE_TITLE, style=BRIGHT_RED_STYLE))
+    rich.print()
+    if tail:
+        sys.stdout.write(tail + NEWLINE)
+    rich.print(f"[red]{message}[/red]")
+    rich.print()
+    rich.print(Rule(style=BRIGHT_RED_STYLE))
+    raise typer.Exit(EXIT_FAILURE)
+
+
+def plan_setup(front_matter: Dict[str, Any]) -> SetupPlan:
+    """Read and check the set up of the front matter without running it.
+
+    Args:
+        front_matter: The front matter of the configuration file.
+
+    Returns:
+        The set up plan, which has no groups when there is no set up.
+
+    Raises:
+        ValueError: If the setup or setup_inputs do not have a valid form.
 
     """
-    # if setup exists in the front matter
     setup = front_matter.get(SETUP_KEY)
-    if setup:
-        # run commands first, capturing all output and tracking the first failure
-        failure_command = None
-        captured_output = ""
-        for line in setup.splitlines():
-            command = line.strip()
-            proc = subprocess.run(
-                command,
-                shell=True,
-                check=False,
-                timeout=TIMEOUT_SECONDS,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
+    if not setup:
+        return SetupPlan([], [])
+    return SetupPlan(_setup_groups(setup), _setup_inputs(front_matter))
+
+
+def run_setup(
+    front_matter: Dict[str, Any],
+    timeout: int = TIMEOUT_SECONDS,
+    force: bool = False,
+    verbose: bool = False,
+    stamp_directory: Path | None = None,
+) -> None:
+    """Run the shell set up commands and exit the program if a command fails.
+
+    Args:
+        front_matter: A dictionary whose 'setup' key contains the set up commands,
+        as a multi-line string or as a list of commands and groups of commands,
+        and whose optional 'setup_inputs' key names the files that the set up
+        commands install from.
+        timeout: The maximum number of seconds that each command may run;
+            a command that runs out of time counts as a failure.
+        force: Whether to run every set up command, even if its stamp
+            shows that nothing changed.
+        verbose: Whether to tell why each set up command ran or was skipped.
+        stamp_directory: The directory that stores the set up stamps,
+            defaulting to the platform-specific user data directory.
+
+    Raises:
+        ValueError: If the setup or setup_inputs do not have a valid form.
+
+    """
+    run_setup_plan(
+        plan_setup(front_matter), timeout, force, verbose, stamp_directory
+    )
+
+
+def run_setup_plan(
+    plan: SetupPlan,
+    timeout: int = TIMEOUT_SECONDS,
+    force: bool = False,
+    verbose: bool = False,
+    stamp_directory: Path | None = None,
+) -> None:
+    """Run the commands of a set up plan and exit the program if one fails.
+
+    A set up command is skipped when the stamp of its last successful
+    run shows that neither the set up commands nor the files named by
+    setup_inputs changed since then.
+
+    Args:
+        plan: The set up plan from the front matter.
+        timeout: The maximum number of seconds that each command may run;
+            a command that runs out of time counts as a failure.
+        force: Whether to run every set up command, even if its stamp
+            shows that nothing changed.
+        verbose: Whether to tell why each set up command ran or was skipped.
+        stamp_directory: The directory that stores the set up stamps,
+            defaulting to the platform-specific user data directory.
+
+    """
+    groups, patterns = plan
+    if not groups:
+        return
+    project_directory = os.getcwd()
+    stamp = (
+        load_setup_stamp(project_directory, stamp_directory)
+        if patterns
+        else {}
+    )
+    steps = plan_setup_steps(
+        [command for group in groups for command in group.commands],
+        setup_inputs_fingerprint(patterns),
+        stamp,
+        force,
+    )
+    rich.print()
+    rich.print(Rule(SETUP_RULE_TITLE, style=GREEN_STYLE))
+    rich.print()
+    skipped_count = sum(1 for step in steps if not step.run)
+    if skipped_count and not verbose:
+        sys.stdout.write(
+            SETUP_SKIPPED_COUNT_FMT.format(skipped_count) + NEWLINE
+        )
+    # run the groups in order, streaming the output of every command
+    # and stopping at the first group with a command that fails
+    succeeded: List[str] = []
+    failure = None
+    position = 0
+    for group in groups:
+        group_steps = steps[position : position + len(group.commands)]
+        position += len(group.commands)
+        if verbose:
+            sys.stdout.writelines(
+                (SETUP_RUNNING_FMT if step.run else SETUP_SKIPPED_FMT).format(
+                    step.command, step.reason
+                )
+                + NEWLINE
+                for step in group_steps
             )
-            if proc.stdout:
-                captured_output += proc.stdout.decode(errors="replace")
-            if proc.stderr:
-                captured_output += proc.stderr.decode(errors="replace")
-            if proc.returncode != EXIT_SUCCESS:
-                failure_command = command
-                break
-        # display results with appropriate rule colors
-        if failure_command is not None:
-            rule_style = BRIGHT_RED_STYLE
-            rich.print()
-            rich.print(Rule(SETUP_RULE_TITLE, style=rule_style))
-            rich.print()
-            if captured_output:
-                sys.stdout.write(captured_output)
-            rich.print(
-                f"[red]{SETUP_FAILURE_FMT.format(failure_command)}[/red]"
+        running = [step for step in group_steps if step.run]
+        results = dict(
+            zip(
+                (step.digest for step in running),
+                _run_setup_group(running, group.parallel, timeout),
             )
-            rich.print()
-            rich.print(Rule(style=rule_style))
-            raise typer.Exit(EXIT_FAILURE)
-        else:
-            rich.print()
-            rich.print(Rule(SETUP_RULE_TITLE, style=GREEN_STYLE))
-            rich.print()
-            if captured_output:
-                sys.stdout.write(captured_output)
-            typer.echo(SETUP_DONE_MSG)
-            rich.print(Rule(style=GREEN_STYLE))
+        )
+        for step in group_steps:
+            returncode, tail = results.get(step.digest, (EXIT_SUCCESS, ""))
+            if returncode == EXIT_SUCCESS:
+                if failure is None:
+                    succeeded.append(step.digest)
+            elif failure is None:
+                message = (
+                    SETUP_FAILURE_FMT
+                    if returncode is not None
+                    else SETUP_TIMEOUT_FMT
+                )
+                failure = (message.format(step.command, timeout), tail)
+        if failure is not None:
+            break
+    # stamp the commands that succeeded with the setup_inputs as the
+    # commands left them, since a command such as "uv sync" may
+    # rewrite its own lock file
+    if patterns:
+        fingerprint = setup_inputs_fingerprint(patterns) or ""
+        save_setup_stamp(
+            dict.fromkeys(succeeded, fingerprint),
+            project_directory,
+            stamp_directory,
+        )
+    if failure is not None:
+        _print_setup_failure(*failure)
+    typer.echo(SETUP_DONE_MSG)
+    rich.print(Rule(style=GREEN_STYLE))
@@ -0,0 +1,205 @@
+"""Skip the set up commands whose stamp shows that nothing changed.
+
+Set up commands such as "uv sync" or "npm ci" take a long time and do
+the same work on every run as long as the files that they install from
+do not change. After a set up command succeeds, a stamp records a digest
+of the set up commands up to and including it, along with a fingerprint
+of the files that the front matter lists as setup_inputs, such as
+uv.lock or package-lock.json. A later run in the same directory skips
+every command whose stamp still matches. A command that runs makes all
+of the commands after it run too, since they may depend on what it did.
+Without any setup_inputs, nothing tells whether a command needs to run
+again, so the set up commands always run.
+"""
+
+import hashlib
+import json
+import os
+import uuid
+from collections import namedtuple
+from pathlib import Path
+from typing import Dict, List, Sequence
+
+import platformdirs
+
+from gatorgrade.report_history import HISTORY_APPLICATION_NAME
+from gatorgrade.result_cache import compute_input_fingerprint
+
+STAMP_DIRECTORY_NAME = "setup"
+STAMP_FILE_SUFFIX = ".json"
+STAMP_SCHEMA_VERSION = 1
+STAMP_SCHEMA_KEY = "stamp_schema_version"
+STAMP_STEPS_KEY = "steps"
+STAMP_FILE_ENCODING = "utf-8"
+STAMP_TEMPORARY_SUFFIX = ".tmp"
+DIGEST_SEPARATOR = "\n"
+PRIVATE_DIRECTORY_MODE = 0o700
+
+# the reasons that a set up command ran or was skipped
+FORCED_REASON = "--force-setup was given"
+NO_INPUTS_REASON = "the front matter declares no setup_inputs"
+EARLIER_STEP_REASON = "an earlier set up command ran"
+FIRST_RUN_REASON = "it has not succeeded in this directory before"
+COMMANDS_CHANGED_REASON = "the set up commands changed"
+INPUTS_CHANGED_REASON = "the setup_inputs changed"
+UNCHANGED_REASON = "the set up commands and setup_inputs are unchanged"
+
+# one set up command: the command, the digest of the set up commands up
+# to and including it, whether it has to run, and the reason why
+SetupStep = namedtuple("SetupStep", ["command", "digest", "run", "reason"])
+
+
+def get_setup_stamp_directory() -> Path:
+    """Return the platform-specific directory for set up stamps."""
+    data_directory = platformdirs.user_data_dir(
+        HISTORY_APPLICATION_NAME,
+        appauthor=False,
+    )
+    return Path(data_directory) / STAMP_DIRECTORY_NAME
+
+
+def _stamp_path(stamp_directory: Path, project_directory: str) -> Path:
+    """Return the path of the stamp file for one project directory."""
+    name = hashlib.sha256(
+        os.path.abspath(project_directory).encode(STAMP_FILE_ENCODING)
+    ).hexdigest()
+    return stamp_directory / f"{name}{STAMP_FILE_SUFFIX}"
+
+
+def load_setup_stamp(
+    project_directory: str, stamp_directory: Path | None = None
+) -> Dict[str, str]:
+    """Load the stamps of the set up commands that succeeded in a directory.
+
+    Args:
+        project_directory: The directory that the set up commands run in.
+        stamp_directory: The directory that stores the stamps, defaulting
+            to the platform-specific user data directory.
+
+    Returns:
+        The fingerprint of the setup_inputs for the digest of each set up
+        command that succeeded, which is empty when there is no stamp or
+        it cannot be read.
+
+    """
+    directory = (
+        stamp_directory
+        if stamp_directory is not None
+        else get_setup_stamp_directory()
+    )
+    path = _stamp_path(directory, project_directory)
+    try:
+        payload = json.loads(path.read_text(encoding=STAMP_FILE_ENCODING))
+    except (OSError, UnicodeDecodeError, json.JSONDecodeError):
+        return {}
+    if not isinstance(payload, dict):
+        return {}
+    if payload.get(STAMP_SCHEMA_KEY) != STAMP_SCHEMA_VERSION:
+        return {}
+    steps = payload.get(STAMP_STEPS_KEY)
+    if not isinstance(steps, dict):
+        return {}
+    return {
+        digest: fingerprint
+        for digest, fingerprint in steps.items()
+        if isinstance(fingerprint, str)
+    }
+
+
+def save_setup_stamp(
+    steps: Dict[str, str],
+    project_directory: str,
+    stamp_directory: Path | None = None,
+) -> None:
+    """Store the stamps of the set up commands that succeeded in a directory.
+
+    The stamp replaces the earlier one of the directory, so that the
+    stamps of commands that no longer exist do not pile up. Failing to
+    write the stamp only means that the commands run again next time.
+
+    Args:
+        steps: The fingerprint of the setup_inputs for the digest of each
+            set up command that succeeded.
+        project_directory: The directory that the set up commands run in.
+        stamp_directory: The directory that stores the stamps, defaulting
+            to the platform-specific user data directory.
+
+    """
+    directory = (
+        stamp_directory
+        if stamp_directory is not None
+        else get_setup_stamp_directory()
+    )
+    path = _stamp_path(directory, project_directory)
+    payload = {STAMP_SCHEMA_KEY: STAMP_SCHEMA_VERSION, STAMP_STEPS_KEY: steps}
+    # write through a temporary file so that a concurrent run never
+    # reads a partial stamp
+    temporary_path = path.with_name(
+        f".{path.name}.{uuid.uuid4().hex}{STAMP_TEMPORARY_SUFFIX}"
+    )
+    try:
+        directory.mkdir(
+            parents=True, exist_ok=True, mode=PRIVATE_DIRECTORY_MODE
+        )
+        temporary_path.write_text(
+            json.dumps(payload), encoding=STAMP_FILE_ENCODING
+        )
+        os.replace(temporary_path, path)
+    except OSError:
+        pass
+    finally:
+        temporary_path.unlink(missing_ok=True)
+
+
+def setup_inputs_fingerprint(patterns: Sequence[str] | None) -> str | None:
+    """Return the fingerprint of the setup_inputs, or None without any."""
+    if not patterns:
+        return None
+    return compute_input_fingerprint(patterns)
+
+
+def plan_setup_steps(
+    commands: Sequence[str],
+    fingerprint: str | None,
+    stamp: Dict[str, str],
+    force: bool = False,
+) -> List[SetupStep]:
+    """Decide which set up commands have to run and which can be skipped.
+
+    Args:
+        commands: The set up commands, in the order that they run.
+        fingerprint: The fingerprint of the setup_inputs, or None when
+            the front matter declares none.
+        stamp: The stamps of the set up commands that succeeded before.
+        force: Whether every set up command has to run.
+
+    Returns:
+        One step for each set up command, in order.
+
+    """
+    steps = []
+    digest = hashlib.sha256()
+    earlier_step_ran = False
+    for command in commands:
+        digest.update(command.encode(STAMP_FILE_ENCODING))
+        digest.update(DIGEST_SEPARATOR.encode(STAMP_FILE_ENCODING))
+        step_digest = digest.hexdigest()
+        stamped_fingerprint = stamp.get(step_digest)
+        if force:
+            reason = FORCED_REASON
+        elif fingerprint is None:
+            reason = NO_INPUTS_REASON
+        elif earlier_step_ran:
+            reason = EARLIER_STEP_REASON
+        elif stamped_fingerprint is None:
+            reason = COMMANDS_CHANGED_REASON if stamp else FIRST_RUN_REASON
+        elif stamped_fingerprint != fingerprint:
+            reason = INPUTS_CHANGED_REASON
+        else:
+            steps.append(
+                SetupStep(command, step_digest, False, UNCHANGED_REASON)
+            )
+            continue
+        earlier_step_ran = True
+        steps.append(SetupStep(command, step_digest, True, reason))
+    return steps
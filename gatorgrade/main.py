@@ -1,6 +1,8 @@
 """Use GatorGrade to run checks and generate helpful output."""
 
+import functools
 import importlib.metadata
+import itertools
 import sys
 from pathlib import Path
 from typing import Optional, Tuple
@@ -25,6 +27,11 @@ from gatorgrade.engine import (
 )
 from gatorgrade.hint.local_engine import DEFAULT_MODEL_ID
 from gatorgrade.hint.remote_engine import REMOTE_MODEL_DEFAULT
+from gatorgrade.input.command_line_generator import legacy_check_ids
+from gatorgrade.input.compiled_config import (
+    compiled_config_path,
+    get_compiled_config_directory,
+)
 from gatorgrade.input.filter import (
     DEFAULT_FILTER_BY,
     DEFAULT_FILTER_FUZZY_THRESHOLD,
@@ -36,40 +43,52 @@ from gatorgrade.input.filter import (
     filter_checks,
 )
 from gatorgrade.input.parse_config import (
+    ConfigDocument,
     get_config_dir,
-    get_due_date,
-    get_due_date_aliases_present,
-    get_project_name,
-    has_due_date_field,
-    parse_config,
     resolve_config_path,
 )
-from gatorgrade.output.output import run_checks
+from gatorgrade.input.set_up_shell import run_setup_plan
+from gatorgrade.output.executor import DEFAULT_TIMEOUT_SECONDS
+from gatorgrade.output.output import (
+    DEFAULT_JOBS,
+    run_checks,
+    start_gg_pool,
+)
 from gatorgrade.report_history import (
     DEFAULT_HISTORY_REPORT_COUNT,
     DEFAULT_HISTORY_SIZE_MIB,
     filter_checks_by_failed_ids,
     get_all_check_ids,
     get_failed_check_ids,
-    get_history_scope,
     get_report_history_directory,
 )
 from gatorgrade.resolve import (
     resolve_system_prompt,
     resolve_validation_rules,
 )
+from gatorgrade.result_cache import (
+    DEFAULT_CACHE_SIZE_MIB,
+    get_result_cache_directory,
+)
 from gatorgrade.validate import (
+    parse_jobs,
     validate_auto_hint_options,
     validate_baseline_weight,
+    validate_cache_size,
+    validate_check_timeout,
     validate_filter_failed_last,
     validate_filter_fuzzy_threshold,
     validate_filter_options,
     validate_filter_passed_last,
     validate_github_env,
+    validate_jobs,
+    validate_max_failures,
     validate_output_limit,
     validate_report,
     validate_report_history_count,
     validate_report_history_size,
+    validate_slowest,
+    validate_total_timeout,
 )
 
 # import the version from the single-source-of-truth module so that
@@ -131,6 +150,8 @@ EXIT_MESSAGE = "Fix these error(s) before running gatorgrade."
 # default config directory computed at module load time for display in help
 DEFAULT_CONFIG_DIR = str(get_config_dir())
 DEFAULT_REPORT_HISTORY_DIR = str(get_report_history_directory())
+DEFAULT_RESULT_CACHE_DIR = str(get_result_cache_directory())
+DEFAULT_COMPILED_CONFIG_DIR = str(get_compiled_config_directory())
 
 # cli flag names used in the report
 CONFIG_FLAG = "--config"
@@ -160,6 +181,19 @@ REPORT_HISTORY_FLAG = "--report-history"
 REPORT_HISTORY_MAX_COUNT_FLAG = "--report-history-max-count"
 REPORT_HISTORY_MAX_MIB_FLAG = "--report-history-max-mb"
 GITHUB_ENV_FLAG = "--github-env"
+JOBS_FLAG = "--jobs"
+CACHE_FLAG = "--cache"
+CACHE_MAX_MIB_FLAG = "--cache-max-mb"
+COMPILED_CACHE_FLAG = "--compiled-cache"
+CHECK_TIMEOUT_FLAG = "--check-timeout"
+TOTAL_TIMEOUT_FLAG = "--total-timeout"
+OUTPUT_LOG_FLAG = "--output-log"
+FAIL_FAST_FLAG = "--fail-fast"
+MAX_FAILURES_FLAG = "--max-failures"
+SLOWEST_FLAG = "--slowest"
+SHELL_SESSION_FLAG = "--shell-session"
+SHARE_COMMANDS_FLAG = "--share-commands"
+FORCE_SETUP_FLAG = "--force-setup"
 
 # labels for rich rule display
 CONFIG_ERROR_LABEL = "Configuration Error"
@@ -184,7 +218,7 @@ def _version_callback(value: bool) -> None:
         raise typer.Exit()
 
 
-def _print_verbose_info(  # noqa: PLR0913
+def _print_verbose_info(  # noqa: PLR0912, PLR0913, PLR0915
     verbose: bool,
     config_path: Path,
     config_dir: Path,
@@ -206,6 +240,18 @@ def _print_verbose_info(  # noqa: PLR0913
     report_history: bool = True,
     report_history_max_count: int = DEFAULT_HISTORY_REPORT_COUNT,
     report_history_max_mib: int = DEFAULT_HISTORY_SIZE_MIB,
+    jobs: int = DEFAULT_JOBS,
+    cache: bool = True,
+    cache_max_mib: int = DEFAULT_CACHE_SIZE_MIB,
+    compiled_cache: bool = True,
+    check_timeout: int = DEFAULT_TIMEOUT_SECONDS,
+    total_timeout: int | None = None,
+    output_log: bool = False,
+    max_failures: int | None = None,
+    slowest: int | None = None,
+    shell_session: bool = False,
+    share_commands: bool = True,
+    force_setup: bool = False,
 ) -> None:
     """Print verbose configuration info before running checks.
 
@@ -234,6 +280,18 @@ def _print_verbose_info(  # noqa: PLR0913
         report_history: Whether automatic report history is enabled.
         report_history_max_count: Maximum retained report count.
         report_history_max_mib: Maximum retained report size in MiB.
+        jobs: The maximum number of checks run at the same time.
+        cache: Whether the result cache is enabled.
+        cache_max_mib: Maximum result cache size in MiB.
+        compiled_cache: Whether the compiled configuration cache is enabled.
+        check_timeout: The default number of seconds one check may run.
+        total_timeout: The number of seconds all checks may run, or None.
+        output_log: Whether long check output is saved to log files.
+        max_failures: The number of failures that stops the run, or None.
+        slowest: The number of slowest checks to list, or None.
+        shell_session: Whether shell checks run in shell sessions.
+        share_commands: Whether checks with the same command share a run.
+        force_setup: Whether every set up command runs despite its stamp.
 
     """
     if not verbose:
@@ -255,6 +313,18 @@ def _print_verbose_info(  # noqa: PLR0913
     config.add(f"Baseline weight: {baseline_weight}")
     config.add(f"Diagnostics: {show_diagnostics}")
     config.add(f"Progress: {progress_bar}")
+    config.add(f"Jobs: {jobs}")
+    config.add(f"Check timeout: {check_timeout}")
+    if total_timeout is not None:
+        config.add(f"Total timeout: {total_timeout}")
+    config.add(f"Output log: {output_log}")
+    if max_failures is not None:
+        config.add(f"Fail fast: after {max_failures} failure(s)")
+    if slowest is not None:
+        config.add(f"Slowest: {slowest} check(s)")
+    config.add(f"Shell session: {shell_session}")
+    config.add(f"Share commands: {share_commands}")
+    config.add(f"Force setup: {force_setup}")
     config.add(f"Auto-hint: {auto_hint}")
     # auto hinting
     if auto_hint:
@@ -290,6 +360,19 @@ def _print_verbose_info(  # noqa: PLR0913
         reports.add(f"Max MiB: {report_history_max_mib}")
         reports.add(f"Directory: {DEFAULT_REPORT_HISTORY_DIR}")
     console.print(reports)
+    # result cache tree
+    result_cache = Tree("Result Cache", guide_style="dim")
+    result_cache.add(f"Cache: {cache}")
+    if cache:
+        result_cache.add(f"Max MiB: {cache_max_mib}")
+        result_cache.add(f"Directory: {DEFAULT_RESULT_CACHE_DIR}")
+    console.print(result_cache)
+    # compiled configuration cache tree
+    compiled_config = Tree("Compiled Config Cache", guide_style="dim")
+    compiled_config.add(f"Cache: {compiled_cache}")
+    if compiled_cache:
+        compiled_config.add(f"Directory: {DEFAULT_COMPILED_CONFIG_DIR}")
+    console.print(compiled_config)
     console.print()
     console.print(Rule(style="green"))
 
@@ -414,6 +497,30 @@ def gatorgrade(  # noqa: PLR0912, PLR0913, PLR0915
         show_default=True,
         callback=validate_report_history_size,
     ),
+    cache: bool = typer.Option(
+        True,
+        "--cache/--no-cache",
+        help=(
+            "Reuse the results of checks whose declared inputs did not change"
+            f" since an earlier run ({DEFAULT_RESULT_CACHE_DIR})."
+        ),
+    ),
+    cache_max_mib: int = typer.Option(
+        DEFAULT_CACHE_SIZE_MIB,
+        "--cache-max-mb",
+        help="Maximum total size of the result cache in MiB.",
+        show_default=True,
+        callback=validate_cache_size,
+    ),
+    compiled_cache: bool = typer.Option(
+        True,
+        "--compiled-cache/--no-compiled-cache",
+        help=(
+            "Reuse the compiled form of an unchanged configuration file"
+            " instead of parsing it again"
+            f" ({DEFAULT_COMPILED_CONFIG_DIR})."
+        ),
+    ),
     report: Tuple[str, str, str] = typer.Option(
         (None, None, None),
         "--report",
@@ -461,6 +568,96 @@ def gatorgrade(  # noqa: PLR0912, PLR0913, PLR0915
         "--progress-bar/--no-progress-bar",
         help="Show or hide the progress bar for checks.",
     ),
+    jobs: str = typer.Option(
+        str(DEFAULT_JOBS),
+        "--jobs",
+        "-j",
+        help=(
+            "Maximum number of checks to run at the same time, either a"
+            " positive integer or [blue]auto[/blue] for one job per"
+            " processor core. Results are always displayed and reported"
+            " in configuration order."
+        ),
+        callback=validate_jobs,
+    ),
+    check_timeout: int = typer.Option(
+        DEFAULT_TIMEOUT_SECONDS,
+        "--check-timeout",
+        help=(
+            "Maximum number of seconds that a check may run, unless the check"
+            " sets its own timeout. A check that runs out of time fails."
+        ),
+        show_default=True,
+        callback=validate_check_timeout,
+    ),
+    total_timeout: Optional[int] = typer.Option(
+        None,
+        "--total-timeout",
+        help=(
+            "Maximum number of seconds that all of the checks together may run."
+            " Checks that are still running or waiting when it expires fail."
+        ),
+        callback=validate_total_timeout,
+    ),
+    output_log: bool = typer.Option(
+        False,
+        "--output-log/--no-output-log",
+        help=(
+            "Save the full output of a failing check that is too long to keep"
+            " in memory to a temporary log file named in the JSON report."
+        ),
+    ),
+    fail_fast: bool = typer.Option(
+        False,
+        "--fail-fast",
+        help=(
+            "Stop after the first failing check, cancelling the checks that are"
+            " still running; the checks that did not finish are reported as"
+            " not run."
+        ),
+    ),
+    max_failures: Optional[int] = typer.Option(
+        None,
+        "--max-failures",
+        help=(
+            "Stop after this many failing checks, as with"
+            " [blue]--fail-fast[/blue], which is the same as a value of 1."
+        ),
+        callback=validate_max_failures,
+    ),
+    slowest: Optional[int] = typer.Option(
+        None,
+        "--slowest",
+        help=(
+            "List this many of the checks that took the longest to run,"
+            " with their wall times, in the summary."
+        ),
+        callback=validate_slowest,
+    ),
+    shell_session: bool = typer.Option(
+        False,
+        "--shell-session/--no-shell-session",
+        help=(
+            "Run the commands of shell checks in long-lived shells instead of"
+            " starting a new shell for every check (not available on Windows)."
+        ),
+    ),
+    share_commands: bool = typer.Option(
+        True,
+        "--share-commands/--no-share-commands",
+        help=(
+            "Run a command once for all of the checks with the same command"
+            " and working directory, instead of once for every check."
+        ),
+    ),
+    force_setup: bool = typer.Option(
+        False,
+        "--force-setup",
+        help=(
+            "Run every set up command, even those whose stamp shows that the"
+            " set up commands and their setup_inputs did not change."
+        ),
+    ),
     verbose: bool = typer.Option(
         False,
         "--verbose/--no-verbose",
@@ -537,6 +734,13 @@ def gatorgrade(  # noqa: PLR0912, PLR0913, PLR0915
     #    a clear "file not found" error for that specified file
     resolved_config_dir: Path | None = config_dir
     resolved_filename = resolve_config_path(filename, resolved_config_dir)
+    # the callback has already confirmed that the value is valid
+    resolved_jobs = parse_jobs(jobs) or DEFAULT_JOBS
+    # --fail-fast stops at the first failure unless --max-failures,
+    # which also turns on fail-fast mode, sets a different number
+    resolved_max_failures = (
+        max_failures if max_failures is not None else 1 if fail_fast else None
+    )
     # if ctx.subcommand is None then this means
     # that, by default, gatorgrade should run in checking mode;
     # note that the current implementation of the tool only
@@ -544,11 +748,26 @@ def gatorgrade(  # noqa: PLR0912, PLR0913, PLR0915
     # also note that the output of the tool is now segmented
     # into sections that are demarcated by horizintal rules
     if ctx.invoked_subcommand is None:
+        # determine whether any pre-run filter was provided
+        filter_was_active = (
+            bool(filter_query)
+            or filter_failed_last is not None
+            or filter_passed_last is not None
+        )
+        # parse the configuration file once; the due date, the project
+        # name, and the checks all come from this one parsed document;
+        # unless the checks are filtered, which needs all of them, only
+        # the front matter is parsed now and the checks are streamed
+        document = ConfigDocument.load(
+            resolved_filename,
+            compiled=compiled_cache,
+            stream=not filter_was_active,
+        )
         # check the due date before parsing config so warnings appear before setup;
         # this returns both the due date and any errors that might have arisen
         # when parsing the due date (i.e., due to an incorrect time/date format)
-        due_date, due_date_error = get_due_date(resolved_filename)
-        if has_due_date_field(resolved_filename) and due_date is None:
+        due_date, due_date_error = document.get_due_date()
+        if document.has_due_date_field() and due_date is None:
             console.print()
             console.print(
                 Rule(
@@ -581,7 +800,7 @@ def gatorgrade(  # noqa: PLR0912, PLR0913, PLR0915
         # (there are multiple ways to specify a due date,
         # in terms of the keys that are accepted in the front
         # matter, include both "due_date" and "duedate")
-        aliases_present = get_due_date_aliases_present(resolved_filename)
+        aliases_present = document.get_due_date_aliases_present()
         if len(aliases_present) > 1:
             chosen = aliases_present[0]
             ignored = ", ".join(aliases_present[1:])
@@ -624,18 +843,38 @@ def gatorgrade(  # noqa: PLR0912, PLR0913, PLR0915
             report_history=report_history,
             report_history_max_count=report_history_max_count,
             report_history_max_mib=report_history_max_mib,
+            jobs=resolved_jobs,
+            cache=cache,
+            cache_max_mib=cache_max_mib,
+            compiled_cache=compiled_cache,
+            check_timeout=check_timeout,
+            total_timeout=total_timeout,
+            output_log=output_log,
+            max_failures=resolved_max_failures,
+            slowest=slowest,
+            shell_session=shell_session,
+            share_commands=share_commands,
+            force_setup=force_setup,
         )
-        # parse the provided configuration file
-        checks, parse_error = parse_config(resolved_filename, baseline_weight)
+        # parse the provided configuration file; parsing runs nothing,
+        # so the set up commands only run once there are checks to run
+        if filter_was_active:
+            config, parse_error = document.load_config(baseline_weight)
+        else:
+            config, parse_error = document.stream_config(baseline_weight)
+        checks = config.checks
+        # peek at the first streamed check, so that a file without any
+        # checks is reported before anything is set up
+        if parse_error is None and not isinstance(checks, list):
+            first_check = next(checks, None)
+            checks = (
+                []
+                if first_check is None
+                else itertools.chain([first_check], checks)
+            )
         # extract the optional project name from the config file
-        project_name = get_project_name(resolved_filename)
-        history_scope = get_history_scope(resolved_filename, project_name)
-        # determine whether any pre-run filter was provided
-        filter_was_active = (
-            bool(filter_query)
-            or filter_failed_last is not None
-            or filter_passed_last is not None
-        )
+        project_name = document.get_project_name()
+        history_scope = document.get_history_scope()
         history_reports_inspected = 0
         history_reports_total = 0
         # validate filter option combinations;
@@ -717,10 +956,11 @@ def gatorgrade(  # noqa: PLR0912, PLR0913, PLR0915
             console.print()
             console.print(Rule(style="bright_red"))
         # there are valid checks and thus the
-        # tool should run them with run_checks
-        elif len(checks) > 0:
+        # tool should run them with run_checks;
+        # a stream of checks is only left when it has one
+        elif checks:
             # capture the original check count before filtering
-            pre_filter_count = len(checks)
+            pre_filter_count = len(checks) if filter_was_active else None
             # resolve filter defaults when filter_query is active
             # (must happen before cli_args dict references them)
             resolved_filter_mode = (
@@ -781,6 +1021,19 @@ def gatorgrade(  # noqa: PLR0912, PLR0913, PLR0915
                 REPORT_HISTORY_FLAG: report_history,
                 REPORT_HISTORY_MAX_COUNT_FLAG: report_history_max_count,
                 REPORT_HISTORY_MAX_MIB_FLAG: report_history_max_mib,
+                JOBS_FLAG: resolved_jobs,
+                CACHE_FLAG: cache,
+                CACHE_MAX_MIB_FLAG: cache_max_mib,
+                COMPILED_CACHE_FLAG: compiled_cache,
+                CHECK_TIMEOUT_FLAG: check_timeout,
+                TOTAL_TIMEOUT_FLAG: total_timeout,
+                OUTPUT_LOG_FLAG: output_log,
+                FAIL_FAST_FLAG: resolved_max_failures is not None,
+                MAX_FAILURES_FLAG: resolved_max_failures,
+                SLOWEST_FLAG: slowest,
+                SHELL_SESSION_FLAG: shell_session,
+                SHARE_COMMANDS_FLAG: share_commands,
+                FORCE_SETUP_FLAG: force_setup,
             }
             version_info = {
                 GATORGRADE_VERSION_KEY: GATORGRADE_VERSION,
@@ -807,6 +1060,14 @@ def gatorgrade(  # noqa: PLR0912, PLR0913, PLR0915
                 filter_failed_last is not None
                 or filter_passed_last is not None
             ):
+                # reports saved with an earlier scheme of check
+                # identifiers are matched through the identifiers that
+                # it gives the checks, computed at most once
+                translate_legacy_ids = functools.cache(
+                    functools.partial(
+                        legacy_check_ids, config.check_data, config.checks
+                    )
+                )
                 try:
                     historical_check_ids: set[str] | None = None
                     # get the failed check IDs
@@ -819,6 +1080,7 @@ def gatorgrade(  # noqa: PLR0912, PLR0913, PLR0915
                             get_report_history_directory(),
                             history_scope,
                             filter_failed_last,
+                            translate_legacy_ids,
                         )
                         history_reports_inspected = failed_inspected
                         historical_check_ids = failed_ids
@@ -832,6 +1094,7 @@ def gatorgrade(  # noqa: PLR0912, PLR0913, PLR0915
                             reports_dir,
                             history_scope,
                             filter_passed_last,
+                            translate_legacy_ids,
                         )
                         (
                             passed_failed_ids,
@@ -841,6 +1104,7 @@ def gatorgrade(  # noqa: PLR0912, PLR0913, PLR0915
                             reports_dir,
                             history_scope,
                             filter_passed_last,
+                            translate_legacy_ids,
                         )
                         passed_ids = all_ids - passed_failed_ids
                         if historical_check_ids is not None:
@@ -910,53 +1174,74 @@ def gatorgrade(  # noqa: PLR0912, PLR0913, PLR0915
                 console.print()
                 console.print(Rule(style="green"))
             else:
-                # auto-hint engine: try to create it if --auto-hint is passed;
-                # the engine sources hints from a remote OpenAI-compatible API
-                # (i.e., when --auto-hint-url is provided) or from a local
-                # huggingface transformers model (i.e., when no URL is provided).
-                # remote engine fails to initialise or returns None for a hint,
-                # the program falls back to the local engine; resolve the system prompt
-                # and validation rules if specified in the config front matter
-                if auto_hint:
-                    system_prompt = resolve_system_prompt(
-                        resolved_filename, resolved_config_dir
+                # start the workers for the GatorGrader checks, when there
+                # are enough of them, so that they import GatorGrader while
+                # the set up commands run
+                with start_gg_pool(checks, resolved_jobs) as gg_pool:
+                    # run the set up commands of the front matter as their own
+                    # stage, which exits the program if one of them fails
+                    run_setup_plan(
+                        config.setup_plan, force=force_setup, verbose=verbose
                     )
-                    validation_rules = resolve_validation_rules(
-                        resolved_filename, resolved_config_dir
-                    )
-                    auto_hint_engine = create_auto_hint_engine(
-                        resolved_filename,
-                        auto_hint_model,
-                        auto_hint_url,
-                        auto_hint_api_key,
-                        system_prompt=system_prompt,
-                        validation_rules=validation_rules,
-                        auto_hint_model_default=AUTO_HINT_MODEL_DEFAULT,
-                        console=console,
+                    # auto-hint engine: try to create it if --auto-hint is passed;
+                    # the engine sources hints from a remote OpenAI-compatible API
+                    # (i.e., when --auto-hint-url is provided) or from a local
+                    # huggingface transformers model (i.e., when no URL is provided).
+                    # remote engine fails to initialise or returns None for a hint,
+                    # the program falls back to the local engine; resolve the system prompt
+                    # and validation rules if specified in the config front matter
+                    if auto_hint:
+                        system_prompt = resolve_system_prompt(
+                            resolved_filename, resolved_config_dir
+                        )
+                        validation_rules = resolve_validation_rules(
+                            resolved_filename, resolved_config_dir
+                        )
+                        auto_hint_engine = create_auto_hint_engine(
+                            resolved_filename,
+                            auto_hint_model,
+                            auto_hint_url,
+                            auto_hint_api_key,
+                            system_prompt=system_prompt,
+                            validation_rules=validation_rules,
+                            auto_hint_model_default=AUTO_HINT_MODEL_DEFAULT,
+                            console=console,
+                        )
+                    # run the checks that were specified in a way
+                    # that adheres to the configuration both in
+                    # the command-line arguments and also in the
+                    # gatorgrade.yml file
+                    checks_status = run_checks(
+                        checks,
+                        report,
+                        not progress_bar,
+                        show_diagnostics,
+                        output_limit,
+                        cli_args,
+                        version_info,
+                        github_env,
+                        project_name,
+                        due_date,
+                        auto_hint_engine=auto_hint_engine,
+                        auto_hint_url=auto_hint_url,
+                        auto_hint_track=auto_hint_track,
+                        report_history=report_history,
+                        report_history_max_count=report_history_max_count,
+                        report_history_max_mib=report_history_max_mib,
+                        history_scope=history_scope,
+                        jobs=resolved_jobs,
+                        result_cache=cache,
+                        result_cache_max_mib=cache_max_mib,
+                        check_timeout=check_timeout,
+                        total_timeout=total_timeout,
+                        output_log=output_log,
+                        max_failures=resolved_max_failures,
+                        slowest=slowest,
+                        verbose=verbose,
+                        shell_session=shell_session,
+                        share_commands=share_commands,
+                        gg_pool=gg_pool,
                     )
-                # run the checks that were specified in a way
-                # that adheres to the configuration both in
-                # the command-line arguments and also in the
-                # gatorgrade.yml file
-                checks_status = run_checks(
-                    checks,
-                    report,
-                    not progress_bar,
-                    show_diagnostics,
-                    output_limit,
-                    cli_args,
-                    version_info,
-                    github_env,
-                    project_name,
-                    due_date,
-                    auto_hint_engine=auto_hint_engine,
-                    auto_hint_url=auto_hint_url,
-                    auto_hint_track=auto_hint_track,
-                    report_history=report_history,
-                    report_history_max_count=report_history_max_count,
-                    report_history_max_mib=report_history_max_mib,
-                    history_scope=history_scope,
-                )
         # no checks were created and this means
         # that, most likely, the file was not
         # valid and thus the tool cannot run checks
@@ -979,5 +1264,131 @@ def gatorgrade(  # noqa: PLR0912, PLR0913, PLR0915
             sys.exit(FAILURE)
 
 
+def _exit_with_config_error(message: str) -> None:
+    """Display an error in the configuration file and exit."""
+    console.print()
+    console.print(Rule(Text(CONFIG_ERROR_PLURAL_LABEL), style="bright_red"))
+    console.print(NEWLINE + message)
+    console.print(Text(EXIT_MESSAGE))
+    console.print()
+    console.print(Rule(style="bright_red"))
+    sys.exit(FAILURE)
+
+
+@app.command("check-config")
+def check_config(
+    filename: Path = typer.Option(
+        FILE,
+        "--config",
+        "-c",
+        help="Name of the configuration file in YML format.",
+    ),
+    config_dir: Optional[Path] = typer.Option(
+        None,
+        "--config-dir",
+        "-d",
+        help=(
+            "Directory for gatorgrade.yml and other configuration files"
+            " referenced in gatorgrade.yml's YML frontmatter."
+        ),
+        show_default=DEFAULT_CONFIG_DIR,
+    ),
+    baseline_weight: int = typer.Option(
+        1,
+        "--baseline-weight",
+        "-b",
+        help="Default weight applied to checks without an explicit weight (>= 1).",
+        callback=validate_baseline_weight,
+    ),
+) -> None:
+    """Check the configuration file without running its set up or checks."""
+    resolved_filename = resolve_config_path(filename, config_dir)
+    document = ConfigDocument.load(resolved_filename, compiled=False)
+    config, parse_error = document.load_config(baseline_weight)
+    if parse_error is None and not config.checks:
+        parse_error = f"The path {resolved_filename} either does not exist or is not valid."
+    if parse_error is not None:
+        _exit_with_config_error(parse_error)
+    groups, setup_inputs = config.setup_plan
+    summary = Tree("Configuration", guide_style="dim")
+    summary.add(f"Config file: {resolved_filename}")
+    summary.add(f"Checks: {len(config.checks)}")
+    summary.add(
+        f"Set up commands: {sum(len(group.commands) for group in groups)}"
+    )
+    if any(group.parallel for group in groups):
+        summary.add(
+            f"Parallel set up groups: {sum(1 for group in groups if group.parallel)}"
+        )
+    if setup_inputs:
+        summary.add(f"Setup inputs: {', '.join(setup_inputs)}")
+    _, due_date_error = document.get_due_date()
+    if due_date_error:
+        summary.add(
+            Text(f"Due date ignored: {due_date_error}", style="yellow")
+        )
+    console.print()
+    console.print(Rule("Configuration Check", style="green"))
+    console.print()
+    console.print(summary)
+    console.print()
+    console.print("The configuration is valid.")
+    console.print()
+    console.print(Rule(style="green"))
+
+
+@app.command("compile")
+def compile_config(
+    filename: Path = typer.Option(
+        FILE,
+        "--config",
+        "-c",
+        help="Name of the configuration file in YML format.",
+    ),
+    config_dir: Optional[Path] = typer.Option(
+        None,
+        "--config-dir",
+        "-d",
+        help=(
+            "Directory for gatorgrade.yml and other configuration files"
+            " referenced in gatorgrade.yml's YML frontmatter."
+        ),
+        show_default=DEFAULT_CONFIG_DIR,
+    ),
+    baseline_weight: int = typer.Option(
+        1,
+        "--baseline-weight",
+        "-b",
+        help="Default weight applied to checks without an explicit weight (>= 1).",
+        callback=validate_baseline_weight,
+    ),
+) -> None:
+    """Store the compiled configuration file so later runs skip parsing it."""
+    resolved_filename = resolve_config_path(filename, config_dir)
+    document = ConfigDocument.load(resolved_filename)
+    config, parse_error = document.load_config(baseline_weight)
+    if parse_error is None and not config.checks:
+        parse_error = f"The path {resolved_filename} either does not exist or is not valid."
+    if parse_error is not None:
+        _exit_with_config_error(parse_error)
+    # a configuration with checks was read, so it has a compiled key
+    compiled_path = compiled_config_path(str(document.key))
+    if not compiled_path.exists():
+        _exit_with_config_error(
+            f"The compiled configuration could not be stored in {compiled_path.parent}."
+        )
+    summary = Tree("Compiled Configuration", guide_style="dim")
+    summary.add(f"Config file: {resolved_filename}")
+    summary.add(f"Checks: {len(config.checks)}")
+    summary.add(f"Baseline weight: {baseline_weight}")
+    summary.add(f"Compiled file: {compiled_path}")
+    console.print()
+    console.print(Rule("Configuration Compiled", style="green"))
+    console.print()
+    console.print(summary)
+    console.print()
+    console.print(Rule(style="green"))
+
+
 if __name__ == "__main__":
     app()
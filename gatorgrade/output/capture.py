@@ -0,0 +1,149 @@
+"""Capture the output of a command in a fixed amount of memory.
+
+A check that prints in an endless loop can write gigabytes of output,
+so the output of a command is never stored in full. Instead, the first
+and the last bytes that it writes are kept, up to a cap, and everything
+in between is only counted. The full output can optionally be written
+to a temporary log file so that it is still available for a report.
+"""
+
+import os
+import tempfile
+from typing import IO
+
+# the number of bytes kept from the start and from the end of the output
+DEFAULT_HEAD_BYTES = 64 * 1024
+DEFAULT_TAIL_BYTES = 64 * 1024
+
+NEWLINE_BYTE = b"\n"
+OMITTED_OUTPUT_FMT = "\n... ({} byte(s) in {} line(s) of output omitted) ...\n"
+OUTPUT_LOG_PREFIX = "gatorgrade-output-"
+OUTPUT_LOG_SUFFIX = ".log"
+
+
+class BoundedCapture:
+    """Keep the head and tail of a stream of bytes and count the rest.
+
+    The head holds at most head_bytes and the tail holds at most twice
+    tail_bytes, since it is only trimmed once it has grown past that,
+    so the memory that a capture uses does not depend on how much
+    output the command writes.
+    """
+
+    def __init__(
+        self,
+        head_bytes: int = DEFAULT_HEAD_BYTES,
+        tail_bytes: int = DEFAULT_TAIL_BYTES,
+        spill: bool = False,
+    ) -> None:
+        """Construct a BoundedCapture that has not received any output.
+
+        Args:
+            head_bytes: The number of bytes to keep from the start.
+            tail_bytes: The number of bytes to keep from the end.
+            spill: Whether to also write the full output to a temporary
+                log file, which is kept only if output was omitted.
+
+        """
+        self.head_bytes = head_bytes
+        self.tail_bytes = tail_bytes
+        self.spill = spill
+        self.total_bytes = 0
+        self.log_path: str | None = None
+        self._head = bytearray()
+        self._tail = bytearray()
+        self._newlines = 0
+        self._omitted_newlines = 0
+        self._ends_with_newline = True
+        self._log_file: IO[bytes] | None = None
+        self._closed = False
+
+    @property
+    def total_lines(self) -> int:
+        """Return the number of lines in all of the output so far."""
+        unterminated = 0 if self._ends_with_newline else 1
+        return self._newlines + unterminated
+
+    @property
+    def omitted_bytes(self) -> int:
+        """Return the number of bytes that were counted but not kept."""
+        return self.total_bytes - len(self._head) - len(self._tail)
+
+    @property
+    def omitted_lines(self) -> int:
+        """Return the number of line endings in the omitted output."""
+        return self._omitted_newlines
+
+    def write(self, data: bytes) -> None:
+        """Count a chunk of output and keep the parts that fit.
+
+        Args:
+            data: The next chunk of output from the command.
+
+        """
+        if not data:
+            return
+        self.total_bytes += len(data)
+        self._newlines += data.count(NEWLINE_BYTE)
+        self._ends_with_newline = data.endswith(NEWLINE_BYTE)
+        if self.spill:
+            self._write_log(data)
+        # fill the head first and send whatever does not fit to the tail
+        room = self.head_bytes - len(self._head)
+        if room > 0:
+            self._head += data[:room]
+            data = data[room:]
+            if not data:
+                return
+        # a chunk that is longer than the tail replaces it entirely, so
+        # only count the line endings in the part that is dropped
+        if len(data) >= self.tail_bytes:
+            keep_from = len(data) - self.tail_bytes
+            self._omitted_newlines += self._tail.count(NEWLINE_BYTE)
+            self._omitted_newlines += data.count(NEWLINE_BYTE, 0, keep_from)
+            self._tail = bytearray(data[keep_from:])
+            return
+        self._tail += data
+        # trim the tail in batches instead of after every small chunk
+        if len(self._tail) > 2 * self.tail_bytes:
+            drop = len(self._tail) - self.tail_bytes
+            self._omitted_newlines += self._tail.count(NEWLINE_BYTE, 0, drop)
+            del self._tail[:drop]
+
+    def _write_log(self, data: bytes) -> None:
+        """Append a chunk of output to the temporary log file."""
+        if self._log_file is None:
+            # the file stays open until the capture is closed
+            self._log_file = tempfile.NamedTemporaryFile(
+                prefix=OUTPUT_LOG_PREFIX,
+                suffix=OUTPUT_LOG_SUFFIX,
+                delete=False,
+            )
+            self.log_path = self._log_file.name
+        self._log_file.write(data)
+
+    def close(self) -> None:
+        """Finish the capture and close the log file, if there is one.
+
+        The log file is deleted again when none of the output was
+        omitted, since the kept output is then already complete.
+        Closing a capture more than once has no further effect.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        if self._log_file is not None:
+            self._log_file.close()
+            self._log_file = None
+            if self.omitted_bytes == 0 and self.log_path is not None:
+                os.unlink(self.log_path)
+                self.log_path = None
+
+    def getvalue(self) -> bytes:
+        """Return the kept output, marking where output was omitted."""
+        if self.omitted_bytes == 0:
+            return bytes(self._head + self._tail)
+        marker = OMITTED_OUTPUT_FMT.format(
+            self.omitted_bytes, self.omitted_lines
+        ).encode()
+        return bytes(self._head) + marker + bytes(self._tail)
@@ -8,8 +8,13 @@ NEWLINE = "\n"
 EMPTY = ""
 CHECK_MARK = "\u2713"
 CROSS_MARK = "\u2715"
+SKIP_MARK = "\u21b7"
 PASS_COLOR = "green"
 FAIL_COLOR = "red"
+SKIP_COLOR = "yellow"
+NOT_RUN_MARK = "\u25cb"
+NOT_RUN_COLOR = "dim"
+CACHED_LABEL = "cached"
 DIAGNOSTIC_LABEL = "Diagnostic"
 DETAILS_LABEL = "Details"
 HINT_LABEL = "Hint"
@@ -18,6 +23,37 @@ HINT_LABEL = "Hint"
 class CheckResult:  # pylint: disable=too-few-public-methods
     """Represent the result of running a check."""
 
+    # grading many repositories in one process keeps a result for every
+    # check of each of them, so the results store their fixed attributes
+    # in slots instead of a dictionary for every result
+    __slots__ = (
+        "_raw_diagnostic",
+        "cached",
+        "check_id",
+        "cpu_system_time",
+        "cpu_user_time",
+        "description",
+        "details",
+        "diagnostic",
+        "hint",
+        "is_auto_hint",
+        "is_low_quality",
+        "json_info",
+        "not_run",
+        "output_bytes",
+        "output_lines",
+        "output_log",
+        "outputlimit",
+        "passed",
+        "path",
+        "peak_rss_kib",
+        "run_command",
+        "skipped",
+        "timed_out",
+        "wall_time",
+        "weight",
+    )
+
     def __init__(  # noqa: PLR0913
         self,
         passed: bool,
@@ -32,6 +68,17 @@ class CheckResult:  # pylint: disable=too-few-public-methods
         is_low_quality: bool = False,
         details: str = "",
         check_id: str | None = None,
+        skipped: bool = False,
+        cached: bool = False,
+        timed_out: bool = False,
+        not_run: bool = False,
+        output_lines: int | None = None,
+        output_bytes: int | None = None,
+        output_log: str | None = None,
+        wall_time: float | None = None,
+        cpu_user_time: float | None = None,
+        cpu_system_time: float | None = None,
+        peak_rss_kib: int | None = None,
     ):
         """Construct a CheckResult.
 
@@ -40,7 +87,8 @@ class CheckResult:  # pylint: disable=too-few-public-methods
                 If true, indicates that the check has passed.
             description: The description to use in output.
             json_info: The overall information to be included in
-                json output.
+                json output, which is shared with the check rather
+                than copied.
             path: The path associated with the check result.
             diagnostic: The message to use in output if the check
                 has failed.
@@ -57,6 +105,28 @@ class CheckResult:  # pylint: disable=too-few-public-methods
                 configuration (e.g. options and expected values).
             check_id: An optional SHA-256 hash uniquely identifying
                 this check.
+            skipped: Whether the check was skipped, without running,
+                because a check that it depends on did not pass.
+            cached: Whether the result was reused from the result cache
+                instead of running the check.
+            timed_out: Whether the check failed because it was stopped
+                when its timeout, or the total timeout, expired.
+            not_run: Whether the check did not run, or was cancelled,
+                because fail-fast mode stopped the run.
+            output_lines: The number of lines that the command wrote,
+                when its output was too long to be kept in full.
+            output_bytes: The number of bytes that the command wrote,
+                when its output was too long to be kept in full.
+            output_log: The path of a temporary file that holds the
+                full output of the command, if it was saved.
+            wall_time: The number of seconds that the check ran, or
+                None when it did not run.
+            cpu_user_time: The user CPU time, in seconds, that the
+                command of a shell check used, when it is known.
+            cpu_system_time: The system CPU time, in seconds, that the
+                command of a shell check used, when it is known.
+            peak_rss_kib: The peak resident set size, in KiB, of the
+                command of a shell check, when it is known.
 
         """
         self.passed = passed
@@ -73,6 +143,36 @@ class CheckResult:  # pylint: disable=too-few-public-methods
         self.is_low_quality = is_low_quality
         self.details = details
         self.check_id = check_id
+        self.skipped = skipped
+        self.cached = cached
+        self.timed_out = timed_out
+        self.not_run = not_run
+        self.output_lines = output_lines
+        self.output_bytes = output_bytes
+        self.output_log = output_log
+        self.wall_time = wall_time
+        self.cpu_user_time = cpu_user_time
+        self.cpu_system_time = cpu_system_time
+        self.peak_rss_kib = peak_rss_kib
+
+    @property
+    def raw_diagnostic(self) -> str:
+        """Return the un-truncated diagnostic output.
+
+        Most diagnostics are short enough that they are not truncated,
+        so the un-truncated output is only stored when it differs from
+        the diagnostic.
+        """
+        if self._raw_diagnostic is None:
+            return self.diagnostic
+        return self._raw_diagnostic
+
+    @raw_diagnostic.setter
+    def raw_diagnostic(self, raw_diagnostic: str) -> None:
+        """Set the un-truncated diagnostic output."""
+        self._raw_diagnostic = (
+            None if raw_diagnostic == self.diagnostic else raw_diagnostic
+        )
 
     def display_result(self, show_diagnostic: bool = False) -> str:
         """Return check's passed or failed status, description, and, optionally, diagnostic message.
@@ -87,7 +187,15 @@ class CheckResult:  # pylint: disable=too-few-public-methods
         """
         icon = CHECK_MARK if self.passed else CROSS_MARK
         icon_color = PASS_COLOR if self.passed else FAIL_COLOR
+        if self.skipped:
+            icon = SKIP_MARK
+            icon_color = SKIP_COLOR
+        if self.not_run:
+            icon = NOT_RUN_MARK
+            icon_color = NOT_RUN_COLOR
         message = f"[{icon_color}]{icon}[/]  {self.description}"
+        if self.cached:
+            message += f" [dim]({CACHED_LABEL})[/]"
         if not self.passed and show_diagnostic:
             if NEWLINE in self.diagnostic:
                 message += (
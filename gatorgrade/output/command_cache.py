@@ -0,0 +1,182 @@
+"""Run each command of a grading run once, however many checks inspect it.
+
+Instructors often write many checks that run the same command, such as
+pytest or the program of the student, and then each look at a different
+part of its output. Without sharing, every one of those checks runs the
+command again. While a command cache is in use, the checks whose command
+and working directory are identical share a single run of the command:
+the first check to need it runs it, and every other check waits for and
+inspects that same output and exit code. Each check is still reported
+on its own.
+
+Shell checks share the combined output of their command, along with its
+exit code. GatorGrader checks share the separate output, error output,
+and exit code that gator.run.run_command returns; the main process runs
+the command and hands its run to the check wherever the check runs, so
+that checks in worker processes share it too. Since the two kinds of
+checks capture the output of a command differently, a shell check and a
+GatorGrader check with the same command each run it once.
+"""
+
+import asyncio
+import os
+import subprocess
+import threading
+from concurrent.futures import Future
+from contextlib import contextmanager
+from typing import Awaitable, Callable, Dict, Iterator, Tuple
+
+import gator.run
+
+from gatorgrade.output.executor import CommandOutcome
+
+# the output, error output, and exit code of a command that GatorGrader
+# ran, just as gator.run.run_command returns them
+GatorCommandRun = Tuple[bytes, bytes, int]
+
+
+class CommandResultCache:
+    """Share the runs of identical commands among the checks of one run.
+
+    The runs of GatorGrader commands can be shared from many threads at
+    the same time; the runs of shell commands belong to the event loop
+    that runs the shell checks. The cache counts the commands that it
+    ran and the checks that reused the run of another check.
+    """
+
+    def __init__(self) -> None:
+        """Construct an empty CommandResultCache."""
+        self.runs = 0
+        self.shares = 0
+        self._lock = threading.Lock()
+        # (command, working directory) -> run of a GatorGrader command
+        self._gator_runs: Dict[Tuple[str, str], Future] = {}
+        # (command, working directory) -> run of a shell command
+        self._shell_runs: Dict[Tuple[str, str], asyncio.Future] = {}
+
+    def _count(self, shared: bool) -> None:
+        """Count one command that ran or one check that shared a run."""
+        with self._lock:
+            if shared:
+                self.shares += 1
+            else:
+                self.runs += 1
+
+    def run_gator_command(
+        self,
+        command: str,
+        run: Callable[[str], GatorCommandRun] | None = None,
+    ) -> GatorCommandRun:
+        """Run a command for a GatorGrader check, or reuse its earlier run.
+
+        A check that asks for a command that another check is still
+        running waits for that run to finish instead of starting another.
+
+        Args:
+            command: The command that the check runs.
+            run: The function that runs the command, which defaults to
+                the one that GatorGrader uses.
+
+        Returns:
+            The output, error output, and exit code of the command.
+
+        Raises:
+            Exception: Any exception that running the command raised.
+
+        """
+        key = (command, os.getcwd())
+        with self._lock:
+            future = self._gator_runs.get(key)
+            shared = future is not None
+            if future is None:
+                future = Future()
+                self._gator_runs[key] = future
+        self._count(shared)
+        if not shared:
+            try:
+                future.set_result((run or gator.run.run_command)(command))
+            except Exception as error:  # pylint: disable=W0703
+                future.set_exception(error)
+        return future.result()
+
+    async def run_shell_command(
+        self,
+        command: str,
+        timeout: float,
+        run: Callable[[], Awaitable[CommandOutcome]],
+    ) -> Tuple[CommandOutcome, bool]:
+        """Run the command of a shell check, or reuse its earlier run.
+
+        The first check to run a command owns its run, so cancelling that
+        check stops the command; a later check with the same command then
+        runs it again. A check that waits for the run of another check
+        still only waits for as long as its own timeout allows.
+
+        Args:
+            command: The command that the check runs.
+            timeout: The maximum number of seconds that the check waits
+                for a run that another check started.
+            run: The function that starts the command and returns its
+                outcome, called only when the command has to run.
+
+        Returns:
+            The outcome of the command and whether it was shared with a
+            check that ran it earlier.
+
+        Raises:
+            subprocess.TimeoutExpired: If the command did not finish in
+                time, either for the check that ran it or for this one.
+
+        """
+        key = (command, os.getcwd())
+        running = self._shell_runs.get(key)
+        if running is not None and not running.cancelled():
+            self._count(shared=True)
+            try:
+                # shielding keeps a cancelled or timed out check from
+                # cancelling the command for the check that owns it
+                outcome = await asyncio.wait_for(
+                    asyncio.shield(running), timeout
+                )
+            except asyncio.TimeoutError as error:
+                raise subprocess.TimeoutExpired(command, timeout) from error
+            return outcome, True
+        task = asyncio.ensure_future(run())
+        self._shell_runs[key] = task
+        self._count(shared=False)
+        return await task, False
+
+
+@contextmanager
+def serving_command_runs(
+    command_runs: Dict[str, GatorCommandRun],
+) -> Iterator[None]:
+    """Make GatorGrader reuse runs of commands instead of running them.
+
+    Every GatorGrader check that inspects a command runs it through
+    gator.run.run_command, so that function is replaced by one that
+    returns the given run of a command and only runs a command that it
+    has no run of. Since this changes GatorGrader for the whole process,
+    the caller must make sure that no other GatorGrader check runs at
+    the same time in this process.
+
+    Args:
+        command_runs: The runs of commands, by command.
+
+    Yields:
+        Nothing, for use in a with statement.
+
+    """
+    run_command = gator.run.run_command
+
+    def run_or_reuse(command: str) -> GatorCommandRun:
+        command_run = command_runs.get(command)
+        if command_run is None:
+            return run_command(command)
+        return command_run
+
+    gator.run.run_command = run_or_reuse
+    try:
+        yield
+    finally:
+        gator.run.run_command = run_command
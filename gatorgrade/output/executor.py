@@ -0,0 +1,601 @@
+"""Run the shell commands of checks as asyncio subprocesses.
+
+Every shell check is started as an asyncio subprocess so that many
+checks can run inside of a single event loop. The combined stdout and
+stderr of a command is streamed to the loop in chunks while the command
+runs and is kept in a bounded capture, so a command that writes without
+end cannot exhaust memory. Every command starts in a process group of
+its own, so when it does not finish before its timeout expires the
+shell and every process that it started are killed at once. Where the
+platform provides os.wait4, every command is started by a small launcher
+process, which reaps it with os.wait4 so that the CPU time and peak
+memory of the command are reported along with its output, without the
+memory of GatorGrade itself. One thread reads the exits that the
+launcher reports, so no thread is started for each command. A command
+that was split into an argument list because it needs no feature of
+the shell starts its program directly, without a shell.
+"""
+
+import asyncio
+import itertools
+import os
+import signal
+import socket
+import subprocess
+import sys
+import threading
+from collections import namedtuple
+from contextlib import contextmanager
+from typing import Awaitable, Callable, Dict, Iterator, List, Tuple
+
+from gatorgrade.output import launcher
+from gatorgrade.output.capture import BoundedCapture
+from gatorgrade.output.launcher import (
+    KILL_REQUEST,
+    RUN_REQUEST,
+    receive_message,
+    send_message,
+)
+
+# the maximum number of seconds that a single command may run
+DEFAULT_TIMEOUT_SECONDS = 300
+
+# start every command as the leader of a new session, and thus of a new
+# process group, so that it can be killed together with its children;
+# process groups are not available on Windows, where only the shell
+# itself can be killed
+NEW_PROCESS_GROUP = (
+    {"start_new_session": True} if hasattr(os, "killpg") else {}
+)
+
+# os.wait4 reports the resource usage of a process when it is reaped;
+# where it is missing (on Windows) commands run without that report
+HAS_WAIT4 = hasattr(os, "wait4")
+
+# the name of the thread that reads the exits that the launcher reports
+LAUNCHER_THREAD_NAME = "gatorgrade-launcher"
+LAUNCHER_EXITED_MSG = "The launcher of the commands exited"
+
+# ru_maxrss is measured in bytes on macOS and in KiB everywhere else
+MAX_RSS_BYTES_PER_UNIT = 1 if sys.platform == "darwin" else 1024
+BYTES_PER_KIB = 1024
+
+# the resources that a command used: its user and system CPU time, in
+# seconds, and its peak resident set size, in KiB, each covering the
+# shell and every process that it started and waited for; since every
+# command is started by the launcher, its peak includes the few MiB of
+# the launcher but never the memory of GatorGrade
+ResourceUsage = namedtuple(
+    "ResourceUsage", ["user_time", "system_time", "peak_rss_kib"]
+)
+
+
+# the outcome of running a command: its exit code, the kept head and
+# tail of what it wrote to stdout and stderr (interleaved in one
+# stream), the number of lines and bytes that it wrote in total, the
+# number of bytes that were not kept, and the path of the log file
+# with its full output when that was requested and output was omitted,
+# and the resources that it used, when the platform reports them
+CommandOutcome = namedtuple(
+    "CommandOutcome",
+    [
+        "returncode",
+        "output",
+        "line_count",
+        "byte_count",
+        "omitted_bytes",
+        "log_path",
+        "usage",
+    ],
+    defaults=[0, 0, 0, None, None],
+)
+
+
+class CommandTimeoutExpired(subprocess.TimeoutExpired):
+    """Signal that a command was killed because its timeout expired."""
+
+    def __init__(
+        self, command: str, timeout: float, outcome: CommandOutcome
+    ) -> None:
+        """Construct a CommandTimeoutExpired for a killed command.
+
+        Args:
+            command: The command that ran out of time.
+            timeout: The number of seconds that the command was allowed.
+            outcome: The outcome with the output written before the kill.
+
+        """
+        super().__init__(command, timeout, output=outcome.output)
+        self.outcome = outcome
+
+
+class _OutputProtocol(asyncio.SubprocessProtocol, asyncio.Protocol):
+    """Capture the output of a subprocess as it is streamed to the loop.
+
+    The protocol serves both as the protocol of a subprocess transport
+    and as the protocol of a read pipe transport that is connected to
+    the output pipe of a process started with subprocess.Popen.
+    """
+
+    def __init__(self, spill: bool = False) -> None:
+        """Construct an _OutputProtocol with no output yet.
+
+        Args:
+            spill: Whether to write the full output to a log file.
+
+        """
+        self.capture = BoundedCapture(spill=spill)
+        # resolved once the output of the process is closed, which for a
+        # subprocess transport also means that the process has exited
+        self.finished: asyncio.Future = (
+            asyncio.get_running_loop().create_future()
+        )
+
+    def pipe_data_received(self, fd: int, data: bytes) -> None:
+        """Capture a chunk of output as soon as the command writes it."""
+        self.capture.write(data)
+
+    def data_received(self, data: bytes) -> None:
+        """Capture a chunk of output read from the output pipe."""
+        self.capture.write(data)
+
+    def eof_received(self) -> None:
+        """Let the read pipe transport close once the output ends."""
+
+    def connection_lost(self, exc: Exception | None) -> None:
+        """Signal that the process has exited and closed its output."""
+        self.capture.close()
+        if not self.finished.done():
+            self.finished.set_result(None)
+
+    def outcome(
+        self, returncode: int | None, usage: ResourceUsage | None = None
+    ) -> CommandOutcome:
+        """Return the outcome of the command with the output it wrote."""
+        self.capture.close()
+        return CommandOutcome(
+            returncode=returncode,
+            output=self.capture.getvalue(),
+            line_count=self.capture.total_lines,
+            byte_count=self.capture.total_bytes,
+            omitted_bytes=self.capture.omitted_bytes,
+            log_path=self.capture.log_path,
+            usage=usage,
+        )
+
+
+def kill_process_group(process_id: int) -> None:
+    """Kill every process in the process group led by a process.
+
+    A command run through the shell can start grandchildren that keep
+    running, and keep using the CPU, after the shell has been killed;
+    killing the whole group stops all of them.
+
+    Args:
+        process_id: The process id of a process that was started with
+            NEW_PROCESS_GROUP and thus leads its own process group.
+
+    """
+    if not hasattr(os, "killpg"):
+        return
+    try:
+        os.killpg(process_id, signal.SIGKILL)
+    except (ProcessLookupError, PermissionError):
+        # the group has already exited
+        pass
+
+
+def _kill_process(transport: asyncio.SubprocessTransport) -> None:
+    """Kill a process and its process group and close its pipes.
+
+    Closing the pipes matters because, on platforms without process
+    groups, a grandchild started by the shell can keep them open after
+    the shell itself has been killed.
+
+    Args:
+        transport: The transport of the process to kill.
+
+    """
+    process_id = transport.get_pid()
+    if process_id is not None:
+        kill_process_group(process_id)
+    if transport.get_returncode() is None:
+        try:
+            transport.kill()
+        except ProcessLookupError:
+            pass
+    transport.close()
+
+
+def _resource_usage(usage: Tuple[float, float, int]) -> ResourceUsage:
+    """Convert the rusage fields that the launcher reports to a ResourceUsage.
+
+    Args:
+        usage: The user and system CPU time and the ru_maxrss of a
+            reaped command.
+
+    """
+    user_time, system_time, max_rss = usage
+    return ResourceUsage(
+        user_time=user_time,
+        system_time=system_time,
+        peak_rss_kib=max_rss * MAX_RSS_BYTES_PER_UNIT // BYTES_PER_KIB,
+    )
+
+
+def _resolve(
+    loop: asyncio.AbstractEventLoop,
+    exited: asyncio.Future,
+    result: Tuple[int, ResourceUsage | None] | BaseException,
+) -> None:
+    """Resolve the future of a reaped process from another thread."""
+
+    def resolve() -> None:
+        if exited.done():
+            return
+        if isinstance(result, BaseException):
+            exited.set_exception(result)
+        else:
+            exited.set_result(result)
+
+    try:
+        loop.call_soon_threadsafe(resolve)
+    except RuntimeError:
+        # the loop was closed while the process was still running
+        pass
+
+
+class _LauncherClient:
+    """Run commands through the launcher, for every event loop at once.
+
+    The launcher is started when the first command runs, and then runs
+    every command until GatorGrade exits. One thread reads the exits
+    that it reports and resolves the future of each command in the loop
+    that waits for it.
+    """
+
+    def __init__(self) -> None:
+        """Construct a _LauncherClient that has not started the launcher."""
+        self._lock = threading.Lock()
+        self._connection: socket.socket | None = None
+        self._process: subprocess.Popen | None = None
+        # a process that forked can use neither the socket nor the
+        # thread of its parent, so it starts a launcher of its own
+        self._owner: int | None = None
+        self._unavailable = False
+        self._request_ids = itertools.count()
+        # the loop and the future of every command that has not been
+        # reported, by its request id
+        self._waiting: Dict[
+            int, Tuple[asyncio.AbstractEventLoop, asyncio.Future]
+        ] = {}
+
+    def available(self) -> bool:
+        """Return whether the launcher runs, starting it when it does not."""
+        with self._lock:
+            if self._unavailable:
+                return False
+            try:
+                self._connect()
+            except OSError:
+                # an interpreter that cannot be started again runs its
+                # commands without reporting their resources
+                self._unavailable = True
+                return False
+            return True
+
+    def _connect(self) -> socket.socket:
+        """Return the socket of the launcher, starting it if it is not running."""
+        if (
+            self._connection is not None
+            and self._process is not None
+            and self._owner == os.getpid()
+            and self._process.poll() is None
+        ):
+            return self._connection
+        connection, launcher_end = socket.socketpair()
+        try:
+            self._process = subprocess.Popen(
+                [
+                    sys.executable,
+                    "-S",
+                    "-I",
+                    launcher.__file__,
+                    str(launcher_end.fileno()),
+                ],
+                pass_fds=[launcher_end.fileno()],
+            )
+        except OSError:
+            connection.close()
+            raise
+        finally:
+            launcher_end.close()
+        self._connection = connection
+        self._owner = os.getpid()
+        self._waiting = {}
+        threading.Thread(
+            target=self._read,
+            args=(connection, self._waiting),
+            name=LAUNCHER_THREAD_NAME,
+            daemon=True,
+        ).start()
+        return connection
+
+    def start(
+        self,
+        command: str,
+        argv: List[str] | None,
+        output: int,
+        exited: asyncio.Future,
+    ) -> int:
+        """Ask the launcher to start a command.
+
+        Args:
+            command: The command to run in the shell.
+            argv: The program and arguments of the command, if it needs no
+                feature of the shell, or None to run it in the shell.
+            output: The write end of the pipe for the output of the command.
+            exited: The future to resolve with the exit code and the
+                resources of the command once it has been reaped.
+
+        Returns:
+            The id of the request, with which the command can be killed.
+
+        """
+        with self._lock:
+            connection = self._connect()
+            request_id = next(self._request_ids)
+            waiting = self._waiting
+            waiting[request_id] = (exited.get_loop(), exited)
+            request = (
+                RUN_REQUEST,
+                request_id,
+                argv,
+                command,
+                os.getcwd(),
+                dict(os.environb),
+            )
+            try:
+                send_message(connection, request, [output])
+            except OSError:
+                del waiting[request_id]
+                raise
+        return request_id
+
+    def kill(self, request_id: int) -> None:
+        """Kill a command and every process in its process group."""
+        with self._lock:
+            if self._connection is None or self._owner != os.getpid():
+                return
+            try:
+                send_message(self._connection, (KILL_REQUEST, request_id))
+            except OSError:
+                # the launcher has exited, and its commands with it
+                pass
+
+    @staticmethod
+    def _read(
+        connection: socket.socket,
+        waiting: Dict[int, Tuple[asyncio.AbstractEventLoop, asyncio.Future]],
+    ) -> None:
+        """Resolve the future of every command that the launcher reports."""
+        while True:
+            try:
+                received = receive_message(connection)
+            except (OSError, EOFError):
+                received = None
+            if received is None:
+                break
+            (request_id, returncode, usage), _ = received
+            loop, exited = waiting.pop(request_id)
+            if isinstance(returncode, OSError):
+                _resolve(loop, exited, returncode)
+            else:
+                _resolve(loop, exited, (returncode, _resource_usage(usage)))
+        # no command of a launcher that exited is ever reported
+        for request_id in list(waiting):
+            loop, exited = waiting.pop(request_id)
+            _resolve(loop, exited, ChildProcessError(LAUNCHER_EXITED_MSG))
+
+
+_LAUNCHER = _LauncherClient()
+
+
+async def _wait_for_both(
+    first: asyncio.Future, second: asyncio.Future
+) -> None:
+    """Wait until two futures are done, in whatever order they finish."""
+    await first
+    await second
+
+
+async def _wait_or_kill(
+    command: str,
+    timeout: float,
+    protocol: _OutputProtocol,
+    finished: Awaitable,
+    kill: Callable[[], None],
+) -> None:
+    """Wait for a command to finish, killing it when it runs too long.
+
+    Args:
+        command: The command that is running.
+        timeout: The maximum number of seconds the command may run.
+        protocol: The protocol that captures the output of the command.
+        finished: What to wait for until the command has finished.
+        kill: The function that kills the command and closes its pipes.
+
+    Raises:
+        CommandTimeoutExpired: If the command did not finish before
+            the timeout; the outcome with the partial output is attached.
+
+    """
+    try:
+        await asyncio.wait_for(finished, timeout=timeout)
+    except asyncio.TimeoutError as error:
+        kill()
+        raise CommandTimeoutExpired(
+            command, timeout, protocol.outcome(None)
+        ) from error
+    except asyncio.CancelledError:
+        # do not leave the command running when the check is cancelled
+        kill()
+        protocol.capture.close()
+        raise
+
+
+async def _run_through_launcher(
+    command: str, timeout: float, spill: bool, argv: List[str] | None
+) -> CommandOutcome:
+    """Run a command that the launcher starts and reaps with os.wait4.
+
+    The launcher reports the exit code of the command and the resources
+    that it used, while its output pipe is still read by the loop.
+    """
+    loop = asyncio.get_running_loop()
+    exited: asyncio.Future = loop.create_future()
+    read_end, write_end = os.pipe()
+    try:
+        request_id = _LAUNCHER.start(command, argv, write_end, exited)
+    except BaseException:
+        os.close(read_end)
+        raise
+    finally:
+        os.close(write_end)
+    transport, protocol = await loop.connect_read_pipe(
+        lambda: _OutputProtocol(spill), open(read_end, "rb", buffering=0)
+    )
+
+    def kill() -> None:
+        # every process started by the command is in the group led by
+        # the shell or the program, which the launcher kills at once
+        _LAUNCHER.kill(request_id)
+        transport.close()
+
+    await _wait_or_kill(
+        command,
+        timeout,
+        protocol,
+        _wait_for_both(protocol.finished, exited),
+        kill,
+    )
+    returncode, usage = exited.result()
+    return protocol.outcome(returncode, usage)
+
+
+async def _run_with_subprocess_transport(
+    command: str, timeout: float, spill: bool, argv: List[str] | None
+) -> CommandOutcome:
+    """Run a command through an asyncio subprocess transport."""
+    loop = asyncio.get_running_loop()
+    transport = None
+    if argv is not None:
+        try:
+            transport, protocol = await loop.subprocess_exec(
+                lambda: _OutputProtocol(spill),
+                *argv,
+                stdin=None,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                **NEW_PROCESS_GROUP,
+            )
+        except OSError:
+            # let the shell run the program or report why it cannot
+            transport = None
+    if transport is None:
+        # this is the same primitive that asyncio.create_subprocess_shell
+        # uses, but owning the transport makes it possible to close the
+        # pipes of a command that has to be killed
+        transport, protocol = await loop.subprocess_shell(
+            lambda: _OutputProtocol(spill),
+            command,
+            stdin=None,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            **NEW_PROCESS_GROUP,
+        )
+    await _wait_or_kill(
+        command,
+        timeout,
+        protocol,
+        protocol.finished,
+        lambda: _kill_process(transport),
+    )
+    returncode = transport.get_returncode()
+    transport.close()
+    return protocol.outcome(returncode)
+
+
+async def run_shell_command(
+    command: str,
+    timeout: float = DEFAULT_TIMEOUT_SECONDS,
+    spill: bool = False,
+    argv: List[str] | None = None,
+) -> CommandOutcome:
+    """Run a command in the shell and capture its combined output.
+
+    STDERR is redirected to STDOUT so that both are captured together
+    as the diagnostic, in the order that they were written.
+
+    Args:
+        command: The command to run in the shell.
+        timeout: The maximum number of seconds the command may run.
+        spill: Whether to keep the full output in a temporary log file
+            when it is too long to be kept in memory.
+        argv: The program and arguments of the command, when it needs
+            no feature of the shell; the program is then started without
+            a shell, unless it cannot be started, and the command then
+            runs in the shell after all.
+
+    Returns:
+        The exit code of the command, its captured output, and, where
+        the platform reports it, the resources that it used.
+
+    Raises:
+        CommandTimeoutExpired: If the command did not finish before
+            the timeout; the outcome with the partial output is attached.
+
+    """
+    if HAS_WAIT4 and _LAUNCHER.available():
+        return await _run_through_launcher(command, timeout, spill, argv)
+    return await _run_with_subprocess_transport(command, timeout, spill, argv)
+
+
+async def _cancel_pending_tasks() -> None:
+    """Cancel every other task in the running loop and wait for them."""
+    current = asyncio.current_task()
+    tasks = [task for task in asyncio.all_tasks() if task is not current]
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+
+@contextmanager
+def background_event_loop() -> Iterator[asyncio.AbstractEventLoop]:
+    """Run an asyncio event loop in a background thread.
+
+    The checks are scheduled on this loop with
+    asyncio.run_coroutine_threadsafe so that the code that displays
+    the results can keep consuming them synchronously. When the
+    context exits, every task that is still running is cancelled
+    (which kills its command) before the loop is stopped and closed.
+
+    Yields:
+        The running event loop.
+
+    """
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    try:
+        yield loop
+    finally:
+        asyncio.run_coroutine_threadsafe(
+            _cancel_pending_tasks(), loop
+        ).result()
+        asyncio.run_coroutine_threadsafe(
+            loop.shutdown_default_executor(), loop
+        ).result()
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
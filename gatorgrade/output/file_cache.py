@@ -0,0 +1,217 @@
+"""Share the content of files among the GatorGrader checks of one run.
+
+A configuration often has many GatorGrader checks of the same file, such
+as one check for a fragment and another for a regular expression, and
+GatorGrader reads the file again for every one of them. While a file
+cache is in use, every file that GatorGrader reads is read through it,
+so all of the checks of an unchanged file cost one read. Each file is
+stored under the SHA-256 digest of its content, so files with the same
+content share one copy, and a file is read again as soon as its
+modification time or size changes. Large files are read through mmap.
+"""
+
+import hashlib
+import locale
+import mmap
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Tuple
+
+import gator.files
+
+# files of at least this many bytes are mapped instead of read
+MMAP_THRESHOLD_BYTES = 1024 * 1024
+
+# the line endings that Path.read_text translates to a newline
+CARRIAGE_RETURN = "\r"
+WINDOWS_NEWLINE = "\r\n"
+NEWLINE = "\n"
+STRICT_ERRORS = "strict"
+
+# the cache that GatorGrader reads through, if any; GatorGrader checks
+# run one at a time in a process, so there is at most one of them
+_active_cache: "FileContentCache | None" = None
+
+
+def _read_bytes(path: Path, size: int) -> Tuple[str, bytes]:
+    """Read a file and compute the SHA-256 digest of its content.
+
+    Args:
+        path: The path of the file to read.
+        size: The size of the file, in bytes, when it was last checked.
+
+    Returns:
+        The hex digest of the content of the file and the content.
+
+    """
+    with open(path, "rb") as file:
+        if size < MMAP_THRESHOLD_BYTES:
+            content = file.read()
+            return hashlib.sha256(content).hexdigest(), content
+        # hash the mapped pages directly and copy them only once
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return hashlib.sha256(mapped).hexdigest(), mapped[:]
+
+
+def _translate_newlines(text: str) -> str:
+    """Translate line endings like a file opened in text mode does."""
+    if CARRIAGE_RETURN not in text:
+        return text
+    return text.replace(WINDOWS_NEWLINE, NEWLINE).replace(
+        CARRIAGE_RETURN, NEWLINE
+    )
+
+
+class FileContentCache:
+    """Keep the content of the files that the checks of one run read.
+
+    The cache can be used from many threads at the same time. It counts
+    the reads that it served from memory as hits and the reads that had
+    to go to the file system as misses, including those reported by the
+    caches of GatorGrader worker processes.
+    """
+
+    def __init__(self) -> None:
+        """Construct an empty FileContentCache."""
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        # path -> (modification time, size, digest of the content)
+        self._paths: Dict[str, Tuple[int, int, str]] = {}
+        # digest -> content, so that equal files are stored only once
+        self._contents: Dict[str, bytes] = {}
+        # (digest, encoding, errors) -> decoded text
+        self._texts: Dict[Tuple[str, str | None, str | None], str] = {}
+
+    def record(self, hits: int, misses: int) -> None:
+        """Add the hits and misses of another cache to the counts.
+
+        Args:
+            hits: The number of reads that were served from memory.
+            misses: The number of reads that went to the file system.
+
+        """
+        with self._lock:
+            self.hits += hits
+            self.misses += misses
+
+    def read_bytes(self, path: Path) -> Tuple[str, bytes]:
+        """Return the digest and content of a file, reading it if needed.
+
+        Args:
+            path: The path of the file to read.
+
+        Returns:
+            The hex digest of the content of the file and the content.
+
+        Raises:
+            OSError: If the file cannot be read.
+
+        """
+        status = path.stat()
+        key = str(path.resolve())
+        with self._lock:
+            entry = self._paths.get(key)
+            if entry is not None and entry[:2] == (
+                status.st_mtime_ns,
+                status.st_size,
+            ):
+                self.hits += 1
+                return entry[2], self._contents[entry[2]]
+        digest, content = _read_bytes(path, status.st_size)
+        with self._lock:
+            self.misses += 1
+            self._paths[key] = (status.st_mtime_ns, status.st_size, digest)
+            content = self._contents.setdefault(digest, content)
+        return digest, content
+
+    def read_text(
+        self,
+        path: Path,
+        encoding: str | None = None,
+        errors: str | None = None,
+    ) -> str:
+        """Return the text of a file just like Path.read_text would.
+
+        Args:
+            path: The path of the file to read.
+            encoding: The name of the encoding of the file.
+            errors: How to handle content that cannot be decoded.
+
+        Returns:
+            The decoded content of the file with universal newlines.
+
+        Raises:
+            OSError: If the file cannot be read.
+            UnicodeDecodeError: If the content cannot be decoded.
+
+        """
+        digest, content = self.read_bytes(path)
+        text_key = (digest, encoding, errors)
+        with self._lock:
+            text = self._texts.get(text_key)
+        if text is None:
+            # decode in the same way that opening the file in text mode does
+            text = _translate_newlines(
+                content.decode(
+                    encoding or locale.getpreferredencoding(False),
+                    errors or STRICT_ERRORS,
+                )
+            )
+            with self._lock:
+                self._texts[text_key] = text
+        return text
+
+
+class _CachedPath(type(Path())):  # type: ignore[misc]
+    """A path whose text is read through the active file cache."""
+
+    def read_text(
+        self, encoding: str | None = None, errors: str | None = None
+    ) -> str:
+        """Read the text of the file through the active file cache."""
+        cache = _active_cache
+        if cache is None:
+            return super().read_text(encoding=encoding, errors=errors)
+        return cache.read_text(self, encoding, errors)
+
+
+def _cached_paths(
+    create_paths: Callable[..., List[Path]],
+) -> Callable[..., List[Path]]:
+    """Wrap gator.files.create_paths to return paths read through a cache."""
+
+    def create_cached_paths(*args, **kwargs) -> List[Path]:
+        return [_CachedPath(path) for path in create_paths(*args, **kwargs)]
+
+    return create_cached_paths
+
+
+@contextmanager
+def reading_through(cache: FileContentCache) -> Iterator[FileContentCache]:
+    """Make GatorGrader read the files that it checks through a cache.
+
+    Every GatorGrader check that reads the content of a file finds the
+    file with gator.files.create_paths and then reads it with
+    Path.read_text, so the paths that it returns are replaced by paths
+    that read through the cache. Since this changes GatorGrader for the
+    whole process, the caller must make sure that no other GatorGrader
+    check runs at the same time in this process.
+
+    Args:
+        cache: The cache to read files through.
+
+    Yields:
+        The cache, for use in a with statement.
+
+    """
+    global _active_cache  # noqa: PLW0603
+    create_paths = gator.files.create_paths
+    gator.files.create_paths = _cached_paths(create_paths)
+    _active_cache = cache
+    try:
+        yield cache
+    finally:
+        _active_cache = None
+        gator.files.create_paths = create_paths
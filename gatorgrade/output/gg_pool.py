@@ -0,0 +1,249 @@
+"""Run GatorGrader checks in a pool of worker processes.
+
+GatorGrader keeps the result of the check that it is running in
+module-level state, so within one process its checks can only run one
+after another. A pool of worker processes lets several GatorGrader
+checks run at the same time, keeps the state of one check from leaking
+into the checks of other workers, and stops a check that crashes its
+worker from taking down the whole run. Every worker imports GatorGrader
+once, when it starts, and then runs many checks. The workers start as
+soon as the pool is created, so that they import GatorGrader while
+other work goes on, and checks can run in the calling process until
+they are ready. To bound the memory that the workers accumulate, the
+pool is replaced by a fresh one after its workers have together run a
+fixed number of checks each; the fresh workers start once the current
+ones have run half of their checks, so no check waits for them. Every
+worker reads the files that its checks inspect through a file cache of
+its own, and reports its cache hits and misses with each result. The
+runs of the commands that a check inspects can be handed to the worker
+along with the check, so that the worker does not run them again.
+"""
+
+import multiprocessing
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from types import TracebackType
+from typing import Dict, List, Tuple, Type
+
+# importing this module in a worker imports GatorGrader, so every
+# worker pays for that import once instead of once per check
+import gator
+
+from gatorgrade.output.command_cache import (
+    GatorCommandRun,
+    serving_command_runs,
+)
+from gatorgrade.output.file_cache import FileContentCache, reading_through
+
+# the number of checks that each worker runs, on average, before the
+# pool is replaced with new workers
+DEFAULT_CHECKS_PER_WORKER = 50
+
+# the number of times a check is retried on a new pool when a worker
+# died while the check was waiting for or running in the pool
+MAX_POOL_RESTARTS = 1
+
+# start workers from a fresh interpreter instead of forking, since the
+# checks are scheduled from a process that is already running threads
+WORKER_START_METHOD = "spawn"
+
+# the (description, passed, diagnostic) tuple returned by gator.grader
+GraderResult = Tuple[str, bool, str]
+
+# the file cache of a worker process, which lives as long as the worker
+# and thus never outlives the run that started the pool
+_worker_file_cache = FileContentCache()
+
+
+def _start_worker() -> None:
+    """Do nothing, since unpickling this function imports GatorGrader.
+
+    Every worker runs this function when it starts, and every new pool
+    also hands it to each of its workers as a task, which starts all of
+    them at once instead of one for each of the first checks.
+    """
+
+
+def _grade(
+    gg_args: List[str], command_runs: Dict[str, GatorCommandRun]
+) -> Tuple[GraderResult, int, int]:
+    """Run one GatorGrader check inside of a worker process.
+
+    Args:
+        gg_args: The command-line arguments of the GatorGrader check.
+        command_runs: The runs of the commands that the check inspects,
+            by command, which the check reuses instead of running them.
+
+    Returns:
+        The description, passed status, and diagnostic of the check,
+        followed by the file cache hits and misses of the check.
+
+    """
+    hits = _worker_file_cache.hits
+    misses = _worker_file_cache.misses
+    with (
+        reading_through(_worker_file_cache),
+        serving_command_runs(command_runs),
+    ):
+        description, passed, diagnostic = gator.grader(gg_args)
+    hits = _worker_file_cache.hits - hits
+    misses = _worker_file_cache.misses - misses
+    return (description, passed, diagnostic), hits, misses
+
+
+class GatorGraderPool:
+    """Hand GatorGrader checks to a pool of pre-warmed worker processes.
+
+    The worker processes start as soon as the pool is created, and the
+    pool is ready once all of them have imported GatorGrader. The pool
+    can be used from many threads at the same time.
+    """
+
+    def __init__(
+        self,
+        workers: int,
+        checks_per_worker: int = DEFAULT_CHECKS_PER_WORKER,
+        file_cache: FileContentCache | None = None,
+    ) -> None:
+        """Construct a GatorGraderPool and start its workers.
+
+        Args:
+            workers: The maximum number of checks to run at the same time.
+            checks_per_worker: The number of checks that each worker
+                runs, on average, before the workers are replaced.
+            file_cache: The cache that counts the file cache hits and
+                misses of the workers, if they should be counted.
+
+        """
+        self.workers = max(workers, 1)
+        self.checks_per_worker = max(checks_per_worker, 1)
+        self._lock = threading.Lock()
+        self._executor: ProcessPoolExecutor | None = None
+        # the workers that replace the current ones, and the tasks that
+        # start the workers of each, which are done once they are ready
+        self._next_executor: ProcessPoolExecutor | None = None
+        self._starting: List[Future] = []
+        self._next_starting: List[Future] = []
+        self._submitted = 0
+        self.file_cache = file_cache
+        with self._lock:
+            self._executor, self._starting = self._start_executor()
+
+    def _start_executor(self) -> Tuple[ProcessPoolExecutor, List[Future]]:
+        """Return a new executor whose workers are all starting."""
+        executor = ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context(WORKER_START_METHOD),
+            initializer=_start_worker,
+        )
+        return executor, [
+            executor.submit(_start_worker) for _ in range(self.workers)
+        ]
+
+    def ready(self) -> bool:
+        """Return whether the workers have started and imported GatorGrader."""
+        with self._lock:
+            return self._executor is not None and all(
+                started.done() for started in self._starting
+            )
+
+    def _executor_for_next_check(self) -> ProcessPoolExecutor:
+        """Return the executor for the next check, replacing a spent one.
+
+        The caller must hold the lock. A replaced executor is shut down
+        without waiting, so the checks that it already accepted still
+        finish before its workers exit.
+        """
+        quota = self.workers * self.checks_per_worker
+        if self._next_executor is None and self._submitted >= quota // 2:
+            self._next_executor, self._next_starting = self._start_executor()
+        if self._executor is not None and self._submitted >= quota:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+        if self._executor is None:
+            if self._next_executor is None:
+                self._next_executor, self._next_starting = (
+                    self._start_executor()
+                )
+            self._executor, self._starting = (
+                self._next_executor,
+                self._next_starting,
+            )
+            self._next_executor, self._next_starting = None, []
+            self._submitted = 0
+        self._submitted += 1
+        return self._executor
+
+    def _discard(self, executor: ProcessPoolExecutor) -> None:
+        """Stop using an executor whose worker died, if still in use."""
+        with self._lock:
+            if self._executor is executor:
+                self._executor = None
+        executor.shutdown(wait=False)
+
+    def grade(
+        self,
+        gg_args: List[str],
+        command_runs: Dict[str, GatorCommandRun] | None = None,
+    ) -> GraderResult:
+        """Run a GatorGrader check in a worker and wait for its result.
+
+        Args:
+            gg_args: The command-line arguments of the GatorGrader check.
+            command_runs: The runs of the commands that the check
+                inspects, by command, so that the worker reuses them.
+
+        Returns:
+            The description, passed status, and diagnostic of the check.
+
+        Raises:
+            BrokenProcessPool: If a worker died while running the check
+                even after the pool was restarted.
+            Exception: Any exception that GatorGrader raised for the check.
+
+        """
+        attempt = 0
+        while True:
+            try:
+                # submit while holding the lock so that no other thread
+                # can replace the executor between choosing and using it
+                with self._lock:
+                    executor = self._executor_for_next_check()
+                    future = executor.submit(
+                        _grade, list(gg_args), dict(command_runs or {})
+                    )
+                result, hits, misses = future.result()
+            except BrokenProcessPool:
+                # a worker died, which breaks the whole executor, so
+                # start a new one unless this check already had a retry
+                self._discard(executor)
+                if attempt >= MAX_POOL_RESTARTS:
+                    raise
+                attempt += 1
+                continue
+            if self.file_cache is not None:
+                self.file_cache.record(hits, misses)
+            return result
+
+    def close(self) -> None:
+        """Stop the worker processes after their current checks finish."""
+        with self._lock:
+            executors = [self._executor, self._next_executor]
+            self._executor = self._next_executor = None
+        for executor in executors:
+            if executor is not None:
+                executor.shutdown(wait=True, cancel_futures=True)
+
+    def __enter__(self) -> "GatorGraderPool":
+        """Return the pool for use in a with statement."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Stop the worker processes when the with statement ends."""
+        self.close()
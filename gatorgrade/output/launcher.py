@@ -0,0 +1,245 @@
+"""Start the commands of shell checks from a small process of their own.
+
+The peak memory that os.wait4 reports for a process includes the memory
+of the process that forked it, since the kernel carries the peak of a
+process over both its fork and its exec. A command forked from
+GatorGrade, after it has parsed a large configuration, would therefore
+report at least the memory of GatorGrade itself. GatorGrade instead
+runs this module once, as a fresh interpreter that imports nothing but
+a few modules of the standard library, and asks it to start every
+command. The launcher reaps each command with os.wait4 and sends back
+its exit code and the resources that it used, so the peak memory of a
+command only ever includes the few MiB of the launcher.
+
+The launcher and GatorGrade talk over a Unix socket, where every
+message is a pickled tuple that follows its length. A request to run a
+command carries the write end of the pipe that receives its output.
+"""
+
+import os
+import pickle
+import select
+import signal
+import socket
+import struct
+import sys
+from typing import Any, Dict, List, Sequence, Tuple
+
+# the length of the pickled message that follows it on the socket
+HEADER = struct.Struct("!I")
+
+# the number of bytes read from the socket at once
+RECEIVE_BYTES = 65536
+
+# the requests that GatorGrade sends to the launcher
+RUN_REQUEST = "run"
+KILL_REQUEST = "kill"
+
+# the shell that runs a command that has no argument list, which is the
+# same shell that subprocess.Popen uses
+SHELL = "/system/bin/sh" if hasattr(sys, "getandroidapilevel") else "/bin/sh"
+
+# the signals that the launcher or the interpreter ignore and that every
+# command must handle in the default way again, as subprocess.Popen does
+RESET_SIGNALS = [
+    getattr(signal, name)
+    for name in ("SIGINT", "SIGPIPE", "SIGXFSZ")
+    if hasattr(signal, name)
+]
+
+
+def send_message(
+    connection: socket.socket, message: Any, fds: Sequence[int] = ()
+) -> None:
+    """Send a message, and any file descriptors with it, over the socket.
+
+    Args:
+        connection: The socket between GatorGrade and the launcher.
+        message: The tuple to send, which must be picklable.
+        fds: The file descriptors to pass along with the message.
+
+    """
+    payload = pickle.dumps(message, protocol=pickle.HIGHEST_PROTOCOL)
+    data = HEADER.pack(len(payload)) + payload
+    sent = socket.send_fds(connection, [data], list(fds)) if fds else 0
+    connection.sendall(data[sent:])
+
+
+def _receive_exactly(
+    connection: socket.socket, size: int, fds: List[int]
+) -> bytes | None:
+    """Receive a number of bytes and collect the descriptors sent with them.
+
+    Returns:
+        The bytes, or None when the socket was closed before any of them.
+
+    """
+    chunks = []
+    remaining = size
+    while remaining:
+        data, received, _, _ = socket.recv_fds(
+            connection, min(remaining, RECEIVE_BYTES), 1
+        )
+        if not data:
+            if remaining == size:
+                return None
+            raise EOFError("The socket closed in the middle of a message")
+        for fd in received:
+            os.set_inheritable(fd, False)
+        fds.extend(received)
+        chunks.append(data)
+        remaining -= len(data)
+    return b"".join(chunks)
+
+
+def receive_message(
+    connection: socket.socket,
+) -> Tuple[Any, List[int]] | None:
+    """Receive a message, and the file descriptors sent with it.
+
+    Args:
+        connection: The socket between GatorGrade and the launcher.
+
+    Returns:
+        The message and its file descriptors, or None once the other
+        side has closed the socket.
+
+    """
+    fds: List[int] = []
+    header = _receive_exactly(connection, HEADER.size, fds)
+    if header is None:
+        return None
+    (size,) = HEADER.unpack(header)
+    payload = _receive_exactly(connection, size, fds)
+    if payload is None:
+        raise EOFError("The socket closed in the middle of a message")
+    return pickle.loads(payload), fds
+
+
+def _spawn(
+    argv: List[str] | None,
+    command: str,
+    cwd: str,
+    environ: Dict[bytes, bytes],
+    output: int,
+) -> int:
+    """Start a command whose output goes to a pipe.
+
+    The command leads a new session, and thus a new process group, so
+    that it can be killed together with every process that it started.
+
+    Returns:
+        The process id of the command.
+
+    """
+    # posix_spawn can neither change the directory of the command nor
+    # search the PATH of its environment, so the launcher, which runs one
+    # request at a time, takes on both of them before it spawns
+    os.chdir(cwd)
+    path = environ.get(b"PATH")
+    if path is None:
+        os.unsetenv(b"PATH")
+    else:
+        os.putenv(b"PATH", path)
+    options: Dict[str, Any] = {
+        "file_actions": [
+            (os.POSIX_SPAWN_DUP2, output, 1),
+            (os.POSIX_SPAWN_DUP2, output, 2),
+        ],
+        "setsigdef": RESET_SIGNALS,
+        "setsid": True,
+    }
+    if argv is not None:
+        try:
+            return os.posix_spawnp(argv[0], argv, environ, **options)
+        except OSError:
+            # the shell runs the program or reports why it cannot
+            pass
+    return os.posix_spawn(SHELL, [SHELL, "-c", command], environ, **options)
+
+
+class _Launcher:
+    """Fork the requested commands and report them once they exit."""
+
+    def __init__(self, connection: socket.socket) -> None:
+        """Construct a _Launcher that serves the requests of a socket."""
+        self.connection = connection
+        # the process id of every running command, by its request id
+        self.running: Dict[int, int] = {}
+        # the request id of every running command, by its process id
+        self.requests: Dict[int, int] = {}
+
+    def run(self, request: Tuple[Any, ...], fds: List[int]) -> None:
+        """Fork a command, or kill one, as a request asks."""
+        kind, request_id = request[:2]
+        if kind == KILL_REQUEST:
+            process_id = self.running.get(request_id)
+            if process_id is not None:
+                try:
+                    os.killpg(process_id, signal.SIGKILL)
+                except (ProcessLookupError, PermissionError):
+                    pass
+            return
+        argv, command, cwd, environ = request[2:]
+        (output,) = fds
+        try:
+            process_id = _spawn(argv, command, cwd, environ, output)
+        except OSError as error:
+            send_message(self.connection, (request_id, error, None))
+            return
+        finally:
+            os.close(output)
+        self.running[request_id] = process_id
+        self.requests[process_id] = request_id
+
+    def reap(self) -> None:
+        """Report every command that has exited since the last call."""
+        while self.requests:
+            try:
+                process_id, status, rusage = os.wait4(-1, os.WNOHANG)
+            except ChildProcessError:
+                return
+            if process_id == 0:
+                return
+            request_id = self.requests.pop(process_id)
+            del self.running[request_id]
+            usage = (rusage.ru_utime, rusage.ru_stime, rusage.ru_maxrss)
+            send_message(
+                self.connection,
+                (request_id, os.waitstatus_to_exitcode(status), usage),
+            )
+
+
+def main(socket_fd: int) -> None:
+    """Serve the requests of GatorGrade until it closes the socket.
+
+    Args:
+        socket_fd: The file descriptor of the launcher's end of the
+            socket, which GatorGrade passed to the launcher.
+
+    """
+    # a Ctrl-C in the terminal interrupts GatorGrade, which then stops
+    # its commands, so the launcher keeps serving until it is told to
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    connection = socket.socket(fileno=socket_fd)
+    launcher = _Launcher(connection)
+    # the handler does nothing but make every exit of a command wake up
+    # the select call below through the wakeup file descriptor
+    exited, wakeup = os.pipe()
+    os.set_blocking(wakeup, False)
+    signal.set_wakeup_fd(wakeup)
+    signal.signal(signal.SIGCHLD, lambda signum, frame: None)
+    while True:
+        readable, _, _ = select.select([connection, exited], [], [])
+        if exited in readable:
+            os.read(exited, RECEIVE_BYTES)
+            launcher.reap()
+        if connection in readable:
+            received = receive_message(connection)
+            if received is None:
+                return
+            launcher.run(*received)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]))
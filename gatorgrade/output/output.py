@@ -1,13 +1,29 @@
 """Run checks and display whether each has passed or failed."""
 
+import asyncio
+import concurrent.futures
 import datetime
+import heapq
 import json as json_module
 import os
 import subprocess
 import threading
 import time
+from concurrent.futures import Future
+from contextlib import ExitStack, nullcontext
 from pathlib import Path
-from typing import Any, List, Tuple, Union
+from typing import (
+    Any,
+    Awaitable,
+    ContextManager,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Set,
+    Tuple,
+    Union,
+)
 
 import gator
 import rich
@@ -20,13 +36,48 @@ from rich.progress import (
 )
 from rich.rule import Rule
 
-from gatorgrade.input.checks import GatorGraderCheck, ShellCheck
+from gatorgrade.input.checks import (
+    GatorGraderCheck,
+    InvalidCheck,
+    PytestCheck,
+    ShellCheck,
+)
 from gatorgrade.output.check_result import CheckResult
+from gatorgrade.output.command_cache import (
+    CommandResultCache,
+    serving_command_runs,
+)
+from gatorgrade.output.executor import (
+    DEFAULT_TIMEOUT_SECONDS,
+    CommandOutcome,
+    CommandTimeoutExpired,
+    background_event_loop,
+    run_shell_command,
+)
+from gatorgrade.output.file_cache import FileContentCache, reading_through
+from gatorgrade.output.gg_pool import GatorGraderPool
+from gatorgrade.output.pytest_outcome import (
+    PytestRuns,
+    node_outcome,
+    pytest_command,
+)
+from gatorgrade.output.shell_session import (
+    HAS_SHELL_SESSIONS,
+    ShellSessionPool,
+)
 from gatorgrade.report_history import (
     DEFAULT_HISTORY_REPORT_COUNT,
     DEFAULT_HISTORY_SIZE_MIB,
     save_report_history,
 )
+from gatorgrade.result_cache import (
+    DEFAULT_CACHE_SIZE_MIB,
+    compute_cache_key,
+    compute_input_fingerprint,
+    load_cached_result,
+    prune_result_cache,
+    save_cached_result,
+)
 from gatorgrade.track import append_track_entry, build_track_entry
 
 # disable rich's default highlight to stop number coloring
@@ -72,6 +123,30 @@ RUNNING_CHECKS_LABEL = "Running checks"
 RUNNING_CHECKS_RULE_LABEL = "Running Check(s)"
 WEIGHT_LABEL = "Weight"
 RUN_COMMAND_LABEL = "Run this command"
+SKIPPED_LABEL = "Skipped"
+SKIPPED_DIAGNOSTIC_FMT = (
+    "Skipped because a check it depends on did not pass: {}"
+)
+SKIPPED_SEPARATOR = ", "
+UNKNOWN_CHECK_LABEL = "unknown check"
+TIMED_OUT_DIAGNOSTIC_FMT = "Timed out and stopped after {:.1f} second(s)"
+TOTAL_TIMEOUT_DIAGNOSTIC = (
+    "Not started because the total timeout for all checks expired"
+)
+TIMED_OUT_LABEL = "Timed out"
+NOT_RUN_DIAGNOSTIC_FMT = (
+    "Not run because the run stopped after {} failing check(s)"
+)
+NOT_RUN_LABEL = "Not run"
+CACHED_LABEL = "Cached"
+SLOWEST_LABEL = "Slowest"
+FILE_CACHE_LABEL = "File cache"
+SHARED_COMMANDS_LABEL = "Shared commands"
+SLOWEST_ITEM_FMT = "{} ({:.2f}s)"
+SLOWEST_SEPARATOR = "; "
+RESULT_CACHE_WARNING = (
+    "[yellow]Warning: Could not update the result cache: {}[/]"
+)
 
 # format strings for diagnostic truncation
 TRUNCATED_MSG = "\n   ... (output truncated from {} to {} line(s))"
@@ -104,6 +179,23 @@ HINT_KEY = "hint"
 WEIGHT_KEY = "weight"
 OUTPUTLIMIT_KEY = "outputlimit"
 CHECK_ID_KEY = "check_id"
+OUTCOME_KEY = "outcome"
+OUTCOME_SKIPPED = "skipped"
+OUTCOME_TIMED_OUT = "timed_out"
+OUTCOME_NOT_RUN = "not_run"
+CACHED_KEY = "cached"
+OUTPUT_LINES_KEY = "output_lines"
+OUTPUT_BYTES_KEY = "output_bytes"
+OUTPUT_LOG_KEY = "output_log"
+RESOURCES_KEY = "resources"
+WALL_TIME_KEY = "wall_time"
+CPU_USER_TIME_KEY = "cpu_user_time"
+CPU_SYSTEM_TIME_KEY = "cpu_system_time"
+PEAK_RSS_KIB_KEY = "peak_rss_kib"
+# report times to the millisecond, which is finer than they can be trusted
+RESOURCE_TIME_DIGITS = 3
+DETAILS_KEY = "details"
+RUN_COMMAND_KEY = "run_command"
 DATETIME_FMT = "%Y-%m-%d %H:%M:%S"
 
 # JSON key constants used in check results
@@ -145,6 +237,7 @@ MD_PASSING_HEADER = "\n## Passing Checks\n"
 MD_FAILING_HEADER = "\n\n## Failing Checks\n"
 MD_PASSING_ITEM = "\n- [x] {}"
 MD_FAILING_ITEM = "\n- [ ] {}"
+MD_CACHED_SUFFIX = " _(cached)_"
 MD_CODE_BLOCK_FMT = "\n## {}\n\n```json\n{}\n```"
 MD_LIST_INDENT = SPACE + SPACE
 MD_DIAG_OPEN = "````text"
@@ -158,6 +251,14 @@ MD_REPORT_TIME_LABEL = "**Report Time:**"
 MD_OPTIONS_LABEL = "**options:**"
 MD_DIAGNOSTIC_LABEL = "**diagnostic:**"
 MD_DUE_DATE_LABEL = "**Due Date:**"
+MD_RESOURCES_HEADER = (
+    "\n\n## Check Resources\n\n"
+    "| Check | Wall Time (s) | User CPU (s) | System CPU (s) "
+    "| Peak RSS (KiB) |\n"
+    "| --- | ---: | ---: | ---: | ---: |"
+)
+MD_RESOURCES_ROW = "\n| {} | {} | {} | {} | {} |"
+MD_UNKNOWN_RESOURCE = "-"
 
 # error message strings
 FILE_WRITE_ERR = (
@@ -172,6 +273,28 @@ EMPTY_CLI_ARGS: dict = {}
 AUTO_HINT_STEPS = 100
 AUTO_HINT_SLEEP_TIME = 0.15
 
+# default number of checks that may run at the same time; a single
+# job keeps the original one-check-after-another behavior
+DEFAULT_JOBS = 1
+
+# the number of checks, for each job, that are read from a stream of
+# checks and started before the result of the oldest one is waited for
+CHECKS_AHEAD_PER_JOB = 4
+
+# the number of GatorGrader checks that a run needs before it starts a
+# pool of worker processes for them; a worker takes hundreds of
+# milliseconds to start and import GatorGrader, during which a few
+# dozen checks already run in this process, so fewer checks never pay
+# back the start of the pool
+MIN_POOLED_GG_CHECKS = 50
+
+# GatorGrader stores the result of the check it is running in a
+# module-level global, so two gator.grader calls must never overlap;
+# this lock serializes the checks that run in this process while shell
+# checks still run concurrently; with more than one job GatorGrader
+# checks instead run at the same time in a pool of worker processes
+GG_LOCK = threading.Lock()
+
 
 def _elide_report_path(path_str: str) -> str:
     """Elide the middle of a long file/directory path, keeping the start and filename."""
@@ -192,12 +315,16 @@ def _elide_report_path(path_str: str) -> str:
     return path_str
 
 
-def _truncate_diagnostic(diagnostic: str, limit: int | None) -> str:
+def _truncate_diagnostic(
+    diagnostic: str, limit: int | None, total_lines: int | None = None
+) -> str:
     """Truncate diagnostic output to a maximum number of lines.
 
     Args:
         diagnostic: The raw diagnostic output.
         limit: The maximum number of lines to keep.
+        total_lines: The number of lines that the command wrote, when
+            only part of its output was captured in the diagnostic.
 
     Returns:
         The truncated diagnostic string.
@@ -208,7 +335,7 @@ def _truncate_diagnostic(diagnostic: str, limit: int | None) -> str:
     lines = diagnostic.splitlines()
     if len(lines) <= limit:
         return diagnostic
-    total = len(lines)
+    total = total_lines if total_lines is not None else len(lines)
     truncated = lines[:limit]
     return NEWLINE.join(truncated) + TRUNCATED_MSG.format(total, limit)
 
@@ -235,44 +362,266 @@ def _print_historical_filter_summary(cli_args: dict | None) -> None:
     )
 
 
-def _run_shell_check(
-    check: ShellCheck, output_limit: int | None = None
+def _print_cache_summary(results: List[CheckResult]) -> None:
+    """Print how many results were reused from the result cache, if any."""
+    cached_count = sum(1 for result in results if result.cached)
+    if cached_count > 0:
+        rich.print(
+            f"[bold]- {CACHED_LABEL}:[/] {cached_count} check(s) reused"
+            " from an earlier run with unchanged inputs"
+        )
+
+
+def _print_file_cache_summary(file_cache: FileContentCache) -> None:
+    """Print how many file reads the file cache saved, if it was used."""
+    if file_cache.hits + file_cache.misses > 0:
+        rich.print(
+            f"[bold]- {FILE_CACHE_LABEL}:[/] {file_cache.hits} hit(s),"
+            f" {file_cache.misses} miss(es)"
+        )
+
+
+def _print_command_cache_summary(
+    command_cache: CommandResultCache | None,
+) -> None:
+    """Print how many checks reused the run of a command, if any did."""
+    if command_cache is not None and command_cache.shares > 0:
+        rich.print(
+            f"[bold]- {SHARED_COMMANDS_LABEL}:[/] {command_cache.runs}"
+            f" run(s) for {command_cache.runs + command_cache.shares}"
+            " check(s)"
+        )
+
+
+def _print_slowest_summary(
+    results: List[CheckResult], slowest: int | None
+) -> None:
+    """Print the checks that ran for the longest time, slowest first.
+
+    Args:
+        results: The results of all of the checks.
+        slowest: The number of checks to list, or None to list none.
+
+    """
+    if not slowest:
+        return
+    timed_results = [
+        result for result in results if result.wall_time is not None
+    ]
+    if not timed_results:
+        return
+    timed_results.sort(key=lambda result: result.wall_time, reverse=True)
+    rich.print(
+        f"[bold]- {SLOWEST_LABEL}:[/] "
+        + SLOWEST_SEPARATOR.join(
+            escape(
+                SLOWEST_ITEM_FMT.format(result.description, result.wall_time)
+            )
+            for result in timed_results[:slowest]
+        )
+    )
+
+
+def _captured_output_details(
+    outcome: CommandOutcome | None,
+) -> Dict[str, Any]:
+    """Describe the output of a command that was too long to capture.
+
+    Args:
+        outcome: The outcome of the command, if it started.
+
+    Returns:
+        The CheckResult arguments that record how much output the
+        command wrote, and where its full output was saved, or no
+        arguments when all of the output was captured.
+
+    """
+    if outcome is None or outcome.omitted_bytes == 0:
+        return {}
+    return {
+        "output_lines": outcome.line_count,
+        "output_bytes": outcome.byte_count,
+        "output_log": outcome.log_path,
+    }
+
+
+def _resource_details(outcome: CommandOutcome) -> Dict[str, Any]:
+    """Describe the CPU time and memory that a command used.
+
+    Args:
+        outcome: The outcome of the command.
+
+    Returns:
+        The CheckResult arguments that record the resource usage of the
+        command, or no arguments when the platform did not report it.
+
+    """
+    if outcome.usage is None:
+        return {}
+    return {
+        "cpu_user_time": outcome.usage.user_time,
+        "cpu_system_time": outcome.usage.system_time,
+        "peak_rss_kib": outcome.usage.peak_rss_kib,
+    }
+
+
+def _timed_out_result(
+    check: Union[ShellCheck, GatorGraderCheck, PytestCheck],
+    output_limit: int | None,
+    raw_diagnostic: str,
+    outcome: CommandOutcome | None = None,
+) -> CheckResult:
+    """Create the failing result of a check that ran out of time.
+
+    Args:
+        check: The shell or GatorGrader check that timed out.
+        output_limit: The maximum number of diagnostic lines to display.
+        raw_diagnostic: The explanation, followed by any partial output.
+        outcome: The outcome of the killed command, if it started.
+
+    Returns:
+        A failing CheckResult that is marked as timed out.
+
+    """
+    limit = (
+        check.outputlimit if check.outputlimit is not None else output_limit
+    )
+    output_details = _captured_output_details(outcome)
+    return CheckResult(
+        passed=False,
+        description=_check_description(check),
+        json_info=check.json_info,
+        diagnostic=_truncate_diagnostic(
+            raw_diagnostic, limit, output_details.get("output_lines")
+        ),
+        weight=check.weight,
+        outputlimit=limit,
+        hint=check.hint,
+        raw_diagnostic=raw_diagnostic,
+        check_id=check.check_id,
+        timed_out=True,
+        **output_details,
+    )
+
+
+def _command_timed_out_result(
+    check: Union[ShellCheck, PytestCheck],
+    output_limit: int | None,
+    error: subprocess.TimeoutExpired,
+    start_time: float,
+) -> CheckResult:
+    """Create the failing result of a check whose command ran out of time.
+
+    Args:
+        check: The shell or pytest check whose command timed out.
+        output_limit: The maximum number of diagnostic lines to display.
+        error: The timeout, with the output written before the kill.
+        start_time: The time.monotonic() value when the check started.
+
+    Returns:
+        A failing CheckResult that is marked as timed out and shows the
+        time that the command ran for and its partial output.
+
+    """
+    elapsed = time.monotonic() - start_time
+    raw_diagnostic = TIMED_OUT_DIAGNOSTIC_FMT.format(elapsed)
+    # the partial output may end in the middle of a character
+    partial_output = (error.output or b"").decode(errors="replace").strip()
+    if partial_output:
+        raw_diagnostic += DIAGNOSTIC_INDENT + partial_output.replace(
+            NEWLINE, DIAGNOSTIC_INDENT
+        )
+    killed_outcome = (
+        error.outcome if isinstance(error, CommandTimeoutExpired) else None
+    )
+    return _timed_out_result(
+        check, output_limit, raw_diagnostic, killed_outcome
+    )
+
+
+async def _run_shell_check_async(  # noqa: PLR0913
+    check: ShellCheck,
+    output_limit: int | None = None,
+    timeout: float = DEFAULT_TIMEOUT_SECONDS,
+    *,
+    spill_output: bool = False,
+    shell_sessions: ShellSessionPool | None = None,
+    command_cache: CommandResultCache | None = None,
 ) -> CheckResult:
-    """Run a shell check.
+    """Run a shell check as an asyncio subprocess.
+
+    A command that runs for longer than the timeout is killed, together
+    with every process that it started, and the check fails with the
+    time that it ran for and the output that it wrote before it stopped.
+    Only the start and the end of very long output are kept, so the
+    diagnostic marks where output was left out. A check that reuses the
+    run of its command by an earlier check does not report the CPU time
+    and memory of the command again.
 
     Args:
         check: The shell check to run.
         output_limit: The maximum number of diagnostic lines to display.
+        timeout: The maximum number of seconds that the check may run.
+        spill_output: Whether to keep output that is too long to capture
+            in a temporary log file.
+        shell_sessions: The pool of long-lived shell sessions to run the
+            command in, or None to start a new shell for the command.
+        command_cache: The cache that shares one run of a command among
+            the checks with the same command, or None to always run it.
 
     Returns:
         The result of running the shell check as a CheckResult.
 
     """
-    # run the shell command and capture its output and return code
-    result = subprocess.run(
-        check.command,
-        shell=True,
-        check=False,
-        timeout=300,
-        stdout=subprocess.PIPE,
-        # redirect STDERR to STDOUT so STDOUT and STDERR can be captured
-        # together as diagnostic
-        stderr=subprocess.STDOUT,
-    )
-    passed = result.returncode == 0
-    # add spaces after each newline to indent all lines of diagnostic
+
+    def start_command() -> Awaitable[CommandOutcome]:
+        if shell_sessions is not None:
+            return shell_sessions.run_command(
+                check.command, timeout, spill_output
+            )
+        return run_shell_command(
+            check.command,
+            timeout,
+            spill_output,
+            getattr(check, "argv", None),
+        )
+
+    start_time = time.monotonic()
+    shared = False
+    try:
+        if command_cache is not None:
+            outcome, shared = await command_cache.run_shell_command(
+                check.command, timeout, start_command
+            )
+        else:
+            outcome = await start_command()
+    except subprocess.TimeoutExpired as error:
+        return _command_timed_out_result(
+            check, output_limit, error, start_time
+        )
+    passed = outcome.returncode == 0
+    # add spaces after each newline to indent all lines of diagnostic;
+    # the captured output may be cut in the middle of a character
     raw_diagnostic = (
         EMPTY
         if passed
-        else result.stdout.decode().strip().replace(NEWLINE, DIAGNOSTIC_INDENT)
+        else outcome.output.decode(errors="replace")
+        .strip()
+        .replace(NEWLINE, DIAGNOSTIC_INDENT)
     )
+    output_details = _captured_output_details(None if passed else outcome)
+    if passed and outcome.log_path is not None:
+        # a passing check does not report its output, so drop its log
+        Path(outcome.log_path).unlink(missing_ok=True)
     limit = (
         check.outputlimit if check.outputlimit is not None else output_limit
     )
     # truncate the diagnostic message if it is too long (note that this
     # limit can be specified on a per-check basis or, alternatively, it
     # can be provided by the person running gatorgrade on the command-line)
-    diagnostic = _truncate_diagnostic(raw_diagnostic, limit)
+    diagnostic = _truncate_diagnostic(
+        raw_diagnostic, limit, output_details.get("output_lines")
+    )
     # create and return the CheckResult arising from the
     # execution of the shell check
     return CheckResult(
@@ -285,6 +634,59 @@ def _run_shell_check(
         hint=check.hint,
         raw_diagnostic=raw_diagnostic,
         check_id=check.check_id,
+        **output_details,
+        **({} if shared else _resource_details(outcome)),
+    )
+
+
+async def _run_pytest_check_async(
+    check: PytestCheck,
+    output_limit: int | None,
+    timeout: float,
+    spill_output: bool,
+    pytest_runs: PytestRuns,
+) -> CheckResult:
+    """Run a pytest check by inspecting a shared run of pytest.
+
+    The command to run is recorded as the command that runs pytest for
+    the tests of this check alone, so that it can be run to see why
+    they failed.
+
+    Args:
+        check: The pytest check to run.
+        output_limit: The maximum number of diagnostic lines to display.
+        timeout: The maximum number of seconds that pytest may run, if
+            this check is the one that starts it.
+        spill_output: Whether to keep output of pytest that is too long
+            to capture in a temporary log file.
+        pytest_runs: The runs of pytest that the pytest checks share.
+
+    Returns:
+        The result of the tests of the check as a CheckResult.
+
+    """
+    start_time = time.monotonic()
+    try:
+        run = await pytest_runs.run_for(check, timeout, spill_output)
+    except subprocess.TimeoutExpired as error:
+        return _command_timed_out_result(
+            check, output_limit, error, start_time
+        )
+    passed, raw_diagnostic = node_outcome(check.nodeid, run)
+    raw_diagnostic = raw_diagnostic.replace(NEWLINE, DIAGNOSTIC_INDENT)
+    limit = (
+        check.outputlimit if check.outputlimit is not None else output_limit
+    )
+    return CheckResult(
+        passed=passed,
+        description=check.description,
+        json_info=check.json_info,
+        diagnostic=_truncate_diagnostic(raw_diagnostic, limit),
+        weight=check.weight,
+        outputlimit=limit,
+        hint=check.hint,
+        raw_diagnostic=raw_diagnostic,
+        check_id=check.check_id,
     )
 
 
@@ -323,21 +725,55 @@ def _build_gg_check_details(check: GatorGraderCheck) -> str:
     return ", ".join(parts)
 
 
+def _gg_command(check: GatorGraderCheck) -> str | None:
+    """Return the command that a GatorGrader check inspects, if any."""
+    if GG_COMMAND_ARG not in check.gg_args:
+        return None
+    index_of_command = check.gg_args.index(GG_COMMAND_ARG)
+    if index_of_command + 1 >= len(check.gg_args):
+        return None
+    return check.gg_args[index_of_command + 1]
+
+
 def _run_gg_check(
-    check: GatorGraderCheck, output_limit: int | None = None
+    check: GatorGraderCheck,
+    output_limit: int | None = None,
+    gg_pool: GatorGraderPool | None = None,
+    file_cache: FileContentCache | None = None,
+    command_cache: CommandResultCache | None = None,
 ) -> CheckResult:
     """Run a GatorGrader check.
 
     Args:
         check: The GatorGrader check to run.
         output_limit: The maximum number of diagnostic lines to display.
+        gg_pool: The pool of worker processes to run the check in, or
+            None to run it in this process, where the check also runs
+            while the workers of the pool are still starting.
+        file_cache: The cache that a check run in this process reads
+            the files that it inspects through, if any.
+        command_cache: The cache that shares one run of a command among
+            the checks with the same command, or None to always run it.
 
     Returns:
         The result of running the GatorGrader check as a CheckResult.
 
     """
     try:
-        result = gator.grader(check.gg_args)
+        # run the command that the check inspects, or reuse the run of
+        # another check, before the check runs wherever it runs
+        command_runs = {}
+        command = _gg_command(check)
+        if command_cache is not None and command is not None:
+            command_runs[command] = command_cache.run_gator_command(command)
+        if gg_pool is not None and gg_pool.ready():
+            result = gg_pool.grade(check.gg_args, command_runs)
+        else:
+            with GG_LOCK, ExitStack() as stack:
+                if file_cache is not None:
+                    stack.enter_context(reading_through(file_cache))
+                stack.enter_context(serving_command_runs(command_runs))
+                result = gator.grader(check.gg_args)
         passed = result[1]
         description = result[0]
         diagnostic = result[2]
@@ -386,7 +822,889 @@ def _run_gg_check(
     )
 
 
-def create_report_json(  # noqa: PLR0913
+def _run_check(
+    check: Union[ShellCheck, GatorGraderCheck, PytestCheck],
+    output_limit: int | None = None,
+    gg_pool: GatorGraderPool | None = None,
+    file_cache: FileContentCache | None = None,
+    command_cache: CommandResultCache | None = None,
+) -> CheckResult | None:
+    """Run a single GatorGrader check and record its command.
+
+    Shell and pytest checks run as subprocesses in the event loop, so
+    only GatorGrader checks, which run in Python, are run here.
+
+    Args:
+        check: The GatorGrader check to run.
+        output_limit: The maximum number of diagnostic lines to display.
+        gg_pool: The pool of worker processes for GatorGrader checks,
+            or None to run them in this process.
+        file_cache: The cache that GatorGrader checks run in this
+            process read the files that they inspect through, if any.
+        command_cache: The cache that shares one run of the command of
+            a GatorGrader check among the checks with the same command.
+
+    Returns:
+        The result of running the check, or None when the check is of
+        an unknown type and thus cannot be run.
+
+    """
+    result = None
+    # run a check that GatorGrader implements
+    if isinstance(check, GatorGraderCheck):
+        result = _run_gg_check(
+            check, output_limit, gg_pool, file_cache, command_cache
+        )
+        # check to see if there was a command in the
+        # GatorGraderCheck. This code finds the index of the
+        # word "--command" in the check.gg_args list if it
+        # is available (it is not available for all of
+        # the various types of GatorGraderCheck instances),
+        # and then it adds 1 to that index to get the actual
+        # command run and then stores that command in the
+        # result.run_command field that is initialized to
+        # an empty string in the constructor for CheckResult
+        if GG_COMMAND_ARG in check.gg_args:
+            index_of_command = check.gg_args.index(GG_COMMAND_ARG)
+            index_of_new_command = index_of_command + 1
+            result.run_command = check.gg_args[index_of_new_command]
+    return result
+
+
+def _check_description(
+    check: Union[ShellCheck, GatorGraderCheck, PytestCheck],
+) -> str:
+    """Return the description of a check without running it.
+
+    Args:
+        check: The shell, pytest, or GatorGrader check to describe.
+
+    Returns:
+        The description from the configuration file, falling back to
+        the command of a shell check, the node ID of a pytest check, or
+        the name of a GatorGrader check.
+
+    """
+    if isinstance(check, (ShellCheck, PytestCheck, InvalidCheck)):
+        return check.description
+    if isinstance(check.json_info, dict):
+        return str(
+            check.json_info.get(
+                DESCRIPTION_KEY, check.json_info.get(CHECK_KEY, EMPTY)
+            )
+        )
+    return SPACE.join(check.gg_args)
+
+
+def _invalid_result(
+    check: InvalidCheck, output_limit: int | None
+) -> CheckResult:
+    """Create the result of an entry of the configuration that is not valid.
+
+    Args:
+        check: The entry with its configuration errors.
+        output_limit: The maximum number of diagnostic lines to display.
+
+    Returns:
+        A failing CheckResult whose diagnostic is the configuration errors.
+
+    """
+    return CheckResult(
+        passed=False,
+        description=check.description,
+        json_info=check.json_info,
+        diagnostic=check.diagnostic,
+        weight=check.weight,
+        outputlimit=output_limit,
+        check_id=check.check_id,
+    )
+
+
+def _skipped_result(
+    check: Union[ShellCheck, GatorGraderCheck, PytestCheck],
+    output_limit: int | None,
+    failed_prerequisites: List[str],
+) -> CheckResult:
+    """Create the result of a check that was skipped without running.
+
+    Args:
+        check: The shell or GatorGrader check that was skipped.
+        output_limit: The maximum number of diagnostic lines to display.
+        failed_prerequisites: The descriptions of the checks that this
+            check depends on and that did not pass.
+
+    Returns:
+        A failing CheckResult that is marked as skipped.
+
+    """
+    limit = (
+        check.outputlimit if check.outputlimit is not None else output_limit
+    )
+    return CheckResult(
+        passed=False,
+        description=_check_description(check),
+        json_info=check.json_info,
+        diagnostic=SKIPPED_DIAGNOSTIC_FMT.format(
+            SKIPPED_SEPARATOR.join(failed_prerequisites)
+        ),
+        weight=check.weight,
+        outputlimit=limit,
+        check_id=check.check_id,
+        skipped=True,
+    )
+
+
+def _not_run_result(
+    check: Union[ShellCheck, GatorGraderCheck, PytestCheck],
+    output_limit: int | None,
+    max_failures: int,
+) -> CheckResult:
+    """Create the result of a check that fail-fast mode did not let finish.
+
+    Args:
+        check: The shell or GatorGrader check that did not run.
+        output_limit: The maximum number of diagnostic lines to display.
+        max_failures: The number of failing checks that stopped the run.
+
+    Returns:
+        A failing CheckResult that is marked as not run.
+
+    """
+    limit = (
+        check.outputlimit if check.outputlimit is not None else output_limit
+    )
+    return CheckResult(
+        passed=False,
+        description=_check_description(check),
+        json_info=check.json_info,
+        diagnostic=NOT_RUN_DIAGNOSTIC_FMT.format(max_failures),
+        weight=check.weight,
+        outputlimit=limit,
+        check_id=check.check_id,
+        not_run=True,
+    )
+
+
+def _counts_as_failure(result: CheckResult | None) -> bool:
+    """Return whether a result counts towards the fail-fast limit.
+
+    A check that was skipped because a prerequisite failed is only a
+    consequence of that failure, so it does not count on its own.
+    """
+    return (
+        result is not None
+        and not result.passed
+        and not result.skipped
+        and not result.not_run
+    )
+
+
+def _result_cache_key(
+    check: Union[ShellCheck, GatorGraderCheck, PytestCheck],
+) -> str | None:
+    """Return the result cache key of a check, or None if it is not cacheable.
+
+    Only a check that declares its inputs (or, for a GatorGrader check,
+    inspects a file) can be cached, since otherwise there is no way to
+    tell whether anything that the check reads has changed.
+
+    Args:
+        check: The shell or GatorGrader check to look up.
+
+    Returns:
+        The key that combines the check_id with the fingerprint of the
+        current content of the inputs, or None.
+
+    """
+    inputs = getattr(check, "inputs", None)
+    if not inputs or check.check_id is None:
+        return None
+    try:
+        fingerprint = compute_input_fingerprint(inputs)
+    except OSError:
+        # an input that cannot be read cannot be fingerprinted, so
+        # run the check instead of risking a stale result
+        return None
+    return compute_cache_key(check.check_id, fingerprint)
+
+
+def _cache_entry(result: CheckResult) -> dict:
+    """Return the part of a result that is stored in the result cache."""
+    return {
+        STATUS_KEY: result.passed,
+        DESCRIPTION_KEY: result.description,
+        DIAGNOSTIC_KEY: result.raw_diagnostic,
+        PATH_KEY: result.path,
+        DETAILS_KEY: result.details,
+        RUN_COMMAND_KEY: result.run_command,
+        OUTPUT_LINES_KEY: result.output_lines,
+        OUTPUT_BYTES_KEY: result.output_bytes,
+    }
+
+
+def _cached_result(
+    check: Union[ShellCheck, GatorGraderCheck, PytestCheck],
+    entry: dict,
+    output_limit: int | None,
+) -> CheckResult:
+    """Rebuild the result of a check from its result cache entry.
+
+    Args:
+        check: The shell or GatorGrader check that was looked up.
+        entry: The entry that was stored by _cache_entry.
+        output_limit: The maximum number of diagnostic lines to display.
+
+    Returns:
+        The stored result, marked as coming from the cache.
+
+    """
+    limit = (
+        check.outputlimit if check.outputlimit is not None else output_limit
+    )
+    raw_diagnostic = str(entry.get(DIAGNOSTIC_KEY, EMPTY))
+    output_lines = entry.get(OUTPUT_LINES_KEY)
+    output_bytes = entry.get(OUTPUT_BYTES_KEY)
+    # the log file of the earlier run may no longer exist, so only
+    # the counts of its output are kept in the cache
+    if not isinstance(output_lines, int) or not isinstance(output_bytes, int):
+        output_lines = output_bytes = None
+    result = CheckResult(
+        passed=entry.get(STATUS_KEY) is True,
+        description=str(entry.get(DESCRIPTION_KEY, _check_description(check))),
+        json_info=check.json_info,
+        path=entry.get(PATH_KEY),
+        diagnostic=_truncate_diagnostic(raw_diagnostic, limit, output_lines),
+        weight=check.weight,
+        outputlimit=limit,
+        hint=check.hint,
+        raw_diagnostic=raw_diagnostic,
+        details=str(entry.get(DETAILS_KEY, EMPTY)),
+        check_id=check.check_id,
+        cached=True,
+        output_lines=output_lines,
+        output_bytes=output_bytes,
+    )
+    result.run_command = str(entry.get(RUN_COMMAND_KEY, EMPTY))
+    return result
+
+
+def _load_from_cache(
+    check: Union[ShellCheck, GatorGraderCheck, PytestCheck],
+    output_limit: int | None,
+) -> Tuple[str | None, CheckResult | None]:
+    """Look up a check in the result cache.
+
+    Args:
+        check: The shell or GatorGrader check to look up.
+        output_limit: The maximum number of diagnostic lines to display.
+
+    Returns:
+        The cache key of the check (None when it is not cacheable) and
+        the cached result (None when there is no usable entry).
+
+    """
+    key = _result_cache_key(check)
+    if key is None:
+        return None, None
+    entry = load_cached_result(key)
+    if entry is None:
+        return key, None
+    return key, _cached_result(check, entry, output_limit)
+
+
+def _save_to_cache(key: str, result: CheckResult) -> None:
+    """Store a result in the result cache, warning if that is not possible."""
+    try:
+        save_cached_result(key, _cache_entry(result))
+    except (OSError, TypeError, ValueError) as error:
+        rich.print(RESULT_CACHE_WARNING.format(error))
+
+
+async def _run_check_async(  # noqa: PLR0912, PLR0913
+    check: Union[ShellCheck, GatorGraderCheck, PytestCheck, InvalidCheck],
+    output_limit: int | None,
+    semaphore: asyncio.Semaphore,
+    prerequisites: List[Future] | None = None,
+    *,
+    use_cache: bool = False,
+    check_timeout: int = DEFAULT_TIMEOUT_SECONDS,
+    deadline: float | None = None,
+    spill_output: bool = False,
+    gg_pool: GatorGraderPool | None = None,
+    file_cache: FileContentCache | None = None,
+    shell_sessions: ShellSessionPool | None = None,
+    command_cache: CommandResultCache | None = None,
+    pytest_runs: PytestRuns | None = None,
+) -> CheckResult | None:
+    """Run a single check inside of the event loop.
+
+    Shell checks run as asyncio subprocesses directly in the loop, and
+    so do the runs of pytest that the pytest checks share.
+    GatorGrader checks run in Python and thus are handed to the loop's
+    default thread pool so that they do not block the shell checks;
+    from there they run either in this process or in a worker process.
+    A check with prerequisites first waits for all of them to finish
+    and is skipped, without taking a job, if any of them did not pass.
+    When the result cache is in use, a check whose inputs did not change
+    since an earlier run reuses that run's result instead of running.
+    A shell check is stopped when its own timeout expires or, if that
+    comes first, when the deadline for the whole run passes; since a
+    GatorGrader check cannot be interrupted, it only fails with a
+    timeout when the deadline has already passed before it starts.
+    The wall time of every check that runs is recorded on its result,
+    and so are the CPU time and peak memory of a shell check's command.
+    An entry of the configuration that is not valid fails at once.
+
+    Args:
+        check: The shell or GatorGrader check to run.
+        output_limit: The maximum number of diagnostic lines to display.
+        semaphore: The semaphore that bounds how many checks run at once.
+        prerequisites: The futures of the checks this check depends on.
+        use_cache: Whether to reuse and store results in the result cache.
+        check_timeout: The timeout, in seconds, of a check that does not
+            set a timeout of its own.
+        deadline: The time.monotonic() value at which every check that
+            is still running is stopped, or None for no total timeout.
+        spill_output: Whether to keep the output of a shell check that
+            is too long to capture in a temporary log file.
+        gg_pool: The pool of worker processes for GatorGrader checks,
+            or None to run them in this process.
+        file_cache: The cache that GatorGrader checks run in this
+            process read the files that they inspect through, if any.
+        shell_sessions: The pool of long-lived shell sessions for shell
+            checks, or None to start a new shell for every check.
+        command_cache: The cache that shares one run of a command among
+            the checks with the same command, or None to always run it.
+        pytest_runs: The runs of pytest that the pytest checks share, or
+            None to run pytest for every pytest check on its own.
+
+    Returns:
+        The result of running the check, or None for an unknown check.
+
+    """
+    if isinstance(check, InvalidCheck):
+        return _invalid_result(check, output_limit)
+    failed_prerequisites = []
+    for prerequisite in prerequisites or []:
+        prerequisite_result = await asyncio.wrap_future(prerequisite)
+        if prerequisite_result is None or not prerequisite_result.passed:
+            description = (
+                prerequisite_result.description
+                if prerequisite_result is not None
+                else UNKNOWN_CHECK_LABEL
+            )
+            failed_prerequisites.append(description)
+    if failed_prerequisites:
+        return _skipped_result(check, output_limit, failed_prerequisites)
+    loop = asyncio.get_running_loop()
+    cache_key = None
+    if use_cache:
+        # hashing the inputs reads files, so keep it out of the loop
+        cache_key, cached = await loop.run_in_executor(
+            None, _load_from_cache, check, output_limit
+        )
+        if cached is not None:
+            return cached
+    timeout = getattr(check, "timeout", None) or check_timeout
+    async with semaphore:
+        if deadline is not None:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return _timed_out_result(
+                    check, output_limit, TOTAL_TIMEOUT_DIAGNOSTIC
+                )
+            timeout = min(timeout, remaining)
+        # only time the check once it holds a job, so that waiting for
+        # other checks to finish does not count against it
+        start_time = time.monotonic()
+        if isinstance(check, ShellCheck):
+            result = await _run_shell_check_async(
+                check,
+                output_limit,
+                timeout,
+                spill_output=spill_output,
+                shell_sessions=shell_sessions,
+                command_cache=command_cache,
+            )
+            result.run_command = check.command
+        elif isinstance(check, PytestCheck):
+            result = await _run_pytest_check_async(
+                check,
+                output_limit,
+                timeout,
+                spill_output,
+                pytest_runs or PytestRuns([check]),
+            )
+            result.run_command = pytest_command(check.runner, [check.nodeid])
+        else:
+            result = await loop.run_in_executor(
+                None,
+                _run_check,
+                check,
+                output_limit,
+                gg_pool,
+                file_cache,
+                command_cache,
+            )
+        if result is not None:
+            result.wall_time = time.monotonic() - start_time
+    # a timeout depends on how busy the machine was, so only store
+    # results that the check itself decided
+    if cache_key is not None and result is not None and not result.timed_out:
+        await loop.run_in_executor(None, _save_to_cache, cache_key, result)
+    return result
+
+
+def _prerequisite_indices(
+    checks: List[Union[ShellCheck, GatorGraderCheck, PytestCheck]],
+) -> List[List[int]]:
+    """Find the positions of the prerequisites of every check.
+
+    A prerequisite that is not in the list of checks (for instance,
+    because it was filtered out) is treated as already satisfied.
+
+    Args:
+        checks: The list of shell and GatorGrader checks to run.
+
+    Returns:
+        For each check, the indices of the checks that it depends on.
+
+    """
+    indices_by_id: Dict[str, List[int]] = {}
+    for index, check in enumerate(checks):
+        if check.check_id is not None:
+            indices_by_id.setdefault(check.check_id, []).append(index)
+    return [
+        [
+            prerequisite
+            for check_id in getattr(check, "depends_on", [])
+            for prerequisite in indices_by_id.get(check_id, [])
+            if prerequisite != index
+        ]
+        for index, check in enumerate(checks)
+    ]
+
+
+def _execution_order(prerequisites: List[List[int]]) -> List[int]:
+    """Order the checks so that every check starts after its prerequisites.
+
+    The order stays as close to the configuration order as possible:
+    among the checks whose prerequisites have all been scheduled, the
+    one that appears first in the configuration file goes next.
+
+    Args:
+        prerequisites: For each check, the indices of its prerequisites.
+
+    Returns:
+        The indices of all of the checks in the order to start them.
+
+    """
+    remaining = [len(set(indices)) for indices in prerequisites]
+    dependents: Dict[int, List[int]] = {}
+    for index, indices in enumerate(prerequisites):
+        for prerequisite in set(indices):
+            dependents.setdefault(prerequisite, []).append(index)
+    ready = [index for index, count in enumerate(remaining) if count == 0]
+    heapq.heapify(ready)
+    order: List[int] = []
+    while ready:
+        index = heapq.heappop(ready)
+        order.append(index)
+        for dependent in dependents.get(index, []):
+            remaining[dependent] -= 1
+            if remaining[dependent] == 0:
+                heapq.heappush(ready, dependent)
+    # generate_checks rejects cycles, but never drop a check if one
+    # slipped through; its unscheduled prerequisites are then ignored
+    scheduled = set(order)
+    order.extend(i for i in range(len(prerequisites)) if i not in scheduled)
+    return order
+
+
+def _gg_check_count(checks: Iterable[Any]) -> int:
+    """Return the number of GatorGrader checks among the checks."""
+    return sum(1 for check in checks if isinstance(check, GatorGraderCheck))
+
+
+def _gg_pool_workers(gg_check_count: int, jobs: int) -> int:
+    """Return the number of workers for a pool, or 0 when it does not pay.
+
+    Args:
+        gg_check_count: The number of GatorGrader checks of the run.
+        jobs: The maximum number of checks to run at the same time.
+
+    Returns:
+        At most one worker for each job, each GatorGrader check, and each
+        processor, or 0 when there are fewer than MIN_POOLED_GG_CHECKS
+        checks or there would be a single worker, which only adds its
+        start to checks that could run in this process.
+
+    """
+    if gg_check_count < MIN_POOLED_GG_CHECKS:
+        return 0
+    workers = min(jobs, gg_check_count, os.cpu_count() or 1)
+    return workers if workers > 1 else 0
+
+
+def start_gg_pool(
+    checks: Iterable[Any], jobs: int
+) -> ContextManager[GatorGraderPool | None]:
+    """Start the worker processes for the GatorGrader checks of a run.
+
+    The workers start, and import GatorGrader, while the caller goes on,
+    for example by running the setup commands, so that they are ready
+    by the time that run_checks hands them the first checks. A stream of
+    checks starts its pool in run_checks instead, once it has read
+    enough GatorGrader checks.
+
+    Args:
+        checks: The checks of the run, as a list or as a stream.
+        jobs: The maximum number of checks to run at the same time.
+
+    Returns:
+        The pool to pass to run_checks and to close once the checks have
+        run, or a context of None when the checks do not need a pool.
+
+    """
+    workers = (
+        _gg_pool_workers(_gg_check_count(checks), jobs)
+        if isinstance(checks, list)
+        else 0
+    )
+    if not workers:
+        return nullcontext()
+    return GatorGraderPool(workers)
+
+
+def _iter_check_results(  # noqa: PLR0913, PLR0915
+    checks: Iterable[
+        Union[ShellCheck, GatorGraderCheck, PytestCheck, InvalidCheck]
+    ],
+    output_limit: int | None = None,
+    *,
+    jobs: int = DEFAULT_JOBS,
+    use_cache: bool = False,
+    check_timeout: int = DEFAULT_TIMEOUT_SECONDS,
+    total_timeout: int | None = None,
+    spill_output: bool = False,
+    max_failures: int | None = None,
+    file_cache: FileContentCache | None = None,
+    shell_session: bool = False,
+    command_cache: CommandResultCache | None = None,
+    gg_pool: GatorGraderPool | None = None,
+) -> Iterator[CheckResult | None]:
+    """Run the checks and yield their results in configuration order.
+
+    All of the checks are scheduled on one asyncio event loop that runs
+    in a background thread. Checks start in configuration order, except
+    that a check declaring "depends_on" always starts after the checks
+    it depends on, and is skipped as soon as one of them does not pass.
+    With a single job every check runs one after another. With more
+    than one job up to that many checks run at the same time so that
+    independent branches of the dependency graph overlap; the results
+    are still yielded in the order of the configuration file so that
+    the progress output, the failing-check section, and the JSON report
+    stay stable. A check that sets "parallel: false" waits until every
+    earlier check has finished and then runs on its own before later
+    checks start. A check that runs out of time fails instead of
+    stopping the run. With more than one job and at least
+    MIN_POOLED_GG_CHECKS GatorGrader checks, those checks run in a pool
+    of worker processes, with at most one worker per job, so that they
+    can also run at the same time; the pool starts as soon as there are
+    enough of them, and they run in this process until its workers are
+    ready. In fail-fast mode, once max_failures checks have failed, the
+    checks that are still running are cancelled (which kills their
+    commands), no further checks start, and every check that did not
+    finish is yielded as not run. The GatorGrader checks of the run read
+    the files that they inspect through a file cache, so that many
+    checks of one file read it once. In shell session mode, the commands
+    of shell checks are sent to long-lived shells, with at most one
+    shell per job. With a command cache, checks whose command and
+    working directory are identical share a single run of that command.
+    The pytest checks with the same runner share a single run of pytest
+    for all of their tests.
+
+    The checks can also be streamed from an iterator that is only read
+    as the run is ready for more checks: each check starts as soon as it
+    is read, and no more than CHECKS_AHEAD_PER_JOB checks for each job
+    are read ahead of the oldest check whose result was not yielded. The
+    rest of the checks are read at once when a check depends on other
+    checks or is a pytest check, since its prerequisites or the tests
+    that share its run of pytest can come after it, and when the run
+    stops, since the checks that did not run are still yielded.
+
+    Args:
+        checks: The list of shell and GatorGrader checks to run, or an
+            iterator that streams them.
+        output_limit: The maximum number of diagnostic lines to display.
+        jobs: The maximum number of checks to run at the same time.
+        use_cache: Whether to reuse and store results in the result cache.
+        check_timeout: The timeout, in seconds, of a check that does not
+            set a timeout of its own.
+        total_timeout: The number of seconds after which every check
+            that is still running or waiting to run is stopped, or None
+            to let the checks run for as long as they need.
+        spill_output: Whether to keep the output of a shell check that
+            is too long to capture in a temporary log file.
+        max_failures: The number of failing checks after which the run
+            stops, or None to always run every check.
+        file_cache: The file cache for the GatorGrader checks, which
+            also counts their hits and misses, or None for a new one.
+        shell_session: Whether to run the commands of shell checks in
+            long-lived shell sessions instead of a new shell each.
+        command_cache: The cache that shares one run of a command among
+            the checks with the same command, or None to always run it.
+        gg_pool: The pool of worker processes that the caller already
+            started for the GatorGrader checks, or None to start one
+            when there are enough of them.
+
+    Yields:
+        The result of each check, in the order of the checks.
+
+    """
+    # the checks that were read so far; a list of checks is read at once
+    streamed = not isinstance(checks, list)
+    read: List[
+        Union[ShellCheck, GatorGraderCheck, PytestCheck, InvalidCheck]
+    ] = [] if streamed else list(checks)
+    source = iter(checks) if streamed else iter(())
+    deadline = (
+        time.monotonic() + total_timeout if total_timeout is not None else None
+    )
+    if file_cache is None:
+        file_cache = FileContentCache()
+    shell_sessions = (
+        ShellSessionPool() if shell_session and HAS_SHELL_SESSIONS else None
+    )
+    # the pytest checks with the same runner share one run of pytest;
+    # a stream of checks is read to its end before any pytest check
+    prerequisites = [] if streamed else _prerequisite_indices(read)
+    pytest_runs = PytestRuns(read)
+    # a pool that this run starts outlives the loop so that no check is
+    # left waiting for it
+    with ExitStack() as owned_pool, background_event_loop() as loop:
+
+        def start_pool(gg_check_count: int) -> None:
+            """Start the pool once there are enough GatorGrader checks."""
+            nonlocal gg_pool
+            workers = _gg_pool_workers(gg_check_count, jobs)
+            if gg_pool is None and workers:
+                gg_pool = owned_pool.enter_context(
+                    GatorGraderPool(workers, file_cache=file_cache)
+                )
+
+        # the number of GatorGrader checks in a stream is only known
+        # once it has been read, so its pool starts as they are read
+        gg_check_count = _gg_check_count(read)
+        start_pool(gg_check_count)
+        semaphore = asyncio.Semaphore(max(jobs, 1))
+        # the futures of the checks that were started, by check index;
+        # the lock guards them, and the stopped event, against the
+        # callbacks that count failures in the thread of the loop
+        futures: Dict[int, Future] = {}
+        # the futures of the checks that are still running, so that a
+        # serial check only waits for those instead of every check
+        # started so far, which would make a long run quadratic
+        unfinished: Set[Future] = set()
+        lock = threading.RLock()
+        stopped = threading.Event()
+        failure_count = 0
+
+        def count_failure(future: Future) -> None:
+            """Stop the run once enough of the finished checks failed."""
+            nonlocal failure_count
+            if future.cancelled() or future.exception() is not None:
+                return
+            if not _counts_as_failure(future.result()):
+                return
+            with lock:
+                failure_count += 1
+                if max_failures is None or failure_count < max_failures:
+                    return
+                stopped.set()
+                # cancelling a check forgets it, so loop over a copy
+                for started in list(unfinished):
+                    started.cancel()
+
+        def forget(future: Future) -> None:
+            """Stop tracking a check that finished as still running."""
+            with lock:
+                unfinished.discard(future)
+
+        def submit(index: int) -> Future | None:
+            """Schedule a check on the event loop, unless the run stopped."""
+            with lock:
+                if stopped.is_set():
+                    return None
+                future = asyncio.run_coroutine_threadsafe(
+                    _run_check_async(
+                        read[index],
+                        output_limit,
+                        semaphore,
+                        [
+                            futures[i]
+                            for i in (
+                                prerequisites[index]
+                                if index < len(prerequisites)
+                                else []
+                            )
+                            if i in futures
+                        ],
+                        use_cache=use_cache,
+                        check_timeout=check_timeout,
+                        deadline=deadline,
+                        spill_output=spill_output,
+                        gg_pool=gg_pool,
+                        file_cache=file_cache,
+                        shell_sessions=shell_sessions,
+                        command_cache=command_cache,
+                        pytest_runs=pytest_runs,
+                    ),
+                    loop,
+                )
+                futures[index] = future
+                unfinished.add(future)
+                future.add_done_callback(forget)
+                future.add_done_callback(count_failure)
+                return future
+
+        def result_of(index: int) -> CheckResult | None:
+            """Wait for the result of a check, or report it as not run."""
+            future = futures.get(index)
+            if future is not None:
+                try:
+                    return future.result()
+                except concurrent.futures.CancelledError:
+                    pass
+            return _not_run_result(
+                read[index], output_limit, max_failures or failure_count
+            )
+
+        def start(index: int) -> bool:
+            """Start a check, and return whether it ran on its own."""
+            if jobs > 1 and getattr(read[index], "parallel", True):
+                submit(index)
+                return False
+            # a serial check must not overlap with any other check, so
+            # wait for every check started earlier before running it
+            with lock:
+                running = list(unfinished)
+            concurrent.futures.wait(running)
+            future = submit(index)
+            if future is not None:
+                concurrent.futures.wait([future])
+            return True
+
+        try:
+            next_index = 0
+            ahead = max(jobs, 1) * CHECKS_AHEAD_PER_JOB
+            for check in source:
+                read.append(check)
+                gg_check_count += isinstance(check, GatorGraderCheck)
+                start_pool(gg_check_count)
+                if (
+                    stopped.is_set()
+                    or getattr(check, "depends_on", None)
+                    or isinstance(check, PytestCheck)
+                ):
+                    break
+                start(len(read) - 1)
+                # yield the results that are ready, and wait for the
+                # oldest one once too many checks were read ahead of it
+                while next_index in futures and (
+                    futures[next_index].done()
+                    or len(read) - next_index >= ahead
+                ):
+                    yield result_of(next_index)
+                    next_index += 1
+            if streamed:
+                read.extend(source)
+                start_pool(_gg_check_count(read))
+                prerequisites = _prerequisite_indices(read)
+                pytest_runs = PytestRuns(read)
+            for index in _execution_order(prerequisites):
+                if stopped.is_set():
+                    break
+                # a streamed check that was read earlier already started
+                if index in futures or not start(index):
+                    continue
+                # every started check is now finished, so the results can
+                # be yielded up to the first check that has not started
+                while next_index in futures:
+                    yield result_of(next_index)
+                    next_index += 1
+            while next_index < len(read):
+                yield result_of(next_index)
+                next_index += 1
+        finally:
+            if shell_sessions is not None:
+                # stop the shells while their event loop still runs
+                asyncio.run_coroutine_threadsafe(
+                    shell_sessions.close(), loop
+                ).result()
+
+
+def _resources_json(result: CheckResult) -> Dict[str, Any]:
+    """Collect the resources that a check used for the JSON report.
+
+    Args:
+        result: The result of a check that ran.
+
+    Returns:
+        The wall time of the check and, when they are known, the CPU
+        time and peak memory of its command.
+
+    """
+    resources: Dict[str, Any] = {
+        WALL_TIME_KEY: round(result.wall_time or 0.0, RESOURCE_TIME_DIGITS)
+    }
+    if result.cpu_user_time is not None:
+        resources[CPU_USER_TIME_KEY] = round(
+            result.cpu_user_time, RESOURCE_TIME_DIGITS
+        )
+    if result.cpu_system_time is not None:
+        resources[CPU_SYSTEM_TIME_KEY] = round(
+            result.cpu_system_time, RESOURCE_TIME_DIGITS
+        )
+    if result.peak_rss_kib is not None:
+        resources[PEAK_RSS_KIB_KEY] = result.peak_rss_kib
+    return resources
+
+
+def _markdown_resources_table(checks: List[dict]) -> str:
+    """Create a table of the resources that every check used.
+
+    Args:
+        checks: The checks of a JSON report.
+
+    Returns:
+        The Markdown section with one row for each check that ran, or
+        an empty string when no check recorded its resources.
+
+    """
+    rows = EMPTY
+    for check in checks:
+        resources = check.get(RESOURCES_KEY)
+        if not resources:
+            continue
+        values = [
+            resources.get(key, MD_UNKNOWN_RESOURCE)
+            for key in (
+                WALL_TIME_KEY,
+                CPU_USER_TIME_KEY,
+                CPU_SYSTEM_TIME_KEY,
+                PEAK_RSS_KIB_KEY,
+            )
+        ]
+        name = check.get(DESCRIPTION_KEY, check.get(CHECK_KEY, EMPTY))
+        # a pipe in the description would end its table cell early
+        rows += MD_RESOURCES_ROW.format(str(name).replace("|", "\\|"), *values)
+    if not rows:
+        return EMPTY
+    return MD_RESOURCES_HEADER + rows + NEWLINE
+
+
+def create_report_json(  # noqa: PLR0912, PLR0913
     passed_count: int,
     checkResults: List[CheckResult],
     percent_passed: int,
@@ -436,8 +1754,11 @@ def create_report_json(  # noqa: PLR0913
         # grab all of the information in it and add it to the checks list
         results_json = checkResults[i].json_info
         # confirm that the json_info field of the check result is a dictionary
-        # and then add the status, path, and diagnostic information to that dictionary
+        # and then add the status, path, and diagnostic information to a copy
+        # of that dictionary, since the original is part of the parsed
+        # configuration file that later runs in this process share
         if isinstance(results_json, dict):
+            results_json = dict(results_json)
             results_json[STATUS_KEY] = checkResults[i].passed
             results_json[WEIGHT_KEY] = checkResults[i].weight
             results_json[OUTPUTLIMIT_KEY] = checkResults[i].outputlimit
@@ -449,6 +1770,27 @@ def create_report_json(  # noqa: PLR0913
                 results_json[HINT_KEY] = checkResults[i].hint
             if checkResults[i].check_id:
                 results_json[CHECK_ID_KEY] = checkResults[i].check_id
+            # a skipped check keeps a false status so that scores and
+            # report history treat it as not passing, but it is marked
+            # so that it can be told apart from a check that failed
+            if checkResults[i].skipped:
+                results_json[OUTCOME_KEY] = OUTCOME_SKIPPED
+            if checkResults[i].timed_out:
+                results_json[OUTCOME_KEY] = OUTCOME_TIMED_OUT
+            if checkResults[i].not_run:
+                results_json[OUTCOME_KEY] = OUTCOME_NOT_RUN
+            if checkResults[i].cached:
+                results_json[CACHED_KEY] = True
+            # a check whose output was too long to keep in full records
+            # how much it wrote and, if it was saved, where to find it
+            if checkResults[i].output_bytes is not None:
+                results_json[OUTPUT_LINES_KEY] = checkResults[i].output_lines
+                results_json[OUTPUT_BYTES_KEY] = checkResults[i].output_bytes
+            if checkResults[i].output_log is not None:
+                results_json[OUTPUT_LOG_KEY] = checkResults[i].output_log
+            # a check that ran records the resources that it used
+            if checkResults[i].wall_time is not None:
+                results_json[RESOURCES_KEY] = _resources_json(checkResults[i])
         checks_list.append(results_json)
     # create the dictionary for all of the check information
     overall_dict = dict(
@@ -545,6 +1887,8 @@ def create_markdown_report_file(  # noqa: PLR0912, PLR0915
             markdown_contents += MD_PASSING_ITEM.format(check[DESCRIPTION_KEY])
         else:
             markdown_contents += MD_PASSING_ITEM.format(check[CHECK_KEY])
+        if check.get(CACHED_KEY):
+            markdown_contents += MD_CACHED_SUFFIX
     # give extended information about failing checks
     markdown_contents += MD_FAILING_HEADER
     # for each failing check, print out all related information
@@ -554,9 +1898,19 @@ def create_markdown_report_file(  # noqa: PLR0912, PLR0915
             markdown_contents += MD_FAILING_ITEM.format(check[DESCRIPTION_KEY])
         else:
             markdown_contents += MD_FAILING_ITEM.format(check[CHECK_KEY])
-        # show all keys except status and description
+        if check.get(CACHED_KEY):
+            markdown_contents += MD_CACHED_SUFFIX
+        # show all keys except status, description, the cache marker
+        # that was already shown next to the description, and the
+        # resources, which have a table of their own
         for key, value in check.items():
-            if key in (STATUS_KEY, DESCRIPTION_KEY, CHECK_KEY):
+            if key in (
+                STATUS_KEY,
+                DESCRIPTION_KEY,
+                CHECK_KEY,
+                CACHED_KEY,
+                RESOURCES_KEY,
+            ):
                 continue
             if key == OPTIONS_KEY and value:
                 markdown_contents += (
@@ -586,6 +1940,9 @@ def create_markdown_report_file(  # noqa: PLR0912, PLR0915
                     f"{NEWLINE}{MD_LIST_INDENT}- **{key}:** {value}"
                 )
         markdown_contents += NEWLINE
+    markdown_contents += _markdown_resources_table(
+        json.get(CHECKS_KEY)  # type: ignore
+    )
     return markdown_contents
 
 
@@ -802,7 +2159,9 @@ def _format_remaining_time(due_date: datetime.datetime) -> tuple[str, str]:
 
 
 def run_checks(  # noqa: PLR0912, PLR0913, PLR0915
-    checks: List[Union[ShellCheck, GatorGraderCheck]],
+    checks: Iterable[
+        Union[ShellCheck, GatorGraderCheck, PytestCheck, InvalidCheck]
+    ],
     report: Tuple[str, str, str],
     no_progress_bar: bool = False,
     show_diagnostics: bool = True,
@@ -819,6 +2178,18 @@ def run_checks(  # noqa: PLR0912, PLR0913, PLR0915
     report_history_max_count: int = DEFAULT_HISTORY_REPORT_COUNT,
     report_history_max_mib: int = DEFAULT_HISTORY_SIZE_MIB,
     history_scope: str | None = None,
+    jobs: int = DEFAULT_JOBS,
+    result_cache: bool = False,
+    result_cache_max_mib: int = DEFAULT_CACHE_SIZE_MIB,
+    check_timeout: int = DEFAULT_TIMEOUT_SECONDS,
+    total_timeout: int | None = None,
+    output_log: bool = False,
+    max_failures: int | None = None,
+    slowest: int | None = None,
+    verbose: bool = False,
+    shell_session: bool = False,
+    share_commands: bool = True,
+    gg_pool: GatorGraderPool | None = None,
 ) -> bool:
     """Run shell and GatorGrader checks and display whether each has passed or failed.
 
@@ -826,7 +2197,9 @@ def run_checks(  # noqa: PLR0912, PLR0913, PLR0915
         shows the overall fraction of passed checks.
 
     Args:
-        checks: The list of shell and GatorGrader checks to run.
+        checks: The list of shell and GatorGrader checks to run, or an
+            iterator that streams them, whose number is only known once
+            they have all run.
         report: The tuple specifying the report format, type, and name.
         no_progress_bar: Disable the progress bar (shown by default).
         show_diagnostics: Show diagnostic details for failing checks.
@@ -849,6 +2222,29 @@ def run_checks(  # noqa: PLR0912, PLR0913, PLR0915
         report_history_max_count: Maximum number of retained reports.
         report_history_max_mib: Maximum total history size in MiB.
         history_scope: Scope identifier for the current configuration.
+        jobs: The maximum number of checks to run at the same time.
+        result_cache: Whether to reuse the results of checks whose inputs
+            did not change and to store the new results.
+        result_cache_max_mib: Maximum total result cache size in MiB.
+        check_timeout: The timeout, in seconds, of a check that does not
+            set a timeout of its own.
+        total_timeout: The number of seconds that all of the checks
+            together may run, or None for no limit.
+        output_log: Whether to save the full output of a failing shell
+            check, when it is too long to keep, in a temporary log file.
+        max_failures: The number of failing checks after which the run
+            stops in fail-fast mode, or None to run every check.
+        slowest: The number of slowest checks to list in the summary,
+            or None to not list them.
+        verbose: Whether to show the hits and misses of the file cache
+            of the GatorGrader checks, and how many checks shared the run
+            of a command, in the summary.
+        shell_session: Whether to run the commands of shell checks in
+            long-lived shell sessions instead of a new shell each.
+        share_commands: Whether checks with the same command share one
+            run of it instead of each running it again.
+        gg_pool: The pool of worker processes that was started for the
+            GatorGrader checks with start_gg_pool, if any.
 
     """
 
@@ -859,7 +2255,12 @@ def run_checks(  # noqa: PLR0912, PLR0913, PLR0915
         configuration file.
 
         """
-        if auto_hint_engine is None or result.passed:
+        if (
+            auto_hint_engine is None
+            or result.passed
+            or result.skipped
+            or result.not_run
+        ):
             return
         if result.hint is not None:
             # do not overwrite an explicit hint from the config file.
@@ -885,46 +2286,38 @@ def run_checks(  # noqa: PLR0912, PLR0913, PLR0915
             result.is_low_quality = is_low_quality
 
     results: List[CheckResult] = []
+    # the GatorGrader checks of this run share the files that they read,
+    # and the workers of a pool report their hits and misses to it
+    file_cache = FileContentCache()
+    if gg_pool is not None:
+        gg_pool.file_cache = file_cache
+    # the checks of this run with the same command share one run of it
+    command_cache = CommandResultCache() if share_commands else None
     # use the configured project name, falling back to directory name
     display_project_name = project_name or Path.cwd().name
     # run each of the checks
-    # check how many tests are being ran
-    total_checks = len(checks)
+    # check how many tests are being ran, which is not known up front
+    # for a stream of checks
+    total_checks = len(checks) if isinstance(checks, list) else None
     # run checks with no progress bar
     if no_progress_bar:
         rich.print()
         rich.print(Rule(RUNNING_CHECKS_RULE_LABEL))
         rich.print()
-        for check in checks:
-            result = None
-            # command_ran = None
-            # run a shell check; this means
-            # that it is going to run a command
-            # in the shell as a part of a check;
-            # store the command that ran in the
-            # field called run_command that is
-            # inside of a CheckResult object but
-            # not initialized in the constructor
-            if isinstance(check, ShellCheck):
-                result = _run_shell_check(check, output_limit)
-                command_ran = check.command
-                result.run_command = command_ran
-            # run a check that GatorGrader implements
-            elif isinstance(check, GatorGraderCheck):
-                result = _run_gg_check(check, output_limit)
-                # check to see if there was a command in the
-                # GatorGraderCheck. This code finds the index of the
-                # word "--command" in the check.gg_args list if it
-                # is available (it is not available for all of
-                # the various types of GatorGraderCheck instances),
-                # and then it adds 1 to that index to get the actual
-                # command run and then stores that command in the
-                # result.run_command field that is initialized to
-                # an empty string in the constructor for CheckResult
-                if GG_COMMAND_ARG in check.gg_args:
-                    index_of_command = check.gg_args.index(GG_COMMAND_ARG)
-                    index_of_new_command = index_of_command + 1
-                    result.run_command = check.gg_args[index_of_new_command]
+        for result in _iter_check_results(
+            checks,
+            output_limit,
+            jobs=jobs,
+            use_cache=result_cache,
+            check_timeout=check_timeout,
+            total_timeout=total_timeout,
+            spill_output=output_log,
+            max_failures=max_failures,
+            file_cache=file_cache,
+            shell_session=shell_session,
+            command_cache=command_cache,
+            gg_pool=gg_pool,
+        ):
             # there were results from running checks
             # and thus they must be displayed
             if result is not None:
@@ -951,32 +2344,20 @@ def run_checks(  # noqa: PLR0912, PLR0913, PLR0915
                 f"[green]{RUNNING_CHECKS_LABEL}", total=total_checks
             )
             # run each of the checks
-            for check in checks:
-                result = None
-                # command_ran = None
-                if isinstance(check, ShellCheck):
-                    result = _run_shell_check(check, output_limit)
-                    command_ran = check.command
-                    result.run_command = command_ran
-                # run a check that GatorGrader implements
-                elif isinstance(check, GatorGraderCheck):
-                    result = _run_gg_check(check, output_limit)
-                    # check to see if there was a command in the
-                    # GatorGraderCheck. This code finds the index of the
-                    # word "--command" in the check.gg_args list if it
-                    # is available (it is not available for all of
-                    # the various types of GatorGraderCheck instances),
-                    # and then it adds 1 to that index to get the actual
-                    # command run and then stores that command in the
-                    # result.run_command field that is initialized to
-                    # an empty string in the constructor for CheckResult
-                    if GG_COMMAND_ARG in check.gg_args:
-                        index_of_command = check.gg_args.index(GG_COMMAND_ARG)
-                        # index_of_new_command = int(index_of_command) + 1
-                        index_of_new_command = index_of_command + 1
-                        result.run_command = check.gg_args[
-                            index_of_new_command
-                        ]
+            for result in _iter_check_results(
+                checks,
+                output_limit,
+                jobs=jobs,
+                use_cache=result_cache,
+                check_timeout=check_timeout,
+                total_timeout=total_timeout,
+                spill_output=output_log,
+                max_failures=max_failures,
+                file_cache=file_cache,
+                shell_session=shell_session,
+                command_cache=command_cache,
+                gg_pool=gg_pool,
+            ):
                 # there were results from running checks
                 # and thus they must be displayed; use the progress
                 # bar's print method so each check appears above
@@ -986,6 +2367,16 @@ def run_checks(  # noqa: PLR0912, PLR0913, PLR0915
                     progress.print(result.display_result())
                     # if result:
                     progress.update(task, advance=1)
+            # the number of streamed checks is known once they have run
+            if total_checks is None:
+                progress.update(task, total=len(results))
+    # keep the result cache within its size limit now that the new
+    # results of this run have been stored in it
+    if result_cache:
+        try:
+            prune_result_cache(result_cache_max_mib)
+        except OSError as error:
+            rich.print(RESULT_CACHE_WARNING.format(error))
     # determine if there are failures and then display them
     failed_results = list(filter(lambda result: not result.passed, results))
     # generate auto-hints for failing checks with a progress bar
@@ -1166,6 +2557,10 @@ def run_checks(  # noqa: PLR0912, PLR0913, PLR0915
         rich.print(Rule(f"{FAILING_CHECKS_LABEL}", style="bright_red"))
         rich.print("")
         for result in failed_results:
+            # the checks that fail-fast mode stopped are only counted
+            # in the summary instead of being listed one by one
+            if result.not_run:
+                continue
             result.print(show_diagnostic=show_diagnostics)
             if show_diagnostics:
                 # display the weight of the check so that the
@@ -1207,6 +2602,39 @@ def run_checks(  # noqa: PLR0912, PLR0913, PLR0915
             f"[bold]- {POINTS_LABEL}:[/] {passed_weight}/{total_weight} "
             f"[{summary_color}]({weighted_percent}%)[/]"
         )
+        # --> display how many results were reused from the cache
+        _print_cache_summary(results)
+        # --> display the checks that took the longest to run
+        _print_slowest_summary(results, slowest)
+        # --> display how well the file and command caches worked,
+        #     in verbose mode
+        if verbose:
+            _print_file_cache_summary(file_cache)
+            _print_command_cache_summary(command_cache)
+        # --> display how many checks were stopped by a timeout
+        timed_out_count = sum(
+            1 for result in failed_results if result.timed_out
+        )
+        if timed_out_count > 0:
+            rich.print(
+                f"[bold]- {TIMED_OUT_LABEL}:[/] {timed_out_count} check(s)"
+                " ran out of time"
+            )
+        # --> display how many checks did not run because a check
+        #     that they depend on did not pass
+        skipped_count = sum(1 for result in failed_results if result.skipped)
+        if skipped_count > 0:
+            rich.print(
+                f"[bold]- {SKIPPED_LABEL}:[/] {skipped_count} check(s)"
+                " whose prerequisites did not pass"
+            )
+        # --> display how many checks fail-fast mode did not let finish
+        not_run_count = sum(1 for result in failed_results if result.not_run)
+        if not_run_count > 0:
+            rich.print(
+                f"[bold]- {NOT_RUN_LABEL}:[/] {not_run_count} check(s)"
+                " after the run stopped early"
+            )
         # --> if filtering was active, show the historical filter
         #     summary first (status filtering runs before text
         #     filtering), then the query filter reminder line
@@ -1326,6 +2754,15 @@ def run_checks(  # noqa: PLR0912, PLR0913, PLR0915
             f"[bold]- {POINTS_LABEL}:[/] {passed_weight}/{total_weight} "
             f"[{summary_color}]({weighted_percent}%)[/]"
         )
+        # --> display how many results were reused from the cache
+        _print_cache_summary(results)
+        # --> display the checks that took the longest to run
+        _print_slowest_summary(results, slowest)
+        # --> display how well the file and command caches worked,
+        #     in verbose mode
+        if verbose:
+            _print_file_cache_summary(file_cache)
+            _print_command_cache_summary(command_cache)
         # --> if filtering was active, show the historical filter
         #     summary first (status filtering runs before text
         #     filtering), then the query filter reminder line
@@ -0,0 +1,354 @@
+"""Run pytest once for all of the PytestOutcome checks of a grading run.
+
+A configuration with one shell check for each test, such as "pytest
+tests/test_main.py::test_one", starts pytest and collects the tests
+again for every check. A PytestOutcome check names the test instead,
+and all of the PytestOutcome checks of a run that use the same runner
+share one run of pytest for all of their node IDs. That run writes a
+JUnit XML report, from which every check takes the outcome and the
+failure text of its own tests. When pytest refuses to run the whole
+group, for instance because one of the node IDs does not exist, each
+check runs pytest again for its own tests alone, so that one mistake in
+the configuration does not fail the other checks.
+"""
+
+import asyncio
+import os
+import shlex
+import shutil
+import subprocess
+import tempfile
+from collections import namedtuple
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Tuple
+from xml.etree import ElementTree
+
+from gatorgrade.input.checks import PytestCheck
+from gatorgrade.input.command_argv import split_plain_command
+from gatorgrade.output.executor import run_shell_command
+
+# the options that make pytest write its JUnit XML report and run the
+# tests of the files that it could collect even when others fail to
+JUNIT_XML_OPTION = "--junitxml"
+CONTINUE_OPTION = "--continue-on-collection-errors"
+JUNIT_XML_NAME = "pytest-junit.xml"
+TEMPORARY_DIRECTORY_PREFIX = "gatorgrade-pytest-"
+
+# the exit code of pytest when it could not understand its arguments,
+# such as a node ID that does not exist or that is in a file that could
+# not be collected, and thus ran no tests at all
+USAGE_ERROR_EXIT_CODE = 4
+
+# the parts of a node ID and of the test address in a JUnit XML report
+NODEID_SEPARATOR = "::"
+PARAMETERS_START = "["
+ADDRESS_SEPARATOR = "."
+PATH_SEPARATOR = "/"
+PYTHON_SUFFIX = ".py"
+
+# the elements of a test case that tell how it did not pass
+OUTCOME_PASSED = "passed"
+OUTCOME_ELEMENTS = ("failure", "error", "skipped")
+OUTCOME_SKIPPED = "skipped"
+OUTCOME_ERROR = "error"
+TESTCASE_ELEMENT = "testcase"
+CLASSNAME_ATTRIBUTE = "classname"
+NAME_ATTRIBUTE = "name"
+MESSAGE_ATTRIBUTE = "message"
+
+NEWLINE = "\n"
+SPACE = " "
+SKIPPED_DIAGNOSTIC_FMT = "Skipped: {}"
+TESTCASE_DIAGNOSTIC_FMT = "{} ({}): {}"
+NOT_REPORTED_DIAGNOSTIC_FMT = "Pytest did not report the outcome of {}"
+
+# the number of lines at the end of the output of pytest that explain
+# why it did not report the outcome of a test
+OUTPUT_TAIL_LINES = 15
+
+# the outcome of one test case in a JUnit XML report: its address, in
+# the dotted form that pytest writes, whether it passed, failed, had an
+# error, or was skipped, and the message and text that explain why not
+PytestTestCase = namedtuple(
+    "PytestTestCase", ["address", "outcome", "message", "text"]
+)
+
+# one run of pytest: the command that ran, its CommandOutcome, and the
+# test cases of its report, or None when it did not write a report
+PytestRun = namedtuple("PytestRun", ["command", "outcome", "testcases"])
+
+
+def _quote(argument: str) -> str:
+    """Quote an argument for the shell of this platform."""
+    if os.name == "posix":
+        return shlex.quote(argument)
+    return subprocess.list2cmdline([argument])
+
+
+def pytest_command(
+    runner: str, nodeids: Iterable[str], junit_xml: str | None = None
+) -> str:
+    """Build the command that runs pytest for some tests.
+
+    Args:
+        runner: The command that runs pytest.
+        nodeids: The node IDs of the tests to run.
+        junit_xml: The path of the JUnit XML report to write, if any.
+
+    Returns:
+        The command, with every argument quoted for the shell.
+
+    """
+    arguments = [runner]
+    if junit_xml is not None:
+        arguments.append(_quote(f"{JUNIT_XML_OPTION}={junit_xml}"))
+        arguments.append(CONTINUE_OPTION)
+    arguments.extend(_quote(nodeid) for nodeid in nodeids)
+    return SPACE.join(arguments)
+
+
+def junit_address(nodeid: str) -> str:
+    """Convert a node ID to the dotted address that JUnit XML reports use.
+
+    This follows what the junitxml plugin of pytest does, so that
+    "tests/test_a.py::TestA::test_one[1]" becomes
+    "tests.test_a.TestA.test_one[1]".
+
+    Args:
+        nodeid: The pytest node ID of a test, class, or file of tests.
+
+    Returns:
+        The dotted address of the node.
+
+    """
+    path, bracket, parameters = nodeid.partition(PARAMETERS_START)
+    names = path.split(NODEID_SEPARATOR)
+    names[0] = names[0].replace(os.sep, PATH_SEPARATOR)
+    names[0] = names[0].replace(PATH_SEPARATOR, ADDRESS_SEPARATOR)
+    names[0] = names[0].removesuffix(PYTHON_SUFFIX)
+    names[-1] += bracket + parameters
+    return ADDRESS_SEPARATOR.join(names)
+
+
+def parse_junit_xml(path: Path) -> List[PytestTestCase]:
+    """Read the outcome of every test case in a JUnit XML report.
+
+    Args:
+        path: The path of the report that pytest wrote.
+
+    Returns:
+        The outcomes of the test cases, in the order of the report.
+
+    Raises:
+        OSError: If the report cannot be read.
+        ElementTree.ParseError: If the report is not valid XML.
+
+    """
+    testcases = []
+    for element in ElementTree.parse(path).iter(TESTCASE_ELEMENT):
+        classname = element.get(CLASSNAME_ATTRIBUTE) or ""
+        name = element.get(NAME_ATTRIBUTE) or ""
+        # a file that could not be collected has no class name and has
+        # the address of the file as its name
+        address = ADDRESS_SEPARATOR.join(
+            part for part in (classname, name) if part
+        )
+        outcome, message, text = OUTCOME_PASSED, "", ""
+        for outcome_name in OUTCOME_ELEMENTS:
+            child = element.find(outcome_name)
+            if child is not None:
+                outcome = outcome_name
+                message = child.get(MESSAGE_ATTRIBUTE) or ""
+                text = (child.text or "").strip()
+                break
+        testcases.append(PytestTestCase(address, outcome, message, text))
+    return testcases
+
+
+def _belongs_to(testcase: PytestTestCase, address: str) -> bool:
+    """Return whether a test case is part of the node at an address.
+
+    A test case belongs to the node of its own test, of its class, of
+    its file, or of the parametrized function that it is one case of.
+    A file that could not be collected belongs to every node inside of
+    it, since none of its tests could run.
+    """
+    if testcase.address == address:
+        return True
+    if testcase.address.startswith(address) and testcase.address[
+        len(address)
+    ] in (ADDRESS_SEPARATOR, PARAMETERS_START):
+        return True
+    return testcase.outcome == OUTCOME_ERROR and address.startswith(
+        testcase.address + ADDRESS_SEPARATOR
+    )
+
+
+def _output_tail(run: PytestRun) -> str:
+    """Return the last lines of the output of a run of pytest."""
+    lines = run.outcome.output.decode(errors="replace").strip().splitlines()
+    return NEWLINE.join(lines[-OUTPUT_TAIL_LINES:])
+
+
+def node_outcome(nodeid: str, run: PytestRun) -> Tuple[bool, str]:
+    """Decide whether the tests of a node passed in a run of pytest.
+
+    A node passes when pytest reported at least one of its test cases
+    and all of them passed; a skipped test does not pass.
+
+    Args:
+        nodeid: The node ID of the test, class, or file of tests.
+        run: The run of pytest that included the node.
+
+    Returns:
+        Whether the node passed and, when it did not, the diagnostic
+        that explains why: the failure text of a single test, the
+        failure message of each test of a larger node, or the end of
+        the output of pytest when it did not report the node at all.
+
+    """
+    address = junit_address(nodeid)
+    testcases = [
+        testcase
+        for testcase in run.testcases or []
+        if _belongs_to(testcase, address)
+    ]
+    if not testcases:
+        diagnostic = NOT_REPORTED_DIAGNOSTIC_FMT.format(nodeid)
+        tail = _output_tail(run)
+        return False, diagnostic + NEWLINE + tail if tail else diagnostic
+    unsuccessful = [
+        testcase
+        for testcase in testcases
+        if testcase.outcome != OUTCOME_PASSED
+    ]
+    if not unsuccessful:
+        return True, ""
+    if len(testcases) == 1:
+        testcase = unsuccessful[0]
+        if testcase.outcome == OUTCOME_SKIPPED:
+            return False, SKIPPED_DIAGNOSTIC_FMT.format(testcase.message)
+        return False, testcase.text or testcase.message
+    return False, NEWLINE.join(
+        TESTCASE_DIAGNOSTIC_FMT.format(
+            testcase.address,
+            testcase.outcome,
+            testcase.message.splitlines()[0] if testcase.message else "",
+        )
+        for testcase in unsuccessful
+    )
+
+
+async def _run_pytest(
+    runner: str, nodeids: Tuple[str, ...], timeout: float, spill: bool
+) -> PytestRun:
+    """Run pytest for some tests and read the report that it wrote.
+
+    Args:
+        runner: The command that runs pytest.
+        nodeids: The node IDs of the tests to run.
+        timeout: The maximum number of seconds that pytest may run.
+        spill: Whether to keep the full output of pytest in a temporary
+            log file when it is too long to be kept in memory.
+
+    Returns:
+        The run of pytest, whose test cases are None when pytest did
+        not write a report that could be read.
+
+    Raises:
+        subprocess.TimeoutExpired: If pytest did not finish in time.
+
+    """
+    directory = tempfile.mkdtemp(prefix=TEMPORARY_DIRECTORY_PREFIX)
+    try:
+        junit_xml = os.path.join(directory, JUNIT_XML_NAME)
+        command = pytest_command(runner, nodeids, junit_xml)
+        outcome = await run_shell_command(
+            command, timeout, spill, split_plain_command(command)
+        )
+        try:
+            testcases = parse_junit_xml(Path(junit_xml))
+        except (OSError, ElementTree.ParseError):
+            testcases = None
+        return PytestRun(command, outcome, testcases)
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+class PytestRuns:
+    """Share runs of pytest among the PytestOutcome checks of one run.
+
+    The checks are grouped by their runner, and the first check of a
+    group to run starts pytest for the node IDs of the whole group. The
+    runs belong to the event loop that the checks run in.
+    """
+
+    def __init__(self, checks: Iterable[Any]) -> None:
+        """Construct PytestRuns for the PytestOutcome checks of a run.
+
+        Args:
+            checks: The checks of the run, of which only the
+                PytestOutcome checks are grouped.
+
+        """
+        # runner -> node IDs of its checks, in order and without repeats
+        self._groups: Dict[str, List[str]] = {}
+        for check in checks:
+            if isinstance(check, PytestCheck):
+                group = self._groups.setdefault(check.runner, [])
+                if check.nodeid not in group:
+                    group.append(check.nodeid)
+        self._runs: Dict[Tuple[str, Tuple[str, ...]], asyncio.Future] = {}
+
+    async def _shared_run(
+        self,
+        runner: str,
+        nodeids: Tuple[str, ...],
+        timeout: float,
+        spill: bool,
+    ) -> PytestRun:
+        """Return the run of pytest for some tests, starting it if needed."""
+        key = (runner, nodeids)
+        run = self._runs.get(key)
+        if run is None or run.cancelled():
+            # the run is not owned by any one check, so cancelling one
+            # check does not stop pytest for the others
+            run = asyncio.ensure_future(
+                _run_pytest(runner, nodeids, timeout, spill)
+            )
+            self._runs[key] = run
+        return await asyncio.shield(run)
+
+    async def run_for(
+        self, check: PytestCheck, timeout: float, spill: bool = False
+    ) -> PytestRun:
+        """Return a run of pytest that included the tests of a check.
+
+        Args:
+            check: The PytestOutcome check.
+            timeout: The maximum number of seconds that pytest may run,
+                if this check is the one to start it.
+            spill: Whether to keep the full output of pytest in a
+                temporary log file when it is too long to be kept.
+
+        Returns:
+            The run of pytest for the group of the check or, when pytest
+            refused to run the group, for the tests of the check alone.
+
+        Raises:
+            subprocess.TimeoutExpired: If pytest did not finish in time.
+
+        """
+        group = self._groups.get(check.runner, [])
+        if check.nodeid not in group:
+            group = [check.nodeid]
+        run = await self._shared_run(
+            check.runner, tuple(group), timeout, spill
+        )
+        # pytest runs none of the tests when it cannot find one of them,
+        # even though it reports the files that it failed to collect
+        if run.outcome.returncode == USAGE_ERROR_EXIT_CODE and len(group) > 1:
+            run = await self._shared_run(
+                check.runner, (check.nodeid,), timeout, spill
+            )
+        return run
@@ -0,0 +1,316 @@
+"""Run the commands of shell checks in long-lived shell sessions.
+
+Starting a new shell for every check means forking and executing
+/bin/sh, which then sets itself up from scratch, before the command
+of the check even starts. For a configuration with hundreds of tiny
+checks, such as grep and test -f commands, starting shells takes most
+of the time. A shell session starts one shell and sends it the command
+of one check after another through its standard input. Every command
+runs in a subshell, which the session shell forks without executing a
+new program, so the working directory, the environment, and the shell
+options that a command changes never leak into the next command. The
+command is passed to eval as one quoted word, so a command with a
+syntax error only fails itself. After the subshell exits, the session
+shell prints a sentinel line with a random token and the exit code of
+the command, which marks where the output of the command ends. A
+session whose shell died, that ran out of time, or that was left with
+stray output is discarded, and the next command starts a new shell.
+"""
+
+import asyncio
+import os
+import re
+import shlex
+import subprocess
+import uuid
+from typing import List, Tuple, cast
+
+from gatorgrade.output.capture import BoundedCapture
+from gatorgrade.output.executor import (
+    DEFAULT_TIMEOUT_SECONDS,
+    NEW_PROCESS_GROUP,
+    CommandOutcome,
+    CommandTimeoutExpired,
+    kill_process_group,
+)
+
+# the shell that runs the commands; sessions need a POSIX shell and
+# process groups, so they are not available on Windows
+SESSION_SHELL = "/bin/sh"
+HAS_SHELL_SESSIONS = hasattr(os, "killpg") and os.path.exists(SESSION_SHELL)
+
+# the script sent to the session shell for each command; it runs the
+# command in a subshell that cannot read the rest of the script from
+# standard input and then prints the sentinel line with its exit code
+COMMAND_SCRIPT_FMT = (
+    "( cd -- {directory} || exit 125; eval {command}\n) </dev/null 2>&1\n"
+    "printf '\\n%s %d\\n' {sentinel} \"$?\"\n"
+)
+SENTINEL_FMT = "__gatorgrade_{}_{}__"
+SENTINEL_LINE_RE = re.compile(rb" (-?\d+)\n")
+NEWLINE_BYTE = b"\n"
+
+# the number of bytes read from the output of the session at once
+READ_CHUNK_BYTES = 64 * 1024
+
+# the exit code of a command whose session shell ended without telling
+# how the command finished
+SESSION_LOST_EXIT_CODE = 1
+
+# the number of seconds to wait for a session shell to exit after its
+# input is closed before it is killed
+CLOSE_TIMEOUT_SECONDS = 5
+
+
+class ShellSession:
+    """Run commands, one at a time, in one long-lived shell."""
+
+    def __init__(self) -> None:
+        """Construct a ShellSession that has not started its shell."""
+        self._process: asyncio.subprocess.Process | None = None
+        self._token = uuid.uuid4().hex
+        self._runs = 0
+        # output read after the sentinel of the last command
+        self._pending = b""
+        self.capture = BoundedCapture()
+
+    @property
+    def alive(self) -> bool:
+        """Return whether the shell is running and ready for a command."""
+        return (
+            self._process is not None
+            and self._process.returncode is None
+            and not self._pending
+        )
+
+    async def _start(
+        self,
+    ) -> Tuple[asyncio.StreamWriter, asyncio.StreamReader]:
+        """Start a new shell, discarding the previous one if needed.
+
+        Returns:
+            The standard input and the output of the new shell.
+
+        """
+        # output left behind by an earlier command belongs to no command
+        self._pending = b""
+        if self._process is not None:
+            # processes left behind by earlier commands go with the shell
+            self.kill()
+            await self.close()
+        self._process = await asyncio.create_subprocess_exec(
+            SESSION_SHELL,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            **NEW_PROCESS_GROUP,
+        )
+        return (
+            cast(asyncio.StreamWriter, self._process.stdin),
+            cast(asyncio.StreamReader, self._process.stdout),
+        )
+
+    async def _send(self, script: bytes) -> asyncio.StreamReader:
+        """Send a script to the shell, starting a shell if there is none.
+
+        Args:
+            script: The script that runs one command.
+
+        Returns:
+            The output of the shell that received the script.
+
+        """
+        if not self.alive or self._process is None:
+            stdin, stdout = await self._start()
+        else:
+            stdin = cast(asyncio.StreamWriter, self._process.stdin)
+            stdout = cast(asyncio.StreamReader, self._process.stdout)
+        try:
+            stdin.write(script)
+            await stdin.drain()
+        except (BrokenPipeError, ConnectionResetError):
+            # the shell died before it read the command, so running the
+            # command in a new shell cannot run it twice
+            stdin, stdout = await self._start()
+            stdin.write(script)
+            await stdin.drain()
+        return stdout
+
+    async def run(self, command: str, spill: bool = False) -> CommandOutcome:
+        """Run a command in the shell and capture its combined output.
+
+        Args:
+            command: The command to run.
+            spill: Whether to keep the full output in a temporary log
+                file when it is too long to be kept in memory.
+
+        Returns:
+            The exit code of the command and its captured output; the
+            resources of a command in a session are not measured.
+
+        """
+        self._runs += 1
+        sentinel = SENTINEL_FMT.format(self._token, self._runs)
+        script = COMMAND_SCRIPT_FMT.format(
+            directory=shlex.quote(os.getcwd()),
+            command=shlex.quote(command),
+            sentinel=sentinel,
+        )
+        self.capture = BoundedCapture(spill=spill)
+        stdout = await self._send(script.encode())
+        returncode = await self._read_until(
+            stdout, NEWLINE_BYTE + sentinel.encode()
+        )
+        return self.outcome(returncode)
+
+    async def _read_until(
+        self, stdout: asyncio.StreamReader, marker: bytes
+    ) -> int:
+        """Capture output until the sentinel line and return the exit code.
+
+        Args:
+            stdout: The output of the session shell.
+            marker: The newline and the sentinel that precede the exit
+                code of the command in the output of the session.
+
+        Returns:
+            The exit code of the command.
+
+        """
+        # the output that was read but not yet captured stays pending,
+        # so that a command that is stopped still reports all of it
+        while True:
+            found = self._pending.find(marker)
+            if found >= 0:
+                # everything before the marker is output of the command
+                self.capture.write(self._pending[:found])
+                self._pending = self._pending[found:]
+                line = SENTINEL_LINE_RE.match(self._pending, len(marker))
+                if line is not None:
+                    self._pending = self._pending[line.end() :]
+                    return int(line.group(1))
+            else:
+                # keep enough to find a marker split between two chunks
+                keep = len(marker) - 1
+                if len(self._pending) > keep:
+                    self.capture.write(self._pending[:-keep])
+                    self._pending = self._pending[-keep:]
+            chunk = await stdout.read(READ_CHUNK_BYTES)
+            if not chunk:
+                # the shell exited before it finished the command
+                self.capture.write(self._pending)
+                self._pending = b""
+                returncode = (
+                    await self._process.wait() if self._process else None
+                )
+                return returncode or SESSION_LOST_EXIT_CODE
+            self._pending += chunk
+
+    def outcome(self, returncode: int | None) -> CommandOutcome:
+        """Return the outcome of the last command with its output."""
+        self.capture.close()
+        return CommandOutcome(
+            returncode=returncode,
+            output=self.capture.getvalue(),
+            line_count=self.capture.total_lines,
+            byte_count=self.capture.total_bytes,
+            omitted_bytes=self.capture.omitted_bytes,
+            log_path=self.capture.log_path,
+        )
+
+    def kill(self) -> CommandOutcome:
+        """Kill the shell and every process that its commands started.
+
+        Returns:
+            The outcome of the command that was running, without an exit
+            code, with all of the output that it wrote before the kill.
+
+        """
+        if self._process is not None and self._process.returncode is None:
+            kill_process_group(self._process.pid)
+        self.capture.write(self._pending)
+        self._pending = b""
+        return self.outcome(None)
+
+    async def close(self) -> None:
+        """Stop the shell, asking it to exit before killing it."""
+        process = self._process
+        self._process = None
+        if process is None:
+            return
+        if process.returncode is None and process.stdin is not None:
+            process.stdin.close()
+            try:
+                await asyncio.wait_for(process.wait(), CLOSE_TIMEOUT_SECONDS)
+            except asyncio.TimeoutError:
+                kill_process_group(process.pid)
+        await process.wait()
+
+
+class ShellSessionPool:
+    """Hand the commands of shell checks to idle shell sessions.
+
+    A new session is started whenever every existing session is busy,
+    so there are never more sessions than commands that ran at the same
+    time. The pool belongs to the event loop that it is used in.
+    """
+
+    def __init__(self) -> None:
+        """Construct a ShellSessionPool without any sessions."""
+        self._idle: List[ShellSession] = []
+        self._sessions: List[ShellSession] = []
+
+    async def run_command(
+        self,
+        command: str,
+        timeout: float = DEFAULT_TIMEOUT_SECONDS,
+        spill: bool = False,
+    ) -> CommandOutcome:
+        """Run a command in an idle session and capture its output.
+
+        Args:
+            command: The command to run.
+            timeout: The maximum number of seconds the command may run.
+            spill: Whether to keep the full output in a temporary log
+                file when it is too long to be kept in memory.
+
+        Returns:
+            The exit code of the command and its captured output.
+
+        Raises:
+            CommandTimeoutExpired: If the command did not finish before
+                the timeout; the outcome with the partial output is
+                attached and the session is discarded.
+
+        """
+        if self._idle:
+            session = self._idle.pop()
+        else:
+            session = ShellSession()
+            self._sessions.append(session)
+        try:
+            outcome = await asyncio.wait_for(
+                session.run(command, spill), timeout=timeout
+            )
+        except asyncio.TimeoutError as error:
+            raise CommandTimeoutExpired(
+                command, timeout, session.kill()
+            ) from error
+        except BaseException:
+            # a cancelled command must not keep running in the session
+            session.kill()
+            raise
+        self._idle.append(session)
+        return outcome
+
+    async def close(self) -> None:
+        """Stop the shells of every session that the pool started."""
+        sessions = self._sessions
+        idle = self._idle
+        self._sessions = []
+        self._idle = []
+        for session in sessions:
+            # a session that is still busy was left by a cancelled run
+            if session not in idle:
+                session.kill()
+            await session.close()
@@ -7,10 +7,12 @@ import json
 import os
 import uuid
 from pathlib import Path
-from typing import Any, Sequence
+from typing import Any, Callable, Dict, Iterator, Sequence
 
 import platformdirs
 
+from gatorgrade.hash import CHECK_ID_VERSION, LEGACY_CHECK_ID_VERSION
+
 HISTORY_APPLICATION_NAME = "gatorgrade"
 HISTORY_DIRECTORY_NAME = "reports"
 HISTORY_FILE_PREFIX = "gatorgrade-report-"
@@ -19,6 +21,7 @@ HISTORY_SCHEMA_VERSION = 1
 HISTORY_SCHEMA_KEY = "history_schema_version"
 HISTORY_SAVED_AT_KEY = "history_saved_at"
 HISTORY_SCOPE_KEY = "history_scope"
+HISTORY_CHECK_ID_VERSION_KEY = "check_id_version"
 HISTORY_REPORT_KEY = "report"
 CHECKS_KEY = "checks"
 CHECK_ID_KEY = "check_id"
@@ -112,6 +115,7 @@ def _make_history_payload(
         HISTORY_SCHEMA_KEY: HISTORY_SCHEMA_VERSION,
         HISTORY_SAVED_AT_KEY: current_time.isoformat(),
         HISTORY_SCOPE_KEY: scope,
+        HISTORY_CHECK_ID_VERSION_KEY: CHECK_ID_VERSION,
         HISTORY_REPORT_KEY: history_report,
     }
 
@@ -267,12 +271,60 @@ def load_history_reports(
     return reports
 
 
+def _report_checks(
+    history_payload: dict[str, Any],
+    legacy_check_ids: Callable[[], Dict[str, str]] | None,
+) -> Iterator[tuple[str, Any]]:
+    """Yield the identifier and status of every check in a history report.
+
+    A report saved before the current scheme of check identifiers has
+    its identifiers translated to the current ones, skipping those that
+    no longer identify any check.
+
+    Args:
+        history_payload: A history payload returned by load_history_reports.
+        legacy_check_ids: A function that returns the current identifier
+            of each check by the identifier of the earlier scheme, which
+            is only called for a report that was saved with it.
+
+    Yields:
+        The identifier and the status of each check.
+
+    """
+    report = history_payload.get(HISTORY_REPORT_KEY, {})
+    checks = report.get(CHECKS_KEY, [])
+    if not isinstance(checks, list):
+        return
+    translation = None
+    version = history_payload.get(
+        HISTORY_CHECK_ID_VERSION_KEY, LEGACY_CHECK_ID_VERSION
+    )
+    if version != CHECK_ID_VERSION and legacy_check_ids is not None:
+        translation = legacy_check_ids()
+    for check in checks:
+        if not isinstance(check, dict):
+            continue
+        check_id = check.get(CHECK_ID_KEY)
+        if not isinstance(check_id, str) or not check_id:
+            continue
+        if translation is not None:
+            check_id = translation.get(check_id)
+            if check_id is None:
+                continue
+        yield check_id, check.get(STATUS_KEY)
+
+
 def get_failed_check_ids(
     history_directory: Path,
     scope: str,
     report_count: int,
+    legacy_check_ids: Callable[[], Dict[str, str]] | None = None,
 ) -> tuple[set[str], int, int]:
-    """Return failed IDs, number inspected, and total in-scope reports."""
+    """Return failed IDs, number inspected, and total in-scope reports.
+
+    The legacy_check_ids function translates the identifiers of reports
+    saved with an earlier scheme of check identifiers, as in _report_checks.
+    """
     reports = load_history_reports(
         history_directory,
         scope,
@@ -280,19 +332,10 @@ def get_failed_check_ids(
     )
     failed_check_ids: set[str] = set()
     for history_payload in reports:
-        report = history_payload[HISTORY_REPORT_KEY]
-        checks = report.get(CHECKS_KEY)
-        if not isinstance(checks, list):
-            continue
-        for check in checks:
-            if not isinstance(check, dict):
-                continue
-            check_id = check.get(CHECK_ID_KEY)
-            if (
-                isinstance(check_id, str)
-                and check_id
-                and check.get(STATUS_KEY) is False
-            ):
+        for check_id, status in _report_checks(
+            history_payload, legacy_check_ids
+        ):
+            if status is False:
                 failed_check_ids.add(check_id)
     return (
         failed_check_ids,
@@ -317,8 +360,13 @@ def get_all_check_ids(
     history_directory: Path,
     scope: str,
     report_count: int,
+    legacy_check_ids: Callable[[], Dict[str, str]] | None = None,
 ) -> set[str]:
-    """Return all distinct check IDs from the last N reports."""
+    """Return all distinct check IDs from the last N reports.
+
+    The legacy_check_ids function translates the identifiers of reports
+    saved with an earlier scheme of check identifiers, as in _report_checks.
+    """
     reports = load_history_reports(
         history_directory,
         scope,
@@ -326,14 +374,6 @@ def get_all_check_ids(
     )
     all_ids: set[str] = set()
     for history_payload in reports:
-        report = history_payload.get(HISTORY_REPORT_KEY, {})
-        checks = report.get(CHECKS_KEY, [])
-        if not isinstance(checks, list):
-            continue
-        for check in checks:
-            if not isinstance(check, dict):
-                continue
-            check_id = check.get(CHECK_ID_KEY)
-            if isinstance(check_id, str) and check_id:
-                all_ids.add(check_id)
+        for check_id, _ in _report_checks(history_payload, legacy_check_ids):
+            all_ids.add(check_id)
     return all_ids
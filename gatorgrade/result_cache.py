@@ -0,0 +1,256 @@
+"""Persist check results so that unchanged checks are not run again.
+
+A result is stored under a key that combines the check_id of a check
+with a fingerprint of the content of the files that the check reads,
+the versions of gatorgrade and of GatorGrader, and the version of the
+layout of the cache. As long as neither the check nor any of its input
+files change, the stored result is reused instead of running the check
+again; upgrading either tool, which can change how a check is graded,
+runs every check again.
+"""
+
+import functools
+import glob
+import hashlib
+import importlib.metadata
+import json
+import os
+import uuid
+from pathlib import Path
+from typing import Any, Sequence
+
+import platformdirs
+
+from gatorgrade.report_history import HISTORY_APPLICATION_NAME
+from gatorgrade.version import GATORGRADE_VERSION
+
+CACHE_DIRECTORY_NAME = "results"
+CACHE_FILE_SUFFIX = ".json"
+CACHE_SCHEMA_VERSION = 2
+CACHE_SCHEMA_KEY = "cache_schema_version"
+CACHE_RESULT_KEY = "result"
+CACHE_FILE_ENCODING = "utf-8"
+CACHE_FILE_MODE_WRITE = "w"
+CACHE_TEMPORARY_SUFFIX = ".tmp"
+DEFAULT_CACHE_SIZE_MIB = 50
+BYTES_PER_MIB = 1024 * 1024
+# the number of bytes read from an input file at one time when hashing
+HASH_CHUNK_SIZE = 1024 * 1024
+FINGERPRINT_SEPARATOR = b"\0"
+KEY_SEPARATOR = "\n"
+# the distribution that grades the GatorGrader checks, whose version is
+# part of every key
+GATORGRADER_DISTRIBUTION = "gatorgrader"
+UNKNOWN_VERSION = "unknown"
+PRIVATE_DIRECTORY_MODE = 0o700
+
+
+def get_result_cache_directory() -> Path:
+    """Return the platform-specific directory for cached check results."""
+    data_directory = platformdirs.user_data_dir(
+        HISTORY_APPLICATION_NAME,
+        appauthor=False,
+    )
+    return Path(data_directory) / CACHE_DIRECTORY_NAME
+
+
+def _hash_file(path: str) -> str:
+    """Return the SHA-256 hex digest of the content of one file."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as file:
+        for chunk in iter(lambda: file.read(HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def compute_input_fingerprint(patterns: Sequence[str]) -> str:
+    """Compute a fingerprint of the files that match the glob patterns.
+
+    The fingerprint covers the patterns themselves, the path of every
+    matching file, and the content of every matching file, so that
+    adding, removing, renaming, or editing an input changes it. A
+    pattern may use "**" to match files in any subdirectory.
+
+    Args:
+        patterns: The glob patterns that name the input files.
+
+    Returns:
+        A hex digest that identifies the current state of the inputs.
+
+    """
+    digest = hashlib.sha256()
+    matched_paths: set[str] = set()
+    for pattern in patterns:
+        digest.update(pattern.encode(CACHE_FILE_ENCODING))
+        digest.update(FINGERPRINT_SEPARATOR)
+        matched_paths.update(
+            path
+            for path in glob.glob(pattern, recursive=True)
+            if os.path.isfile(path)
+        )
+    for path in sorted(matched_paths):
+        digest.update(path.encode(CACHE_FILE_ENCODING))
+        digest.update(FINGERPRINT_SEPARATOR)
+        digest.update(_hash_file(path).encode(CACHE_FILE_ENCODING))
+        digest.update(FINGERPRINT_SEPARATOR)
+    return digest.hexdigest()
+
+
+@functools.cache
+def _key_versions() -> str:
+    """Return the versions that every key of the cache covers."""
+    try:
+        gatorgrader_version = importlib.metadata.version(
+            GATORGRADER_DISTRIBUTION
+        )
+    except importlib.metadata.PackageNotFoundError:
+        gatorgrader_version = UNKNOWN_VERSION
+    return KEY_SEPARATOR.join(
+        (str(CACHE_SCHEMA_VERSION), GATORGRADE_VERSION, gatorgrader_version)
+    )
+
+
+def compute_cache_key(check_id: str, fingerprint: str) -> str:
+    """Combine a check identifier and an input fingerprint into a key.
+
+    Args:
+        check_id: The identifier of the check.
+        fingerprint: The fingerprint of the input files of the check.
+
+    Returns:
+        A hex digest of both, of the versions of gatorgrade and of
+        GatorGrader, and of the version of the layout of the cache,
+        since a result stored by another version may be graded
+        differently now.
+
+    """
+    key_source = KEY_SEPARATOR.join((_key_versions(), check_id, fingerprint))
+    return hashlib.sha256(key_source.encode(CACHE_FILE_ENCODING)).hexdigest()
+
+
+def _cache_path(cache_directory: Path, key: str) -> Path:
+    """Return the path of the file that stores the result for a key."""
+    return cache_directory / f"{key}{CACHE_FILE_SUFFIX}"
+
+
+def load_cached_result(
+    key: str, cache_directory: Path | None = None
+) -> dict[str, Any] | None:
+    """Load the stored result for a key, or return None when there is none.
+
+    Args:
+        key: The key computed by compute_cache_key.
+        cache_directory: The cache directory, defaulting to the
+            platform-specific user data directory.
+
+    Returns:
+        The stored result, or None if it is missing or unreadable.
+
+    """
+    directory = (
+        cache_directory
+        if cache_directory is not None
+        else get_result_cache_directory()
+    )
+    path = _cache_path(directory, key)
+    try:
+        payload = json.loads(path.read_text(encoding=CACHE_FILE_ENCODING))
+    except (OSError, UnicodeDecodeError, json.JSONDecodeError):
+        return None
+    if not isinstance(payload, dict):
+        return None
+    if payload.get(CACHE_SCHEMA_KEY) != CACHE_SCHEMA_VERSION:
+        return None
+    result = payload.get(CACHE_RESULT_KEY)
+    if not isinstance(result, dict):
+        return None
+    # mark the entry as recently used so that pruning keeps it longest
+    try:
+        os.utime(path)
+    except OSError:
+        pass
+    return result
+
+
+def save_cached_result(
+    key: str,
+    result: dict[str, Any],
+    cache_directory: Path | None = None,
+) -> Path:
+    """Store the result for a key, replacing any earlier result.
+
+    Args:
+        key: The key computed by compute_cache_key.
+        result: The JSON-serialisable result to store.
+        cache_directory: The cache directory, defaulting to the
+            platform-specific user data directory.
+
+    Returns:
+        The path of the file that stores the result.
+
+    """
+    directory = (
+        cache_directory
+        if cache_directory is not None
+        else get_result_cache_directory()
+    )
+    directory.mkdir(parents=True, exist_ok=True, mode=PRIVATE_DIRECTORY_MODE)
+    destination = _cache_path(directory, key)
+    payload = {
+        CACHE_SCHEMA_KEY: CACHE_SCHEMA_VERSION,
+        CACHE_RESULT_KEY: result,
+    }
+    # write through a temporary file so that checks that finish at the
+    # same time, or a concurrent run, never observe a partial entry
+    temporary_path = destination.with_name(
+        f".{destination.name}.{uuid.uuid4().hex}{CACHE_TEMPORARY_SUFFIX}"
+    )
+    try:
+        with temporary_path.open(
+            CACHE_FILE_MODE_WRITE, encoding=CACHE_FILE_ENCODING
+        ) as file:
+            json.dump(payload, file)
+        os.replace(temporary_path, destination)
+    finally:
+        temporary_path.unlink(missing_ok=True)
+    return destination
+
+
+def prune_result_cache(
+    max_size_mib: int = DEFAULT_CACHE_SIZE_MIB,
+    cache_directory: Path | None = None,
+) -> list[Path]:
+    """Delete the least recently used results until the size limit is met.
+
+    Args:
+        max_size_mib: The maximum total size of the cache in MiB.
+        cache_directory: The cache directory, defaulting to the
+            platform-specific user data directory.
+
+    Returns:
+        The paths of the files that were deleted.
+
+    """
+    directory = (
+        cache_directory
+        if cache_directory is not None
+        else get_result_cache_directory()
+    )
+    if not directory.exists():
+        return []
+    entries = []
+    for path in directory.iterdir():
+        if path.is_file() and path.name.endswith(CACHE_FILE_SUFFIX):
+            stat = path.stat()
+            entries.append((stat.st_mtime, path, stat.st_size))
+    entries.sort()
+    total_size = sum(size for _, _, size in entries)
+    maximum_size = max_size_mib * BYTES_PER_MIB
+    deleted_files: list[Path] = []
+    for _, path, size in entries:
+        if total_size <= maximum_size:
+            break
+        path.unlink(missing_ok=True)
+        deleted_files.append(path)
+        total_size -= size
+    return deleted_files
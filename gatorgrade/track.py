@@ -6,7 +6,9 @@ and at least one hint was generated, an entry is appended to this file.
 
 The file is a top-level JSON array. If the file does not exist, it is
 created. If it exists, new data is appended safely without corruption
-(atomic read-write via a temporary file + rename).
+(atomic read-write via a temporary file + rename). Each entry records
+the version of the scheme that computed its check_ids, since check_ids
+of different versions never match.
 """
 
 import datetime
@@ -16,6 +18,8 @@ import tempfile
 from pathlib import Path
 from typing import Any
 
+from gatorgrade.hash import CHECK_ID_VERSION
+
 # filename for the tracking file
 AUTO_HINTS_FILENAME = "autohints.json"
 
@@ -26,6 +30,7 @@ TRACK_DUE_DATE_KEY = "due_date"
 TRACK_VERSION_INFO_KEY = "version_info"
 TRACK_CLI_ARGS_KEY = "cli_args"
 TRACK_HINTS_KEY = "hints"
+TRACK_CHECK_ID_VERSION_KEY = "check_id_version"
 
 # per-hint keys
 HINT_DESCRIPTION_KEY = "description"
@@ -68,7 +73,7 @@ def build_track_entry(
 
     Returns:
         A dict with timestamp, project info, version info, CLI
-        args, and a hints list. Returns an empty dict if no
+        args, the version of the check_ids, and a hints list. Returns an empty dict if no
         auto-hints were generated.
 
     """
@@ -106,6 +111,7 @@ def build_track_entry(
         entry[TRACK_VERSION_INFO_KEY] = version_info
     if cli_args:
         entry[TRACK_CLI_ARGS_KEY] = cli_args
+    entry[TRACK_CHECK_ID_VERSION_KEY] = CHECK_ID_VERSION
     entry[TRACK_HINTS_KEY] = hints_list
     return entry
 
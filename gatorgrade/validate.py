@@ -19,6 +19,7 @@ Usage:
 """
 
 import math
+import os
 import re
 from pathlib import Path
 from typing import Optional, Tuple
@@ -113,6 +114,9 @@ REPORT_HISTORY_COUNT_ERR_FMT = (
 REPORT_HISTORY_SIZE_ERR_FMT = (
     "Report history maximum size must be a positive integer, got {}"
 )
+CACHE_SIZE_ERR_FMT = (
+    "Result cache maximum size must be a positive integer, got {}"
+)
 FILTER_FAILED_LAST_ERR_FMT = (
     "Failed-check history count must be a positive integer, got {}"
 )
@@ -132,6 +136,107 @@ def validate_report_history_size(value: int) -> int:
     return value
 
 
+def validate_cache_size(value: int) -> int:
+    """Validate the maximum result-cache size in MiB."""
+    if isinstance(value, bool) or not isinstance(value, int) or value <= 0:
+        raise BadParameter(CACHE_SIZE_ERR_FMT.format(value))
+    return value
+
+
+# error messages for timeout validation
+CHECK_TIMEOUT_ERR_FMT = "Check timeout must be a positive integer, got {}"
+TOTAL_TIMEOUT_ERR_FMT = "Total timeout must be a positive integer, got {}"
+
+
+def validate_check_timeout(value: int) -> int:
+    """Validate the default number of seconds that one check may run."""
+    if isinstance(value, bool) or not isinstance(value, int) or value <= 0:
+        raise BadParameter(CHECK_TIMEOUT_ERR_FMT.format(value))
+    return value
+
+
+def validate_total_timeout(value: int | None) -> int | None:
+    """Validate the number of seconds that all of the checks may run."""
+    if value is not None and (
+        isinstance(value, bool) or not isinstance(value, int) or value <= 0
+    ):
+        raise BadParameter(TOTAL_TIMEOUT_ERR_FMT.format(value))
+    return value
+
+
+# error message for fail-fast validation
+MAX_FAILURES_ERR_FMT = "Maximum failures must be a positive integer, got {}"
+
+
+def validate_max_failures(value: int | None) -> int | None:
+    """Validate the number of failing checks that stops the run."""
+    if value is not None and (
+        isinstance(value, bool) or not isinstance(value, int) or value <= 0
+    ):
+        raise BadParameter(MAX_FAILURES_ERR_FMT.format(value))
+    return value
+
+
+# error message for slowest checks validation
+SLOWEST_ERR_FMT = "Slowest must be a positive integer, got {}"
+
+
+def validate_slowest(value: int | None) -> int | None:
+    """Validate the number of slowest checks to list in the summary."""
+    if value is not None and (
+        isinstance(value, bool) or not isinstance(value, int) or value <= 0
+    ):
+        raise BadParameter(SLOWEST_ERR_FMT.format(value))
+    return value
+
+
+# value of --jobs that selects one job per available processor core
+JOBS_AUTO = "auto"
+
+# error message for jobs validation
+JOBS_ERR_FMT = "Jobs must be a positive integer or '{}', got '{}'"
+
+
+def parse_jobs(value: str) -> int | None:
+    """Convert a --jobs value into a number of jobs.
+
+    Args:
+        value: Either a positive integer or "auto" (case-insensitive),
+            which selects the number of processor cores.
+
+    Returns:
+        The number of jobs, or None if the value is not valid.
+
+    """
+    if value.strip().lower() == JOBS_AUTO:
+        return os.cpu_count() or 1
+    try:
+        jobs = int(value)
+    except ValueError:
+        return None
+    if jobs <= 0:
+        return None
+    return jobs
+
+
+def validate_jobs(value: str) -> str:
+    """Validate that --jobs is a positive integer or "auto".
+
+    Args:
+        value: The jobs value to validate.
+
+    Returns:
+        The validated value unchanged.
+
+    Raises:
+        BadParameter: If value is neither "auto" nor a positive integer.
+
+    """
+    if parse_jobs(value) is None:
+        raise BadParameter(JOBS_ERR_FMT.format(JOBS_AUTO, value))
+    return value
+
+
 def validate_filter_failed_last(value: int | None) -> int | None:
     """Validate the number of recent reports used for failure filtering."""
     if value is not None and (
@@ -0,0 +1,657 @@
+"""Measure the speed of the parts of GatorGrade that run for every check.
+
+Each command times one part of GatorGrade against the alternative that
+it replaced, or that it can be switched to, and prints both timings.
+
+Run with:
+uv run -m scripts.bench shell-session
+uv run -m scripts.bench direct-exec
+uv run -m scripts.bench parse
+uv run -m scripts.bench flatten
+uv run -m scripts.bench check-id
+uv run -m scripts.bench fuzzy
+uv run -m scripts.bench gg-pool
+uv run task bench-shell-session
+uv run task bench-direct-exec
+uv run task bench-parse
+uv run task bench-flatten
+uv run task bench-check-id
+uv run task bench-fuzzy
+uv run task bench-gg-pool
+"""
+
+import asyncio
+import pickle
+import random
+import tempfile
+import time
+import tracemalloc
+from contextlib import nullcontext
+from pathlib import Path
+from typing import Any, Awaitable, Callable, List, Optional
+from unittest import mock
+
+import typer
+import yaml
+from rich.console import Console
+from rich.table import Table
+
+from gatorgrade import hash as check_id_hash
+from gatorgrade.hash import CHECK_ID_VERSION, LEGACY_CHECK_ID_VERSION
+from gatorgrade.input import filter as filter_module
+from gatorgrade.input.checks import GatorGraderCheck, ShellCheck
+from gatorgrade.input.command_argv import split_plain_command
+from gatorgrade.input.command_line_generator import _check_id
+from gatorgrade.input.in_file_path import (
+    YAML_LOADER,
+    CheckData,
+    iter_check_data,
+)
+from gatorgrade.input.parse_config import ConfigDocument, ParsedConfig
+from gatorgrade.output import output
+from gatorgrade.output.executor import run_shell_command
+from gatorgrade.output.gg_pool import GatorGraderPool
+from gatorgrade.output.shell_session import (
+    HAS_SHELL_SESSIONS,
+    ShellSessionPool,
+)
+
+# a check that only tests for a file, which is the kind of tiny check
+# whose time is mostly spent on starting the shell
+TINY_COMMAND = "test -f pyproject.toml"
+DEFAULT_RUNS = 300
+
+# a check that runs a program which is not a built-in of the shell, so
+# that it can be started without a shell
+PLAIN_COMMAND = "ls pyproject.toml"
+
+# the sizes of the generated configuration files that are parsed, in
+# checks, and the number of times that each one is parsed
+DEFAULT_PARSE_SIZES = [10, 1_000, 50_000]
+DEFAULT_PARSE_RUNS = 1
+
+# the front matter and the checks of a generated configuration file, of
+# which every other check is a shell check and the rest are GatorGrader
+# checks for one of a few files
+PARSE_FRONT_MATTER = """name: Generated
+due_date: 2026-12-15T23:59:00
+setup: |
+  echo set up
+---
+"""
+PARSE_FILE_CHECKS = """- src/module_{index}.py:
+    - description: Module {index} has no TODOs
+      check: MatchFileFragment
+      options:
+        fragment: TODO
+        count: 0
+        exact: true
+"""
+PARSE_SHELL_CHECK = """- description: Check {index} passes
+  command: test -f pyproject.toml
+  weight: 2
+"""
+
+# the number of checks in the generated tree of directories, how deep
+# the checks are nested, how many directories each level has, and how
+# many directories and files in them the checks are spread over
+DEFAULT_FLATTEN_CHECKS = 100_000
+DEFAULT_FLATTEN_DEPTH = 32
+FLATTEN_FANOUT = 4
+FLATTEN_DIRECTORIES = 256
+FLATTEN_FILES = 50
+# the number of checks in the configuration files whose check identifiers
+# are computed
+DEFAULT_CHECK_ID_SIZES = [1_000, 10_000, 100_000]
+CHECK_ID_FILE_NAME = "gatorgrade.yml"
+# the number of checks in a question bank that is filtered with FUZZY, the
+# words that their descriptions, commands, and hints are made of, and the
+# queries, with typos, that the bank is filtered with
+DEFAULT_FUZZY_CHECKS = 5_000
+FUZZY_SEED = 25
+FUZZY_DESCRIPTION_WORDS = 8
+FUZZY_HINT_WORDS = 12
+FUZZY_VOCABULARY = (
+    "confirm complete documentation fragment function question answer "
+    "program output repository commits formatting linting coverage "
+    "assertion parameter variable exception generator iterator module "
+    "dictionary comprehension recursion algorithm efficiency"
+).split()
+FUZZY_QUERIES = ["confrm fragmnt", "documentaton", "recursoin algoritm"]
+# the number of GatorGrader checks of a run, the jobs that run them, the
+# seconds that its setup commands take, and the number of runs
+DEFAULT_GG_CHECKS = 8
+DEFAULT_GG_JOBS = 4
+DEFAULT_SETUP_SECONDS = 0.5
+DEFAULT_GG_RUNS = 3
+
+console = Console()
+
+app = typer.Typer(
+    name="bench",
+    help="Measure the speed of the parts of GatorGrade run for every check.",
+)
+
+
+@app.callback()
+def main() -> None:
+    """Measure the speed of the parts of GatorGrade run for every check."""
+
+
+def _print_timings(title: str, runs: int, timings: dict[str, float]) -> None:
+    """Print the total and per-run time of each alternative, fastest first."""
+    table = Table(title=f"{title} ({runs} run(s))")
+    table.add_column("Alternative")
+    table.add_column("Total (s)", justify="right")
+    table.add_column("Per run (ms)", justify="right")
+    table.add_column("Speedup", justify="right")
+    slowest = max(timings.values())
+    for name, seconds in sorted(timings.items(), key=lambda item: item[1]):
+        table.add_row(
+            name,
+            f"{seconds:.3f}",
+            f"{seconds / runs * 1000:.3f}",
+            f"{slowest / seconds:.1f}x",
+        )
+    console.print(table)
+
+
+async def _time_commands(
+    run: Callable[[str], Awaitable[object]], command: str, runs: int
+) -> float:
+    """Return the number of seconds that running a command many times took."""
+    start = time.perf_counter()
+    for _ in range(runs):
+        await run(command)
+    return time.perf_counter() - start
+
+
+async def _time_shell_session(command: str, runs: int) -> dict[str, float]:
+    """Time a command in a new shell each run and in one shell session."""
+    sessions = ShellSessionPool()
+    try:
+        # start the session shell before the timing starts
+        await sessions.run_command(command)
+        session_seconds = await _time_commands(
+            sessions.run_command, command, runs
+        )
+    finally:
+        await sessions.close()
+    spawn_seconds = await _time_commands(run_shell_command, command, runs)
+    return {
+        "new shell per check": spawn_seconds,
+        "shell session": session_seconds,
+    }
+
+
+@app.command("shell-session")
+def shell_session(
+    command: str = typer.Option(
+        TINY_COMMAND, help="The command of the check to run."
+    ),
+    runs: int = typer.Option(
+        DEFAULT_RUNS, min=1, help="The number of times to run the command."
+    ),
+) -> None:
+    """Compare a new shell for every check with a shell session."""
+    if not HAS_SHELL_SESSIONS:
+        console.print("[red]Shell sessions are not available here.[/red]")
+        raise typer.Exit(code=1)
+    timings = asyncio.run(_time_shell_session(command, runs))
+    _print_timings(f"Shell checks: {command}", runs, timings)
+
+
+async def _time_direct_exec(
+    command: str, argv: list[str], runs: int
+) -> dict[str, float]:
+    """Time a command through the shell and with its program started directly."""
+
+    async def run_direct(command: str) -> object:
+        return await run_shell_command(command, argv=argv)
+
+    return {
+        "through /bin/sh": await _time_commands(
+            run_shell_command, command, runs
+        ),
+        "started directly": await _time_commands(run_direct, command, runs),
+    }
+
+
+@app.command("direct-exec")
+def direct_exec(
+    command: str = typer.Option(
+        PLAIN_COMMAND, help="The command of the check to run."
+    ),
+    runs: int = typer.Option(
+        DEFAULT_RUNS, min=1, help="The number of times to run the command."
+    ),
+) -> None:
+    """Compare running a plain command through a shell and directly."""
+    argv = split_plain_command(command)
+    if argv is None:
+        console.print(f"[red]This command needs a shell: {command}[/red]")
+        raise typer.Exit(code=1)
+    timings = asyncio.run(_time_direct_exec(command, argv, runs))
+    _print_timings(f"Shell checks: {command}", runs, timings)
+
+
+def _generated_config(checks: int) -> str:
+    """Return the text of a configuration file with some number of checks."""
+    parts = [PARSE_FRONT_MATTER]
+    for index in range(checks):
+        template = PARSE_SHELL_CHECK if index % 2 else PARSE_FILE_CHECKS
+        parts.append(template.format(index=index))
+    return "".join(parts)
+
+
+def _time_loader(text: str, loader: type, runs: int) -> float:
+    """Return the number of seconds that parsing a text many times took."""
+    start = time.perf_counter()
+    for _ in range(runs):
+        list(yaml.load_all(text, Loader=loader))
+    return time.perf_counter() - start
+
+
+@app.command("parse")
+def parse(
+    sizes: list[int] = typer.Option(
+        DEFAULT_PARSE_SIZES,
+        "--checks",
+        min=1,
+        help="The number of checks in a generated configuration file.",
+    ),
+    runs: int = typer.Option(
+        DEFAULT_PARSE_RUNS,
+        min=1,
+        help="The number of times to parse each configuration file.",
+    ),
+) -> None:
+    """Compare the YAML loaders on configuration files of several sizes."""
+    loaders = {
+        "FullLoader (pure Python)": yaml.FullLoader,
+        "SafeLoader (pure Python)": yaml.SafeLoader,
+    }
+    if YAML_LOADER is not yaml.SafeLoader:
+        loaders["CSafeLoader (libyaml)"] = YAML_LOADER
+    else:
+        console.print("[yellow]PyYAML was built without libyaml.[/yellow]")
+    for size in sizes:
+        text = _generated_config(size)
+        timings = {
+            name: _time_loader(text, loader, runs)
+            for name, loader in loaders.items()
+        }
+        _print_timings(f"Parse a config with {size} check(s)", runs, timings)
+
+
+def _recursive_add_checks_to_list(
+    path: Optional[str],
+    data_list: List[Any],
+    reformatted_data: List[CheckData],
+) -> None:
+    """Flatten the checks recursively, as gatorgrade did before."""
+    current_path = path
+    for ddict in data_list:
+        for item in ddict:
+            if isinstance(ddict[item], list):
+                path = item if not path else f"{path}/{item}"
+                _recursive_add_checks_to_list(
+                    path, ddict[item], reformatted_data
+                )
+                path = current_path
+            else:
+                reformatted_data.append(
+                    CheckData(file_context=path, check=ddict)
+                )
+                break
+
+
+def _recursive_flatten(data: List[Any]) -> List[CheckData]:
+    """Return the checks flattened by the recursive walk."""
+    check_data: List[CheckData] = []
+    _recursive_add_checks_to_list(None, data, check_data)
+    return check_data
+
+
+def _iterative_flatten(data: List[Any]) -> List[CheckData]:
+    """Return the checks flattened by the explicit stack of gatorgrade."""
+    return list(iter_check_data(None, data))
+
+
+def _generated_tree(checks: int, depth: int) -> List[Any]:
+    """Return the checks of a configuration file, each in a deep directory.
+
+    As in a generated configuration file, every check is its own entry
+    with the full tree of directories above its file, so that the same
+    directories and files are named again for many of the checks.
+    """
+    data = []
+    for index in range(checks):
+        entry: Any = {
+            "description": f"Check {index} passes",
+            "check": "MatchFileFragment",
+            "options": {"fragment": "TODO", "count": 0},
+        }
+        leaf = index % FLATTEN_DIRECTORIES
+        entry = {
+            f"module_{index // FLATTEN_DIRECTORIES % FLATTEN_FILES}.py": [
+                entry
+            ]
+        }
+        for level in range(depth):
+            directory = leaf // FLATTEN_FANOUT**level % FLATTEN_FANOUT
+            entry = {f"level{level}_{directory}": [entry]}
+        data.append(entry)
+    return data
+
+
+def _measure_flatten(
+    flatten: Callable[[List[Any]], List[CheckData]],
+    data: List[Any],
+    runs: int,
+) -> tuple[float, int, int]:
+    """Return the seconds that flattening took and the memory it kept.
+
+    The memory is both the memory that the flattened checks keep and the
+    size of their pickled form, which is stored in the compiled cache.
+    """
+    start = time.perf_counter()
+    for _ in range(runs):
+        flatten(data)
+    seconds = time.perf_counter() - start
+    tracemalloc.start()
+    check_data = flatten(data)
+    kept, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    pickled = len(pickle.dumps(check_data, protocol=pickle.HIGHEST_PROTOCOL))
+    return seconds, kept, pickled
+
+
+@app.command("flatten")
+def flatten(
+    checks: int = typer.Option(
+        DEFAULT_FLATTEN_CHECKS,
+        min=1,
+        help="The number of checks in the generated tree of directories.",
+    ),
+    depth: int = typer.Option(
+        DEFAULT_FLATTEN_DEPTH,
+        min=0,
+        help="The number of directories that each check is nested under.",
+    ),
+    runs: int = typer.Option(
+        DEFAULT_PARSE_RUNS,
+        min=1,
+        help="The number of times to flatten the checks.",
+    ),
+) -> None:
+    """Compare flattening deeply nested checks recursively and with a stack."""
+    data = _generated_tree(checks, depth)
+    alternatives = {
+        "Recursive, a path string per check": _recursive_flatten,
+        "Explicit stack, interned paths": _iterative_flatten,
+    }
+    timings = {}
+    memory = Table(title="Memory of the flattened checks")
+    memory.add_column("Alternative")
+    memory.add_column("Kept (MiB)", justify="right")
+    memory.add_column("Pickled (MiB)", justify="right")
+    for name, alternative in alternatives.items():
+        timings[name], kept, pickled = _measure_flatten(
+            alternative, data, runs
+        )
+        memory.add_row(name, f"{kept / 2**20:.1f}", f"{pickled / 2**20:.1f}")
+    _print_timings(
+        f"Flatten {checks} check(s) nested {depth} directories deep",
+        runs,
+        timings,
+    )
+    console.print(memory)
+
+
+def _time_check_ids(
+    config: ParsedConfig, version: int, runs: int, memoized: bool = False
+) -> float:
+    """Return the number of seconds that computing every check_id took.
+
+    Unless the check_ids are memoized, the memo of check_ids is emptied
+    before every run, so that each run computes every check_id.
+    """
+    pairs = list(zip(config.check_data, config.checks))
+    elapsed = 0.0
+    for _ in range(runs):
+        if not memoized:
+            check_id_hash._CHECK_ID_MEMO.clear()
+        start = time.perf_counter()
+        for check_data, check in pairs:
+            _check_id(check_data, check.weight, check.outputlimit, version)
+        elapsed += time.perf_counter() - start
+    return elapsed
+
+
+@app.command("check-id")
+def check_id(
+    sizes: list[int] = typer.Option(
+        DEFAULT_CHECK_ID_SIZES,
+        "--checks",
+        min=1,
+        help="The number of checks in a generated configuration file.",
+    ),
+    runs: int = typer.Option(
+        DEFAULT_PARSE_RUNS,
+        min=1,
+        help="The number of times to compute the check_ids of every check.",
+    ),
+) -> None:
+    """Compare the schemes of check identifiers and their memo."""
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / CHECK_ID_FILE_NAME
+        for size in sizes:
+            path.write_text(_generated_config(size))
+            config, error = ConfigDocument.load(
+                path, compiled=False
+            ).load_config()
+            if error is not None:
+                raise typer.Exit(error)
+            timings = {
+                "Version 1, indented with nested copies": _time_check_ids(
+                    config, LEGACY_CHECK_ID_VERSION, runs
+                ),
+                "Version 2, compact encoder": _time_check_ids(
+                    config, CHECK_ID_VERSION, runs
+                ),
+                "Version 2, memoized from an earlier run": _time_check_ids(
+                    config, CHECK_ID_VERSION, runs, memoized=True
+                ),
+            }
+            _print_timings(
+                f"Compute the check_ids of {size} check(s)", runs, timings
+            )
+
+
+def _dynamic_programming_within(
+    word_a: str, word_b: str, fuzzy_threshold: float
+) -> bool:
+    """Compare the ratio of a row-by-row edit distance with a threshold."""
+    s1 = word_a.lower()
+    s2 = word_b.lower()
+    max_len = max(len(word_a), len(word_b))
+    if max_len == 0:
+        return 0.0 <= fuzzy_threshold
+    if len(s1) < len(s2):
+        s1, s2 = s2, s1
+    prev_row = list(range(len(s2) + 1))
+    for i, char1 in enumerate(s1, 1):
+        curr_row = [i]
+        for j, char2 in enumerate(s2, 1):
+            cost = 0 if char1 == char2 else 1
+            curr_row.append(
+                min(
+                    curr_row[j - 1] + 1,
+                    prev_row[j] + 1,
+                    prev_row[j - 1] + cost,
+                )
+            )
+        prev_row = curr_row
+    return prev_row[-1] / max_len <= fuzzy_threshold
+
+
+def _question_bank(checks: int) -> List[ShellCheck]:
+    """Return shell checks whose fields are made of random words."""
+    generator = random.Random(FUZZY_SEED)
+
+    def words(count: int) -> str:
+        return " ".join(generator.choices(FUZZY_VOCABULARY, k=count))
+
+    return [
+        ShellCheck(
+            command=f"grep -q {generator.choice(FUZZY_VOCABULARY)} q{index}.md",
+            description=words(FUZZY_DESCRIPTION_WORDS),
+            hint=words(FUZZY_HINT_WORDS),
+        )
+        for index in range(checks)
+    ]
+
+
+def _time_fuzzy_filter(
+    bank: List[ShellCheck], runs: int
+) -> tuple[float, list[list[ShellCheck]]]:
+    """Return the seconds that filtering took and the checks it selected."""
+    selected = []
+    start = time.perf_counter()
+    for _ in range(runs):
+        selected = [
+            filter_module.filter_checks(
+                bank, mode=filter_module.FilterMode.FUZZY, query=query
+            )
+            for query in FUZZY_QUERIES
+        ]
+    return time.perf_counter() - start, selected
+
+
+@app.command("fuzzy")
+def fuzzy(
+    checks: int = typer.Option(
+        DEFAULT_FUZZY_CHECKS,
+        min=1,
+        help="The number of checks in the generated question bank.",
+    ),
+    runs: int = typer.Option(
+        DEFAULT_PARSE_RUNS,
+        min=1,
+        help="The number of times to filter the question bank.",
+    ),
+) -> None:
+    """Compare the edit distances that FUZZY filtering can be computed with."""
+    bank = _question_bank(checks)
+    with mock.patch.object(
+        filter_module, "_within_levenshtein_ratio", _dynamic_programming_within
+    ):
+        baseline_seconds, baseline = _time_fuzzy_filter(bank, runs)
+    seconds, selected = _time_fuzzy_filter(bank, runs)
+    if selected != baseline:
+        console.print(
+            "[red]The two edit distances selected other checks.[/red]"
+        )
+        raise typer.Exit(code=1)
+    _print_timings(
+        f"Filter {checks} check(s) with {len(FUZZY_QUERIES)} FUZZY queries",
+        runs,
+        {
+            "Row-by-row dynamic program": baseline_seconds,
+            "Bit-parallel, bounded by the threshold": seconds,
+        },
+    )
+
+
+def _gg_checks(directory: Path, checks: int) -> List[GatorGraderCheck]:
+    """Return GatorGrader checks of a file in a directory, creating it."""
+    (directory / "notes.txt").write_text("TODO: one\nTODO: two\n")
+    gg_args = [
+        "MatchFileFragment",
+        "--fragment",
+        "TODO",
+        "--count",
+        "2",
+        "--exact",
+        "--directory",
+        str(directory),
+        "--file",
+        "notes.txt",
+    ]
+    return [
+        GatorGraderCheck(gg_args=gg_args, json_info={"index": index})
+        for index in range(checks)
+    ]
+
+
+def _time_gg_runs(
+    checks: List[GatorGraderCheck],
+    jobs: int,
+    setup_seconds: float,
+    runs: int,
+    before_setup: bool = False,
+) -> float:
+    """Return the seconds that the setup and the checks of many runs took."""
+    start = time.perf_counter()
+    for _ in range(runs):
+        pool = output.start_gg_pool(checks, jobs) if before_setup else None
+        with pool or nullcontext() as gg_pool:
+            # the setup commands run while the workers start
+            time.sleep(setup_seconds)
+            list(
+                output._iter_check_results(checks, jobs=jobs, gg_pool=gg_pool)
+            )
+    return time.perf_counter() - start
+
+
+@app.command("gg-pool")
+def gg_pool(
+    checks: int = typer.Option(
+        DEFAULT_GG_CHECKS, min=1, help="The number of GatorGrader checks."
+    ),
+    jobs: int = typer.Option(
+        DEFAULT_GG_JOBS, min=2, help="The number of checks run at once."
+    ),
+    setup_seconds: float = typer.Option(
+        DEFAULT_SETUP_SECONDS,
+        min=0,
+        help="The number of seconds that the setup commands take.",
+    ),
+    runs: int = typer.Option(
+        DEFAULT_GG_RUNS, min=1, help="The number of runs of the checks."
+    ),
+) -> None:
+    """Compare running GatorGrader checks in this process and in a pool."""
+    timings = {}
+    with tempfile.TemporaryDirectory() as directory:
+        gg_checks = _gg_checks(Path(directory), checks)
+        with mock.patch.object(output, "_gg_pool_workers", lambda *_: 0):
+            timings["In this process"] = _time_gg_runs(
+                gg_checks, jobs, setup_seconds, runs
+            )
+        # a pool of one worker for each job, whatever the number of
+        # checks and of processors
+        with mock.patch.object(output, "_gg_pool_workers", lambda *_: jobs):
+            # every check waits for a worker, as before the pool was
+            # pre-warmed, when its workers only started with the checks
+            with mock.patch.object(GatorGraderPool, "ready", lambda _: True):
+                timings["Pool started with the checks, waiting"] = (
+                    _time_gg_runs(gg_checks, jobs, setup_seconds, runs)
+                )
+            timings["Pool started with the checks"] = _time_gg_runs(
+                gg_checks, jobs, setup_seconds, runs
+            )
+            timings["Pool started before the setup"] = _time_gg_runs(
+                gg_checks, jobs, setup_seconds, runs, before_setup=True
+            )
+    _print_timings(
+        f"{checks} GatorGrader check(s) with {jobs} jobs after a setup of"
+        f" {setup_seconds} s",
+        runs,
+        timings,
+    )
+
+
+if __name__ == "__main__":
+    app()
@@ -10,7 +10,9 @@ from typing import Any
 
 import pytest
 
-from gatorgrade import main, report_history
+from gatorgrade import hash as check_id_hash
+from gatorgrade import main, report_history, result_cache
+from gatorgrade.input import compiled_config
 
 # disable the garbage collector at module load time to avoid intermittent
 # segfaults on CPython 3.14 when numpy C extensions interact with
@@ -88,6 +90,40 @@ def isolate_report_history(
     )
 
 
+@pytest.fixture(autouse=True)
+def isolate_result_cache(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    """Keep the result cache inside each test's temporary directory."""
+    cache_directory = tmp_path / "result-cache"
+    monkeypatch.setattr(
+        result_cache,
+        "get_result_cache_directory",
+        lambda: cache_directory,
+    )
+
+
+@pytest.fixture(autouse=True)
+def isolate_compiled_config(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    """Keep compiled configurations inside each test's temporary directory."""
+    compiled_directory = tmp_path / "compiled-config"
+    monkeypatch.setattr(
+        compiled_config,
+        "get_compiled_config_directory",
+        lambda: compiled_directory,
+    )
+
+
+@pytest.fixture(autouse=True)
+def isolate_check_id_memo(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Start each test with an empty memo of check_ids."""
+    monkeypatch.setattr(check_id_hash, "_CHECK_ID_MEMO", {})
+
+
 @pytest.fixture
 def chdir() -> Any:
     """Change working directory to a specified directory then changes back to base directory."""
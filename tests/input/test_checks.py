@@ -1,13 +1,18 @@
 """Test suite for checks.py."""
 
+from typing import Any
+
 import pytest
 from hypothesis import given
 from hypothesis import strategies as st
 
 from gatorgrade.input.checks import (
     GatorGraderCheck,
+    PytestCheck,
     ShellCheck,
+    validate_bool,
     validate_positive_nonzero_int,
+    validate_str_list,
 )
 
 
@@ -416,3 +421,90 @@ def test_gatorgrader_check_default_check_id_is_none() -> None:
         json_info={"check": "TestCheck"},
     )
     assert check.check_id is None
+
+
+def test_checks_default_to_parallel() -> None:
+    """Test that both check types may run in parallel by default."""
+    shell_check = ShellCheck(command="echo 'test'")
+    gg_check = GatorGraderCheck(gg_args=["TestCheck"], json_info="test")
+    assert shell_check.parallel is True
+    assert gg_check.parallel is True
+
+
+def test_shell_check_stores_parallel_opt_out() -> None:
+    """Test ShellCheck stores an explicit parallel opt-out."""
+    check = ShellCheck(command="echo 'test'", parallel=False)
+    assert check.parallel is False
+
+
+def test_validate_bool_accepts_booleans() -> None:
+    """Test validate_bool returns None for true and false."""
+    assert validate_bool(True, "parallel") is None
+    assert validate_bool(False, "parallel") is None
+
+
+def test_validate_bool_rejects_strings() -> None:
+    """Test validate_bool returns an error for non-boolean values."""
+    error = validate_bool("no", "parallel")
+    assert error is not None
+    assert "parallel must be true or false" in error
+
+
+def test_depends_on_defaults_to_empty_list() -> None:
+    """Test that checks have no prerequisites unless they are given."""
+    assert ShellCheck(command="ls").depends_on == []
+    assert GatorGraderCheck(gg_args=[], json_info={}).depends_on == []
+
+
+@pytest.mark.parametrize(
+    "value, expected_valid",
+    [
+        ("Build", True),
+        (["Build", "Test"], True),
+        ([], True),
+        (["Build", 3], False),
+        (3, False),
+        (None, False),
+    ],
+)
+def test_validate_str_list(value: Any, expected_valid: bool) -> None:
+    """Test that validate_str_list accepts only a string or list of strings."""
+    error = validate_str_list(value, "depends_on")
+    assert (error is None) == expected_valid
+
+
+def test_shell_check_with_timeout() -> None:
+    """Test ShellCheck construction with an explicit timeout."""
+    check = ShellCheck(command="echo test", timeout=5)
+    assert check.timeout == 5  # noqa: PLR2004
+
+
+def test_shell_check_invalid_timeout_zero() -> None:
+    """Test ShellCheck raises ValueError for a timeout of 0."""
+    with pytest.raises(ValueError) as exc_info:
+        ShellCheck(command="echo test", timeout=0)
+    assert "positive, non-zero integer" in str(exc_info.value)
+
+
+def test_gatorgrader_check_invalid_timeout_negative() -> None:
+    """Test GatorGraderCheck raises ValueError for a negative timeout."""
+    with pytest.raises(ValueError) as exc_info:
+        GatorGraderCheck(gg_args=["Test"], json_info={}, timeout=-1)
+    assert "positive, non-zero integer" in str(exc_info.value)
+
+
+def test_pytest_check_defaults() -> None:
+    """Test PytestCheck uses pytest and its node ID by default."""
+    check = PytestCheck(nodeid="tests/test_main.py::test_one")
+    assert check.runner == "pytest"
+    assert check.description == "tests/test_main.py::test_one"
+    assert check.weight == 1
+    assert check.depends_on == []
+
+
+def test_pytest_check_invalid_weight_and_timeout() -> None:
+    """Test PytestCheck reports every invalid field at once."""
+    with pytest.raises(ValueError) as exc_info:
+        PytestCheck(nodeid="tests/test_main.py", weight=0, timeout=-1)
+    assert "weight" in str(exc_info.value)
+    assert "timeout" in str(exc_info.value)
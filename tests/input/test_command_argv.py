@@ -0,0 +1,78 @@
+"""Test suite for command_argv.py."""
+
+import shlex
+
+import pytest
+
+from gatorgrade.input import command_argv
+from gatorgrade.input.command_argv import split_plain_command
+
+
+@pytest.fixture(autouse=True)
+def _posix_shell(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Split commands as on a platform with a POSIX shell."""
+    monkeypatch.setattr(command_argv, "HAS_DIRECT_EXEC", True)
+
+
+@pytest.mark.parametrize(
+    "command",
+    [
+        "uv run pytest tests/test_main.py",
+        "python -c \"import sys; print('a b'); sys.exit(1)\"",
+        "grep -q 'TODO: done' README.md",
+        "  ruff   check  ",
+        "mdl --style=.mdlrc a#b c~ d=e",
+        "cmd '' \"\" ''x",
+        "'FOO=1' x",
+        "cmd 'a'=b",
+    ],
+)
+def test_split_plain_command_matches_the_shell(command: str) -> None:
+    """A plain command is split into the same words as the shell uses."""
+    assert split_plain_command(command) == shlex.split(command)
+
+
+@pytest.mark.parametrize(
+    "command",
+    [
+        "ls *.py",
+        "ls file?.txt",
+        "ls [ab].txt",
+        "ls | wc -l",
+        "make && make test",
+        "cat < input.txt",
+        "echo hi > out.txt",
+        "run; other",
+        "(cd src && ls)",
+        "{ ls; }",
+        "sleep 1 &",
+        "echo $HOME",
+        "ls `pwd`",
+        'grep "a\\b" file',
+        "ls ~/src",
+        "ls # comment",
+        "FOO=1 python -m app",
+        "cd src",
+        "echo hello",
+        "test -f README.md",
+        "[ -f README.md ]",
+        "true",
+        "ls 'unterminated",
+        "ls\nrm",
+        "",
+        "   ",
+    ],
+)
+def test_split_plain_command_leaves_shell_commands_to_the_shell(
+    command: str,
+) -> None:
+    """A command that needs the shell, or one of its built-ins, is not split."""
+    assert split_plain_command(command) is None
+
+
+def test_split_plain_command_needs_a_posix_shell(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """No command is split on a platform without a POSIX shell."""
+    monkeypatch.setattr(command_argv, "HAS_DIRECT_EXEC", False)
+    assert split_plain_command("ruff check") is None
@@ -4,8 +4,20 @@ import pytest
 from hypothesis import given
 from hypothesis import strategies as st
 
-from gatorgrade.input.checks import GatorGraderCheck, ShellCheck
-from gatorgrade.input.command_line_generator import generate_checks
+from gatorgrade.hash import LEGACY_CHECK_ID_VERSION, compute_check_id
+from gatorgrade.input.checks import (
+    GatorGraderCheck,
+    InvalidCheck,
+    PytestCheck,
+    ShellCheck,
+)
+from gatorgrade.input.command_argv import HAS_DIRECT_EXEC
+from gatorgrade.input.command_line_generator import (
+    INVALID_ENTRY,
+    generate_checks,
+    iter_checks,
+    legacy_check_ids,
+)
 from gatorgrade.input.in_file_path import CheckData
 
 
@@ -502,6 +514,24 @@ def test_generate_checks_count_matches_input_property(
                     or cd.check["outputlimit"] <= 0
                 )
             )
+            or (
+                "parallel" in cd.check
+                and not isinstance(cd.check["parallel"], bool)
+            )
+            or (
+                "inputs" in cd.check
+                and not isinstance(cd.check["inputs"], str)
+            )
+            or (
+                cd.check.get("timeout") is not None
+                and (
+                    not isinstance(cd.check["timeout"], int)
+                    or isinstance(cd.check["timeout"], bool)
+                    or cd.check["timeout"] <= 0
+                )
+            )
+            # a depends_on entry can be invalid or name no other check
+            or "depends_on" in cd.check
             for cd in check_data_list
         )
 
@@ -589,3 +619,406 @@ def test_generate_checks_shell_check_id_differs_with_command() -> None:
     )
     checks = generate_checks([cd1, cd2])
     assert checks[0].check_id != checks[1].check_id
+
+
+def test_generate_checks_parallel_defaults_to_true() -> None:
+    """Test generate_checks marks checks as parallel unless told otherwise."""
+    check_data = CheckData(file_context=None, check={"command": "ls"})
+    checks = generate_checks([check_data])
+    assert checks[0].parallel is True
+
+
+def test_generate_checks_with_parallel_false() -> None:
+    """Test generate_checks honors parallel: false for both check types."""
+    shell_data = CheckData(
+        file_context=None,
+        check={"command": "ls", "parallel": False},
+    )
+    gg_data = CheckData(
+        file_context="src/main.py",
+        check={"check": "ConfirmFileExists", "parallel": False},
+    )
+    checks = generate_checks([shell_data, gg_data])
+    assert checks[0].parallel is False
+    assert checks[1].parallel is False
+    assert "--parallel" not in checks[1].gg_args
+
+
+def test_generate_checks_with_invalid_parallel() -> None:
+    """Test generate_checks raises ValueError for a non-boolean parallel."""
+    check_data = CheckData(
+        file_context=None,
+        check={"command": "ls", "parallel": "sometimes"},
+    )
+    with pytest.raises(ValueError) as exc_info:
+        generate_checks([check_data])
+    assert "Configuration error" in str(exc_info.value)
+    assert "must be true or false" in str(exc_info.value)
+
+
+def test_generate_checks_resolves_depends_on_by_description() -> None:
+    """Test generate_checks turns depends_on descriptions into check ids."""
+    build = CheckData(
+        file_context=None,
+        check={"description": "Build", "command": "make"},
+    )
+    test = CheckData(
+        file_context=None,
+        check={
+            "description": "Test",
+            "command": "make test",
+            "depends_on": "Build",
+        },
+    )
+    checks = generate_checks([build, test])
+    assert checks[0].depends_on == []
+    assert checks[1].depends_on == [checks[0].check_id]
+
+
+def test_generate_checks_resolves_depends_on_by_check_id() -> None:
+    """Test generate_checks accepts the check id of a prerequisite."""
+    build = CheckData(
+        file_context=None,
+        check={"description": "Build", "command": "make"},
+    )
+    build_id = generate_checks([build])[0].check_id
+    gg_data = CheckData(
+        file_context="src/main.py",
+        check={"check": "ConfirmFileExists", "depends_on": [build_id]},
+    )
+    checks = generate_checks([build, gg_data])
+    assert checks[1].depends_on == [build_id]
+
+
+def test_generate_checks_resolves_depends_on_by_legacy_check_id() -> None:
+    """Test generate_checks accepts the check id of an earlier scheme."""
+    build = CheckData(
+        file_context=None,
+        check={"description": "Build", "command": "make"},
+    )
+    legacy_id = compute_check_id(
+        "Build", build.check, version=LEGACY_CHECK_ID_VERSION
+    )
+    gg_data = CheckData(
+        file_context="src/main.py",
+        check={"check": "ConfirmFileExists", "depends_on": [legacy_id]},
+    )
+    checks = generate_checks([build, gg_data])
+    assert checks[1].depends_on == [checks[0].check_id]
+    assert legacy_check_ids([build, gg_data], checks)[legacy_id] == (
+        checks[0].check_id
+    )
+
+
+def test_generate_checks_with_unknown_depends_on() -> None:
+    """Test generate_checks rejects a depends_on that names no check."""
+    check_data = CheckData(
+        file_context=None,
+        check={"description": "Test", "command": "ls", "depends_on": ["Nope"]},
+    )
+    with pytest.raises(ValueError) as exc_info:
+        generate_checks([check_data])
+    assert "Configuration error in check 'Test'" in str(exc_info.value)
+    assert "'Nope'" in str(exc_info.value)
+
+
+def test_generate_checks_with_invalid_depends_on() -> None:
+    """Test generate_checks rejects a depends_on that is not a string list."""
+    check_data = CheckData(
+        file_context=None,
+        check={"command": "ls", "depends_on": [1, 2]},
+    )
+    with pytest.raises(ValueError) as exc_info:
+        generate_checks([check_data])
+    assert "must be a string or a list of strings" in str(exc_info.value)
+
+
+def test_generate_checks_with_depends_on_cycle() -> None:
+    """Test generate_checks rejects checks that depend on each other."""
+    first = CheckData(
+        file_context=None,
+        check={"description": "A", "command": "ls", "depends_on": "B"},
+    )
+    second = CheckData(
+        file_context=None,
+        check={"description": "B", "command": "ls", "depends_on": "A"},
+    )
+    with pytest.raises(ValueError) as exc_info:
+        generate_checks([first, second])
+    assert "forms a cycle: A -> B -> A" in str(exc_info.value)
+    assert str(exc_info.value).count("forms a cycle") == 1
+
+
+def test_generate_checks_with_self_dependency() -> None:
+    """Test generate_checks rejects a check that depends on itself."""
+    check_data = CheckData(
+        file_context=None,
+        check={"description": "A", "command": "ls", "depends_on": "A"},
+    )
+    with pytest.raises(ValueError) as exc_info:
+        generate_checks([check_data])
+    assert "must not refer to the check itself" in str(exc_info.value)
+
+
+def test_generate_checks_with_inputs() -> None:
+    """Test generate_checks records the inputs that decide a check's result."""
+    shell_data = CheckData(
+        file_context=None,
+        check={"command": "pytest", "inputs": ["src/**/*.py", "tests/*.py"]},
+    )
+    gg_data = CheckData(
+        file_context="src/main.py",
+        check={"check": "MatchFileFragment", "inputs": "README.md"},
+    )
+    gg_command_data = CheckData(
+        file_context="src/main.py",
+        check={"check": "ExecuteCommand", "options": {"command": "ls"}},
+    )
+    no_inputs_data = CheckData(file_context=None, check={"command": "ls"})
+    checks = generate_checks(
+        [shell_data, gg_data, gg_command_data, no_inputs_data]
+    )
+    assert checks[0].inputs == ["src/**/*.py", "tests/*.py"]
+    assert checks[1].inputs == ["src/main.py", "README.md"]
+    assert checks[2].inputs is None
+    assert checks[3].inputs is None
+
+
+def test_generate_checks_with_invalid_inputs() -> None:
+    """Test generate_checks rejects inputs that are not glob strings."""
+    check_data = CheckData(
+        file_context=None,
+        check={"command": "ls", "inputs": {"src": True}},
+    )
+    with pytest.raises(ValueError) as exc_info:
+        generate_checks([check_data])
+    assert "Check inputs must be a string or a list of strings" in str(
+        exc_info.value
+    )
+
+
+def test_generate_checks_passes_timeout_to_check() -> None:
+    """Test generate_checks passes the timeout of a check through."""
+    check_data = CheckData(
+        file_context=None,
+        check={"command": "echo 'hello'", "timeout": 7},
+    )
+    checks = generate_checks([check_data])
+    assert checks[0].timeout == 7  # noqa: PLR2004
+
+
+def test_generate_checks_with_invalid_timeout_zero() -> None:
+    """Test generate_checks raises ValueError for a timeout of 0."""
+    check_data = CheckData(
+        file_context=None,
+        check={"command": "echo 'hello'", "timeout": 0},
+    )
+    with pytest.raises(ValueError) as exc_info:
+        generate_checks([check_data])
+    assert "Configuration error" in str(exc_info.value)
+    assert "positive, non-zero integer" in str(exc_info.value)
+
+
+@pytest.mark.skipif(not HAS_DIRECT_EXEC, reason="needs a POSIX shell")
+def test_generate_checks_splits_plain_commands_once() -> None:
+    """A command without shell features gets its argument list up front."""
+    checks = generate_checks(
+        [
+            CheckData(file_context=None, check={"command": "ls -la 'a b'"}),
+            CheckData(file_context=None, check={"command": "ls | wc -l"}),
+        ]
+    )
+    assert isinstance(checks[0], ShellCheck)
+    assert isinstance(checks[1], ShellCheck)
+    assert checks[0].argv == ["ls", "-la", "a b"]
+    assert checks[1].argv is None
+
+
+def test_generate_checks_with_pytest_outcome_check() -> None:
+    """A PytestOutcome check becomes a PytestCheck of its node ID."""
+    check_data = CheckData(
+        file_context=None,
+        check={
+            "description": "The first test passes",
+            "check": "PytestOutcome",
+            "options": {
+                "nodeid": "tests/test_main.py::test_one",
+                "runner": "uv run pytest",
+            },
+        },
+    )
+    checks = generate_checks([check_data])
+    assert isinstance(checks[0], PytestCheck)
+    assert checks[0].nodeid == "tests/test_main.py::test_one"
+    assert checks[0].runner == "uv run pytest"
+    assert checks[0].description == "The first test passes"
+    assert checks[0].check_id is not None
+
+
+def test_generate_checks_with_pytest_outcome_file_context() -> None:
+    """A nested PytestOutcome check names a test in the file above it."""
+    checks = generate_checks(
+        [
+            CheckData(
+                file_context="tests/test_main.py",
+                check={
+                    "check": "PytestOutcome",
+                    "options": {"nodeid": "TestMain::test_one"},
+                },
+            ),
+            CheckData(
+                file_context="tests/test_main.py",
+                check={"check": "PytestOutcome"},
+            ),
+        ]
+    )
+    assert isinstance(checks[0], PytestCheck)
+    assert isinstance(checks[1], PytestCheck)
+    assert checks[0].nodeid == "tests/test_main.py::TestMain::test_one"
+    assert checks[0].runner == "pytest"
+    assert checks[1].nodeid == "tests/test_main.py"
+
+
+@pytest.mark.parametrize(
+    "check",
+    [
+        {"check": "PytestOutcome"},
+        {"check": "PytestOutcome", "options": {"runner": "pytest"}},
+        {"check": "PytestOutcome", "options": {"nodeid": ""}},
+        {
+            "check": "PytestOutcome",
+            "options": {"nodeid": "tests/test_main.py", "runner": 3},
+        },
+    ],
+)
+def test_generate_checks_with_invalid_pytest_outcome_options(
+    check: dict,
+) -> None:
+    """A PytestOutcome check without a usable node ID is an error."""
+    with pytest.raises(ValueError) as exc_info:
+        generate_checks([CheckData(file_context=None, check=check)])
+    assert "Configuration error" in str(exc_info.value)
+
+
+def test_generate_checks_accepts_a_generator() -> None:
+    """The check data may be produced by a generator."""
+    checks = generate_checks(
+        CheckData(file_context=None, check={"command": f"echo {number}"})
+        for number in range(3)
+    )
+    assert [check.command for check in checks] == [
+        "echo 0",
+        "echo 1",
+        "echo 2",
+    ]
+
+
+def test_iter_checks_yields_each_check_before_reading_the_next() -> None:
+    """A check is yielded before the data of the next check is read."""
+    read: list = []
+
+    def check_data():
+        for number in range(3):
+            read.append(number)
+            yield CheckData(
+                file_context=None, check={"command": f"echo {number}"}
+            )
+
+    checks = iter_checks(check_data())
+    first = next(checks)
+    assert isinstance(first, ShellCheck)
+    assert read == [0]
+    assert len(list(checks)) == 2  # noqa: PLR2004
+
+
+def test_iter_checks_reports_invalid_checks_in_place() -> None:
+    """An invalid check and a malformed entry fail without stopping the rest."""
+    checks = list(
+        iter_checks(
+            [
+                CheckData(file_context=None, check={"command": "ls"}),
+                CheckData(
+                    file_context=None,
+                    check={"description": "Bad", "command": "ls", "weight": 0},
+                ),
+                "- Malformed entry at line 5, column 3: not a check",
+                CheckData(file_context=None, check={"command": "pwd"}),
+            ],
+            baseline_weight=2,
+        )
+    )
+    assert [type(check) for check in checks] == [
+        ShellCheck,
+        InvalidCheck,
+        InvalidCheck,
+        ShellCheck,
+    ]
+    assert checks[1].description == "Bad"
+    assert "Configuration error in check 'Bad'" in checks[1].diagnostic
+    assert checks[1].weight == 2  # noqa: PLR2004
+    assert checks[1].check_id is not None
+    assert checks[2].description == INVALID_ENTRY
+    assert checks[2].diagnostic.endswith("not a check")
+
+
+def test_iter_checks_resolves_dependencies_on_later_checks() -> None:
+    """A check can depend on a check that comes after it in the file."""
+    checks = list(
+        iter_checks(
+            [
+                CheckData(
+                    file_context=None,
+                    check={"description": "A", "command": "ls"},
+                ),
+                CheckData(
+                    file_context=None,
+                    check={
+                        "description": "B",
+                        "command": "ls",
+                        "depends_on": "C",
+                    },
+                ),
+                CheckData(
+                    file_context=None,
+                    check={
+                        "description": "C",
+                        "command": "ls",
+                        "depends_on": "A",
+                    },
+                ),
+                CheckData(
+                    file_context=None,
+                    check={
+                        "description": "D",
+                        "command": "ls",
+                        "depends_on": "Nope",
+                    },
+                ),
+            ]
+        )
+    )
+    first, second, third, fourth = checks
+    assert second.depends_on == [third.check_id]
+    assert third.depends_on == [first.check_id]
+    assert isinstance(fourth, InvalidCheck)
+    assert "'Nope'" in fourth.diagnostic
+
+
+def test_iter_checks_breaks_a_cycle_at_the_check_that_reports_it() -> None:
+    """Only the first check of a cycle is invalid, and the others wait on it."""
+    first, second = iter_checks(
+        [
+            CheckData(
+                file_context=None,
+                check={"description": "A", "command": "ls", "depends_on": "B"},
+            ),
+            CheckData(
+                file_context=None,
+                check={"description": "B", "command": "ls", "depends_on": "A"},
+            ),
+        ]
+    )
+    assert isinstance(first, InvalidCheck)
+    assert "forms a cycle: A -> B -> A" in first.diagnostic
+    assert isinstance(second, ShellCheck)
+    assert second.depends_on == [first.check_id]
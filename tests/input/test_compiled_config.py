@@ -0,0 +1,290 @@
+"""Test suite for compiled_config.py."""
+
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from gatorgrade import hash as check_id_hash
+from gatorgrade.hash import memoized_check_ids, remember_check_ids
+from gatorgrade.input import compiled_config
+from gatorgrade.input import parse_config as parse_config_module
+from gatorgrade.input.compiled_config import (
+    CHECK_ID_MEMO_FILE_NAME,
+    COMPILED_SCHEMA_VERSION,
+    CompiledConfig,
+    compiled_config_key,
+    compiled_config_path,
+    load_check_id_memo,
+    load_compiled_config,
+    save_check_id_memo,
+    save_compiled_config,
+)
+from gatorgrade.input.parse_config import ConfigDocument
+
+CONFIG = (
+    "name: Project\n"
+    "due_date: 2026-12-15\n"
+    "---\n"
+    "- src:\n"
+    "    - main.py:\n"
+    "        - description: Has a main function\n"
+    "          check: MatchFileFragment\n"
+    "          options:\n"
+    "            fragment: def main\n"
+    "            count: 1\n"
+    "- description: Says hello\n"
+    "  command: echo hello\n"
+)
+BASELINE_WEIGHT = 3
+
+
+@pytest.fixture
+def parse_count(monkeypatch: pytest.MonkeyPatch) -> list:
+    """Count how many times the YAML loader runs."""
+    parses: list = []
+    parse_yaml_text = parse_config_module.parse_yaml_text
+
+    def counting_parse(text: str) -> list:
+        parses.append(text)
+        return parse_yaml_text(text)
+
+    monkeypatch.setattr(parse_config_module, "parse_yaml_text", counting_parse)
+    return parses
+
+
+def _new_run() -> None:
+    """Forget the documents parsed in this process, as a new run would."""
+    parse_config_module._CONFIG_DOCUMENTS.clear()
+
+
+def test_compiled_config_key_covers_bytes_and_version(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """The key changes with the bytes of the file and the version."""
+    key = compiled_config_key(b"- command: echo hi\n")
+    assert key == compiled_config_key(b"- command: echo hi\n")
+    assert key != compiled_config_key(b"- command: echo ho\n")
+    monkeypatch.setattr(compiled_config, "GATORGRADE_VERSION", "0.0.0")
+    assert key != compiled_config_key(b"- command: echo hi\n")
+
+
+def test_save_and_load_compiled_config(tmp_path: Path) -> None:
+    """A stored compiled configuration loads back unchanged."""
+    compiled = CompiledConfig(COMPILED_SCHEMA_VERSION, [{"a": 1}], 1, None)
+    path = save_compiled_config("key", compiled, tmp_path)
+    assert path == compiled_config_path("key", tmp_path)
+    assert load_compiled_config("key", tmp_path) == compiled
+    assert load_compiled_config("missing", tmp_path) is None
+
+
+def test_load_compiled_config_ignores_damaged_and_old_files(
+    tmp_path: Path,
+) -> None:
+    """A damaged file or one with an older layout is not loaded."""
+    compiled_config_path("damaged", tmp_path).write_bytes(b"not a pickle")
+    assert load_compiled_config("damaged", tmp_path) is None
+    old = CompiledConfig(COMPILED_SCHEMA_VERSION - 1, [], 1, None)
+    save_compiled_config("old", old, tmp_path)
+    assert load_compiled_config("old", tmp_path) is None
+
+
+def test_save_compiled_config_keeps_the_most_recent(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    """Only the most recently used compiled configurations are kept."""
+    monkeypatch.setattr(compiled_config, "MAX_COMPILED_CONFIGS", 2)
+    compiled = CompiledConfig(COMPILED_SCHEMA_VERSION, [], 1, None)
+    for key in ("first", "second", "third"):
+        save_compiled_config(key, compiled, tmp_path)
+    stored = sorted(path.stem for path in tmp_path.iterdir())
+    assert len(stored) == 2  # noqa: PLR2004
+    assert "third" in stored
+
+
+def test_save_compiled_config_ignores_unwritable_directory(
+    tmp_path: Path,
+) -> None:
+    """A compiled configuration that cannot be stored is skipped."""
+    blocked = tmp_path / "blocked"
+    blocked.write_text("a file where the directory should be")
+    compiled = CompiledConfig(COMPILED_SCHEMA_VERSION, [], 1, None)
+    assert save_compiled_config("key", compiled, blocked) is None
+
+
+def test_later_run_loads_checks_without_parsing(
+    tmp_path: Path, parse_count: list
+) -> None:
+    """A later run of an unchanged file does not run the YAML loader."""
+    config = tmp_path / "gatorgrade.yml"
+    config.write_text(CONFIG)
+    first, error = ConfigDocument.load(config).load_config(BASELINE_WEIGHT)
+    assert error is None
+    _new_run()
+    document = ConfigDocument.load(config)
+    second, error = document.load_config(BASELINE_WEIGHT)
+    assert error is None
+    assert len(parse_count) == 1
+    assert document.get_project_name() == "Project"
+    assert document.get_due_date()[0] is not None
+    assert [check.check_id for check in second.checks] == [
+        check.check_id for check in first.checks
+    ]
+    assert [check.weight for check in second.checks] == [BASELINE_WEIGHT] * 2
+    assert second.check_data[0].file_context == "src/main.py"
+
+
+def test_other_baseline_weight_generates_checks_again(
+    tmp_path: Path, parse_count: list
+) -> None:
+    """Another baseline weight generates the checks but does not parse."""
+    config = tmp_path / "gatorgrade.yml"
+    config.write_text(CONFIG)
+    ConfigDocument.load(config).load_config(BASELINE_WEIGHT)
+    _new_run()
+    parsed, error = ConfigDocument.load(config).load_config(1)
+    assert error is None
+    assert [check.weight for check in parsed.checks] == [1, 1]
+    assert len(parse_count) == 1
+
+
+def test_changed_file_is_parsed_again(
+    tmp_path: Path, parse_count: list
+) -> None:
+    """Editing the file compiles it again."""
+    config = tmp_path / "gatorgrade.yml"
+    config.write_text(CONFIG)
+    ConfigDocument.load(config).load_config()
+    config.write_text(CONFIG.replace("echo hello", "echo goodbye"))
+    _new_run()
+    parsed, _ = ConfigDocument.load(config).load_config()
+    assert parsed.checks[1].command == "echo goodbye"
+    assert len(parse_count) == 2  # noqa: PLR2004
+
+
+def test_compiled_form_is_not_used_when_disabled(
+    tmp_path: Path, parse_count: list
+) -> None:
+    """Without the compiled form, the file is parsed and nothing is stored."""
+    config = tmp_path / "gatorgrade.yml"
+    config.write_text(CONFIG)
+    document = ConfigDocument.load(config, compiled=False)
+    document.load_config()
+    assert document.key is not None
+    assert not compiled_config_path(document.key).exists()
+    _new_run()
+    ConfigDocument.load(config, compiled=False).load_config()
+    assert len(parse_count) == 2  # noqa: PLR2004
+
+
+def test_invalid_config_is_not_compiled(tmp_path: Path) -> None:
+    """A configuration with errors is never stored in compiled form."""
+    config = tmp_path / "gatorgrade.yml"
+    config.write_text("- command: echo hi\n  weight: 0\n")
+    document = ConfigDocument.load(config)
+    _, error = document.load_config()
+    assert error is not None
+    assert document.key is not None
+    assert not compiled_config_path(document.key).exists()
+
+
+def test_later_run_hashes_only_edited_checks(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A later run only computes the check_ids of the checks that changed."""
+    config = tmp_path / "gatorgrade.yml"
+    config.write_text(CONFIG)
+    encoded: list = []
+    encode = check_id_hash.COMPACT_ENCODER.encode
+
+    def counting_encode(value: Any) -> str:
+        encoded.append(value)
+        return encode(value)
+
+    monkeypatch.setattr(
+        check_id_hash.COMPACT_ENCODER, "encode", counting_encode
+    )
+    first, _ = ConfigDocument.load(config).load_config(BASELINE_WEIGHT)
+    assert len(encoded) == len(first.checks)
+    assert (tmp_path / "compiled-config" / CHECK_ID_MEMO_FILE_NAME).exists()
+    _new_run()
+    monkeypatch.setattr(check_id_hash, "_CHECK_ID_MEMO", {})
+    config.write_text(CONFIG.replace("Says hello", "Says hi"))
+    second, _ = ConfigDocument.load(config).load_config(BASELINE_WEIGHT)
+    assert len(encoded) == len(first.checks) + 1
+    assert second.checks[0].check_id == first.checks[0].check_id
+    assert second.checks[1].check_id != first.checks[1].check_id
+
+
+def test_check_id_memo_of_other_version_is_ignored(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A memo stored for another scheme of check_ids is not used."""
+    remember_check_ids({b"key": b"digest"})
+    assert save_check_id_memo(tmp_path) is not None
+    monkeypatch.setattr(check_id_hash, "_CHECK_ID_MEMO", {})
+    monkeypatch.setattr(
+        compiled_config, "CHECK_ID_VERSION", check_id_hash.CHECK_ID_VERSION + 1
+    )
+    load_check_id_memo(tmp_path)
+    assert memoized_check_ids() == {}
+    monkeypatch.setattr(
+        compiled_config, "CHECK_ID_VERSION", check_id_hash.CHECK_ID_VERSION
+    )
+    load_check_id_memo(tmp_path)
+    assert memoized_check_ids() == {b"key": b"digest"}
+
+
+def test_damaged_check_id_memo_is_ignored(tmp_path: Path) -> None:
+    """A memo that cannot be unpickled only means hashing again."""
+    (tmp_path / CHECK_ID_MEMO_FILE_NAME).write_bytes(b"not a pickle")
+    load_check_id_memo(tmp_path)
+    assert memoized_check_ids() == {}
+
+
+def test_stream_config_stores_the_compiled_config_once_consumed(
+    tmp_path: Path, parse_count: list
+) -> None:
+    """A streamed file is stored compiled once all of its checks were read."""
+    config = tmp_path / "gatorgrade.yml"
+    config.write_text(CONFIG)
+    document = ConfigDocument.load(config, stream=True)
+    streamed, error = document.stream_config(BASELINE_WEIGHT)
+    assert error is None
+    assert streamed.front_matter["name"] == "Project"
+    assert load_compiled_config(str(document.key)) is None
+    checks = list(streamed.checks)
+    compiled = load_compiled_config(str(document.key))
+    assert compiled is not None
+    assert [check.check_id for check in compiled.config.checks] == [
+        check.check_id for check in checks
+    ]
+    _new_run()
+    loaded, error = ConfigDocument.load(config, stream=True).stream_config(
+        BASELINE_WEIGHT
+    )
+    assert error is None
+    assert [check.check_id for check in loaded.checks] == [
+        check.check_id for check in checks
+    ]
+    assert parse_count == []
+
+
+def test_stream_config_does_not_store_a_file_with_errors(
+    tmp_path: Path,
+) -> None:
+    """A streamed file with an invalid check is not stored compiled."""
+    config = tmp_path / "gatorgrade.yml"
+    config.write_text(
+        CONFIG + "- description: Bad\n  command: ls\n  weight: 0\n"
+    )
+    document = ConfigDocument.load(config, stream=True)
+    streamed, _ = document.stream_config(BASELINE_WEIGHT)
+    assert len(list(streamed.checks)) == 3  # noqa: PLR2004
+    assert load_compiled_config(str(document.key)) is None
+    _new_run()
+    _, error = ConfigDocument.load(config, stream=True).load_config(
+        BASELINE_WEIGHT
+    )
+    assert error is not None
+    assert "Configuration error in check 'Bad'" in error
@@ -24,6 +24,7 @@ from gatorgrade.input.filter import (
     _levenshtein_distance,
     _levenshtein_ratio,
     _match,
+    _within_levenshtein_ratio,
     filter_checks,
 )
 
@@ -186,6 +187,19 @@ class TestLevenshteinDistance:
         """Completely different strings have large distance."""
         assert _levenshtein_distance("abc", "xyz") == 3  # noqa: PLR2004
 
+    def test_longer_than_a_machine_word(self) -> None:
+        """Strings longer than 64 characters have their exact distance."""
+        assert _levenshtein_distance("ab" * 50, "ba" * 50) == 2  # noqa: PLR2004
+
+    def test_bounded_distance_within_bound(self) -> None:
+        """A distance within the bound is returned exactly."""
+        assert _levenshtein_distance("checking", "check", 3) == 3  # noqa: PLR2004
+
+    def test_bounded_distance_stops_above_bound(self) -> None:
+        """A distance above the bound is reported as above it."""
+        assert _levenshtein_distance("abcdef", "uvwxyz", 2) > 2  # noqa: PLR2004
+        assert _levenshtein_distance("a", "abcdefgh", 2) > 2  # noqa: PLR2004
+
 
 class TestLevenshteinRatio:
     """Tests for _levenshtein_ratio."""
@@ -220,6 +234,27 @@ class TestLevenshteinRatio:
         assert _levenshtein_ratio("", "") == 0.0
 
 
+class TestWithinLevenshteinRatio:
+    """Tests for _within_levenshtein_ratio."""
+
+    def test_ratio_on_the_threshold_matches(self) -> None:
+        """checking/check has ratio 3/8, which is within 0.375."""
+        assert _within_levenshtein_ratio("checking", "check", 3 / 8)
+        assert not _within_levenshtein_ratio("checking", "check", 0.374)
+
+    def test_negative_or_nan_threshold_never_matches(self) -> None:
+        """No ratio is within a negative threshold or one that is NaN."""
+        assert not _within_levenshtein_ratio("same", "same", -0.1)
+        assert not _within_levenshtein_ratio("same", "same", float("nan"))
+
+    def test_lowercase_that_is_longer_than_the_word(self) -> None:
+        """A ratio above 1.0 from lowercasing is compared as it was."""
+        ratio = _levenshtein_ratio("b", "\u0130b\u0130")
+        assert ratio > 1.0
+        assert not _within_levenshtein_ratio("b", "\u0130b\u0130", 1.0)
+        assert _within_levenshtein_ratio("b", "\u0130b\u0130", ratio)
+
+
 class TestFuzzyMatchWord:
     """Tests for _fuzzy_match_word."""
 
@@ -957,6 +992,47 @@ def test_levenshtein_properties(s1: str, s2: str) -> None:
     assert dist <= max(len(s1), len(s2))
 
 
+def _reference_levenshtein_distance(s1: str, s2: str) -> int:
+    """Compute the edit distance with the classic dynamic program."""
+    prev_row = list(range(len(s2) + 1))
+    for i, char1 in enumerate(s1, 1):
+        curr_row = [i]
+        for j, char2 in enumerate(s2, 1):
+            cost = 0 if char1 == char2 else 1
+            curr_row.append(
+                min(
+                    curr_row[j - 1] + 1,
+                    prev_row[j] + 1,
+                    prev_row[j - 1] + cost,
+                )
+            )
+        prev_row = curr_row
+    return prev_row[-1]
+
+
+@pytest.mark.propertybased
+@given(
+    st.text(alphabet="abcAB\u0130 ", max_size=80),
+    st.text(alphabet="abcAB\u0130 ", max_size=80),
+    st.floats(min_value=0.0, max_value=1.5),
+)
+def test_levenshtein_matches_reference(
+    s1: str, s2: str, fuzzy_threshold: float
+) -> None:
+    """The bit-parallel distance and the bounded ratio match the reference."""
+    distance = _reference_levenshtein_distance(s1, s2)
+    assert _levenshtein_distance(s1, s2) == distance
+    for max_distance in range(4):
+        bounded = _levenshtein_distance(s1, s2, max_distance)
+        if distance <= max_distance:
+            assert bounded == distance
+        else:
+            assert bounded > max_distance
+    assert _within_levenshtein_ratio(s1, s2, fuzzy_threshold) == (
+        _levenshtein_ratio(s1, s2) <= fuzzy_threshold
+    )
+
+
 class TestEnsureStr:
     """Tests for _ensure_str."""
 
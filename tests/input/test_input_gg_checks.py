@@ -1,15 +1,27 @@
 """Test suite for parse_config function."""
 
+import datetime
+import os
+import sys
 import tempfile
 from pathlib import Path
 
 import pytest
+import yaml
 from hypothesis import given
 from hypothesis import strategies as st
 
+from gatorgrade.input import in_file_path
+from gatorgrade.input import parse_config as parse_config_module
 from gatorgrade.input.checks import GatorGraderCheck, ShellCheck
-from gatorgrade.input.in_file_path import reformat_yaml_data
+from gatorgrade.input.in_file_path import (
+    MALFORMED_ENTRY_MSG,
+    MALFORMED_LIST_MSG,
+    iter_check_data,
+    reformat_yaml_data,
+)
 from gatorgrade.input.parse_config import (
+    ConfigDocument,
     _platform_config_dir,
     get_auto_hint_model,
     get_config_dir,
@@ -19,6 +31,7 @@ from gatorgrade.input.parse_config import (
     get_system_prompt_file,
     get_validation_phrases_file,
     has_due_date_field,
+    load_config,
     parse_config,
     resolve_config_path,
 )
@@ -505,6 +518,48 @@ def test_get_due_date_with_unquoted_yaml_datetime(tmp_path: Path) -> None:
     assert result.minute == 59  # noqa: PLR2004
 
 
+@pytest.mark.parametrize("loader", [in_file_path.YAML_LOADER, yaml.SafeLoader])
+def test_get_due_date_with_either_yaml_loader(
+    loader: type, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    """Test the C loader and its pure-Python fallback read due dates alike."""
+    monkeypatch.setattr(in_file_path, "YAML_LOADER", loader)
+    config_file = tmp_path / "gatorgrade.yml"
+    config_file.write_text(
+        "due_date: 2026-12-15T23:59:00+00:00\n"
+        "---\n"
+        "- description: test\n"
+        "  command: echo hello\n"
+    )
+    result, error = get_due_date(config_file)
+    assert error is None
+    assert result is not None
+    assert result.tzinfo is None
+    assert result == datetime.datetime(
+        2026, 12, 15, 23, 59, tzinfo=datetime.timezone.utc
+    ).astimezone().replace(tzinfo=None)
+
+
+def test_yaml_loader_uses_libyaml_when_available() -> None:
+    """Test the configuration loader is the C loader when libyaml is built in."""
+    if yaml.__with_libyaml__:
+        assert in_file_path.YAML_LOADER is yaml.CSafeLoader
+    else:
+        assert in_file_path.YAML_LOADER is yaml.SafeLoader
+
+
+def test_parse_config_rejects_python_object_tags(tmp_path: Path) -> None:
+    """Test the safe loader does not build arbitrary Python objects."""
+    config_file = tmp_path / "gatorgrade.yml"
+    config_file.write_text(
+        "- description: !!python/tuple [a, b]\n  command: echo hello\n"
+    )
+    checks, error = parse_config(config_file)
+    assert checks == []
+    assert error is not None
+    assert "python/tuple" in error
+
+
 @pytest.mark.parametrize(
     ("fields", "count", "first"),
     [
@@ -766,6 +821,203 @@ def test_reformat_yaml_data_with_empty_list() -> None:
         reformat_yaml_data([])
 
 
+def test_iter_check_data_yields_nested_checks_lazily() -> None:
+    """The checks nested under files are yielded one at a time, in order."""
+    data = [
+        {"src": [{"main.py": [{"description": "first", "check": "A"}]}]},
+        {"description": "second", "command": "echo hi"},
+    ]
+    checks = iter_check_data(None, data)
+    first = next(checks)
+    assert first.file_context == "src/main.py"
+    assert first.check["description"] == "first"
+    assert [check.file_context for check in checks] == [None]
+
+
+def test_iter_check_data_handles_deep_nesting() -> None:
+    """Directories nested deeper than the recursion limit are flattened."""
+    depth = sys.getrecursionlimit() * 2
+    data: list = [{"description": "deep", "command": "echo hi"}]
+    for level in range(depth):
+        data = [{f"d{level}": data}]
+    (check,) = iter_check_data(None, data)
+    assert check.file_context.count("/") == depth - 1
+    assert check.check["description"] == "deep"
+
+
+def test_iter_check_data_shares_file_context_strings() -> None:
+    """Checks for the same file share one interned file_context string."""
+    data = [
+        {"src": [{"main.py": [{"description": str(index), "command": "x"}]}]}
+        for index in range(3)
+    ]
+    first, second, third = iter_check_data(None, data)
+    assert first.file_context == "src/main.py"
+    assert first.file_context is second.file_context is third.file_context
+
+
+def test_iter_check_data_keeps_order_of_files_in_one_entry() -> None:
+    """Several files in one entry are flattened in the order they appear."""
+    data = [
+        {
+            "src": [{"description": "in src", "command": "x"}],
+            "tests": [{"description": "in tests", "command": "y"}],
+        },
+        {"docs": [{"description": "in docs", "command": "w"}], "command": "z"},
+    ]
+    checks = list(iter_check_data(None, data))
+    assert [check.file_context for check in checks] == [
+        "src",
+        "tests",
+        "docs",
+        None,
+    ]
+    assert checks[-1].check is data[-1]
+
+
+def test_iter_check_data_raises_for_malformed_entry() -> None:
+    """Without a list for them, a malformed entry raises a ValueError."""
+    with pytest.raises(ValueError, match="checks/1"):
+        list(iter_check_data(None, [{"command": "x"}, "not a check"]))
+
+
+def test_parse_config_reports_position_of_malformed_entries(
+    tmp_path: Path,
+) -> None:
+    """Every malformed entry is reported with its line and column."""
+    config_file = tmp_path / "gatorgrade.yml"
+    config_file.write_text(
+        "name: Project\n"
+        "---\n"
+        "- description: fine\n"
+        "  command: echo hi\n"
+        "- just a string\n"
+        "- src:\n"
+        "    - main.py:\n"
+        "        - 42\n"
+    )
+    checks, error = parse_config(config_file)
+    assert checks == []
+    assert error is not None
+    assert error.splitlines() == [
+        "- Malformed entry at line 5, column 3: " + MALFORMED_ENTRY_MSG,
+        "- Malformed entry at line 8, column 11: " + MALFORMED_ENTRY_MSG,
+    ]
+
+
+def test_parse_config_reports_checks_that_are_not_a_list(
+    tmp_path: Path,
+) -> None:
+    """A document of checks that is not a list is reported as malformed."""
+    config_file = tmp_path / "gatorgrade.yml"
+    config_file.write_text("name: Project\n---\ncommand: echo hi\n")
+    _, error = parse_config(config_file)
+    assert error == (
+        f"- Malformed entry at line 3, column 1: {MALFORMED_LIST_MSG}"
+    )
+
+
+def test_parse_config_finds_malformed_entries_without_reading_again(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    """The positions of malformed entries come from the one parse of the file."""
+    config_file = tmp_path / "gatorgrade.yml"
+    config_file.write_text("- description: fine\n  command: echo hi\n- 42\n")
+
+    def fail_compose_all(*args: object, **kwargs: object) -> None:
+        raise AssertionError("the file was composed a second time")
+
+    monkeypatch.setattr(yaml, "compose_all", fail_compose_all)
+    _, error = parse_config(config_file)
+    assert error == (
+        f"- Malformed entry at line 3, column 3: {MALFORMED_ENTRY_MSG}"
+    )
+
+
+@pytest.mark.parametrize("loader", [in_file_path.YAML_LOADER, yaml.SafeLoader])
+def test_parse_yaml_text_loads_the_documents_as_load_all_does(
+    loader: type, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Loading the list of checks one entry at a time gives the same data."""
+    monkeypatch.setattr(in_file_path, "YAML_LOADER", loader)
+    text = (
+        "name: Project\n"
+        "---\n"
+        "- &shared\n"
+        "  description: first\n"
+        "  command: echo one\n"
+        "- <<: *shared\n"
+        "  description: second\n"
+        "- src:\n"
+        "    - main.py:\n"
+        "        - description: nested\n"
+        "          check: MatchFileFragment\n"
+    )
+    parsed = in_file_path.parse_yaml_text(text)
+    assert parsed.documents == list(yaml.load_all(text, Loader=loader))
+    assert parsed.check_data == reformat_yaml_data(parsed.documents)
+    assert parsed.malformed == []
+
+
+def test_check_data_stream_yields_checks_before_a_later_error() -> None:
+    """The checks before a YAML error are read before the error is found."""
+    stream = in_file_path.CheckDataStream(
+        "name: Project\n"
+        "---\n"
+        "- description: first\n"
+        "  command: echo one\n"
+        "- 42\n"
+        "- {unclosed: [\n"
+    )
+    assert stream.front_matter == {"name": "Project"}
+    entries = iter(stream)
+    first = next(entries)
+    assert first.check == {"description": "first", "command": "echo one"}
+    malformed, error = entries
+    assert malformed == (
+        f"- Malformed entry at line 5, column 3: {MALFORMED_ENTRY_MSG}"
+    )
+    assert "line 7" in error
+    assert not stream.complete
+
+
+@pytest.mark.parametrize(
+    ("text", "front_matter", "documents"),
+    [
+        ("- command: ls\n", {}, [[{"command": "ls"}]]),
+        ("name: x\n---\n- command: ls\n", {"name": "x"}, None),
+        ("", {}, []),
+    ],
+)
+def test_check_data_stream_keeps_the_documents(
+    text: str, front_matter: dict, documents: list | None
+) -> None:
+    """A consumed stream has the documents that load_all gives."""
+    stream = in_file_path.CheckDataStream(text, keep_documents=True)
+    assert stream.front_matter == front_matter
+    checks = list(stream)
+    assert all(isinstance(check, in_file_path.CheckData) for check in checks)
+    assert stream.complete
+    expected = (
+        list(yaml.safe_load_all(text)) if documents is None else documents
+    )
+    assert stream.documents == expected
+
+
+def test_check_data_stream_reports_a_document_after_the_checks() -> None:
+    """A file with a document after the list of checks ends with an error."""
+    stream = in_file_path.CheckDataStream(
+        "name: x\n---\n- command: ls\n---\n- command: pwd\n"
+    )
+    *checks, error = stream
+    assert len(checks) == 1
+    assert error == (
+        "- Malformed entry at line 5, column 1: "
+        + in_file_path.EXTRA_DOCUMENT_MSG
+    )
+    assert not stream.complete
+
+
 def test_get_project_name_returns_name_when_specified(tmp_path: Path) -> None:
     """Test get_project_name returns the name from the config front matter."""
     config_file = tmp_path / "gatorgrade.yml"
@@ -893,3 +1145,141 @@ def test_has_due_date_field_detects_all_aliases(
     )
     result = has_due_date_field(config_file)
     assert result is True
+
+
+def test_load_config_does_not_run_setup(tmp_path: Path, chdir) -> None:
+    """Test load_config returns the set up plan instead of running it."""
+    config = tmp_path / "gatorgrade.yml"
+    config.write_text(
+        "name: Project\n"
+        "setup: |\n"
+        "  touch setup-ran.txt\n"
+        "setup_inputs: uv.lock\n"
+        "---\n"
+        "- src/main.py:\n"
+        "    - description: Has a main function\n"
+        "      check: MatchFileFragment\n"
+        "      options:\n"
+        "        fragment: def main\n"
+        "        count: 1\n"
+    )
+    chdir(tmp_path)
+    parsed, error = load_config(config)
+    assert error is None
+    assert not (tmp_path / "setup-ran.txt").exists()
+    assert parsed.front_matter["name"] == "Project"
+    assert parsed.setup_plan.groups[0].commands == ["touch setup-ran.txt"]
+    assert parsed.setup_plan.inputs == ["uv.lock"]
+    assert parsed.check_data[0].file_context == "src/main.py"
+    assert len(parsed.checks) == 1
+
+
+def test_load_config_reports_invalid_setup(tmp_path: Path) -> None:
+    """Test load_config reports a set up that has no valid form."""
+    config = tmp_path / "gatorgrade.yml"
+    config.write_text("setup: 3\n---\n- command: echo hi\n")
+    parsed, error = load_config(config)
+    assert error is not None
+    assert "Setup must be" in error
+    assert parsed.checks == []
+
+
+DOCUMENT_CONFIG = (
+    "name: Project\n"
+    "due_date: 2026-12-15\n"
+    "auto_hint_model: model\n"
+    "---\n"
+    "- command: echo hi\n"
+)
+
+
+@pytest.fixture
+def parse_count(monkeypatch: pytest.MonkeyPatch) -> list:
+    """Count how many times a configuration file is parsed."""
+    parses: list = []
+    parse_yaml_text = parse_config_module.parse_yaml_text
+
+    def counting_parse(text: str) -> list:
+        parses.append(text)
+        return parse_yaml_text(text)
+
+    monkeypatch.setattr(parse_config_module, "parse_yaml_text", counting_parse)
+    return parses
+
+
+def test_config_document_parses_once_for_every_accessor(
+    tmp_path: Path, parse_count: list
+) -> None:
+    """Test that the accessors of one file share a single parse."""
+    config = tmp_path / "gatorgrade.yml"
+    config.write_text(DOCUMENT_CONFIG)
+    assert get_project_name(config) == "Project"
+    assert get_auto_hint_model(config) == "model"
+    assert has_due_date_field(config)
+    assert get_due_date_aliases_present(config) == ["due_date"]
+    assert get_due_date(config)[0] is not None
+    assert get_system_prompt_file(config) is None
+    assert get_validation_phrases_file(config) is None
+    _, error = load_config(config)
+    assert error is None
+    assert len(ConfigDocument.load(config).get_history_scope()) == 64  # noqa: PLR2004
+    assert len(parse_count) == 1
+
+
+def test_config_document_parses_again_when_the_file_changes(
+    tmp_path: Path, parse_count: list
+) -> None:
+    """Test that a changed file is parsed again instead of reused."""
+    config = tmp_path / "gatorgrade.yml"
+    config.write_text(DOCUMENT_CONFIG)
+    assert get_project_name(config) == "Project"
+    config.write_text(DOCUMENT_CONFIG.replace("Project", "Renamed project"))
+    assert get_project_name(config) == "Renamed project"
+    # the same size and modification time count as the same file
+    modified = config.stat().st_mtime_ns
+    config.write_text(DOCUMENT_CONFIG.replace("Project", "Projexx"))
+    os.utime(config, ns=(modified, modified))
+    assert get_project_name(config) == "Projexx"
+    assert len(parse_count) == 3  # noqa: PLR2004
+
+
+def test_config_document_keeps_the_path_of_each_caller(
+    tmp_path: Path, chdir, parse_count: list
+) -> None:
+    """Test that a file named by two paths keeps the path of each caller."""
+    (tmp_path / "gatorgrade.yml").write_text(DOCUMENT_CONFIG)
+    chdir(tmp_path.parent)
+    relative = Path(tmp_path.name) / "gatorgrade.yml"
+    assert ConfigDocument.load(relative).path == relative
+    chdir(tmp_path)
+    assert ConfigDocument.load(Path("gatorgrade.yml")).path == Path(
+        "gatorgrade.yml"
+    )
+    assert len(parse_count) == 1
+
+
+def test_config_document_raises_its_parse_error_to_each_accessor(
+    tmp_path: Path,
+) -> None:
+    """Test that every accessor handles the error of the one parse."""
+    config = tmp_path / "gatorgrade.yml"
+    config.write_text("name: [unclosed\n---\n- command: echo hi\n")
+    document = ConfigDocument.load(config)
+    with pytest.raises(yaml.YAMLError):
+        _ = document.front_matter
+    assert document.get_project_name() is None
+    assert not document.has_due_date_field()
+    due_date, error = document.get_due_date()
+    assert due_date is None
+    assert error is not None
+    assert error.startswith("Could not parse YAML front matter")
+    _, error = document.load_config()
+    assert error is not None
+
+
+def test_config_document_of_a_missing_file_is_empty(tmp_path: Path) -> None:
+    """Test that a file that does not exist has no documents."""
+    document = ConfigDocument.load(tmp_path / "missing.yml")
+    assert document.documents == []
+    assert document.front_matter == {}
+    assert document.get_due_date() == (None, None)
@@ -1,11 +1,22 @@
 """Test suite for set_up_shell.py."""
 
+from pathlib import Path
+from typing import Any
+
 import pytest
 from hypothesis import given
 from hypothesis import strategies as st
 from typer import Exit
 
-from gatorgrade.input.set_up_shell import run_setup
+from gatorgrade.input.set_up_shell import (
+    SETUP_TAIL_LINES,
+    SetupOutput,
+    run_setup,
+)
+
+# the number of runs of a set up command that ran, was skipped, was
+# forced, and then ran because its input changed
+RUNS_AFTER_CHANGE = 3
 
 
 def test_run_setup_with_no_setup_commands() -> None:
@@ -72,6 +83,18 @@ def test_run_setup_with_mixed_commands() -> None:
     assert exc_info.value.exit_code == 1
 
 
+def test_run_setup_with_command_that_times_out(
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    """Test run_setup exits instead of crashing when a command times out."""
+    front_matter = {"setup": 'python -c "import time; time.sleep(30)"'}
+    with pytest.raises(Exit) as exc_info:
+        run_setup(front_matter, timeout=1)
+    assert exc_info.value.exit_code == 1
+    printed = " ".join(capsys.readouterr().out.split())
+    assert "timed out after 1 second(s)" in printed
+
+
 @pytest.mark.propertybased
 @given(st.dictionaries(st.text(min_size=1, max_size=10), st.text(max_size=20)))
 def test_run_setup_no_setup_key_property(front_matter: dict) -> None:
@@ -100,3 +123,129 @@ def test_run_setup_with_commands_property(commands: str) -> None:
         pass
     except Exception:
         pytest.fail("run_setup raised an unexpected exception")
+
+
+def _setup_with_inputs(tmp_path: Path) -> dict:
+    """Return front matter whose set up counts its runs in a file."""
+    (tmp_path / "uv.lock").write_text("version 1")
+    return {
+        "setup": "echo run >> runs.txt",
+        "setup_inputs": ["uv.lock"],
+    }
+
+
+def test_run_setup_skips_unchanged_setup(
+    tmp_path: Path, chdir, capsys: pytest.CaptureFixture[str]
+) -> None:
+    """Set up with unchanged inputs runs again only when forced or changed."""
+    chdir(tmp_path)
+    front_matter = _setup_with_inputs(tmp_path)
+    stamps = tmp_path / "stamps"
+    run_setup(front_matter, stamp_directory=stamps)
+    run_setup(front_matter, stamp_directory=stamps)
+    assert (tmp_path / "runs.txt").read_text().count("run") == 1
+    assert "Skipped 1 unchanged set up command(s)" in capsys.readouterr().out
+    run_setup(front_matter, force=True, stamp_directory=stamps)
+    (tmp_path / "uv.lock").write_text("version 2")
+    run_setup(front_matter, verbose=True, stamp_directory=stamps)
+    assert (tmp_path / "runs.txt").read_text().count(
+        "run"
+    ) == RUNS_AFTER_CHANGE
+    assert "because the setup_inputs changed" in capsys.readouterr().out
+
+
+def test_run_setup_does_not_stamp_failing_setup(tmp_path: Path, chdir) -> None:
+    """A failing set up command runs again on the next run."""
+    chdir(tmp_path)
+    front_matter = _setup_with_inputs(tmp_path)
+    front_matter["setup"] += "\nfalse"
+    stamps = tmp_path / "stamps"
+    for _ in range(2):
+        with pytest.raises(Exit):
+            run_setup(front_matter, stamp_directory=stamps)
+    assert (tmp_path / "runs.txt").read_text().count("run") == 1
+
+
+def test_run_setup_with_invalid_setup_inputs() -> None:
+    """Setup inputs that are not strings are a configuration error."""
+    with pytest.raises(ValueError) as exc_info:
+        run_setup({"setup": "echo 'Hello'", "setup_inputs": [3]})
+    assert "setup_inputs" in str(exc_info.value)
+
+
+def _wait_for_command(create: str, wait_for: str) -> str:
+    """Return a command that creates a file and waits for another one."""
+    return (
+        f"python -c \"import os, time; open('{create}', 'w').close();"
+        f" [time.sleep(0.05) for _ in range(200) if not os.path.exists('{wait_for}')];"
+        f" raise SystemExit(0 if os.path.exists('{wait_for}') else 1)\""
+    )
+
+
+def test_run_setup_runs_parallel_group_at_the_same_time(
+    tmp_path: Path, chdir, capsys: pytest.CaptureFixture[str]
+) -> None:
+    """The commands of a parallel group can wait for each other."""
+    chdir(tmp_path)
+    front_matter = {
+        "setup": [
+            "echo first",
+            {
+                "commands": [
+                    _wait_for_command("a.txt", "b.txt"),
+                    _wait_for_command("b.txt", "a.txt"),
+                ],
+                "parallel": True,
+            },
+            "echo last",
+        ]
+    }
+    run_setup(front_matter)
+    out = capsys.readouterr().out
+    # run one after another, the first command would give up and fail
+    assert out.index("first") < out.index("last")
+
+
+def test_run_setup_streams_output_and_shows_tail_on_failure(
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    """The failure message ends with the last lines of the failed command."""
+    front_matter = {
+        "setup": [
+            "python -c \"for i in range(100): print(f'line {i}')\"; exit 2"
+        ]
+    }
+    with pytest.raises(Exit):
+        run_setup(front_matter)
+    out = capsys.readouterr().out
+    # every line streams once, and only the tail repeats in the failure
+    assert out.count("line 0\n") == 1
+    assert out.count("line 99\n") == 2  # noqa: PLR2004
+    assert "failed" in out
+
+
+def test_setup_output_labels_lines_and_bounds_tail() -> None:
+    """Labelled output is split into lines and the tail stays bounded."""
+    output = SetupOutput("[job] ")
+    for number in range(SETUP_TAIL_LINES * 2):
+        output.write(f"line {number}\n".encode())
+    output.capture.close()
+    lines = output.tail().splitlines()
+    assert len(lines) == SETUP_TAIL_LINES
+    assert lines[-1] == f"line {SETUP_TAIL_LINES * 2 - 1}"
+
+
+@pytest.mark.parametrize(
+    "setup",
+    [
+        {"echo": "hello"},
+        ["echo 'Hello'", {"parallel": True}],
+        [{"commands": "echo 'Hello'", "parallel": "yes"}],
+        [{"commands": [3]}],
+    ],
+)
+def test_run_setup_with_invalid_setup_form(setup: Any) -> None:
+    """Setup that is not commands or groups of them is a configuration error."""
+    with pytest.raises(ValueError) as exc_info:
+        run_setup({"setup": setup})
+    assert "Configuration error" in str(exc_info.value)
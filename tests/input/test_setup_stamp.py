@@ -0,0 +1,103 @@
+"""Test suite for setup_stamp.py."""
+
+from pathlib import Path
+
+from gatorgrade.input.setup_stamp import (
+    COMMANDS_CHANGED_REASON,
+    EARLIER_STEP_REASON,
+    FIRST_RUN_REASON,
+    FORCED_REASON,
+    INPUTS_CHANGED_REASON,
+    NO_INPUTS_REASON,
+    UNCHANGED_REASON,
+    load_setup_stamp,
+    plan_setup_steps,
+    save_setup_stamp,
+    setup_inputs_fingerprint,
+)
+
+COMMANDS = ["uv sync", "npm ci"]
+
+
+def _stamp_of(commands: list[str], fingerprint: str) -> dict[str, str]:
+    """Return the stamp of set up commands that all succeeded."""
+    return {
+        step.digest: fingerprint
+        for step in plan_setup_steps(commands, fingerprint, {})
+    }
+
+
+def test_plan_setup_steps_runs_everything_the_first_time() -> None:
+    """Without a stamp, every set up command runs."""
+    steps = plan_setup_steps(COMMANDS, "inputs", {})
+    assert [step.command for step in steps] == COMMANDS
+    assert [step.run for step in steps] == [True, True]
+    assert [step.reason for step in steps] == [
+        FIRST_RUN_REASON,
+        EARLIER_STEP_REASON,
+    ]
+
+
+def test_plan_setup_steps_skips_unchanged_commands() -> None:
+    """A matching stamp skips every set up command."""
+    steps = plan_setup_steps(COMMANDS, "inputs", _stamp_of(COMMANDS, "inputs"))
+    assert [step.run for step in steps] == [False, False]
+    assert {step.reason for step in steps} == {UNCHANGED_REASON}
+
+
+def test_plan_setup_steps_reruns_after_a_change() -> None:
+    """Changed inputs or commands run the commands that they affect."""
+    stamp = _stamp_of(COMMANDS, "inputs")
+    changed_inputs = plan_setup_steps(COMMANDS, "other inputs", stamp)
+    assert [step.reason for step in changed_inputs] == [
+        INPUTS_CHANGED_REASON,
+        EARLIER_STEP_REASON,
+    ]
+    changed_command = plan_setup_steps(
+        ["uv sync", "npm install"], "inputs", stamp
+    )
+    assert [step.run for step in changed_command] == [False, True]
+    assert changed_command[1].reason == COMMANDS_CHANGED_REASON
+
+
+def test_plan_setup_steps_without_inputs_or_with_force() -> None:
+    """Set up commands always run without inputs and when forced."""
+    stamp = _stamp_of(COMMANDS, "inputs")
+    assert {
+        step.reason for step in plan_setup_steps(COMMANDS, None, stamp)
+    } == {NO_INPUTS_REASON}
+    forced = plan_setup_steps(COMMANDS, "inputs", stamp, force=True)
+    assert {step.reason for step in forced} == {FORCED_REASON}
+    assert all(step.run for step in forced)
+
+
+def test_setup_stamp_round_trip(tmp_path: Path) -> None:
+    """A saved stamp loads again for the same directory only."""
+    stamp = _stamp_of(COMMANDS, "inputs")
+    save_setup_stamp(stamp, "project", tmp_path)
+    assert load_setup_stamp("project", tmp_path) == stamp
+    assert load_setup_stamp("other project", tmp_path) == {}
+    assert not list(tmp_path.glob(".*.tmp"))
+
+
+def test_load_setup_stamp_ignores_unreadable_stamps(tmp_path: Path) -> None:
+    """A damaged stamp or one of another schema counts as no stamp."""
+    save_setup_stamp({"digest": "inputs"}, "project", tmp_path)
+    (stamp_path,) = tmp_path.iterdir()
+    for content in ("not json", "[]", '{"stamp_schema_version": 0}'):
+        stamp_path.write_text(content)
+        assert load_setup_stamp("project", tmp_path) == {}
+
+
+def test_setup_inputs_fingerprint_follows_file_content(
+    tmp_path: Path, chdir
+) -> None:
+    """The fingerprint changes with the content of the input files."""
+    chdir(tmp_path)
+    assert setup_inputs_fingerprint([]) is None
+    lock_file = tmp_path / "uv.lock"
+    lock_file.write_text("first")
+    first = setup_inputs_fingerprint(["uv.lock"])
+    assert setup_inputs_fingerprint(["uv.lock"]) == first
+    lock_file.write_text("second")
+    assert setup_inputs_fingerprint(["uv.lock"]) != first
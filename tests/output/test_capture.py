@@ -0,0 +1,90 @@
+"""Test suite for capture.py."""
+
+import os
+
+from hypothesis import given
+from hypothesis import strategies as st
+
+from gatorgrade.output.capture import BoundedCapture
+
+HEAD_BYTES = 8
+TAIL_BYTES = 8
+
+
+def test_bounded_capture_keeps_short_output_whole() -> None:
+    """Output that fits in the head and tail is kept without a marker."""
+    capture = BoundedCapture(HEAD_BYTES, TAIL_BYTES)
+    capture.write(b"one\ntwo\n")
+    capture.write(b"three")
+    capture.close()
+    assert capture.getvalue() == b"one\ntwo\nthree"
+    assert capture.total_lines == 3  # noqa: PLR2004
+    assert capture.total_bytes == len(b"one\ntwo\nthree")
+    assert capture.omitted_bytes == 0
+
+
+def test_bounded_capture_keeps_head_and_tail_of_long_output() -> None:
+    """Long output keeps its start and end and counts what was left out."""
+    capture = BoundedCapture(HEAD_BYTES, TAIL_BYTES)
+    lines = [f"line {number}\n".encode() for number in range(1000)]
+    for line in lines:
+        capture.write(line)
+    capture.close()
+    value = capture.getvalue()
+    assert value.startswith(b"".join(lines)[:HEAD_BYTES])
+    assert value.endswith(b"999\n")
+    assert b"of output omitted" in value
+    assert capture.total_lines == len(lines)
+    assert capture.total_bytes == sum(len(line) for line in lines)
+    assert capture.omitted_bytes > 0
+
+
+def test_bounded_capture_handles_chunk_longer_than_tail() -> None:
+    """A single large chunk replaces the tail with its own last bytes."""
+    capture = BoundedCapture(HEAD_BYTES, TAIL_BYTES)
+    data = b"x\n" * 100
+    capture.write(data)
+    assert capture.getvalue().endswith(data[-TAIL_BYTES:])
+    assert capture.omitted_bytes == len(data) - HEAD_BYTES - TAIL_BYTES
+    assert capture.omitted_lines == capture.omitted_bytes // 2
+
+
+@given(st.lists(st.binary(max_size=50), max_size=50))
+def test_bounded_capture_memory_stays_bounded_property(
+    chunks: list[bytes],
+) -> None:
+    """Property: the kept output never exceeds the head and twice the tail."""
+    capture = BoundedCapture(HEAD_BYTES, TAIL_BYTES)
+    for chunk in chunks:
+        capture.write(chunk)
+        kept = capture.total_bytes - capture.omitted_bytes
+        assert kept <= HEAD_BYTES + 2 * TAIL_BYTES
+    data = b"".join(chunks)
+    assert capture.total_bytes == len(data)
+    if capture.omitted_bytes == 0:
+        assert capture.getvalue() == data
+
+
+def test_bounded_capture_spills_full_output_when_omitted() -> None:
+    """The full output is kept in a log file when some of it was omitted."""
+    capture = BoundedCapture(HEAD_BYTES, TAIL_BYTES, spill=True)
+    data = b"0123456789\n" * 10
+    capture.write(data)
+    capture.close()
+    assert capture.log_path is not None
+    try:
+        with open(capture.log_path, "rb") as log_file:
+            assert log_file.read() == data
+    finally:
+        os.unlink(capture.log_path)
+
+
+def test_bounded_capture_removes_log_when_nothing_omitted() -> None:
+    """No log file is left behind when all of the output was kept."""
+    capture = BoundedCapture(HEAD_BYTES, TAIL_BYTES, spill=True)
+    capture.write(b"short")
+    log_path = capture.log_path
+    capture.close()
+    assert log_path is not None
+    assert capture.log_path is None
+    assert not os.path.exists(log_path)
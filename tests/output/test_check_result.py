@@ -1,11 +1,22 @@
 """Test suite for check_result.py."""
 
+import sys
+import tracemalloc
+from typing import Any, Callable, List, Tuple
+
 import pytest
 from hypothesis import given
 from hypothesis import strategies as st
 
+from gatorgrade.input.checks import GatorGraderCheck, PytestCheck, ShellCheck
 from gatorgrade.output.check_result import CheckResult
 
+# the number of checks in a batch of 400 repositories with 150 checks each,
+# and how much more than the size of their objects a check and its result
+# may take together, which leaves room for the rounding of the allocator
+BATCH_CHECKS = 400 * 150
+MEMORY_BUDGET_MARGIN = 1.25
+
 
 def test_check_result_str_method_without_diagnostic() -> None:
     """Test the __str__ method for a passing CheckResult."""
@@ -311,3 +322,150 @@ def test_check_result_passing_hint_not_shown() -> None:
     )
     result = check_result.display_result(show_diagnostic=True)
     assert "This should not appear" not in result
+
+
+def test_check_result_display_result_for_skipped_check() -> None:
+    """Test that a skipped CheckResult uses its own icon and color."""
+    check_result = CheckResult(
+        passed=False,
+        description="Test skipped",
+        json_info={"check": "test"},
+        diagnostic="Skipped because a check it depends on did not pass: build",
+        skipped=True,
+    )
+    result_str = check_result.display_result(show_diagnostic=True)
+    assert "↷" in result_str
+    assert "✕" not in result_str
+    assert "[yellow]" in result_str
+    assert "build" in result_str
+
+
+def test_check_result_display_result_for_not_run_check() -> None:
+    """Test that a not-run CheckResult uses its own icon and color."""
+    check_result = CheckResult(
+        passed=False,
+        description="Test not run",
+        json_info={"check": "test"},
+        not_run=True,
+    )
+    result_str = check_result.display_result()
+    assert "○" in result_str
+    assert "✕" not in result_str
+    assert "[dim]" in result_str
+
+
+def test_check_result_stores_raw_diagnostic_only_when_it_differs() -> None:
+    """A raw diagnostic equal to the diagnostic is not stored twice."""
+    check_result = CheckResult(
+        passed=False,
+        description="Test",
+        json_info={},
+        diagnostic="short",
+        raw_diagnostic="short",
+    )
+    assert check_result.raw_diagnostic == "short"
+    assert check_result._raw_diagnostic is None
+    check_result.raw_diagnostic = "short\nand long"
+    assert check_result.raw_diagnostic == "short\nand long"
+    check_result.raw_diagnostic = ""
+    assert check_result.raw_diagnostic == ""
+
+
+def test_check_result_shares_json_info_with_its_check() -> None:
+    """A result refers to the json_info of its check instead of a copy."""
+    json_info = {"description": "Test", "command": "true"}
+    check = ShellCheck(command="true", json_info=json_info)
+    check_result = CheckResult(
+        passed=True, description="Test", json_info=check.json_info
+    )
+    assert check_result.json_info is json_info
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        ShellCheck(command="true"),
+        GatorGraderCheck(gg_args=["MatchFileFragment"], json_info={}),
+        PytestCheck(nodeid="tests/test_main.py"),
+        CheckResult(passed=True, description="Test", json_info={}),
+    ],
+)
+def test_checks_and_results_have_no_instance_dictionary(value: object) -> None:
+    """Checks and results keep their attributes in slots."""
+    assert not hasattr(value, "__dict__")
+    with pytest.raises(AttributeError):
+        value.misspelled_attribute = True  # type: ignore[attr-defined]
+
+
+class _UnslottedCopy:
+    """An object with the same attributes as another, kept in a dict."""
+
+    def __init__(self, source: Any) -> None:
+        """Copy every slot of the source into the dict of the object."""
+        for name in type(source).__slots__:
+            setattr(self, name, getattr(source, name, None))
+
+
+def _shell_check_and_result(json_info: dict) -> Tuple[Any, Any]:
+    """Create a failing shell check and its result, sharing json_info."""
+    check = ShellCheck(command="true", json_info=json_info, check_id="id")
+    result = CheckResult(
+        passed=False,
+        description=check.description,
+        json_info=check.json_info,
+        diagnostic="fail",
+        raw_diagnostic="fail",
+        check_id=check.check_id,
+    )
+    return check, result
+
+
+def _unslotted_check_and_result(json_info: dict) -> Tuple[Any, Any]:
+    """Create the same check and result with their attributes in dicts."""
+    check, result = _shell_check_and_result(json_info)
+    return _UnslottedCopy(check), _UnslottedCopy(result)
+
+
+def _memory_per_check(create: Callable[[dict], Tuple[Any, Any]]) -> float:
+    """Return the bytes that a batch of checks and results takes per check."""
+    json_info = {"description": "Test", "command": "true"}
+    tracemalloc.start()
+    try:
+        start, _ = tracemalloc.get_traced_memory()
+        batch: List[Tuple[Any, Any]] = [
+            create(json_info) for _ in range(BATCH_CHECKS)
+        ]
+        used, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    assert len(batch) == BATCH_CHECKS
+    return (used - start) / BATCH_CHECKS
+
+
+def _own_size(value: Any, shared: object) -> int:
+    """Return the size of an object and of the lists and dicts it owns."""
+    size = sys.getsizeof(value)
+    for name in type(value).__slots__:
+        attribute = getattr(value, name, None)
+        if isinstance(attribute, (list, dict)) and attribute is not shared:
+            size += sys.getsizeof(attribute)
+    return size
+
+
+def test_checks_and_results_stay_within_memory_budget() -> None:
+    """A batch of checks and their results takes no more than their objects.
+
+    The budget is measured on the running interpreter, since the size of
+    an object differs between versions of Python and platforms.
+    """
+    json_info = {"description": "Test", "command": "true"}
+    check, result = _shell_check_and_result(json_info)
+    # every check and result is also kept in a tuple of the batch
+    expected = (
+        _own_size(check, json_info)
+        + _own_size(result, json_info)
+        + sys.getsizeof((check, result))
+    )
+    slotted = _memory_per_check(_shell_check_and_result)
+    assert slotted <= expected * MEMORY_BUDGET_MARGIN
+    assert slotted < _memory_per_check(_unslotted_check_and_result)
@@ -0,0 +1,215 @@
+"""Test suite for command_cache.py."""
+
+import asyncio
+import subprocess
+import threading
+import time
+from pathlib import Path
+from typing import List
+
+import gator.run
+import pytest
+
+from gatorgrade.input.checks import GatorGraderCheck, ShellCheck
+from gatorgrade.output import output
+from gatorgrade.output.command_cache import (
+    CommandResultCache,
+    GatorCommandRun,
+    serving_command_runs,
+)
+from gatorgrade.output.executor import CommandOutcome
+
+# a command that records every time that it runs in a file
+COUNTING_COMMAND = "echo run >> runs.txt && echo 'tests passed'"
+
+
+def _fragment_check(fragment: str) -> GatorGraderCheck:
+    """Build a GatorGrader check of a fragment in the counting command."""
+    return GatorGraderCheck(
+        gg_args=[
+            "MatchCommandFragment",
+            "--command",
+            COUNTING_COMMAND,
+            "--fragment",
+            fragment,
+            "--count",
+            "1",
+        ],
+        json_info={},
+    )
+
+
+def _run_count(directory: Path) -> int:
+    """Return how many times the counting command ran in a directory."""
+    runs = directory / "runs.txt"
+    return runs.read_text().count("run") if runs.exists() else 0
+
+
+def test_run_gator_command_runs_each_command_once() -> None:
+    """Asking for the same command again reuses its run."""
+    calls: List[str] = []
+
+    def run(command: str) -> GatorCommandRun:
+        calls.append(command)
+        return b"out", b"", 0
+
+    cache = CommandResultCache()
+    for command in ("first", "second", "first", "first"):
+        assert cache.run_gator_command(command, run) == (b"out", b"", 0)
+    assert calls == ["first", "second"]
+    assert (cache.runs, cache.shares) == (2, 2)
+
+
+def test_run_gator_command_keeps_working_directories_apart(
+    tmp_path: Path, chdir
+) -> None:
+    """The same command in another working directory runs again."""
+    cache = CommandResultCache()
+    for directory in (tmp_path, tmp_path / "sub"):
+        directory.mkdir(exist_ok=True)
+        chdir(directory)
+        cache.run_gator_command("echo run >> runs.txt")
+    assert _run_count(tmp_path) == _run_count(tmp_path / "sub") == 1
+
+
+def test_run_gator_command_waits_for_a_run_in_progress() -> None:
+    """Threads that need a command that is running share that run."""
+    calls: List[str] = []
+
+    def run(command: str) -> GatorCommandRun:
+        calls.append(command)
+        time.sleep(0.2)
+        return b"slow", b"", 0
+
+    cache = CommandResultCache()
+    results: List[GatorCommandRun] = []
+    threads = [
+        threading.Thread(
+            target=lambda: results.append(cache.run_gator_command("c", run))
+        )
+        for _ in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert calls == ["c"]
+    assert results == [(b"slow", b"", 0)] * 4
+
+
+def test_run_gator_command_shares_errors() -> None:
+    """A command that cannot run fails every check that shares it."""
+
+    def run(command: str) -> GatorCommandRun:
+        raise OSError(command)
+
+    cache = CommandResultCache()
+    for _ in range(2):
+        with pytest.raises(OSError, match="broken"):
+            cache.run_gator_command("broken", run)
+    assert (cache.runs, cache.shares) == (1, 1)
+
+
+def test_run_shell_command_shares_concurrent_runs() -> None:
+    """Concurrent shell checks with the same command share one run."""
+    calls: List[str] = []
+
+    async def start() -> CommandOutcome:
+        calls.append("started")
+        await asyncio.sleep(0.1)
+        return CommandOutcome(returncode=0, output=b"done")
+
+    async def run_all() -> List:
+        cache = CommandResultCache()
+        return await asyncio.gather(
+            *(cache.run_shell_command("c", 5, start) for _ in range(3))
+        )
+
+    results = asyncio.run(run_all())
+    assert calls == ["started"]
+    assert [shared for _, shared in results] == [False, True, True]
+    assert {outcome.output for outcome, _ in results} == {b"done"}
+
+
+def test_run_shell_command_times_out_only_the_waiting_check() -> None:
+    """A check that cannot wait as long as the run times out on its own."""
+
+    async def start() -> CommandOutcome:
+        await asyncio.sleep(0.3)
+        return CommandOutcome(returncode=0, output=b"done")
+
+    async def run_both() -> List:
+        cache = CommandResultCache()
+        owner = asyncio.ensure_future(cache.run_shell_command("c", 5, start))
+        await asyncio.sleep(0)
+        with pytest.raises(subprocess.TimeoutExpired):
+            await cache.run_shell_command("c", 0.05, start)
+        return await owner
+
+    outcome, shared = asyncio.run(run_both())
+    assert outcome.output == b"done"
+    assert not shared
+
+
+def test_serving_command_runs_restores_gatorgrader() -> None:
+    """GatorGrader reuses the given runs only inside of the block."""
+    run_command = gator.run.run_command
+    with serving_command_runs({"given": (b"given output", b"", 0)}):
+        assert gator.run.run_command("given") == (b"given output", b"", 0)
+        output_bytes, _, returncode = gator.run.run_command("echo other")
+        assert (output_bytes.strip(), returncode) == (b"other", 0)
+    assert gator.run.run_command is run_command
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_iter_check_results_runs_shared_gatorgrader_command_once(
+    jobs: int, tmp_path: Path, chdir
+) -> None:
+    """GatorGrader checks of one command run it once, in any number of jobs."""
+    chdir(tmp_path)
+    checks = [
+        _fragment_check(fragment)
+        for fragment in ("tests passed", "tests failed", "passed")
+    ]
+    results = list(
+        output._iter_check_results(
+            checks, jobs=jobs, command_cache=CommandResultCache()
+        )
+    )
+    assert [result.passed for result in results] == [True, False, True]
+    assert _run_count(tmp_path) == 1
+
+
+def test_iter_check_results_runs_shared_shell_command_once(
+    tmp_path: Path, chdir
+) -> None:
+    """Shell checks of one command run it once and report each check."""
+    chdir(tmp_path)
+    checks = [
+        ShellCheck(command=COUNTING_COMMAND, description=f"check {number}")
+        for number in range(3)
+    ]
+    cache = CommandResultCache()
+    results = list(
+        output._iter_check_results(checks, jobs=3, command_cache=cache)
+    )
+    assert [result.description for result in results] == [
+        "check 0",
+        "check 1",
+        "check 2",
+    ]
+    assert all(result.passed for result in results)
+    assert _run_count(tmp_path) == 1
+    assert (cache.runs, cache.shares) == (1, 2)
+
+
+def test_iter_check_results_without_command_cache_runs_every_command(
+    tmp_path: Path, chdir
+) -> None:
+    """Without a command cache, every check runs its own command."""
+    chdir(tmp_path)
+    checks = [ShellCheck(command=COUNTING_COMMAND) for _ in range(2)] + [
+        _fragment_check("tests passed")
+    ]
+    list(output._iter_check_results(checks))
+    assert _run_count(tmp_path) == len(checks)
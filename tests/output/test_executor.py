@@ -0,0 +1,217 @@
+"""Test suite for executor.py."""
+
+import asyncio
+import os
+import signal
+import subprocess
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from gatorgrade.output import executor
+from gatorgrade.output.executor import (
+    HAS_WAIT4,
+    CommandOutcome,
+    background_event_loop,
+    run_shell_command,
+)
+
+# cross-platform shell commands for testing the executor
+PASSING_CMD = "python -c \"print('hello')\""
+MIXED_STREAMS_CMD = (
+    "python -c \"import sys; print('out', flush=True);"
+    " print('err', file=sys.stderr, flush=True); sys.exit(3)\""
+)
+SLOW_CMD = (
+    "python -c \"import time; print('started', flush=True); time.sleep(30)\""
+)
+EXIT_CODE_THREE = 3
+EXIT_CODE_FOUR = 4
+COMMAND_NOT_FOUND_EXIT_CODE = 127
+
+
+def test_run_shell_command_captures_output() -> None:
+    """A successful command returns a zero exit code and its output."""
+    outcome = asyncio.run(run_shell_command(PASSING_CMD))
+    assert isinstance(outcome, CommandOutcome)
+    assert outcome.returncode == 0
+    assert outcome.output.strip() == b"hello"
+
+
+def test_run_shell_command_combines_stdout_and_stderr() -> None:
+    """Stdout and stderr are captured together along with the exit code."""
+    outcome = asyncio.run(run_shell_command(MIXED_STREAMS_CMD))
+    assert outcome.returncode == EXIT_CODE_THREE
+    assert b"out" in outcome.output
+    assert b"err" in outcome.output
+
+
+def test_run_shell_command_timeout_keeps_partial_output() -> None:
+    """A command that times out is killed and its partial output is kept."""
+    start = time.monotonic()
+    with pytest.raises(subprocess.TimeoutExpired) as exc_info:
+        asyncio.run(run_shell_command(SLOW_CMD, timeout=1))
+    assert time.monotonic() - start < 10  # noqa: PLR2004
+    assert exc_info.value.output is not None
+    assert b"started" in exc_info.value.output
+
+
+def test_run_shell_command_many_commands_share_one_loop() -> None:
+    """Many commands run concurrently inside of a single event loop."""
+
+    async def run_all() -> list[CommandOutcome]:
+        return await asyncio.gather(
+            *(run_shell_command(PASSING_CMD) for _ in range(10))
+        )
+
+    outcomes = asyncio.run(run_all())
+    assert all(outcome.returncode == 0 for outcome in outcomes)
+
+
+def test_background_event_loop_cancels_running_commands() -> None:
+    """Leaving the loop context cancels commands that are still running."""
+    start = time.monotonic()
+    with background_event_loop() as loop:
+        future = asyncio.run_coroutine_threadsafe(
+            run_shell_command(SLOW_CMD), loop
+        )
+        time.sleep(0.2)
+    assert future.cancelled()
+    assert time.monotonic() - start < 10  # noqa: PLR2004
+
+
+@pytest.mark.skipif(not hasattr(os, "killpg"), reason="needs process groups")
+def test_run_shell_command_timeout_kills_whole_process_group(
+    tmp_path: Path,
+) -> None:
+    """A timeout kills the processes that the command started in the background."""
+    marker = tmp_path / "marker.txt"
+    grandchild = (
+        'python -c "import pathlib, time; time.sleep(1.5);'
+        f" pathlib.Path(r'{marker}').write_text('alive')\""
+    )
+    with pytest.raises(subprocess.TimeoutExpired):
+        asyncio.run(run_shell_command(f"{grandchild} & sleep 30", timeout=0.5))
+    time.sleep(2)
+    assert not marker.exists()
+
+
+def test_run_shell_command_bounds_captured_output() -> None:
+    """A command that writes a lot of output only has its ends kept."""
+    line_count = 200_000
+    command = f"python -c \"import sys; sys.stdout.write('abcdefghi\\n' * {line_count})\""
+    outcome = asyncio.run(run_shell_command(command))
+    assert outcome.returncode == 0
+    assert outcome.byte_count == line_count * 10
+    assert outcome.line_count == line_count
+    assert outcome.omitted_bytes > 0
+    assert len(outcome.output) < outcome.byte_count // 4
+    assert outcome.log_path is None
+
+
+@pytest.mark.skipif(not HAS_WAIT4, reason="needs os.wait4")
+def test_run_shell_command_reports_resource_usage() -> None:
+    """A command that burns CPU and memory reports how much it used."""
+    command = (
+        'python -c "data = bytearray(64 * 1024 * 1024);'
+        ' total = sum(range(3_000_000))"'
+    )
+    outcome = asyncio.run(run_shell_command(command))
+    assert outcome.returncode == 0
+    assert outcome.usage is not None
+    assert outcome.usage.user_time + outcome.usage.system_time > 0
+    assert outcome.usage.peak_rss_kib >= 64 * 1024
+
+
+@pytest.mark.skipif(not HAS_WAIT4, reason="needs os.wait4")
+def test_run_shell_command_reports_peak_memory_of_the_command_alone() -> None:
+    """The peak memory of a small command does not grow with GatorGrade."""
+    before = asyncio.run(run_shell_command("true", argv=["true"]))
+    # touch every page so that all of them count as resident memory
+    ballast = bytearray(256 * 1024 * 1024)
+    ballast[::4096] = b"\x01" * len(range(0, len(ballast), 4096))
+    after = asyncio.run(run_shell_command("true", argv=["true"]))
+    assert before.usage is not None and after.usage is not None
+    assert abs(after.usage.peak_rss_kib - before.usage.peak_rss_kib) < 8 * 1024
+    assert after.usage.peak_rss_kib < len(ballast) // 1024 // 4
+    del ballast
+
+
+@pytest.mark.skipif(not HAS_WAIT4, reason="needs os.wait4")
+def test_run_shell_command_reports_exit_code_of_killed_command() -> None:
+    """A command that is killed by a signal reports a negative exit code."""
+    outcome = asyncio.run(run_shell_command("kill -9 $$"))
+    assert outcome.returncode == -signal.SIGKILL
+
+
+@pytest.mark.skipif(not HAS_WAIT4, reason="needs os.wait4")
+def test_run_shell_command_reaps_without_a_thread_per_command() -> None:
+    """Many running commands are reaped by at most one shared thread."""
+    threads_before = threading.active_count()
+    peak_threads = threads_before
+
+    async def run_all() -> list:
+        nonlocal peak_threads
+        commands = [
+            asyncio.ensure_future(
+                run_shell_command(
+                    f'python -c "import time; time.sleep(0.3); exit({index})"'
+                )
+            )
+            for index in range(8)
+        ]
+        while not all(command.done() for command in commands):
+            peak_threads = max(peak_threads, threading.active_count())
+            await asyncio.sleep(0.01)
+        return [command.result() for command in commands]
+
+    outcomes = asyncio.run(run_all())
+    assert [outcome.returncode for outcome in outcomes] == list(range(8))
+    assert all(outcome.usage is not None for outcome in outcomes)
+    assert peak_threads <= threads_before + 1
+
+
+@pytest.mark.skipif(os.name != "posix", reason="needs a POSIX shell")
+def test_run_shell_command_runs_argument_list_without_a_shell() -> None:
+    """A command with an argument list runs its program like the shell does."""
+    command = "python -c \"import os, sys; print(os.getppid(), 'a b')\""
+    argv = ["python", "-c", "import os, sys; print(os.getppid(), 'a b')"]
+    direct = asyncio.run(run_shell_command(command, argv=argv))
+    through_shell = asyncio.run(run_shell_command(command))
+    assert direct.returncode == through_shell.returncode == 0
+    assert direct.output.split()[1:] == through_shell.output.split()[1:]
+    # the program is a child of the launcher, or of the test itself where
+    # there is no launcher, and not of a shell
+    parents = {os.getpid()}
+    if executor._LAUNCHER._process is not None:
+        parents.add(executor._LAUNCHER._process.pid)
+    assert int(direct.output.split()[0]) in parents
+
+
+@pytest.mark.skipif(os.name != "posix", reason="needs a POSIX shell")
+def test_run_shell_command_falls_back_to_shell_for_missing_program() -> None:
+    """A program that cannot be started is reported by the shell as usual."""
+    command = "gatorgrade-no-such-program --flag"
+    direct = asyncio.run(run_shell_command(command, argv=command.split()))
+    through_shell = asyncio.run(run_shell_command(command))
+    assert (
+        direct.returncode
+        == through_shell.returncode
+        == COMMAND_NOT_FOUND_EXIT_CODE
+    )
+    assert direct.output == through_shell.output
+
+
+@pytest.mark.skipif(os.name != "posix", reason="needs a POSIX shell")
+def test_run_shell_command_falls_back_to_shell_for_plain_scripts(
+    tmp_path: Path,
+) -> None:
+    """An executable script without a "#!" line still runs in the shell."""
+    script = tmp_path / "check.sh"
+    script.write_text("echo from script\nexit 4\n")
+    script.chmod(0o755)
+    outcome = asyncio.run(run_shell_command(str(script), argv=[str(script)]))
+    assert outcome.returncode == EXIT_CODE_FOUR
+    assert outcome.output.strip() == b"from script"
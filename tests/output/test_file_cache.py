@@ -0,0 +1,143 @@
+"""Test suite for file_cache.py."""
+
+import os
+from pathlib import Path
+from typing import List
+
+import gator
+import gator.files
+import pytest
+
+from gatorgrade.input.checks import GatorGraderCheck
+from gatorgrade.output import file_cache as file_cache_module
+from gatorgrade.output import output
+from gatorgrade.output.file_cache import FileContentCache, reading_through
+from gatorgrade.output.gg_pool import GatorGraderPool
+
+
+def _fragment_args(directory: Path, fragment: str) -> List[str]:
+    """Build the arguments of a check for a fragment in a test file."""
+    return [
+        "MatchFileFragment",
+        "--fragment",
+        fragment,
+        "--count",
+        "1",
+        "--directory",
+        str(directory),
+        "--file",
+        "notes.txt",
+    ]
+
+
+def test_file_cache_reads_an_unchanged_file_once(tmp_path: Path) -> None:
+    """Reading an unchanged file again is a hit that returns the same text."""
+    notes = tmp_path / "notes.txt"
+    notes.write_text("TODO: one\n", encoding="utf-8")
+    cache = FileContentCache()
+    first = cache.read_text(notes, encoding="utf-8")
+    second = cache.read_text(notes, encoding="utf-8")
+    assert first == second == "TODO: one\n"
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_file_cache_rereads_a_file_that_changed(tmp_path: Path) -> None:
+    """A file whose size or modification time changed is read again."""
+    notes = tmp_path / "notes.txt"
+    notes.write_text("before\n", encoding="utf-8")
+    cache = FileContentCache()
+    assert cache.read_text(notes, encoding="utf-8") == "before\n"
+    notes.write_text("after, and longer\n", encoding="utf-8")
+    assert cache.read_text(notes, encoding="utf-8") == "after, and longer\n"
+    # same size, but a different modification time
+    notes.write_text("AFTER, and longer\n", encoding="utf-8")
+    status = notes.stat()
+    os.utime(notes, ns=(status.st_atime_ns, status.st_mtime_ns + 10**9))
+    assert cache.read_text(notes, encoding="utf-8") == "AFTER, and longer\n"
+    assert (cache.hits, cache.misses) == (0, 3)
+
+
+def test_file_cache_stores_equal_content_once(tmp_path: Path) -> None:
+    """Two files with the same content share one stored copy."""
+    for name in ("first.txt", "second.txt"):
+        (tmp_path / name).write_bytes(b"same")
+    cache = FileContentCache()
+    first_digest, first = cache.read_bytes(tmp_path / "first.txt")
+    second_digest, second = cache.read_bytes(tmp_path / "second.txt")
+    assert first_digest == second_digest
+    assert first is second
+
+
+@pytest.mark.parametrize(
+    "content", [b"one\r\ntwo\rthree\n", b"caf\xc3\xa9\n", b""]
+)
+def test_file_cache_matches_path_read_text(
+    content: bytes, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """The cache decodes files just like Path.read_text, mapped or not."""
+    notes = tmp_path / "notes.txt"
+    notes.write_bytes(content)
+    for threshold in (1, file_cache_module.MMAP_THRESHOLD_BYTES):
+        monkeypatch.setattr(
+            file_cache_module, "MMAP_THRESHOLD_BYTES", threshold
+        )
+        text = FileContentCache().read_text(notes, encoding="utf-8")
+        assert text == notes.read_text(encoding="utf-8")
+
+
+def test_file_cache_raises_like_path_read_text(tmp_path: Path) -> None:
+    """Missing files and undecodable content raise the usual errors."""
+    cache = FileContentCache()
+    with pytest.raises(FileNotFoundError):
+        cache.read_text(tmp_path / "missing.txt", encoding="utf-8")
+    (tmp_path / "binary.bin").write_bytes(b"\xff\xfe\xfa")
+    with pytest.raises(UnicodeDecodeError):
+        cache.read_text(tmp_path / "binary.bin", encoding="utf-8")
+
+
+def test_reading_through_restores_gatorgrader(tmp_path: Path) -> None:
+    """GatorGrader reads through the cache only inside of the block."""
+    (tmp_path / "notes.txt").write_text("TODO\n", encoding="utf-8")
+    create_paths = gator.files.create_paths
+    cache = FileContentCache()
+    with reading_through(cache):
+        for fragment in ("TODO", "DONE", "TODO"):
+            gator.grader(_fragment_args(tmp_path, fragment))
+    assert gator.files.create_paths is create_paths
+    assert (cache.hits, cache.misses) == (2, 1)
+    gator.grader(_fragment_args(tmp_path, "TODO"))
+    assert (cache.hits, cache.misses) == (2, 1)
+
+
+def test_iter_check_results_shares_file_reads_of_gatorgrader_checks(
+    tmp_path: Path,
+) -> None:
+    """GatorGrader checks of one file read it once, in any number of jobs."""
+    (tmp_path / "notes.txt").write_text("TODO\n", encoding="utf-8")
+    checks = [
+        GatorGraderCheck(
+            gg_args=_fragment_args(tmp_path, fragment), json_info={}
+        )
+        for fragment in ("TODO", "DONE", "TODO", "TODO")
+    ]
+    serial_cache = FileContentCache()
+    serial = list(output._iter_check_results(checks, file_cache=serial_cache))
+    assert (serial_cache.hits, serial_cache.misses) == (3, 1)
+    pooled_cache = FileContentCache()
+    pooled = list(
+        output._iter_check_results(checks, jobs=2, file_cache=pooled_cache)
+    )
+    assert pooled_cache.hits + pooled_cache.misses == len(checks)
+    assert [result.passed for result in pooled] == [
+        result.passed for result in serial
+    ]
+
+
+def test_gatorgrader_pool_records_worker_cache_counts(tmp_path: Path) -> None:
+    """The hits and misses of the workers are added to the run's cache."""
+    (tmp_path / "notes.txt").write_text("TODO\n", encoding="utf-8")
+    cache = FileContentCache()
+    with GatorGraderPool(1, file_cache=cache) as pool:
+        for fragment in ("TODO", "DONE"):
+            pool.grade(_fragment_args(tmp_path, fragment))
+    assert (cache.hits, cache.misses) == (1, 1)
@@ -0,0 +1,191 @@
+"""Test suite for gg_pool.py."""
+
+import time
+from pathlib import Path
+from typing import Any, List
+
+import gator
+import pytest
+
+from gatorgrade.input.checks import GatorGraderCheck
+from gatorgrade.output import output
+from gatorgrade.output.gg_pool import GatorGraderPool
+
+# the number of seconds that the workers of a pool may take to start
+WORKER_START_SECONDS = 60
+WORKERS = 2
+
+
+def _fragment_args(directory: Path, count: int) -> List[str]:
+    """Build the arguments of a check for a fragment in a test file."""
+    return [
+        "MatchFileFragment",
+        "--fragment",
+        "TODO",
+        "--count",
+        str(count),
+        "--exact",
+        "--directory",
+        str(directory),
+        "--file",
+        "notes.txt",
+    ]
+
+
+@pytest.fixture
+def notes_directory(tmp_path: Path) -> Path:
+    """Create a directory with a file that contains two fragments."""
+    (tmp_path / "notes.txt").write_text("TODO: one\nTODO: two\n")
+    return tmp_path
+
+
+def test_gatorgrader_pool_matches_in_process_results(
+    notes_directory: Path,
+) -> None:
+    """Checks graded by workers give the same tuples as gator.grader."""
+    arguments = [_fragment_args(notes_directory, count) for count in (1, 2)]
+    with GatorGraderPool(2) as pool:
+        pooled = [pool.grade(args) for args in arguments]
+    assert pooled == [tuple(gator.grader(args)) for args in arguments]
+    assert [passed for _, passed, _ in pooled] == [False, True]
+
+
+def test_gatorgrader_pool_recycles_spent_workers(
+    notes_directory: Path,
+) -> None:
+    """The workers are replaced after they ran their share of checks."""
+    args = _fragment_args(notes_directory, 2)
+    with GatorGraderPool(1, checks_per_worker=2) as pool:
+        first_executor = pool._executor
+        pool.grade(args)
+        pool.grade(args)
+        # the replacement started while the spent workers still ran
+        next_executor = pool._next_executor
+        assert next_executor is not None
+        _, passed, _ = pool.grade(args)
+        assert pool._executor is next_executor is not first_executor
+    assert passed
+
+
+def _wait_until_ready(pool: GatorGraderPool) -> None:
+    """Wait until the workers of a pool have started."""
+    deadline = time.monotonic() + WORKER_START_SECONDS
+    while not pool.ready():
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+
+
+def test_gatorgrader_pool_starts_its_workers_when_created() -> None:
+    """The workers start and import GatorGrader before any check runs."""
+    with GatorGraderPool(WORKERS) as pool:
+        assert pool._executor is not None
+        processes = pool._executor._processes  # type: ignore[attr-defined]
+        assert len(processes) == WORKERS
+        _wait_until_ready(pool)
+        assert pool._submitted == 0
+
+
+def test_gatorgrader_pool_restarts_after_worker_dies(
+    notes_directory: Path,
+) -> None:
+    """A check still runs when the workers of the pool were killed."""
+    args = _fragment_args(notes_directory, 2)
+    with GatorGraderPool(1) as pool:
+        pool.grade(args)
+        assert pool._executor is not None
+        for process in list(pool._executor._processes.values()):  # type: ignore[attr-defined]
+            process.kill()
+            process.join()
+        _, passed, _ = pool.grade(args)
+    assert passed
+
+
+def test_gatorgrader_pool_raises_gatorgrader_errors() -> None:
+    """An error raised by GatorGrader reaches the caller unchanged."""
+    with GatorGraderPool(1) as pool, pytest.raises(Exception) as exc_info:
+        pool.grade(["NoSuchCheck"])
+    assert type(exc_info.value).__name__ == "InvalidCheckError"
+
+
+def _fragment_checks(directory: Path) -> List[GatorGraderCheck]:
+    """Build GatorGrader checks for one, two, and three fragments."""
+    return [
+        GatorGraderCheck(
+            gg_args=_fragment_args(directory, count),
+            json_info={"check": "MatchFileFragment"},
+        )
+        for count in (1, 2, 3)
+    ]
+
+
+def test_iter_check_results_runs_gatorgrader_checks_in_workers(
+    notes_directory: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Parallel GatorGrader checks give the same results as serial ones."""
+    monkeypatch.setattr(output, "_gg_pool_workers", lambda count, jobs: 3)
+    checks = _fragment_checks(notes_directory)
+    graded = []
+    serial = list(output._iter_check_results(checks, jobs=1))
+    with output.start_gg_pool(checks, 3) as pool:
+        assert isinstance(pool, GatorGraderPool)
+        _wait_until_ready(pool)
+        grade = pool.grade
+
+        def spy(*args: Any) -> Any:
+            graded.append(args[0])
+            return grade(*args)
+
+        monkeypatch.setattr(pool, "grade", spy)
+        parallel = list(
+            output._iter_check_results(checks, jobs=3, gg_pool=pool)
+        )
+    assert len(graded) == len(checks)
+    assert [(r.passed, r.diagnostic) for r in serial] == [  # type: ignore
+        (r.passed, r.diagnostic)  # type: ignore
+        for r in parallel
+    ]
+
+
+def test_iter_check_results_runs_few_gatorgrader_checks_in_process(
+    notes_directory: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A few GatorGrader checks with many jobs start no worker at all."""
+
+    def no_pool(*args: Any, **kwargs: Any) -> GatorGraderPool:
+        raise AssertionError("a pool was started for a few checks")
+
+    monkeypatch.setattr(output, "GatorGraderPool", no_pool)
+    checks = _fragment_checks(notes_directory)
+    with output.start_gg_pool(checks, 4) as pool:
+        assert pool is None
+        results = list(output._iter_check_results(checks, jobs=4))
+    assert [r.passed for r in results] == [False, True, False]  # type: ignore
+
+
+def test_iter_check_results_starts_pool_once_stream_has_enough_checks(
+    notes_directory: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A stream starts its pool once it has read enough GatorGrader checks."""
+    monkeypatch.setattr(output, "MIN_POOLED_GG_CHECKS", 2)
+    monkeypatch.setattr(output.os, "cpu_count", lambda: 4)
+    started: List[int] = []
+    read: List[GatorGraderCheck] = []
+
+    class RecordingPool(GatorGraderPool):
+        def __init__(self, workers: int, **kwargs: Any) -> None:
+            started.append(len(read))
+            super().__init__(workers, **kwargs)
+
+    monkeypatch.setattr(output, "GatorGraderPool", RecordingPool)
+
+    def stream() -> Any:
+        for check in _fragment_checks(notes_directory):
+            read.append(check)
+            yield check
+
+    # the number of GatorGrader checks of a stream is not known up front
+    with output.start_gg_pool(stream(), 4) as pool:
+        assert pool is None
+    results = list(output._iter_check_results(stream(), jobs=4))
+    assert started == [2]
+    assert [r.passed for r in results] == [False, True, False]  # type: ignore
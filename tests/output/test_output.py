@@ -1,9 +1,11 @@
 """Test suite for output_functions.py."""
 
+import concurrent.futures
 import datetime
 import json
 import os
 import re
+import time
 from pathlib import Path
 from typing import Any, List, Tuple, Union
 from unittest.mock import MagicMock, patch
@@ -12,8 +14,8 @@ import pytest
 from hypothesis import given
 from hypothesis import strategies as st
 
-from gatorgrade.input.checks import GatorGraderCheck, ShellCheck
-from gatorgrade.output import output
+from gatorgrade.input.checks import GatorGraderCheck, InvalidCheck, ShellCheck
+from gatorgrade.output import executor, output
 from gatorgrade.output.check_result import CheckResult
 
 ANSI_ESCAPE_PATTERN = re.compile(r"\x1b\[[0-9;]*m")
@@ -2849,3 +2851,540 @@ def test_run_checks_generates_low_quality_hint(
         [check], report, auto_hint_engine=mock_engine, no_progress_bar=True
     )
     mock_engine.generate_hint.assert_called_once()
+
+
+def test_iter_check_results_parallel_keeps_configuration_order() -> None:
+    """Parallel execution yields results in configuration order."""
+    slow = ShellCheck(
+        description="slow",
+        command='python -c "import time; time.sleep(0.3)"',
+    )
+    fast = ShellCheck(description="fast", command='python -c "exit(0)"')
+    results = list(output._iter_check_results([slow, fast], jobs=2))
+    assert [r.description for r in results] == ["slow", "fast"]  # type: ignore
+    assert [r.run_command for r in results] == [  # type: ignore
+        slow.command,
+        fast.command,
+    ]
+
+
+def test_iter_check_results_serial_check_waits_for_earlier_checks(
+    tmp_path: Path,
+) -> None:
+    """A parallel: false check starts only after earlier checks finish."""
+    marker = tmp_path / "marker.txt"
+    writer = ShellCheck(
+        description="writer",
+        command=(
+            'python -c "import time, pathlib; time.sleep(0.3);'
+            f" pathlib.Path(r'{marker}').write_text('done')\""
+        ),
+    )
+    reader = ShellCheck(
+        description="reader",
+        command=(
+            f"python -c \"import pathlib; assert pathlib.Path(r'{marker}').exists()\""
+        ),
+        parallel=False,
+    )
+    results = list(output._iter_check_results([writer, reader], jobs=4))
+    assert all(r is not None and r.passed for r in results)
+
+
+def test_iter_check_results_serial_checks_wait_only_for_running_checks(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Running checks one after another never waits on finished checks."""
+    waited: list = []
+    wait = concurrent.futures.wait
+
+    def counting_wait(futures: Any, *args: Any, **kwargs: Any) -> Any:
+        waited.append(len(futures))
+        return wait(futures, *args, **kwargs)
+
+    monkeypatch.setattr(concurrent.futures, "wait", counting_wait)
+    checks = [
+        ShellCheck(description=f"check {index}", command="true")
+        for index in range(20)
+    ]
+    results = list(output._iter_check_results(checks))
+    assert all(r is not None and r.passed for r in results)
+    assert max(waited) <= 1
+
+
+def test_run_checks_with_jobs_reports_in_configuration_order(
+    tmp_path: Path,
+) -> None:
+    """The JSON report lists checks in configuration order with many jobs."""
+    checks: List[Union[ShellCheck, GatorGraderCheck]] = [
+        ShellCheck(
+            description=f"check {index}",
+            command=f'python -c "import time; time.sleep(0.{5 - index})"',
+            json_info={"description": f"check {index}"},
+        )
+        for index in range(5)
+    ]
+    report_path = tmp_path / "report.json"
+    status = output.run_checks(
+        checks,
+        ("FILE", "JSON", str(report_path)),
+        no_progress_bar=False,
+        jobs=5,
+    )
+    assert status is True
+    report = json.loads(report_path.read_text())
+    assert [c["description"] for c in report["checks"]] == [
+        f"check {index}" for index in range(5)
+    ]
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_iter_check_results_streams_checks(jobs: int) -> None:
+    """The first result of a stream of checks comes before the rest is read."""
+    read: List[int] = []
+
+    def checks():
+        for number in range(20):
+            read.append(number)
+            yield ShellCheck(
+                description=f"check {number}", command='python -c "exit(0)"'
+            )
+
+    results = output._iter_check_results(checks(), jobs=jobs)
+    first = next(results)
+    assert first is not None
+    assert first.description == "check 0"
+    assert len(read) <= jobs * output.CHECKS_AHEAD_PER_JOB
+    rest = list(results)
+    assert [r.description for r in rest] == [  # type: ignore
+        f"check {number}" for number in range(1, 20)
+    ]
+
+
+def test_iter_check_results_streams_checks_with_dependencies() -> None:
+    """A streamed check may depend on a check that comes after it."""
+    build = ShellCheck(
+        description="build",
+        command='python -c "exit(1)"',
+        check_id="build",
+    )
+    tests = ShellCheck(
+        description="tests",
+        command='python -c "exit(0)"',
+        check_id="tests",
+        depends_on=["lint"],
+    )
+    lint = ShellCheck(
+        description="lint", command='python -c "exit(1)"', check_id="lint"
+    )
+    results = list(
+        output._iter_check_results(iter([build, tests, lint]), jobs=2)
+    )
+    assert [r.description for r in results] == [  # type: ignore
+        "build",
+        "tests",
+        "lint",
+    ]
+    assert [r.skipped for r in results] == [False, True, False]  # type: ignore
+
+
+def test_iter_check_results_reports_invalid_check() -> None:
+    """An invalid entry fails with its configuration errors and runs nothing."""
+    invalid = InvalidCheck(
+        description="Bad", diagnostic="weight must be positive", weight=2
+    )
+    fine = ShellCheck(description="fine", command='python -c "exit(0)"')
+    first, second = output._iter_check_results(iter([invalid, fine]))
+    assert first is not None
+    assert not first.passed
+    assert first.description == "Bad"
+    assert first.diagnostic == "weight must be positive"
+    assert first.weight == 2  # noqa: PLR2004
+    assert second is not None
+    assert second.passed
+
+
+def test_iter_check_results_skips_dependents_of_failed_check() -> None:
+    """A check is skipped, without running, when a prerequisite fails."""
+    build = ShellCheck(
+        description="build", command='python -c "exit(1)"', check_id="build"
+    )
+    tests = ShellCheck(
+        description="tests",
+        command='python -c "exit(0)"',
+        check_id="tests",
+        depends_on=["build"],
+    )
+    coverage = ShellCheck(
+        description="coverage",
+        command='python -c "exit(0)"',
+        check_id="coverage",
+        depends_on=["tests"],
+    )
+    results = list(
+        output._iter_check_results([build, tests, coverage], jobs=2)
+    )
+    assert [r.skipped for r in results] == [False, True, True]  # type: ignore
+    assert all(r is not None and not r.passed for r in results)
+    assert "build" in results[1].diagnostic  # type: ignore
+    assert "tests" in results[2].diagnostic  # type: ignore
+    assert results[1].run_command == ""  # type: ignore
+
+
+def test_iter_check_results_runs_prerequisite_first(tmp_path: Path) -> None:
+    """A check runs after a prerequisite that appears later in the config."""
+    marker = tmp_path / "marker.txt"
+    reader = ShellCheck(
+        description="reader",
+        command=(
+            f"python -c \"import pathlib; assert pathlib.Path(r'{marker}').exists()\""
+        ),
+        check_id="reader",
+        depends_on=["writer"],
+    )
+    writer = ShellCheck(
+        description="writer",
+        command=(
+            'python -c "import time, pathlib; time.sleep(0.3);'
+            f" pathlib.Path(r'{marker}').write_text('done')\""
+        ),
+        check_id="writer",
+    )
+    for jobs in (1, 4):
+        marker.unlink(missing_ok=True)
+        results = list(output._iter_check_results([reader, writer], jobs=jobs))
+        assert [r.description for r in results] == ["reader", "writer"]  # type: ignore
+        assert all(r is not None and r.passed for r in results)
+
+
+def test_iter_check_results_ignores_filtered_out_prerequisite() -> None:
+    """A prerequisite that is not being run is treated as satisfied."""
+    check = ShellCheck(
+        description="tests",
+        command='python -c "exit(0)"',
+        check_id="tests",
+        depends_on=["filtered-out"],
+    )
+    results = list(output._iter_check_results([check]))
+    assert results[0] is not None
+    assert results[0].passed
+    assert not results[0].skipped
+
+
+def test_create_report_json_marks_skipped_checks() -> None:
+    """Skipped checks have a false status and a skipped outcome."""
+    failed = CheckResult(
+        passed=False, description="failed", json_info={"description": "failed"}
+    )
+    skipped = CheckResult(
+        passed=False,
+        description="skipped",
+        json_info={"description": "skipped"},
+        skipped=True,
+    )
+    report = output.create_report_json(0, [failed, skipped], 0)
+    assert report["checks"][0]["status"] is False
+    assert "outcome" not in report["checks"][0]
+    assert report["checks"][1]["status"] is False
+    assert report["checks"][1]["outcome"] == "skipped"
+
+
+def test_iter_check_results_reuses_cached_result(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A check with unchanged inputs is served from the result cache."""
+    monkeypatch.chdir(tmp_path)
+    source = tmp_path / "main.py"
+    source.write_text("print('hello')\n")
+    counter = tmp_path / "counter.txt"
+    check = ShellCheck(
+        description="count runs",
+        command=(
+            "python -c \"import pathlib; p = pathlib.Path('counter.txt');"
+            " p.write_text(p.read_text() + 'x' if p.exists() else 'x');"
+            ' exit(1)"'
+        ),
+        check_id="count-runs",
+        inputs=["*.py"],
+    )
+    (first,) = output._iter_check_results([check], use_cache=True)
+    (second,) = output._iter_check_results([check], use_cache=True)
+    assert first is not None and second is not None
+    assert not first.cached
+    assert second.cached
+    assert not second.passed
+    assert second.run_command == check.command
+    assert counter.read_text() == "x"
+    source.write_text("print('changed')\n")
+    (third,) = output._iter_check_results([check], use_cache=True)
+    assert third is not None and not third.cached
+    assert counter.read_text() == "xx"
+
+
+def test_iter_check_results_never_caches_checks_without_inputs(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A check that does not declare its inputs always runs."""
+    monkeypatch.chdir(tmp_path)
+    check = ShellCheck(
+        description="no inputs", command='python -c "exit(0)"', check_id="id"
+    )
+    for _ in range(2):
+        (result,) = output._iter_check_results([check], use_cache=True)
+        assert result is not None and not result.cached
+
+
+def test_create_report_json_and_markdown_mark_cached_checks() -> None:
+    """Cached results are marked in the JSON and Markdown reports."""
+    cached = CheckResult(
+        passed=True,
+        description="cached check",
+        json_info={"description": "cached check"},
+        cached=True,
+    )
+    report = output.create_report_json(1, [cached], 100)
+    assert report["checks"][0]["cached"] is True
+    markdown = output.create_markdown_report_file(report)
+    assert "- [x] cached check _(cached)_" in markdown
+
+
+def test_iter_check_results_records_check_that_times_out() -> None:
+    """A check that runs out of time fails with its elapsed time and output."""
+    slow = ShellCheck(
+        description="slow",
+        command=(
+            "python -c \"import time; print('partial', flush=True);"
+            ' time.sleep(30)"'
+        ),
+        timeout=1,
+    )
+    fast = ShellCheck(description="fast", command='python -c "exit(0)"')
+    start = time.monotonic()
+    first, second = output._iter_check_results([slow, fast], jobs=2)
+    assert time.monotonic() - start < 10  # noqa: PLR2004
+    assert first is not None and second is not None
+    assert not first.passed
+    assert first.timed_out
+    assert "Timed out and stopped after" in first.diagnostic
+    assert "partial" in first.diagnostic
+    assert second.passed and not second.timed_out
+
+
+def test_iter_check_results_total_timeout_stops_later_checks() -> None:
+    """Checks that have not started when the total timeout expires time out."""
+    slow = ShellCheck(
+        description="slow", command='python -c "import time; time.sleep(30)"'
+    )
+    later = ShellCheck(description="later", command='python -c "exit(0)"')
+    first, second = output._iter_check_results(
+        [slow, later], jobs=1, total_timeout=1
+    )
+    assert first is not None and second is not None
+    assert first.timed_out and second.timed_out
+    assert second.diagnostic == output.TOTAL_TIMEOUT_DIAGNOSTIC
+
+
+def test_create_report_json_marks_timed_out_checks() -> None:
+    """Timed out results carry a timed_out outcome in the JSON report."""
+    timed_out = CheckResult(
+        passed=False,
+        description="slow check",
+        json_info={"description": "slow check"},
+        timed_out=True,
+    )
+    report = output.create_report_json(0, [timed_out], 100)
+    assert report["checks"][0]["status"] is False
+    assert report["checks"][0]["outcome"] == "timed_out"
+
+
+def test_run_shell_check_records_counts_of_long_output() -> None:
+    """A failing check with long output reports how much it wrote."""
+    line_count = 100_000
+    check = ShellCheck(
+        description="noisy",
+        json_info={"description": "noisy"},
+        command=(
+            "python -c \"import sys; print('noise\\n' * "
+            f'{line_count}, end=str()); sys.exit(1)"'
+        ),
+    )
+    (result,) = output._iter_check_results(
+        [check], output_limit=5, spill_output=True
+    )
+    assert not result.passed
+    assert result.output_lines == line_count
+    assert result.output_bytes == line_count * len("noise\n")
+    assert f"truncated from {line_count} to 5" in result.diagnostic
+    assert result.output_log is not None
+    try:
+        report = output.create_report_json(0, [result], 0)
+        entry = report["checks"][0]
+        assert entry["output_lines"] == line_count
+        assert entry["output_log"] == result.output_log
+        assert os.path.getsize(result.output_log) == result.output_bytes
+    finally:
+        os.unlink(result.output_log)
+
+
+def test_run_shell_check_drops_log_of_passing_check() -> None:
+    """A passing check with long output does not leave a log file."""
+    check = ShellCheck(
+        description="quietly noisy",
+        command="python -c \"print('noise\\n' * 100000)\"",
+    )
+    (result,) = output._iter_check_results([check], spill_output=True)
+    assert result.passed
+    assert result.output_log is None
+    assert result.output_bytes is None
+
+
+def test_iter_check_results_fail_fast_cancels_running_checks() -> None:
+    """Fail-fast mode cancels a running check once another check fails."""
+    slow = ShellCheck(
+        description="slow", command='python -c "import time; time.sleep(30)"'
+    )
+    failing = ShellCheck(description="failing", command='python -c "exit(1)"')
+    start = time.monotonic()
+    first, second = output._iter_check_results(
+        [slow, failing], jobs=2, max_failures=1
+    )
+    assert time.monotonic() - start < 10  # noqa: PLR2004
+    assert first is not None and second is not None
+    assert first.not_run and not first.passed
+    assert not second.passed and not second.not_run
+
+
+def test_iter_check_results_fail_fast_does_not_start_later_checks(
+    tmp_path: Path,
+) -> None:
+    """In a serial run, the checks after the last allowed failure never start."""
+    marker = tmp_path / "ran.txt"
+    checks = [
+        ShellCheck(description="first", command='python -c "exit(1)"'),
+        ShellCheck(description="second", command='python -c "exit(1)"'),
+        ShellCheck(
+            description="third",
+            command=(
+                'python -c "import pathlib;'
+                f" pathlib.Path(r'{marker}').write_text('ran')\""
+            ),
+        ),
+    ]
+    results = list(output._iter_check_results(checks, max_failures=2))
+    assert [r.not_run for r in results] == [False, False, True]  # type: ignore
+    assert not marker.exists()
+
+
+def test_counts_as_failure_ignores_skipped_and_not_run_checks() -> None:
+    """Only checks that ran and failed count towards the fail-fast limit."""
+    failing = CheckResult(passed=False, description="f", json_info=None)
+    skipped = CheckResult(
+        passed=False, description="s", json_info=None, skipped=True
+    )
+    not_run = CheckResult(
+        passed=False, description="n", json_info=None, not_run=True
+    )
+    assert output._counts_as_failure(failing)
+    assert not output._counts_as_failure(skipped)
+    assert not output._counts_as_failure(not_run)
+    assert not output._counts_as_failure(None)
+
+
+def test_run_checks_fail_fast_reports_not_run_checks(
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    """The summary and the JSON report count the checks that did not run."""
+    checks = [
+        ShellCheck(
+            description="failing",
+            command='python -c "exit(1)"',
+            json_info={"description": "failing"},
+        ),
+        ShellCheck(
+            description="never started",
+            command='python -c "exit(0)"',
+            json_info={"description": "never started"},
+        ),
+    ]
+    passed = output.run_checks(
+        checks, ("", "", ""), no_progress_bar=True, max_failures=1
+    )
+    out = " ".join(capsys.readouterr().out.split())
+    assert not passed
+    assert "Not run: 1 check(s)" in out
+
+
+def test_create_report_json_marks_not_run_checks() -> None:
+    """Checks stopped by fail-fast mode carry a not_run outcome."""
+    not_run = CheckResult(
+        passed=False,
+        description="stopped check",
+        json_info={"description": "stopped check"},
+        not_run=True,
+    )
+    report = output.create_report_json(0, [not_run], 0)
+    assert report["checks"][0]["status"] is False
+    assert report["checks"][0]["outcome"] == "not_run"
+
+
+def test_iter_check_results_records_resources_of_checks_that_ran() -> None:
+    """A check that ran records its wall time, and its CPU time if known."""
+    ran = ShellCheck(description="ran", command='python -c "exit(0)"')
+    (result,) = output._iter_check_results([ran])
+    assert result is not None
+    assert result.wall_time is not None and result.wall_time > 0
+    if executor.HAS_WAIT4:
+        assert result.cpu_user_time is not None
+        assert result.peak_rss_kib is not None and result.peak_rss_kib > 0
+
+
+def test_create_report_json_and_markdown_include_resources() -> None:
+    """The resources of a check appear in the JSON and Markdown reports."""
+    measured = CheckResult(
+        passed=False,
+        description="measured | check",
+        json_info={"description": "measured | check"},
+        wall_time=1.23456,
+        cpu_user_time=0.5,
+        cpu_system_time=0.25,
+        peak_rss_kib=2048,
+    )
+    unmeasured = CheckResult(
+        passed=True,
+        description="cached check",
+        json_info={"description": "cached check"},
+        cached=True,
+    )
+    report = output.create_report_json(1, [measured, unmeasured], 50)
+    assert report["checks"][0]["resources"] == {
+        "wall_time": 1.235,
+        "cpu_user_time": 0.5,
+        "cpu_system_time": 0.25,
+        "peak_rss_kib": 2048,
+    }
+    assert "resources" not in report["checks"][1]
+    markdown = output.create_markdown_report_file(report)
+    assert "## Check Resources" in markdown
+    assert "| measured \\| check | 1.235 | 0.5 | 0.25 | 2048 |" in markdown
+    assert "**resources:**" not in markdown
+
+
+def test_run_checks_lists_slowest_checks(
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    """The summary lists the slowest checks first, up to the given number."""
+    checks = [
+        ShellCheck(description="quick", command='python -c "exit(0)"'),
+        ShellCheck(
+            description="sluggish",
+            command='python -c "import time; time.sleep(1)"',
+        ),
+        ShellCheck(description="brisk", command='python -c "exit(0)"'),
+    ]
+    passed = output.run_checks(
+        checks, ("", "", ""), no_progress_bar=True, slowest=2
+    )
+    out = " ".join(capsys.readouterr().out.split())
+    assert passed
+    assert "Slowest: sluggish (" in out
+    assert out.count("s); ") == 1
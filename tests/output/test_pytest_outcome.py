@@ -0,0 +1,201 @@
+"""Test suite for pytest_outcome.py."""
+
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+from gatorgrade.input.checks import PytestCheck
+from gatorgrade.output import output
+from gatorgrade.output.executor import CommandOutcome
+from gatorgrade.output.pytest_outcome import (
+    PytestRun,
+    PytestRuns,
+    PytestTestCase,
+    junit_address,
+    node_outcome,
+    parse_junit_xml,
+    pytest_command,
+)
+
+# the runner of the tests, which is the pytest of this interpreter
+RUNNER = f'"{sys.executable}" -m pytest -p no:cacheprovider -p no:randomly'
+
+# a file of tests whose conftest records every run of pytest in a file
+TESTS_SOURCE = """
+import pytest
+
+def test_ok():
+    pass
+
+def test_bad():
+    assert 1 == 2, "nope"
+
+@pytest.mark.skip(reason="later")
+def test_skip():
+    pass
+
+class TestGroup:
+    @pytest.mark.parametrize("value", [1, 2])
+    def test_value(self, value):
+        assert value == 1
+"""
+CONFTEST_SOURCE = """
+def pytest_sessionstart(session):
+    with open("runs.txt", "a") as runs:
+        runs.write("run\\n")
+"""
+TIMEOUT_SECONDS = 60
+
+
+@pytest.fixture
+def project(tmp_path: Path, chdir) -> Path:
+    """Make a project with one file of tests and enter its directory."""
+    (tmp_path / "tests").mkdir()
+    (tmp_path / "tests" / "test_sample.py").write_text(TESTS_SOURCE)
+    (tmp_path / "conftest.py").write_text(CONFTEST_SOURCE)
+    chdir(tmp_path)
+    return tmp_path
+
+
+def _run_count(directory: Path) -> int:
+    """Return how many times pytest ran in a directory."""
+    runs = directory / "runs.txt"
+    return runs.read_text().count("run") if runs.exists() else 0
+
+
+def _run(testcases: list | None, output: bytes = b"") -> PytestRun:
+    """Build a run of pytest with the given test cases and output."""
+    return PytestRun(
+        "pytest", CommandOutcome(returncode=1, output=output), testcases
+    )
+
+
+@pytest.mark.parametrize(
+    ("nodeid", "address"),
+    [
+        ("tests/test_a.py", "tests.test_a"),
+        ("tests/test_a.py::test_one", "tests.test_a.test_one"),
+        ("test_a.py::TestA::test_one", "test_a.TestA.test_one"),
+        ("tests/test_a.py::test_one[a/b::c]", "tests.test_a.test_one[a/b::c]"),
+    ],
+)
+def test_junit_address(nodeid: str, address: str) -> None:
+    """Node IDs become the dotted addresses of the JUnit XML report."""
+    assert junit_address(nodeid) == address
+
+
+def test_pytest_command_quotes_node_ids() -> None:
+    """The node IDs and the report path are quoted for the shell."""
+    command = pytest_command("pytest", ["tests/test_a.py::test_one[a b]"])
+    assert command in (
+        "pytest 'tests/test_a.py::test_one[a b]'",
+        'pytest "tests/test_a.py::test_one[a b]"',
+    )
+    assert "--junitxml=" in pytest_command("pytest", [], "report.xml")
+
+
+def test_parse_junit_xml(tmp_path: Path) -> None:
+    """Every test case of a report is read with its outcome."""
+    report = tmp_path / "report.xml"
+    report.write_text(
+        '<testsuites><testsuite name="pytest">'
+        '<testcase classname="tests.test_a" name="test_ok"/>'
+        '<testcase classname="tests.test_a" name="test_bad">'
+        '<failure message="assert 1 == 2">long text</failure></testcase>'
+        '<testcase classname="" name="tests.test_b">'
+        '<error message="collection failure">ImportError</error></testcase>'
+        "</testsuite></testsuites>"
+    )
+    assert parse_junit_xml(report) == [
+        PytestTestCase("tests.test_a.test_ok", "passed", "", ""),
+        PytestTestCase(
+            "tests.test_a.test_bad", "failure", "assert 1 == 2", "long text"
+        ),
+        PytestTestCase(
+            "tests.test_b", "error", "collection failure", "ImportError"
+        ),
+    ]
+
+
+def test_node_outcome_of_tests_classes_and_files() -> None:
+    """A node passes only when all of its reported test cases passed."""
+    run = _run(
+        [
+            PytestTestCase("tests.test_a.test_ok", "passed", "", ""),
+            PytestTestCase("tests.test_a.test_okay", "failure", "no", "no!"),
+            PytestTestCase("tests.test_a.Group.test_p[1]", "passed", "", ""),
+            PytestTestCase("tests.test_a.Group.test_p[2]", "failure", "x", ""),
+            PytestTestCase("tests.test_a.test_skip", "skipped", "later", ""),
+        ]
+    )
+    assert node_outcome("tests/test_a.py::test_ok", run) == (True, "")
+    assert node_outcome("tests/test_a.py::test_okay", run) == (False, "no!")
+    assert node_outcome("tests/test_a.py::Group::test_p[1]", run) == (
+        True,
+        "",
+    )
+    passed, diagnostic = node_outcome("tests/test_a.py::Group", run)
+    assert not passed
+    assert diagnostic == "tests.test_a.Group.test_p[2] (failure): x"
+    assert node_outcome("tests/test_a.py::test_skip", run) == (
+        False,
+        "Skipped: later",
+    )
+    passed, diagnostic = node_outcome("tests/test_a.py", run)
+    assert not passed
+    assert diagnostic.count("\n") == 2  # noqa: PLR2004
+
+
+def test_node_outcome_of_uncollected_and_unreported_nodes() -> None:
+    """A file that failed to collect fails every test inside of it."""
+    run = _run(
+        [PytestTestCase("tests.test_b", "error", "failure", "ImportError")],
+        output=b"collected 0 items\nERROR: not found: tests/test_c.py",
+    )
+    assert node_outcome("tests/test_b.py::test_one", run) == (
+        False,
+        "ImportError",
+    )
+    passed, diagnostic = node_outcome("tests/test_c.py::test_one", run)
+    assert not passed
+    assert diagnostic.startswith(
+        "Pytest did not report the outcome of tests/test_c.py::test_one"
+    )
+    assert diagnostic.endswith("ERROR: not found: tests/test_c.py")
+
+
+def test_pytest_runs_share_one_run_for_all_checks(project: Path) -> None:
+    """The checks of one runner share a single run of pytest."""
+    checks = [
+        PytestCheck(f"tests/test_sample.py::{name}", runner=RUNNER)
+        for name in ("test_ok", "test_bad", "test_skip", "TestGroup")
+    ]
+    runs = PytestRuns(checks)
+
+    async def run_all() -> list:
+        return await asyncio.gather(
+            *(runs.run_for(check, TIMEOUT_SECONDS) for check in checks)
+        )
+
+    outcomes = [
+        node_outcome(check.nodeid, run)[0]
+        for check, run in zip(checks, asyncio.run(run_all()))
+    ]
+    assert outcomes == [True, False, False, False]
+    assert _run_count(project) == 1
+
+
+def test_pytest_runs_fall_back_when_a_node_id_is_missing(
+    project: Path,
+) -> None:
+    """A node ID that does not exist only fails its own check."""
+    checks = [
+        PytestCheck("tests/test_sample.py::test_ok", runner=RUNNER),
+        PytestCheck("tests/test_sample.py::test_missing", runner=RUNNER),
+    ]
+    results = list(output._iter_check_results(checks, jobs=2))
+    assert [result.passed for result in results] == [True, False]
+    assert "test_missing" in results[1].diagnostic
+    assert results[0].run_command.endswith("tests/test_sample.py::test_ok")
@@ -0,0 +1,125 @@
+"""Test suite for shell_session.py."""
+
+import asyncio
+import subprocess
+import time
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from gatorgrade.input.checks import ShellCheck
+from gatorgrade.output import output, shell_session
+from gatorgrade.output.executor import CommandOutcome
+from gatorgrade.output.shell_session import ShellSessionPool
+
+pytestmark = pytest.mark.skipif(
+    not shell_session.HAS_SHELL_SESSIONS, reason="needs a POSIX shell"
+)
+
+
+def _run_all(commands: List[str], timeout: float = 10) -> List[CommandOutcome]:
+    """Run commands one after another in one shell session pool."""
+
+    async def run() -> List[CommandOutcome]:
+        sessions = ShellSessionPool()
+        try:
+            return [
+                await sessions.run_command(command, timeout)
+                for command in commands
+            ]
+        finally:
+            await sessions.close()
+
+    return asyncio.run(run())
+
+
+def test_shell_session_matches_a_new_shell() -> None:
+    """Commands report the same exit code and output as in a new shell."""
+    outcomes = _run_all(
+        [
+            "echo hello",
+            "printf 'no newline'",
+            "echo out; echo err >&2; exit 3",
+            "set -e; false; echo unreachable",
+        ]
+    )
+    assert [(o.returncode, o.output) for o in outcomes] == [
+        (0, b"hello\n"),
+        (0, b"no newline"),
+        (3, b"out\nerr\n"),
+        (1, b""),
+    ]
+
+
+def test_shell_session_isolates_each_command(tmp_path: Path) -> None:
+    """A command cannot change the directory or environment of the next."""
+    first_cd, pwd, first_export, echo = _run_all(
+        [
+            f"cd {tmp_path} && pwd",
+            "pwd",
+            "export GATORGRADE_SESSION_TEST=1; alias ls=false",
+            "echo ${GATORGRADE_SESSION_TEST:-unset}; ls >/dev/null",
+        ]
+    )
+    assert first_cd.output.strip() == str(tmp_path).encode()
+    assert pwd.output.strip() == str(Path.cwd()).encode()
+    assert first_export.returncode == 0
+    assert (echo.returncode, echo.output) == (0, b"unset\n")
+
+
+def test_shell_session_survives_broken_commands() -> None:
+    """Syntax errors, reads of standard input, and a killed shell are contained."""
+    syntax, stdin, killed, after = _run_all(
+        ["echo 'unterminated", "cat", "kill -9 $$", "echo after"]
+    )
+    assert syntax.returncode != 0
+    assert (stdin.returncode, stdin.output) == (0, b"")
+    assert killed.returncode != 0
+    assert (after.returncode, after.output) == (0, b"after\n")
+
+
+def test_shell_session_finds_sentinel_split_between_reads(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """The end of a command is found even when it is read in tiny pieces."""
+    monkeypatch.setattr(shell_session, "READ_CHUNK_BYTES", 3)
+    (outcome,) = _run_all(["echo one; echo two"])
+    assert (outcome.returncode, outcome.output) == (0, b"one\ntwo\n")
+
+
+def test_shell_session_timeout_kills_and_replaces_shell() -> None:
+    """A command that runs out of time is killed along with its shell."""
+
+    async def run() -> List[object]:
+        sessions = ShellSessionPool()
+        try:
+            with pytest.raises(subprocess.TimeoutExpired) as error:
+                await sessions.run_command("echo partial; sleep 30", 0.5)
+            after = await sessions.run_command("echo after")
+            return [error.value, after]
+        finally:
+            await sessions.close()
+
+    start = time.monotonic()
+    error, after = asyncio.run(run())
+    assert time.monotonic() - start < 10  # noqa: PLR2004
+    assert error.output == b"partial\n"  # type: ignore[attr-defined]
+    assert after.output == b"after\n"  # type: ignore[attr-defined]
+
+
+def test_iter_check_results_runs_shell_checks_in_sessions() -> None:
+    """Shell checks give the same results in shell session mode."""
+    checks = [
+        ShellCheck(description="passes", command="test -d ."),
+        ShellCheck(description="fails", command="echo missing; exit 1"),
+        ShellCheck(description="parallel", command="true"),
+    ]
+    for jobs in (1, 2):
+        first, second, third = output._iter_check_results(
+            checks, jobs=jobs, shell_session=True
+        )
+        assert first is not None and first.passed
+        assert second is not None and not second.passed
+        assert second.diagnostic == "missing"
+        assert third is not None and third.passed
@@ -1,8 +1,19 @@
 """Tests for the gatorgrade.hash module."""
 
+import hashlib
 import json
 
-from gatorgrade.hash import _ensure_json_safe, compute_check_id
+import pytest
+
+from gatorgrade import hash as check_id_hash
+from gatorgrade.hash import (
+    CHECK_ID_VERSION,
+    LEGACY_CHECK_ID_VERSION,
+    _ensure_json_safe,
+    compute_check_id,
+    memoized_check_ids,
+    remember_check_ids,
+)
 
 # well-known hex string length
 SHA256_HEX_LENGTH = 64
@@ -284,3 +295,89 @@ def test__ensure_json_safe_converts_non_serialisable_to_str() -> None:
     """_ensure_json_safe converts arbitrary objects to strings."""
     result = _ensure_json_safe({"key": object()})
     assert isinstance(result["key"], str)
+
+
+def test_legacy_version_matches_the_indented_scheme() -> None:
+    """Version 1 identifiers are those that earlier versions stored."""
+    check_data = {
+        "check": "MatchFileFragment",
+        "options": {"fragment": "TODO", "count": 0},
+    }
+    canonical = {
+        "description": "No TODOs",
+        "weight": 2,
+        "outputlimit": None,
+        "hint": "Remove them",
+        "check": "MatchFileFragment",
+        "options": {"fragment": "TODO", "count": 0},
+        "json_info": check_data,
+        "file": "src/main.py",
+    }
+    expected = hashlib.sha256(
+        json.dumps(canonical, indent=4, sort_keys=True).encode("utf-8")
+    ).hexdigest()
+    cid = compute_check_id(
+        description="No TODOs",
+        check_data=check_data,
+        file_context="src/main.py",
+        weight=2,
+        hint="Remove them",
+        version=LEGACY_CHECK_ID_VERSION,
+    )
+    assert cid == expected
+
+
+def test_current_version_differs_from_legacy_version() -> None:
+    """The current scheme gives other identifiers than version 1."""
+    check_data = {"command": "echo hi"}
+    current = compute_check_id("Says hi", check_data)
+    assert current == compute_check_id(
+        "Says hi", check_data, version=CHECK_ID_VERSION
+    )
+    assert current != compute_check_id(
+        "Says hi", check_data, version=LEGACY_CHECK_ID_VERSION
+    )
+    assert len(current) == SHA256_HEX_LENGTH
+
+
+def test_unknown_version_is_rejected() -> None:
+    """Computing an identifier with an unknown version raises an error."""
+    with pytest.raises(ValueError, match="Unknown check identifier version"):
+        compute_check_id("Says hi", {"command": "echo hi"}, version=99)
+
+
+def test_hash_of_data_that_is_not_json_safe() -> None:
+    """Check data that JSON cannot encode is hashed in its safe form."""
+    check_data = {"check": "Custom", "options": {"values": {1}}}
+    cid = compute_check_id("Custom", check_data)
+    assert cid == compute_check_id(
+        "Custom", {"check": "Custom", "options": {"values": "{1}"}}
+    )
+
+
+def test_memoized_identifier_matches_computed_identifier() -> None:
+    """An identifier read from the memo equals the one it was computed as."""
+    check_data = {"check": "MatchFileFragment", "options": {"count": 1}}
+    computed = compute_check_id("Has a main", check_data, "main.py")
+    assert len(memoized_check_ids()) == 1
+    memoized = compute_check_id("Has a main", check_data, "main.py")
+    check_id_hash._CHECK_ID_MEMO.clear()
+    assert memoized == computed
+    assert compute_check_id("Has a main", check_data, "main.py") == computed
+
+
+def test_identifier_of_unpicklable_data_is_not_memoized() -> None:
+    """Check data that cannot be pickled is hashed without the memo."""
+    check_data = {"check": "Custom", "options": {"call": lambda: None}}
+    cid = compute_check_id("Custom", check_data)
+    assert len(cid) == SHA256_HEX_LENGTH
+    assert memoized_check_ids() == {}
+
+
+def test_memo_keeps_the_newest_identifiers_when_full(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """A full memo drops its oldest half before keeping another identifier."""
+    monkeypatch.setattr(check_id_hash, "MAX_MEMOIZED_CHECK_IDS", 4)
+    remember_check_ids({bytes([key]): b"digest" for key in range(5)})
+    assert list(memoized_check_ids()) == [b"\x02", b"\x03", b"\x04"]
@@ -5,9 +5,10 @@ import io
 import os
 import re
 import sys
+from contextlib import contextmanager
 from io import StringIO
 from pathlib import Path
-from typing import Any, Callable, Generator, List
+from typing import Any, Callable, Generator, Iterator, List
 
 import pytest
 from typer.testing import CliRunner
@@ -371,7 +372,9 @@ class TestFilterCli:
                     }
                 ]
             },
-            scope=main.get_history_scope(Path("gatorgrade.yml"), None),
+            scope=report_history.get_history_scope(
+                Path("gatorgrade.yml"), None
+            ),
             history_directory=history_directory,
         )
         result = runner.invoke(
@@ -421,7 +424,9 @@ class TestFilterCli:
                     }
                 ]
             },
-            scope=main.get_history_scope(Path("gatorgrade.yml"), None),
+            scope=report_history.get_history_scope(
+                Path("gatorgrade.yml"), None
+            ),
             history_directory=history_directory,
         )
         result = runner.invoke(
@@ -485,7 +490,9 @@ class TestFilterCli:
                     }
                 ]
             },
-            scope=main.get_history_scope(Path("gatorgrade.yml"), None),
+            scope=report_history.get_history_scope(
+                Path("gatorgrade.yml"), None
+            ),
             history_directory=history_directory,
         )
         result = runner.invoke(
@@ -584,6 +591,68 @@ def test_gatorgrade_with_invalid_yaml_file(
     assert result.exit_code == 1
 
 
+def test_gatorgrade_runs_the_checks_beside_an_invalid_one(
+    chdir: Any, capsys: pytest.CaptureFixture[str], tmp_path: Path
+) -> None:
+    """An invalid check of a streamed file fails while the others still run."""
+    config_file = tmp_path / "gatorgrade.yml"
+    config_file.write_text(
+        "- description: First check\n"
+        "  command: python -c 'exit(0)'\n"
+        "- description: Broken check\n"
+        "  command: python -c 'exit(0)'\n"
+        "  weight: 0\n"
+        "- description: Last check\n"
+        "  command: python -c 'exit(0)'\n"
+    )
+    chdir(tmp_path)
+    result = runner.invoke(
+        main.app, ["--no-progress-bar", "--no-report-history"]
+    )
+    capsys.readouterr()
+    assert result.exit_code == 1
+    assert "First check" in result.stdout
+    assert "Last check" in result.stdout
+    assert "Configuration error in check 'Broken check'" in result.stdout
+    assert "2/3" in result.stdout
+
+
+def test_gatorgrade_starts_the_gatorgrader_pool_before_the_setup(
+    chdir: Any,
+    capsys: pytest.CaptureFixture[str],
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """The GatorGrader workers start while the set up commands run."""
+    config_file = tmp_path / "gatorgrade.yml"
+    config_file.write_text(
+        "setup: echo set up\n"
+        "---\n"
+        "- description: First check\n"
+        "  command: python -c 'exit(0)'\n"
+    )
+    events: List[str] = []
+
+    @contextmanager
+    def start_gg_pool(checks: Any, jobs: int) -> Iterator[None]:
+        events.append(f"pool for {jobs} jobs")
+        yield None
+        events.append("pool closed")
+
+    def run_setup_plan(*args: Any, **kwargs: Any) -> None:
+        events.append("setup")
+
+    monkeypatch.setattr(main, "start_gg_pool", start_gg_pool)
+    monkeypatch.setattr(main, "run_setup_plan", run_setup_plan)
+    chdir(tmp_path)
+    result = runner.invoke(
+        main.app, ["--no-progress-bar", "--no-report-history", "--jobs", "2"]
+    )
+    capsys.readouterr()
+    assert result.exit_code == 0
+    assert events == ["pool for 2 jobs", "setup", "pool closed"]
+
+
 def test_gatorgrade_with_version_flag(
     chdir: Any, capsys: pytest.CaptureFixture[str]
 ) -> None:
@@ -1368,3 +1437,280 @@ def test_filter_failed_and_passed_combined_is_accepted(
     capsys.readouterr()
     print(result.stdout)  # noqa: T201
     assert result.exit_code == 0
+
+
+def test_gatorgrade_with_jobs_option(
+    chdir: Any, capsys: pytest.CaptureFixture[str]
+) -> None:
+    """Test that gatorgrade runs the checks with several jobs."""
+    chdir("tests/test_assignment")
+    result = runner.invoke(main.app, ["--jobs", "auto", "--no-report-history"])
+    capsys.readouterr()
+    assert result.exit_code == 0
+    plain_stdout = ANSI_ESCAPE_PATTERN.sub("", result.stdout)
+    assert "- Checks: 3/3 (100%)" in plain_stdout
+
+
+def test_gatorgrade_with_invalid_jobs_option(
+    chdir: Any, capsys: pytest.CaptureFixture[str]
+) -> None:
+    """Test that gatorgrade rejects a jobs value that is not valid."""
+    chdir("tests/test_assignment")
+    result = runner.invoke(main.app, ["--jobs", "0"])
+    capsys.readouterr()
+    assert result.exit_code != 0
+
+
+def test_gatorgrade_reuses_cached_results(
+    chdir: Any, capsys: pytest.CaptureFixture[str]
+) -> None:
+    """Test that a second run reuses the results of unchanged checks."""
+    chdir("tests/test_assignment")
+    first = runner.invoke(main.app, ["--no-report-history"])
+    second = runner.invoke(main.app, ["--no-report-history"])
+    uncached = runner.invoke(main.app, ["--no-report-history", "--no-cache"])
+    capsys.readouterr()
+    assert first.exit_code == 0
+    assert second.exit_code == 0
+    assert "- Cached:" not in ANSI_ESCAPE_PATTERN.sub("", first.stdout)
+    assert "- Cached: 3 check(s)" in ANSI_ESCAPE_PATTERN.sub("", second.stdout)
+    assert "- Cached:" not in ANSI_ESCAPE_PATTERN.sub("", uncached.stdout)
+
+
+def test_gatorgrade_with_invalid_cache_max_mb(
+    chdir: Any, capsys: pytest.CaptureFixture[str]
+) -> None:
+    """Test that gatorgrade rejects a result cache size that is not valid."""
+    chdir("tests/test_assignment")
+    result = runner.invoke(main.app, ["--cache-max-mb", "0"])
+    capsys.readouterr()
+    assert result.exit_code != 0
+
+
+@pytest.mark.parametrize("flag", ["--check-timeout", "--total-timeout"])
+def test_gatorgrade_with_invalid_timeout_options(
+    flag: str, chdir: Any, capsys: pytest.CaptureFixture[str]
+) -> None:
+    """Test that gatorgrade rejects timeouts that are not positive."""
+    chdir("tests/test_assignment")
+    result = runner.invoke(main.app, [flag, "0"])
+    capsys.readouterr()
+    assert result.exit_code != 0
+
+
+def test_gatorgrade_with_fail_fast_option(
+    chdir: Any, capsys: pytest.CaptureFixture[str]
+) -> None:
+    """Test that fail-fast mode still runs every check of a passing config."""
+    chdir("tests/test_assignment")
+    result = runner.invoke(main.app, ["--fail-fast", "--no-report-history"])
+    capsys.readouterr()
+    assert result.exit_code == 0
+    assert "- Checks: 3/3 (100%)" in ANSI_ESCAPE_PATTERN.sub("", result.stdout)
+
+
+def test_gatorgrade_with_invalid_max_failures(
+    chdir: Any, capsys: pytest.CaptureFixture[str]
+) -> None:
+    """Test that gatorgrade rejects a fail-fast limit that is not positive."""
+    chdir("tests/test_assignment")
+    result = runner.invoke(main.app, ["--max-failures", "0"])
+    capsys.readouterr()
+    assert result.exit_code != 0
+
+
+def test_gatorgrade_with_slowest_option(
+    chdir: Any, capsys: pytest.CaptureFixture[str]
+) -> None:
+    """Test that gatorgrade lists the slowest checks in its summary."""
+    chdir("tests/test_assignment")
+    result = runner.invoke(main.app, ["--slowest", "2", "--no-report-history"])
+    capsys.readouterr()
+    assert result.exit_code == 0
+    assert "- Slowest:" in ANSI_ESCAPE_PATTERN.sub("", result.stdout)
+
+
+def test_gatorgrade_with_invalid_slowest(
+    chdir: Any, capsys: pytest.CaptureFixture[str]
+) -> None:
+    """Test that gatorgrade rejects a number of slowest checks below one."""
+    chdir("tests/test_assignment")
+    result = runner.invoke(main.app, ["--slowest", "0"])
+    capsys.readouterr()
+    assert result.exit_code != 0
+
+
+def test_gatorgrade_verbose_shows_file_cache_counts(
+    chdir: Any, capsys: pytest.CaptureFixture[str]
+) -> None:
+    """Test that verbose mode shows the hits and misses of the file cache."""
+    chdir("tests/test_assignment")
+    result = runner.invoke(
+        main.app, ["--verbose", "--no-cache", "--no-report-history"]
+    )
+    capsys.readouterr()
+    assert result.exit_code == 0
+    assert "- File cache: 1 hit(s), 2 miss(es)" in ANSI_ESCAPE_PATTERN.sub(
+        "", result.stdout
+    )
+
+
+def test_gatorgrade_with_shell_session_option(
+    chdir: Any, capsys: pytest.CaptureFixture[str]
+) -> None:
+    """Test that gatorgrade runs every check in shell session mode."""
+    chdir("tests/test_assignment")
+    result = runner.invoke(
+        main.app, ["--shell-session", "--no-cache", "--no-report-history"]
+    )
+    capsys.readouterr()
+    assert result.exit_code == 0
+    assert "- Checks: 3/3 (100%)" in ANSI_ESCAPE_PATTERN.sub("", result.stdout)
+
+
+@pytest.mark.parametrize(
+    ("share_flag", "expected_runs"),
+    [("--share-commands", 1), ("--no-share-commands", 3)],
+)
+def test_gatorgrade_shares_runs_of_identical_commands(
+    share_flag: str,
+    expected_runs: int,
+    chdir: Any,
+    capsys: pytest.CaptureFixture[str],
+    tmp_path: Path,
+) -> None:
+    """Test that checks with the same command run it once unless disabled."""
+    (tmp_path / "gatorgrade.yml").write_text(
+        "".join(
+            f"- description: check {number}\n"
+            '  command: "echo run >> runs.txt"\n'
+            for number in range(3)
+        )
+    )
+    chdir(tmp_path)
+    result = runner.invoke(
+        main.app, [share_flag, "--verbose", "--no-report-history"]
+    )
+    capsys.readouterr()
+    assert result.exit_code == 0
+    plain_stdout = ANSI_ESCAPE_PATTERN.sub("", result.stdout)
+    assert "- Checks: 3/3 (100%)" in plain_stdout
+    assert (tmp_path / "runs.txt").read_text().count("run") == expected_runs
+    assert ("- Shared commands: 1 run(s) for 3 check(s)" in plain_stdout) == (
+        expected_runs == 1
+    )
+
+
+# a configuration whose set up leaves a file behind when it runs
+SETUP_MARKER_CONFIG = (
+    "setup: |\n"
+    "  python -c \"open('setup-ran.txt', 'w').close()\"\n"
+    "---\n"
+    "- description: Say hello\n"
+    '  command: "echo hello"\n'
+)
+
+
+def test_gatorgrade_runs_setup_before_the_checks(
+    chdir: Any, tmp_path: Path
+) -> None:
+    """The set up commands run as their own stage before the checks."""
+    (tmp_path / "gatorgrade.yml").write_text(SETUP_MARKER_CONFIG)
+    chdir(tmp_path)
+    result = runner.invoke(main.app, ["--no-report-history"])
+    assert result.exit_code == 0
+    assert (tmp_path / "setup-ran.txt").exists()
+
+
+def test_gatorgrade_skips_setup_when_filter_leaves_no_checks(
+    chdir: Any, tmp_path: Path
+) -> None:
+    """Nothing is installed when the filter leaves no checks to run."""
+    (tmp_path / "gatorgrade.yml").write_text(SETUP_MARKER_CONFIG)
+    chdir(tmp_path)
+    result = runner.invoke(
+        main.app,
+        ["--filter-query", "nothing like this", "--no-report-history"],
+    )
+    assert result.exit_code == 0
+    assert not (tmp_path / "setup-ran.txt").exists()
+
+
+def test_check_config_reports_a_valid_config_without_setup(
+    chdir: Any, tmp_path: Path
+) -> None:
+    """check-config parses and checks the config but runs nothing."""
+    (tmp_path / "gatorgrade.yml").write_text(SETUP_MARKER_CONFIG)
+    chdir(tmp_path)
+    result = runner.invoke(main.app, ["check-config"])
+    assert result.exit_code == 0
+    assert "Checks: 1" in result.stdout
+    assert "Set up commands: 1" in result.stdout
+    assert "The configuration is valid." in result.stdout
+    assert not (tmp_path / "setup-ran.txt").exists()
+
+
+@pytest.mark.parametrize(
+    "config",
+    [
+        "- description: Bad weight\n  command: echo hi\n  weight: 0\n",
+        "setup:\n  - {parallel: true}\n---\n- command: echo hi\n",
+    ],
+)
+def test_check_config_reports_config_errors(
+    config: str, chdir: Any, tmp_path: Path
+) -> None:
+    """check-config fails with the errors of an invalid config."""
+    (tmp_path / "gatorgrade.yml").write_text(config)
+    chdir(tmp_path)
+    result = runner.invoke(main.app, ["check-config"])
+    assert result.exit_code == 1
+    assert "Configuration error" in result.stdout
+
+
+def test_compile_stores_the_compiled_config(
+    chdir: Any, tmp_path: Path
+) -> None:
+    """The compile command stores the checks so a later run does not parse the file."""
+    (tmp_path / "gatorgrade.yml").write_text(SETUP_MARKER_CONFIG)
+    chdir(tmp_path)
+    result = runner.invoke(main.app, ["compile", "--baseline-weight", "2"])
+    assert result.exit_code == 0
+    assert "Checks: 1" in result.stdout
+    assert "Baseline weight: 2" in result.stdout
+    compiled_files = list((tmp_path / "compiled-config").glob("*.pickle"))
+    assert len(compiled_files) == 1
+    assert not (tmp_path / "setup-ran.txt").exists()
+
+
+@pytest.mark.parametrize(
+    ("flags", "compiled"),
+    [
+        (["--no-cache"], True),
+        (["--no-compiled-cache"], False),
+    ],
+)
+def test_compiled_cache_is_independent_of_result_cache(
+    chdir: Any, tmp_path: Path, flags: list, compiled: bool
+) -> None:
+    """Only --no-compiled-cache keeps a run from storing the compiled config."""
+    (tmp_path / "gatorgrade.yml").write_text(
+        "- description: Say hello\n  command: echo hello\n"
+    )
+    chdir(tmp_path)
+    result = runner.invoke(main.app, ["--no-report-history", *flags])
+    assert result.exit_code == 0
+    compiled_files = list((tmp_path / "compiled-config").glob("*.pickle"))
+    assert len(compiled_files) == int(compiled)
+
+
+def test_compile_reports_config_errors(chdir: Any, tmp_path: Path) -> None:
+    """The compile command fails on an invalid config and stores nothing."""
+    (tmp_path / "gatorgrade.yml").write_text(
+        "- description: Bad weight\n  command: echo hi\n  weight: 0\n"
+    )
+    chdir(tmp_path)
+    result = runner.invoke(main.app, ["compile"])
+    assert result.exit_code == 1
+    assert "Configuration Error(s)" in result.stdout
+    assert not (tmp_path / "compiled-config").exists()
@@ -7,6 +7,7 @@ from typing import Any
 
 import pytest
 
+from gatorgrade.hash import CHECK_ID_VERSION
 from gatorgrade.input.checks import ShellCheck
 from gatorgrade.report_history import (
     BYTES_PER_MIB,
@@ -259,6 +260,7 @@ def test_history_file_is_json(tmp_path: Path) -> None:
     )
     payload = json.loads(path.read_text(encoding="utf-8"))
     assert payload["history_scope"] == "project-one"
+    assert payload["check_id_version"] == CHECK_ID_VERSION
 
 
 def test_get_all_check_ids_returns_distinct_ids(tmp_path: Path) -> None:
@@ -280,6 +282,44 @@ def test_get_all_check_ids_returns_distinct_ids(tmp_path: Path) -> None:
     assert result == {"alpha", "beta"}
 
 
+def test_legacy_check_ids_are_translated(tmp_path: Path) -> None:
+    """Reports saved with an earlier scheme of identifiers are translated."""
+    for day, check_id in [(1, "old-alpha"), (2, "old-gone")]:
+        path = save_report_history(
+            _report(check_id, False),
+            scope="project-one",
+            history_directory=tmp_path,
+            current_time=datetime.datetime(2026, 1, day, tzinfo=UTC),
+        )
+        # a report from an earlier version has no identifier version
+        payload = json.loads(path.read_text(encoding="utf-8"))
+        del payload["check_id_version"]
+        path.write_text(json.dumps(payload), encoding="utf-8")
+    save_report_history(
+        _report("beta", False),
+        scope="project-one",
+        history_directory=tmp_path,
+        current_time=datetime.datetime(2026, 1, 3, tzinfo=UTC),
+    )
+    calls: list[int] = []
+
+    def legacy_check_ids() -> dict[str, str]:
+        calls.append(1)
+        return {"old-alpha": "alpha", "old-beta": "beta"}
+
+    failed_ids, _, _ = get_failed_check_ids(
+        tmp_path, "project-one", 3, legacy_check_ids
+    )
+    assert failed_ids == {"alpha", "beta"}
+    assert get_all_check_ids(tmp_path, "project-one", 3) == {
+        "old-alpha",
+        "old-gone",
+        "beta",
+    }
+    # only the two reports with the earlier scheme are translated
+    assert len(calls) == 2  # noqa: PLR2004
+
+
 def test_get_all_check_ids_empty_directory(tmp_path: Path) -> None:
     """get_all_check_ids returns empty set for empty directory."""
     result = get_all_check_ids(tmp_path, "any-scope", report_count=5)
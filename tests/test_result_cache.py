@@ -0,0 +1,134 @@
+"""Tests for the result cache that reuses results of unchanged checks."""
+
+import json
+import os
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+
+from gatorgrade import result_cache
+from gatorgrade.result_cache import (
+    BYTES_PER_MIB,
+    CACHE_SCHEMA_KEY,
+    compute_cache_key,
+    compute_input_fingerprint,
+    load_cached_result,
+    prune_result_cache,
+    save_cached_result,
+)
+
+
+def test_input_fingerprint_changes_with_file_content(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Editing an input file changes the fingerprint."""
+    monkeypatch.chdir(tmp_path)
+    Path("main.py").write_text("print('hello')\n")
+    first = compute_input_fingerprint(["*.py"])
+    assert compute_input_fingerprint(["*.py"]) == first
+    Path("main.py").write_text("print('goodbye')\n")
+    assert compute_input_fingerprint(["*.py"]) != first
+
+
+def test_input_fingerprint_changes_when_files_are_added(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Adding a file that matches a recursive pattern changes the fingerprint."""
+    monkeypatch.chdir(tmp_path)
+    Path("src").mkdir()
+    Path("src/a.py").write_text("a = 1\n")
+    first = compute_input_fingerprint(["src/**/*.py"])
+    Path("src/nested").mkdir()
+    Path("src/nested/b.py").write_text("b = 2\n")
+    assert compute_input_fingerprint(["src/**/*.py"]) != first
+
+
+def test_input_fingerprint_depends_on_patterns(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Patterns that match nothing still produce distinct fingerprints."""
+    monkeypatch.chdir(tmp_path)
+    assert compute_input_fingerprint(["missing.py"]) != (
+        compute_input_fingerprint(["absent.py"])
+    )
+
+
+def test_cache_key_combines_check_id_and_fingerprint() -> None:
+    """The key changes when either the check or its inputs change."""
+    key = compute_cache_key("check", "inputs")
+    assert key == compute_cache_key("check", "inputs")
+    assert key != compute_cache_key("other", "inputs")
+    assert key != compute_cache_key("check", "changed")
+
+
+@pytest.fixture
+def key_versions() -> Iterator[None]:
+    """Forget the versions that the keys cover, before and after a test."""
+    result_cache._key_versions.cache_clear()
+    yield
+    result_cache._key_versions.cache_clear()
+
+
+def test_cache_key_covers_the_versions(
+    monkeypatch: pytest.MonkeyPatch, key_versions: None
+) -> None:
+    """The key changes when gatorgrade or GatorGrader is upgraded."""
+    key = compute_cache_key("check", "inputs")
+    monkeypatch.setattr(result_cache, "GATORGRADE_VERSION", "0.0.0")
+    result_cache._key_versions.cache_clear()
+    upgraded_gatorgrade = compute_cache_key("check", "inputs")
+    monkeypatch.setattr(
+        result_cache.importlib.metadata, "version", lambda _name: "0.0.0"
+    )
+    result_cache._key_versions.cache_clear()
+    upgraded_gatorgrader = compute_cache_key("check", "inputs")
+    assert len({key, upgraded_gatorgrade, upgraded_gatorgrader}) == 3  # noqa: PLR2004
+
+
+def test_save_and_load_cached_result(tmp_path: Path) -> None:
+    """A saved result can be loaded again with the same key."""
+    save_cached_result("key", {"status": True}, tmp_path)
+    assert load_cached_result("key", tmp_path) == {"status": True}
+    assert load_cached_result("missing", tmp_path) is None
+
+
+def test_load_cached_result_defaults_to_user_data_directory() -> None:
+    """Without a directory, results are stored in the cache directory."""
+    path = save_cached_result("key", {"status": False})
+    assert path.parent == result_cache.get_result_cache_directory()
+    assert load_cached_result("key") == {"status": False}
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        "not json",
+        json.dumps([1, 2]),
+        json.dumps({CACHE_SCHEMA_KEY: 0, "result": {}}),
+        json.dumps({CACHE_SCHEMA_KEY: 1, "result": "text"}),
+    ],
+)
+def test_load_cached_result_ignores_invalid_entries(
+    tmp_path: Path, content: str
+) -> None:
+    """Unreadable or outdated entries are treated as cache misses."""
+    (tmp_path / "key.json").write_text(content)
+    assert load_cached_result("key", tmp_path) is None
+
+
+def test_prune_result_cache_deletes_least_recently_used(
+    tmp_path: Path,
+) -> None:
+    """Pruning removes the oldest entries until the size limit is met."""
+    old = save_cached_result(
+        "old", {"data": "x" * (BYTES_PER_MIB // 2)}, tmp_path
+    )
+    new = save_cached_result(
+        "new", {"data": "y" * (BYTES_PER_MIB // 2)}, tmp_path
+    )
+    os.utime(old, (1, 1))
+    deleted = prune_result_cache(1, tmp_path)
+    assert deleted == [old]
+    assert new.exists()
+    assert prune_result_cache(1, tmp_path / "missing") == []
@@ -9,6 +9,7 @@ from typing import Any
 
 import pytest
 
+from gatorgrade.hash import CHECK_ID_VERSION
 from gatorgrade.output.check_result import CheckResult
 from gatorgrade.track import (
     AUTO_HINTS_FILENAME,
@@ -19,6 +20,7 @@ from gatorgrade.track import (
     HINT_DIAGNOSTIC_KEY,
     HINT_HINT_KEY,
     HINT_WEIGHT_KEY,
+    TRACK_CHECK_ID_VERSION_KEY,
     TRACK_CLI_ARGS_KEY,
     TRACK_DUE_DATE_KEY,
     TRACK_HINTS_KEY,
@@ -120,6 +122,14 @@ def test_build_track_entry_includes_check_id() -> None:
     assert hint[HINT_CHECK_ID_KEY] == result.check_id
 
 
+def test_build_track_entry_records_check_id_version() -> None:
+    """Entry records the version of the scheme that computed check_ids."""
+    result = _make_hinted_result(description="check with id")
+    result.check_id = "a1b2c3d4e5f6" * 10 + "abcd"
+    entry = build_track_entry([result])
+    assert entry[TRACK_CHECK_ID_VERSION_KEY] == CHECK_ID_VERSION
+
+
 def test_build_track_entry_omits_check_id_when_none() -> None:
     """Hint entry omits check_id when the result does not have one."""
     result = _make_hinted_result(description="check without id")
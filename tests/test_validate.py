@@ -140,6 +140,51 @@ class TestReportHistoryValidation:
         with pytest.raises(BadParameter):
             validate.validate_report_history_size(0)
 
+    def test_positive_cache_size_is_valid(self) -> None:
+        """Positive result-cache sizes pass validation."""
+        assert validate.validate_cache_size(1) == 1
+
+    def test_non_positive_cache_size_is_invalid(self) -> None:
+        """Non-positive result-cache sizes fail validation."""
+        with pytest.raises(BadParameter):
+            validate.validate_cache_size(0)
+
+    def test_positive_check_timeout_is_valid(self) -> None:
+        """Positive per-check timeouts pass validation."""
+        assert validate.validate_check_timeout(1) == 1
+
+    def test_non_positive_check_timeout_is_invalid(self) -> None:
+        """Non-positive per-check timeouts fail validation."""
+        with pytest.raises(BadParameter):
+            validate.validate_check_timeout(0)
+
+    def test_missing_total_timeout_is_valid(self) -> None:
+        """An omitted total timeout passes validation."""
+        assert validate.validate_total_timeout(None) is None
+
+    def test_non_positive_total_timeout_is_invalid(self) -> None:
+        """Non-positive total timeouts fail validation."""
+        with pytest.raises(BadParameter):
+            validate.validate_total_timeout(-1)
+
+    def test_missing_max_failures_is_valid(self) -> None:
+        """An omitted fail-fast limit passes validation."""
+        assert validate.validate_max_failures(None) is None
+
+    def test_non_positive_max_failures_is_invalid(self) -> None:
+        """Non-positive fail-fast limits fail validation."""
+        with pytest.raises(BadParameter):
+            validate.validate_max_failures(0)
+
+    def test_missing_slowest_is_valid(self) -> None:
+        """An omitted number of slowest checks passes validation."""
+        assert validate.validate_slowest(None) is None
+
+    def test_non_positive_slowest_is_invalid(self) -> None:
+        """Non-positive numbers of slowest checks fail validation."""
+        with pytest.raises(BadParameter):
+            validate.validate_slowest(0)
+
     def test_positive_failed_last_count_is_valid(self) -> None:
         """Positive historical-filter counts pass validation."""
         assert validate.validate_filter_failed_last(1) == 1
@@ -499,3 +544,37 @@ class TestFilterPassedLast:
         """Boolean raises BadParameter."""
         with pytest.raises(BadParameter):
             validate.validate_filter_passed_last(True)
+
+
+class TestJobs:
+    """Tests for validate_jobs and parse_jobs."""
+
+    def test_positive_int_is_valid(self) -> None:
+        """A positive integer passes through unchanged."""
+        assert validate.validate_jobs("4") == "4"
+        assert validate.parse_jobs("4") == 4  # noqa: PLR2004
+
+    def test_auto_uses_cpu_count(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """The auto value selects the number of processor cores."""
+        monkeypatch.setattr(validate.os, "cpu_count", lambda: 32)
+        assert validate.parse_jobs("AUTO") == 32  # noqa: PLR2004
+
+    def test_auto_without_cpu_count_uses_one_job(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """The auto value falls back to one job when cores are unknown."""
+        monkeypatch.setattr(validate.os, "cpu_count", lambda: None)
+        assert validate.parse_jobs("auto") == 1
+
+    def test_zero_invalid(self) -> None:
+        """Zero raises BadParameter."""
+        with pytest.raises(BadParameter):
+            validate.validate_jobs("0")
+
+    def test_text_invalid(self) -> None:
+        """A value that is neither a number nor auto raises BadParameter."""
+        assert validate.parse_jobs("many") is None
+        with pytest.raises(BadParameter):
+            validate.validate_jobs("many")